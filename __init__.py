@@ -1,4 +1,7 @@
+import os
+
 from .l1_startle_node import LcStartleNode
+from .l1_jsonl_ingest_node import LcStartleJsonlIngestNode
 from .l2_frame_click_node import LcFrameClickNode
 from .l3_keymap_click_node import LcKeymapClickNode
 from .l4_anchor_click_node import LcAnchorClickNode
@@ -7,8 +10,14 @@ from .l6_reflect_boom_node import LcReflectBoomNode
 from .l7_apply_done_node import LcApplyDoneNode
 from .show_text_node import ShowTextNode
 from .pipeline_node import LcEpistemicPipelineNode
+from .pipeline_batch_node import LcEpistemicPipelineBatchNode
+from .seed_archive_node import LcSeedArchiveAppendNode, LcSeedArchiveLoadNode
+from .seed_diff_node import LcSeedDiffNode
+from .seed_field_extract_node import LcSeedFieldExtractNode
 from .get_mada_object_node import GetMadaObjectNode
+from .get_mada_objects_node import GetMadaObjectsNode
 from .store_mada_object_node import StoreMadaObjectNode
+from .store_mada_objects_bulk_node import StoreMadaObjectsBulkNode
 from .initiate_oia_node import InitiateOiaNode
 from .view_oia_cycle_node import ViewOiaCycleNode
 from .add_observation_node import AddObservationNode
@@ -33,6 +42,7 @@ NODE_CLASS_MAPPINGS = {
     "LcADKConfigNode": LcADKConfigNode, # ADK Config Node
     "LcADKGuiInteractionNode": LcADKGuiInteractionNode, # ADK GUI Interaction Node
     "LcStartleNode": LcStartleNode,
+    "LcStartleJsonlIngestNode": LcStartleJsonlIngestNode,
     "LcFrameClickNode": LcFrameClickNode,
     "LcKeymapClickNode": LcKeymapClickNode,
     "LcAnchorClickNode": LcAnchorClickNode,
@@ -41,8 +51,15 @@ NODE_CLASS_MAPPINGS = {
     "LcApplyDoneNode": LcApplyDoneNode,
     "ShowTextNode": ShowTextNode,
     "LcEpistemicPipelineNode": LcEpistemicPipelineNode,
+    "LcEpistemicPipelineBatchNode": LcEpistemicPipelineBatchNode,
+    "LcSeedArchiveAppendNode": LcSeedArchiveAppendNode,
+    "LcSeedArchiveLoadNode": LcSeedArchiveLoadNode,
+    "LcSeedFieldExtractNode": LcSeedFieldExtractNode,
+    "LcSeedDiffNode": LcSeedDiffNode,
     "GetMadaObjectNode": GetMadaObjectNode,
+    "GetMadaObjectsNode": GetMadaObjectsNode,
     "StoreMadaObjectNode": StoreMadaObjectNode,
+    "StoreMadaObjectsBulkNode": StoreMadaObjectsBulkNode,
     "InitiateOiaNode": InitiateOiaNode,
     "ViewOiaCycleNode": ViewOiaCycleNode,
     "AddObservationNode": AddObservationNode,
@@ -66,6 +83,7 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "LcADKConfigNode": "ADK Configuration Node", # ADK Config Node
     "LcADKGuiInteractionNode": "ADK GUI Interaction Node", # ADK GUI Interaction Node
     "LcStartleNode": "lC L1 Startle",
+    "LcStartleJsonlIngestNode": "lC L1 Startle JSONL Ingest",
     "LcFrameClickNode": "lC L2 FrameClick",
     "LcKeymapClickNode": "lC L3 KeymapClick",
     "LcAnchorClickNode": "lC L4 AnchorClick",
@@ -74,8 +92,15 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "LcApplyDoneNode": "lC L7 ApplyDone",
     "ShowTextNode": "Show Text (lC)",
     "LcEpistemicPipelineNode": "lC Epistemic Pipeline (L1-L7)",
+    "LcEpistemicPipelineBatchNode": "lC Epistemic Pipeline Batch (L1-L7)",
+    "LcSeedArchiveAppendNode": "lC Seed Archive Append",
+    "LcSeedArchiveLoadNode": "lC Seed Archive Load",
+    "LcSeedFieldExtractNode": "lC Seed Field Extract",
+    "LcSeedDiffNode": "lC Seed Diff",
     "GetMadaObjectNode": "Get Mada Object (lC)",
+    "GetMadaObjectsNode": "Get Mada Objects (lC)",
     "StoreMadaObjectNode": "Store Mada Object (lC)",
+    "StoreMadaObjectsBulkNode": "Store Mada Objects Bulk (lC)",
     "InitiateOiaNode": "Initiate OIA Cycle (lC)",
     "ViewOiaCycleNode": "View OIA Cycle (lC)",
     "AddObservationNode": "Add OIA Observation (lC)",
@@ -104,4 +129,11 @@ COMFYUI_CUSTOM_TYPES = {
     }
 }
 
+# Node modules import lc_python_core and the agent/memory services on first
+# execute (see lazy_imports). Set LC_EPISTEMIC_EAGER_IMPORTS=1 to import them all
+# at load time instead, e.g. to surface missing dependencies at start-up.
+if os.environ.get("LC_EPISTEMIC_EAGER_IMPORTS", "").strip().lower() in ("1", "true", "yes"):
+    from .lazy_imports import preload_backends
+    preload_backends()
+
 __all__ = ['NODE_CLASS_MAPPINGS', 'NODE_DISPLAY_NAME_MAPPINGS', 'COMFYUI_CUSTOM_TYPES']
@@ -1,5 +1,11 @@
 from typing import Optional, List
-from lc_python_core.sops.meta_sops.sop_oia_cycle_management import add_application_to_cycle
+
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+add_application_to_cycle = lazy_import("lc_python_core.sops.meta_sops.sop_oia_cycle_management", "add_application_to_cycle")
 
 class AddApplicationNode:
     CATEGORY = "LearntCloud/OIA"
@@ -30,7 +36,7 @@ class AddApplicationNode:
         effective_outcome_trace_id = outcome_mada_seed_trace_id if outcome_mada_seed_trace_id and outcome_mada_seed_trace_id.strip() else None
         ref_interp_ids = [r.strip() for r in references_interpretation_ids_str.split(';') if r.strip()] if references_interpretation_ids_str else []
 
-        print(f"AddApplicationNode: Adding to OIA Cycle UID: {oia_cycle_uid}")
+        logger.debug("AddApplicationNode: Adding to OIA Cycle UID: %s", oia_cycle_uid)
         application_id = add_application_to_cycle(
             oia_cycle_uid=oia_cycle_uid,
             summary_of_action_taken_or_planned=summary_of_action,
@@ -40,5 +46,5 @@ class AddApplicationNode:
         )
         if application_id is None:
             raise Exception("Failed to add application. Check console.")
-        print(f"AddApplicationNode: Application {application_id} added.")
+        logger.info("AddApplicationNode: Application %s added.", application_id)
         return (oia_cycle_uid, application_id)
@@ -1,5 +1,11 @@
 from typing import Optional, List
-from lc_python_core.sops.meta_sops.sop_oia_cycle_management import add_interpretation_to_cycle
+
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+add_interpretation_to_cycle = lazy_import("lc_python_core.sops.meta_sops.sop_oia_cycle_management", "add_interpretation_to_cycle")
 
 class AddInterpretationNode:
     CATEGORY = "LearntCloud/OIA"
@@ -30,7 +36,7 @@ class AddInterpretationNode:
         incongruences = [i.strip() for i in incongruence_flags_str.split(';') if i.strip()] if incongruence_flags_str else []
         ref_obs_ids = [r.strip() for r in references_observation_ids_str.split(';') if r.strip()] if references_observation_ids_str else []
 
-        print(f"AddInterpretationNode: Adding to OIA Cycle UID: {oia_cycle_uid}")
+        logger.debug("AddInterpretationNode: Adding to OIA Cycle UID: %s", oia_cycle_uid)
         interpretation_id = add_interpretation_to_cycle(
             oia_cycle_uid=oia_cycle_uid,
             summary=summary,
@@ -40,5 +46,5 @@ class AddInterpretationNode:
         )
         if interpretation_id is None:
             raise Exception("Failed to add interpretation. Check console.")
-        print(f"AddInterpretationNode: Interpretation {interpretation_id} added.")
+        logger.info("AddInterpretationNode: Interpretation %s added.", interpretation_id)
         return (oia_cycle_uid, interpretation_id)
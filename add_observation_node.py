@@ -1,5 +1,11 @@
 from typing import Optional
-from lc_python_core.sops.meta_sops.sop_oia_cycle_management import add_observation_to_cycle
+
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+add_observation_to_cycle = lazy_import("lc_python_core.sops.meta_sops.sop_oia_cycle_management", "add_observation_to_cycle")
 
 class AddObservationNode:
     CATEGORY = "LearntCloud/OIA"
@@ -24,7 +30,7 @@ class AddObservationNode:
         effective_data_source = data_source_mada_uid if data_source_mada_uid and data_source_mada_uid.strip() else None
         effective_raw_ref = raw_observation_ref if raw_observation_ref and raw_observation_ref.strip() else None
         
-        print(f"AddObservationNode: Adding to OIA Cycle UID: {oia_cycle_uid}")
+        logger.debug("AddObservationNode: Adding to OIA Cycle UID: %s", oia_cycle_uid)
         observation_id = add_observation_to_cycle(
             oia_cycle_uid=oia_cycle_uid,
             summary=summary,
@@ -33,5 +39,5 @@ class AddObservationNode:
         )
         if observation_id is None:
             raise Exception("Failed to add observation to OIA cycle. Check console.")
-        print(f"AddObservationNode: Observation {observation_id} added.")
+        logger.info("AddObservationNode: Observation %s added.", observation_id)
         return (oia_cycle_uid, observation_id) # Pass through UID for chaining
@@ -0,0 +1,215 @@
+"""
+Shared background event loop for the async SOPs.
+
+keymap_click_process (L3) is a coroutine function. Running it with
+asyncio.run() on every execute creates and tears down an event loop per call
+and fails outright if the calling thread already runs a loop. Instead, all
+async SOP calls are submitted to one long-lived loop running on a daemon
+thread:
+
+    from .async_runner import resolve_awaitable
+    mada_seed = resolve_awaitable(keymap_click_process(mada_seed_input=mada_seed), timeout=30)
+
+Several calls can be in flight at once (submit_async / resolve_awaitables), so
+the L3 work for a list of seeds overlaps instead of running one after another.
+
+Timeouts: `timeout=None` uses DEFAULT_TIMEOUT (LC_EPISTEMIC_ASYNC_TIMEOUT
+seconds, unset means no limit); `timeout <= 0` waits without a limit. A call
+that times out is cancelled on the loop and raises AsyncCallTimeout, or with
+return_exceptions=True gets an AsyncCallTimeout in its result slot.
+"""
+import asyncio
+import atexit
+import inspect
+import os
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Iterable, List, Optional
+
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _timeout_from_env() -> Optional[float]:
+    value = os.environ.get("LC_EPISTEMIC_ASYNC_TIMEOUT", "").strip()
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        logger.warning("Ignoring invalid LC_EPISTEMIC_ASYNC_TIMEOUT=%r", value)
+        return None
+    return seconds if seconds > 0 else None
+
+
+DEFAULT_TIMEOUT: Optional[float] = _timeout_from_env()
+
+
+class AsyncCallTimeout(TimeoutError):
+    pass
+
+
+def _effective_timeout(timeout: Optional[float]) -> Optional[float]:
+    if timeout is None:
+        return DEFAULT_TIMEOUT
+    return timeout if timeout > 0 else None
+
+
+async def _await(awaitable: Awaitable) -> Any:
+    return await awaitable
+
+
+class AsyncRunner:
+    """
+    Owns an event loop running forever on a daemon thread. The loop and its
+    thread are started on first use and restarted if the thread is gone
+    (e.g. in a forked process-pool worker).
+    """
+
+    def __init__(self, name: str = "lc-epistemic-async"):
+        self._name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        loop, thread = self._loop, self._thread
+        if loop is not None and thread is not None and thread.is_alive():
+            return loop
+        with self._lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    loop.run_forever()
+
+                thread = threading.Thread(target=run_loop, name=self._name, daemon=True)
+                thread.start()
+                started.wait()
+                self._loop, self._thread = loop, thread
+                logger.debug("AsyncRunner: Started event loop thread %s.", self._name)
+            return self._loop
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, awaitable: Awaitable) -> Future:
+        """
+        Schedules `awaitable` on the loop and returns a concurrent.futures.Future.
+        """
+        coroutine = awaitable if inspect.iscoroutine(awaitable) else _await(awaitable)
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop())
+
+    def run(self, awaitable: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        Runs `awaitable` on the loop and blocks until it finishes.
+        """
+        return self.run_many([awaitable], timeout)[0]
+
+    def run_many(self, awaitables: Iterable[Awaitable], timeout: Optional[float] = None,
+                 return_exceptions: bool = False) -> List[Any]:
+        """
+        Submits all awaitables at once and returns their results in order.
+        `timeout` applies to the whole group. With return_exceptions=True a
+        failed call's exception is returned in its slot instead of raised,
+        and once the deadline passes only the calls still running are
+        cancelled, each with an AsyncCallTimeout in its slot.
+        """
+        awaitables = list(awaitables)
+        if self.in_loop_thread():
+            for awaitable in awaitables:
+                if inspect.iscoroutine(awaitable):
+                    awaitable.close()
+            raise RuntimeError("AsyncRunner: Blocking on the runner's own event loop would deadlock; await the call instead.")
+        timeout = _effective_timeout(timeout)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        futures = [self.submit(awaitable) for awaitable in awaitables]
+        results: List[Any] = []
+        try:
+            for future in futures:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    results.append(future.result(remaining))
+                except FutureTimeoutError:
+                    if not return_exceptions:
+                        raise AsyncCallTimeout(f"Async SOP call did not finish within {timeout}s")
+                    # The deadline has passed, so later calls are only waited for if already done
+                    if future.cancel():
+                        results.append(AsyncCallTimeout(f"Async SOP call did not finish within {timeout}s"))
+                        continue
+                    try: # finished between the timeout and the cancel
+                        results.append(future.result(0))
+                    except Exception as e:
+                        results.append(e)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return results
+
+    def shutdown(self, timeout: float = 5.0):
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not loop.is_running():
+            loop.close()
+
+
+_runner = AsyncRunner()
+
+
+def get_async_runner() -> AsyncRunner:
+    return _runner
+
+
+def shutdown_async_runner(timeout: float = 5.0):
+    _runner.shutdown(timeout)
+
+
+atexit.register(shutdown_async_runner)
+
+
+def submit_async(awaitable: Awaitable) -> Future:
+    return _runner.submit(awaitable)
+
+
+def run_async(awaitable: Awaitable, timeout: Optional[float] = None) -> Any:
+    return _runner.run(awaitable, timeout)
+
+
+def resolve_awaitable(value: Any, timeout: Optional[float] = None) -> Any:
+    """
+    Returns `value`, or its result if it is awaitable. Lets callers treat an
+    SOP the same whether it is a coroutine function or a plain function.
+    """
+    if inspect.isawaitable(value):
+        return _runner.run(value, timeout)
+    return value
+
+
+def resolve_awaitables(values: Iterable[Any], timeout: Optional[float] = None,
+                       return_exceptions: bool = False) -> List[Any]:
+    """
+    resolve_awaitable() for many values, with the awaitable ones running
+    concurrently on the shared loop.
+    """
+    values = list(values)
+    pending = [(i, value) for i, value in enumerate(values) if inspect.isawaitable(value)]
+    if pending:
+        results = _runner.run_many([value for _, value in pending], timeout, return_exceptions)
+        for (i, _), result in zip(pending, results):
+            values[i] = result
+    return values
@@ -0,0 +1,79 @@
+"""
+Measures how long importing this package takes, as ComfyUI does at start-up,
+with backends deferred to first execute (the default) and with every backend
+imported up front (LC_EPISTEMIC_EAGER_IMPORTS=1, the old behaviour).
+
+Run from the directory that contains this package (e.g. ComfyUI/custom_nodes):
+
+    python -m lc_comfyui_epistemic_nodes.benchmarks.bench_import_time --repeat 5
+
+Each measurement runs in a fresh interpreter so nothing is cached in
+sys.modules. Without lc_python_core installed the eager mode only measures
+the failed import attempts.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+_PACKAGE = __package__.rsplit(".", 1)[0]
+_PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {package}
+elapsed = time.perf_counter() - start
+backend_modules = [name for name in sys.modules if name.split(".")[0] in ("lc_python_core", "playwright", "google")]
+print(json.dumps({{"seconds": elapsed, "modules": len(sys.modules), "backend_modules": len(backend_modules)}}))
+"""
+
+
+def _measure_once(eager: bool) -> dict:
+    env = dict(os.environ)
+    env["LC_EPISTEMIC_EAGER_IMPORTS"] = "1" if eager else "0"
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD_SCRIPT.format(package=_PACKAGE)],
+        cwd=_PACKAGE_PARENT, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(repeat: int) -> dict:
+    results = {}
+    for mode, eager in (("lazy", False), ("eager", True)):
+        samples = [_measure_once(eager) for _ in range(repeat)]
+        seconds = [sample["seconds"] for sample in samples]
+        results[mode] = {
+            "median_seconds": statistics.median(seconds),
+            "min_seconds": min(seconds),
+            "modules_loaded": samples[-1]["modules"],
+            "backend_modules_loaded": samples[-1]["backend_modules"],
+        }
+    eager_seconds = results["eager"]["median_seconds"]
+    results["reduction"] = 1.0 - results["lazy"]["median_seconds"] / eager_seconds if eager_seconds else 0.0
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'mode':<8} {'median ms':>10} {'min ms':>10} {'modules':>8} {'backend':>8}")
+    for mode in ("lazy", "eager"):
+        row = results[mode]
+        print(f"{mode:<8} {row['median_seconds'] * 1e3:>10.1f} {row['min_seconds'] * 1e3:>10.1f} "
+              f"{row['modules_loaded']:>8} {row['backend_modules_loaded']:>8}")
+    print(f"Import time reduction: {results['reduction']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Microbenchmarks for the node entry points across input sizes.
+
+Times LcStartleNode.execute, LcFrameClickNode.execute,
+LcEpistemicPipelineNode.execute_pipeline, the MADA store/get nodes and the
+PBI nodes with input payloads from 10 B to 10 MB. By default lc_python_core
+is replaced by benchmarks.stub_backends, so the suite runs offline and the
+numbers reflect the nodes' own overhead; --real-backends uses the installed
+lc_python_core instead.
+
+Run from the directory that contains this package (e.g. ComfyUI/custom_nodes):
+
+    python -m lc_comfyui_epistemic_nodes.benchmarks.bench_nodes --output results.json
+    python -m lc_comfyui_epistemic_nodes.benchmarks.bench_nodes --compare results.json
+
+--compare exits with status 1 if any case's median is more than --threshold
+times slower than in the given results file.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import stub_backends
+
+RESULTS_FORMAT_VERSION = 1
+DEFAULT_SIZES = "10,1K,100K,1M,10M"
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 * 1024}
+
+
+def parse_size(text: str) -> int:
+    text = text.strip().upper().rstrip("B")
+    unit = text[-1] if text and text[-1] in _SIZE_UNITS else ""
+    return int(float(text[:len(text) - len(unit)]) * _SIZE_UNITS[unit])
+
+
+def format_size(size: int) -> str:
+    for unit, factor in (("M", 1024 * 1024), ("K", 1024)):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{unit}B"
+    return f"{size}B"
+
+
+def make_text(size: int) -> str:
+    sentence = "The quick brown fox jumps over the lazy dog. "
+    return (sentence * (size // len(sentence) + 1))[:size]
+
+
+def measure(fn: Callable[[], Any], min_seconds: float, max_repeat: int) -> Dict[str, Any]:
+    """
+    Calls `fn` until `min_seconds` have elapsed (at least once, at most
+    `max_repeat` times) and returns per-call statistics.
+    """
+    samples: List[float] = []
+    started = time.perf_counter()
+    while len(samples) < max_repeat:
+        call_start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - call_start)
+        if time.perf_counter() - started >= min_seconds:
+            break
+    return {
+        "repeat": len(samples),
+        "median_seconds": statistics.median(samples),
+        "min_seconds": min(samples),
+        "mean_seconds": statistics.fmean(samples),
+    }
+
+
+def _cases(text: str) -> List[Tuple[str, Callable[[], Any]]]:
+    """
+    (case name, zero-argument call) pairs for one input payload. Set-up work
+    (e.g. the L1 seed for L2, the stored object for get) happens here, once.
+    """
+    from ..get_mada_object_node import GetMadaObjectNode
+    from ..l1_startle_node import LcStartleNode
+    from ..l2_frame_click_node import LcFrameClickNode
+    from ..lc_add_comment_to_pbi_node import LcAddCommentToPbiNode
+    from ..lc_get_pbi_details_node import LcGetPbiDetailsNode
+    from ..lc_link_pbi_node import LcLinkPbiNode
+    from ..create_pbi_node import CreatePbiNode
+    from ..pipeline_node import LcEpistemicPipelineNode
+    from ..query_pbis_node import QueryPbisNode
+    from ..store_mada_object_node import StoreMadaObjectNode
+
+    l1_node = LcStartleNode()
+    l2_node = LcFrameClickNode()
+    pipeline = LcEpistemicPipelineNode()
+    store_node = StoreMadaObjectNode()
+    get_node = GetMadaObjectNode()
+    create_pbi_node = CreatePbiNode()
+    query_node = QueryPbisNode()
+    details_node = LcGetPbiDetailsNode()
+    link_node = LcLinkPbiNode()
+    comment_node = LcAddCommentToPbiNode()
+
+    mada_seed_L1, trace_id, _ = l1_node.execute(text, "bench_nodes", "", "bench_user")
+    payload_json = json.dumps({"content": text})
+    stored_uid = store_node.store_object(payload_json, "BenchmarkObject", "{}")[0]
+    pbi_uid = create_pbi_node.create_new_pbi("Benchmark PBI", "Task", "New", "Medium", detailed_description=text)[0]
+    other_pbi_uid = create_pbi_node.create_new_pbi("Benchmark PBI 2", "Task", "Defined", "Low")[0]
+    if stub_backends.stub_backends_installed():
+        for uid in (stored_uid, pbi_uid, other_pbi_uid):
+            stub_backends.pin(uid)
+
+    # Read-only cases first, so the store contents they see do not depend on the write cases
+    return [
+        ("l1_startle_execute", lambda: l1_node.execute(text, "bench_nodes", "", "bench_user")),
+        ("l2_frame_click_execute", lambda: l2_node.execute(trace_id, mada_seed_in=mada_seed_L1)),
+        ("pipeline_execute", lambda: pipeline.execute_pipeline(text)),
+        ("get_mada_object", lambda: get_node.get_object(stored_uid, "{}")),
+        ("get_pbi_details", lambda: details_node.execute_get_details(pbi_uid)),
+        ("query_pbis", lambda: query_node.query_pbis_from_mada(status="New")),
+        ("link_pbis", lambda: link_node.execute_link_pbis(pbi_uid, other_pbi_uid, "relates_to")),
+        ("add_comment_to_pbi", lambda: comment_node.execute_add_comment(pbi_uid, text, "urn:crux:uid::bench_user")),
+        ("store_mada_object", lambda: store_node.store_object(payload_json, "BenchmarkObject", "{}")),
+        ("create_pbi", lambda: create_pbi_node.create_new_pbi("Benchmark PBI", "Task", "New", "Medium", detailed_description=text)),
+    ]
+
+
+def run(sizes: List[int], min_seconds: float, max_repeat: int, case_filter: Optional[str] = None) -> List[Dict[str, Any]]:
+    results = []
+    for size in sizes:
+        if stub_backends.stub_backends_installed():
+            stub_backends.reset_store()
+        text = make_text(size)
+        for name, call in _cases(text):
+            if case_filter and case_filter not in name:
+                continue
+            row = {"case": name, "input_bytes": size}
+            row.update(measure(call, min_seconds, max_repeat))
+            results.append(row)
+            print(f"{name:<24}{format_size(size):>8}{row['median_seconds'] * 1e3:>12.3f} ms  (x{row['repeat']})", file=sys.stderr)
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Cases whose median is more than `threshold` times the baseline median.
+    """
+    previous = {(row["case"], row["input_bytes"]): row for row in baseline.get("results", [])}
+    regressions = []
+    for row in results:
+        old = previous.get((row["case"], row["input_bytes"]))
+        if old and old["median_seconds"] > 0:
+            ratio = row["median_seconds"] / old["median_seconds"]
+            if ratio > threshold:
+                regressions.append({"case": row["case"], "input_bytes": row["input_bytes"], "ratio": ratio,
+                                    "median_seconds": row["median_seconds"], "baseline_median_seconds": old["median_seconds"]})
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated input sizes, e.g. 10,1K,10M")
+    parser.add_argument("--min-seconds", type=float, default=0.2, help="minimum time spent per case and size")
+    parser.add_argument("--max-repeat", type=int, default=1000)
+    parser.add_argument("--case", help="only run cases whose name contains this string")
+    parser.add_argument("--real-backends", action="store_true", help="use the installed lc_python_core instead of the stubs")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="results JSON from an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    if not args.real_backends:
+        stub_backends.install_stub_backends()
+    sizes = [parse_size(size) for size in args.sizes.split(",") if size.strip()]
+    results = run(sizes, args.min_seconds, args.max_repeat, args.case)
+
+    report = {
+        "format": RESULTS_FORMAT_VERSION,
+        "created_utc": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backends": "real" if args.real_backends else "stub",
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression['case']} {format_size(regression['input_bytes'])}: "
+                  f"{regression['ratio']:.2f}x slower", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compares the seed_codec wire format with the JSON paths the nodes used before.
+
+Run from the directory that contains this package (e.g. ComfyUI/custom_nodes):
+
+    python -m lc_comfyui_epistemic_nodes.benchmarks.bench_seed_codec --repeat 500
+
+Seeds are produced by a full L1-L7 run, so lc_python_core must be importable.
+"""
+import argparse
+import json
+import time
+
+from ..pipeline_node import MadaSeed, prepare_pipeline_params, run_pipeline
+from ..seed_codec import MSGPACK_AVAILABLE, decode_seed, encode_seed
+
+
+def _time_per_call(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def _candidates():
+    candidates = [
+        ("json_indent2", lambda seed: seed.model_dump_json(indent=2).encode("utf-8"),
+         lambda data: MadaSeed.model_validate_json(data)),
+        ("json_compact", lambda seed: seed.model_dump_json().encode("utf-8"),
+         lambda data: MadaSeed.model_validate_json(data)),
+        ("codec_tagged", lambda seed: encode_seed(seed, fmt="tagged"),
+         lambda data: decode_seed(data, MadaSeed)),
+        ("codec_tagged_zlib", lambda seed: encode_seed(seed, fmt="tagged", compress=True),
+         lambda data: decode_seed(data, MadaSeed)),
+    ]
+    if MSGPACK_AVAILABLE:
+        candidates.append(("codec_msgpack", lambda seed: encode_seed(seed, fmt="msgpack"),
+                           lambda data: decode_seed(data, MadaSeed)))
+    return candidates
+
+
+def run_benchmark(input_text: str, repeat: int):
+    params = prepare_pipeline_params()
+    seed = run_pipeline(input_text, params)[0]
+    results = []
+    for name, encode, decode in _candidates():
+        data = encode(seed)
+        results.append({
+            "format": name,
+            "bytes": len(data),
+            "encode_us": _time_per_call(lambda: encode(seed), repeat) * 1e6,
+            "decode_us": _time_per_call(lambda: decode(data), repeat) * 1e6,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--input-text", default="The quick brown fox jumps over the lazy dog. " * 20)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.input_text, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    baseline = results[0]
+    print(f"{'format':<20}{'bytes':>10}{'size':>8}{'encode us':>12}{'decode us':>12}")
+    for row in results:
+        print(f"{row['format']:<20}{row['bytes']:>10}{row['bytes'] / baseline['bytes']:>8.2f}"
+              f"{row['encode_us']:>12.1f}{row['decode_us']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Compares the ways L1 can build the initial seed shell, per seed.
+
+_build_initial_madaSeed_shell_py constructs every layer object, trace and
+container separately. _validate_initial_madaSeed_shell_py validates a
+template dict built once per process in a single model_validate() call.
+_create_initial_madaSeed_shell_py (what L1 uses) returns a compiled
+structural clone of the once-validated template (see seed_clone). For
+reference, model_copy(deep=True) of the same prototype is timed as well.
+
+Run from the directory that contains this package (e.g. ComfyUI/custom_nodes):
+
+    python -m lc_comfyui_epistemic_nodes.benchmarks.bench_seed_shell --repeat 2000
+
+By default lc_python_core is replaced by benchmarks.stub_backends (same
+model tree); --real-backends uses the installed lc_python_core.
+"""
+import argparse
+import json
+import time
+
+from . import stub_backends
+
+
+def _time_per_call(fn, repeat: int, rounds: int = 5) -> float:
+    # Best of several rounds; the paths differ by a few microseconds
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / repeat
+
+
+def run_benchmark(repeat: int):
+    from .. import l1_startle_node as l1
+
+    l1._ensure_imports()
+    raw_signals = [l1.RawSignalItem(raw_input_id="bench_raw_id", raw_input_signal="bench")]
+    now = l1._get_current_timestamp_utc_py()
+    template_in_use = l1._get_seed_shell_template() is not None
+    result = {
+        "template_in_use": template_in_use,
+        "clone_in_use": l1._shell_clone is not None,
+        "constructors_us": _time_per_call(lambda: l1._build_initial_madaSeed_shell_py("bench_seed", "bench_seed", raw_signals, now), repeat) * 1e6,
+    }
+    if template_in_use:
+        result["template_validate_us"] = _time_per_call(lambda: l1._validate_initial_madaSeed_shell_py("bench_seed", "bench_seed", raw_signals, now), repeat) * 1e6
+        prototype = l1.MadaSeed.model_validate(l1._get_seed_shell_template())
+        result["deep_copy_us"] = _time_per_call(lambda: prototype.model_copy(deep=True), max(1, repeat // 10)) * 1e6
+    result["shell_us"] = _time_per_call(lambda: l1._create_initial_madaSeed_shell_py("bench_seed", "bench_seed", raw_signals), repeat) * 1e6
+    result["speedup"] = result["constructors_us"] / result["shell_us"] if result["shell_us"] else 0.0
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=1000)
+    parser.add_argument("--real-backends", action="store_true", help="use the installed lc_python_core instead of the stubs")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    if not args.real_backends:
+        stub_backends.install_stub_backends()
+    result = run_benchmark(args.repeat)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    if not result["template_in_use"]:
+        print("Template not in use (no Pydantic); L1 constructs every shell.")
+    elif not result["clone_in_use"]:
+        print("Prototype not clonable; L1 validates the template per seed.")
+    print(f"constructors:      {result['constructors_us']:10.1f} us/seed")
+    if result["template_in_use"]:
+        print(f"template validate: {result['template_validate_us']:10.1f} us/seed")
+        print(f"deep copy:         {result['deep_copy_us']:10.1f} us/seed")
+    print(f"L1 shell:          {result['shell_us']:10.1f} us/seed  ({result['speedup']:.1f}x vs constructors)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+"""
+In-process stand-ins for lc_python_core, used by bench_nodes so the node
+benchmarks run offline and measure the nodes' own overhead (input parsing,
+seed handling, serialization) rather than the SOPs.
+
+install_stub_backends() registers a synthetic `lc_python_core` package in
+sys.modules with:
+    mada_seed_types / schemas.mada_schema - Pydantic models shaped like the
+        real MadaSeed tree (one shared set of classes).
+    sops.sop_l1_startle ... sop_l7_apply_done - SOPs that fill in each
+        layer's object with fixed content; L3 is async like the real one.
+    services.lc_mem_service - a bounded in-memory MADA/PBI store.
+
+It must run before any node resolves its backends (see lazy_imports) and
+refuses to shadow a real lc_python_core that is already imported. Not for
+use outside benchmarks.
+"""
+import sys
+import types
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+STUB_MARKER = "__lc_benchmark_stub__"
+# Large payloads are stored repeatedly while benchmarking; keep only the newest.
+_STORE_LIMIT = 16
+
+
+class _Model(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+
+class RawSignalItem(_Model):
+    raw_input_id: str
+    raw_input_signal: Any = None
+
+
+class SignalComponentMetadataL1(_Model):
+    component_role_L1: Optional[str] = None
+    raw_signal_ref_uid_L1: Optional[str] = None
+    encoding_status_L1: Optional[str] = None
+    byte_size_hint_L1: Optional[int] = None
+    media_type_hint_L1: Optional[str] = None
+    error_details: Optional[str] = None
+
+
+class L1StartleContext(_Model):
+    version: str = "0.1.1"
+    L1_epistemic_state_of_startle: Optional[str] = None
+    trace_creation_time_L1: Optional[datetime] = None
+    input_origin_L1: Optional[str] = None
+    signal_components_metadata_L1: List[SignalComponentMetadataL1] = []
+    error_details: Optional[str] = None
+
+
+class L2EpistemicStateOfFramingEnum(str, Enum):
+    FRAMED = "Framed"
+    LCL_CLARIFY_STRUCTURE = "LCL-Clarify-Structure"
+    LCL_DEFER_STRUCTURE = "LCL-Defer-Structure"
+    LCL_FAILURE_SIZE_NOISE = "LCL-Failure-SizeNoise"
+    LCL_FAILURE_AMBIGUOUS_FRAME = "LCL-Failure-AmbiguousFrame"
+    LCL_FAILURE_MISSING_COMMS_CONTEXT = "LCL-Failure-MissingCommsContext"
+    LCL_FAILURE_INTERNAL_L2 = "LCL-Failure-Internal_L2"
+
+
+class _LayerObj(_Model):
+    version: Optional[str] = None
+    description: Optional[str] = None
+    error_details: Optional[str] = None
+
+
+class L2FrameTypeObj(_LayerObj):
+    frame_type_L2: Optional[str] = None
+    L2_epistemic_state_of_framing: Optional[L2EpistemicStateOfFramingEnum] = None
+
+
+class L3SurfaceKeymapObj(_LayerObj):
+    keymap: Dict[str, Any] = {}
+
+
+class L4AnchorStateObj(_LayerObj):
+    persona_profile_uid: Optional[str] = None
+
+
+class L5FieldStateObj(_LayerObj):
+    field_instance_uid: Optional[str] = None
+
+
+class _PayloadContent(_Model):
+    formatted_text: Optional[str] = None
+    structured_data: Optional[Dict[str, Any]] = None
+
+
+class L6ReflectionPayloadObj(_LayerObj):
+    payload_content: Optional[_PayloadContent] = None
+    l6_epistemic_state: Optional[L2EpistemicStateOfFramingEnum] = None
+
+
+class L7EncodedApplication(_LayerObj):
+    action_intent: Optional[str] = None
+    next_steps: List[str] = []
+
+
+class L6ReflectionPayloadContainer(_Model):
+    L6_reflection_payload_obj: Optional[L6ReflectionPayloadObj] = None
+    L7_encoded_application: Optional[L7EncodedApplication] = None
+
+
+class L5FieldStateContainer(_Model):
+    L5_field_state_obj: Optional[L5FieldStateObj] = None
+    L6_reflection_payload: Optional[L6ReflectionPayloadContainer] = None
+
+
+class L4AnchorStateContainer(_Model):
+    L4_anchor_state_obj: Optional[L4AnchorStateObj] = None
+    L5_field_state: Optional[L5FieldStateContainer] = None
+
+
+class L3SurfaceKeymapContainer(_Model):
+    L3_surface_keymap_obj: Optional[L3SurfaceKeymapObj] = None
+    L4_anchor_state: Optional[L4AnchorStateContainer] = None
+
+
+class L2FrameTypeContainer(_Model):
+    L2_frame_type_obj: Optional[L2FrameTypeObj] = None
+    L3_surface_keymap: Optional[L3SurfaceKeymapContainer] = None
+
+
+class L1StartleReflexContainer(_Model):
+    L1_startle_context: Optional[L1StartleContext] = None
+    L2_frame_type: Optional[L2FrameTypeContainer] = None
+
+
+class SeedContent(_Model):
+    raw_signals: List[RawSignalItem] = []
+    L1_startle_reflex: Optional[L1StartleReflexContainer] = None
+
+
+class _Trace(_Model):
+    version: Optional[str] = None
+    sop_name: Optional[str] = None
+    completion_timestamp: Optional[datetime] = None
+    error_details: Optional[str] = None
+
+
+class L1Trace(_Trace):
+    L1_generated_trace_id: Optional[str] = None
+
+
+class L2Trace(_Trace): pass
+class L3Trace(_Trace): pass
+class L4Trace(_Trace): pass
+class L5Trace(_Trace): pass
+class L6Trace(_Trace): pass
+class L7Trace(_Trace): pass
+
+
+class TraceMetadata(_Model):
+    trace_id: str
+    L1_trace: Optional[L1Trace] = None
+    L2_trace: Optional[L2Trace] = Field(default_factory=L2Trace)
+    L3_trace: Optional[L3Trace] = Field(default_factory=L3Trace)
+    L4_trace: Optional[L4Trace] = Field(default_factory=L4Trace)
+    L5_trace: Optional[L5Trace] = Field(default_factory=L5Trace)
+    L6_trace: Optional[L6Trace] = Field(default_factory=L6Trace)
+    L7_trace: Optional[L7Trace] = Field(default_factory=L7Trace)
+
+
+class SeedQAQC(_Model):
+    integrity_findings: List[Any] = []
+
+
+class MadaSeed(_Model):
+    version: str
+    seed_id: str
+    seed_content: SeedContent
+    trace_metadata: TraceMetadata
+    seed_QA_QC: SeedQAQC = Field(default_factory=SeedQAQC)
+    seed_completion_timestamp: Optional[datetime] = None
+
+
+def get_utc_timestamp() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def generate_crux_uid(hint: str = "") -> str:
+    return f"urn:crux:uid::{hint}::{uuid.uuid4().hex}"
+
+
+# --- SOPs ---
+
+def startle_process(input_event: Dict[str, Any]) -> MadaSeed:
+    trace_id = generate_crux_uid("trace_event_L1")
+    raw_signals = []
+    components = []
+    for component in input_event.get("data_components", []):
+        signal_id = generate_crux_uid("raw_signal")
+        raw_signals.append(RawSignalItem(raw_input_id=signal_id, raw_input_signal=component.get("content_handle_placeholder")))
+        components.append(SignalComponentMetadataL1(component_role_L1=component.get("role_hint"), raw_signal_ref_uid_L1=signal_id,
+                                                    encoding_status_L1="Decoded", byte_size_hint_L1=component.get("size_hint"),
+                                                    media_type_hint_L1=component.get("type_hint")))
+    return MadaSeed(
+        version="0.3.0",
+        seed_id=trace_id,
+        seed_content=SeedContent(raw_signals=raw_signals, L1_startle_reflex=L1StartleReflexContainer(
+            L1_startle_context=L1StartleContext(L1_epistemic_state_of_startle="Startled", trace_creation_time_L1=get_utc_timestamp(),
+                                                input_origin_L1=input_event.get("origin_hint"), signal_components_metadata_L1=components))),
+        trace_metadata=TraceMetadata(trace_id=trace_id, L1_trace=L1Trace(sop_name="stub.startle_process", L1_generated_trace_id=trace_id,
+                                                                         completion_timestamp=get_utc_timestamp())),
+    )
+
+
+def frame_click_process(mada_seed: MadaSeed, comm_context_hints: Optional[Dict[str, Any]] = None) -> MadaSeed:
+    mada_seed.seed_content.L1_startle_reflex.L2_frame_type = L2FrameTypeContainer(L2_frame_type_obj=L2FrameTypeObj(
+        version="0.1.0", frame_type_L2="Text", L2_epistemic_state_of_framing=L2EpistemicStateOfFramingEnum.FRAMED))
+    mada_seed.trace_metadata.L2_trace = L2Trace(sop_name="stub.frame_click_process", completion_timestamp=get_utc_timestamp())
+    return mada_seed
+
+
+def _l2(mada_seed: MadaSeed) -> L2FrameTypeContainer:
+    return mada_seed.seed_content.L1_startle_reflex.L2_frame_type
+
+
+async def keymap_click_process(mada_seed_input: MadaSeed) -> MadaSeed:
+    _l2(mada_seed_input).L3_surface_keymap = L3SurfaceKeymapContainer(L3_surface_keymap_obj=L3SurfaceKeymapObj(
+        version="0.1.0", keymap={"tokens": 0, "keywords": []}))
+    mada_seed_input.trace_metadata.L3_trace = L3Trace(sop_name="stub.keymap_click_process", completion_timestamp=get_utc_timestamp())
+    return mada_seed_input
+
+
+def anchor_click_process(mada_seed: MadaSeed, persona_profile_uid: Optional[str] = None) -> MadaSeed:
+    _l2(mada_seed).L3_surface_keymap.L4_anchor_state = L4AnchorStateContainer(L4_anchor_state_obj=L4AnchorStateObj(
+        version="0.1.0", persona_profile_uid=persona_profile_uid))
+    mada_seed.trace_metadata.L4_trace = L4Trace(sop_name="stub.anchor_click_process", completion_timestamp=get_utc_timestamp())
+    return mada_seed
+
+
+def field_click_process(mada_seed: MadaSeed, field_instance_uid: Optional[str] = None) -> MadaSeed:
+    _l2(mada_seed).L3_surface_keymap.L4_anchor_state.L5_field_state = L5FieldStateContainer(L5_field_state_obj=L5FieldStateObj(
+        version="0.1.0", field_instance_uid=field_instance_uid))
+    mada_seed.trace_metadata.L5_trace = L5Trace(sop_name="stub.field_click_process", completion_timestamp=get_utc_timestamp())
+    return mada_seed
+
+
+def reflect_boom_process(mada_seed: MadaSeed, presentation_intent: Optional[str] = None) -> MadaSeed:
+    l5 = _l2(mada_seed).L3_surface_keymap.L4_anchor_state.L5_field_state
+    l5.L6_reflection_payload = L6ReflectionPayloadContainer(L6_reflection_payload_obj=L6ReflectionPayloadObj(
+        version="0.1.0", payload_content=_PayloadContent(formatted_text=f"Stub reflection ({presentation_intent or 'default'})"),
+        l6_epistemic_state=L2EpistemicStateOfFramingEnum.FRAMED))
+    mada_seed.trace_metadata.L6_trace = L6Trace(sop_name="stub.reflect_boom_process", completion_timestamp=get_utc_timestamp())
+    return mada_seed
+
+
+def apply_done_process(mada_seed: MadaSeed, action_intent: Optional[str] = None) -> MadaSeed:
+    l6 = _l2(mada_seed).L3_surface_keymap.L4_anchor_state.L5_field_state.L6_reflection_payload
+    l6.L7_encoded_application = L7EncodedApplication(version="0.1.0", description="Stub application",
+                                                     action_intent=action_intent, next_steps=["Review"])
+    mada_seed.trace_metadata.L7_trace = L7Trace(sop_name="stub.apply_done_process", completion_timestamp=get_utc_timestamp())
+    mada_seed.seed_completion_timestamp = get_utc_timestamp()
+    return mada_seed
+
+
+# --- lc_mem_service ---
+
+PBI_OBJECT_TYPE = "PBI"
+_objects: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_pinned = set()
+
+
+def _remember(uid: str, record: Dict[str, Any]):
+    _objects[uid] = record
+    if len(_objects) > _STORE_LIMIT + len(_pinned):
+        for old_uid in list(_objects):
+            if old_uid not in _pinned:
+                del _objects[old_uid]
+                break
+
+
+def pin(uid: str):
+    """
+    Protects an object created during benchmark set-up from eviction.
+    """
+    _pinned.add(uid)
+
+
+def reset_store():
+    _objects.clear()
+    _pinned.clear()
+
+
+def mock_lc_mem_core_ensure_uid(object_type: str, context_description: str = "") -> str:
+    return generate_crux_uid(object_type)
+
+
+def mock_lc_mem_core_create_object(object_uid: str, object_payload: Dict[str, Any], initial_metadata: Optional[Dict[str, Any]] = None,
+                                   requesting_persona_context: Optional[Dict[str, Any]] = None):
+    _remember(object_uid, {"object_uid": object_uid, "payload": object_payload, "metadata": initial_metadata or {}})
+    return True
+
+
+def mock_lc_mem_core_get_object(object_uid: str, requesting_persona_context: Optional[Dict[str, Any]] = None):
+    return _objects.get(object_uid)
+
+
+def mock_lc_mem_core_query_objects(query_params: Dict[str, Any], requesting_persona_context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    filters = {key: value for key, value in query_params.items() if key != "object_type"}
+    results = []
+    for record in _objects.values():
+        payload = record["payload"]
+        if record.get("object_type") != query_params.get("object_type"):
+            continue
+        if all(payload.get(key) == value for key, value in filters.items()):
+            results.append(payload)
+    return results
+
+
+def create_pbi(pbi_data: Dict[str, Any], requesting_persona_context: Optional[Dict[str, Any]] = None) -> str:
+    pbi_uid = generate_crux_uid("pbi")
+    payload = dict(pbi_data, pbi_uid=pbi_uid, comments=[], links=[])
+    _remember(pbi_uid, {"object_uid": pbi_uid, "object_type": PBI_OBJECT_TYPE, "payload": payload, "metadata": {}})
+    return pbi_uid
+
+
+def get_pbi_details(pbi_uid: str, requesting_persona_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    record = _objects.get(pbi_uid)
+    if record is None:
+        return {"status": f"Error: PBI {pbi_uid} not found.", "details": None}
+    return {"status": "Success", "details": record["payload"]}
+
+
+def link_pbis(source_pbi_uid: str, target_pbi_uid: str, link_type: str, requesting_persona_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    record = _objects.get(source_pbi_uid)
+    if record is None or target_pbi_uid not in _objects:
+        return {"status": "Error: PBI(s) not found."}
+    record["payload"]["links"].append({"target_pbi_uid": target_pbi_uid, "link_type": link_type})
+    return {"status": "Success"}
+
+
+def add_comment_to_pbi(pbi_uid: str, comment_text: str, author_persona_uid: str,
+                       requesting_persona_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    record = _objects.get(pbi_uid)
+    if record is None:
+        return {"comment_id": None, "status": f"Error: PBI {pbi_uid} not found."}
+    comment_id = generate_crux_uid("comment")
+    # Keep only the latest comment so repeated benchmark calls do not grow the PBI
+    record["payload"]["comments"] = [{"comment_id": comment_id, "author_persona_uid": author_persona_uid, "text": comment_text}]
+    return {"comment_id": comment_id, "status": "Success"}
+
+
+_MODULE_CONTENTS = {
+    "mada_seed_types": [
+        "MadaSeed", "RawSignalItem", "L1StartleContext", "SignalComponentMetadataL1", "SeedContent", "TraceMetadata",
+        "L1StartleReflexContainer", "L2FrameTypeContainer", "L3SurfaceKeymapContainer", "L4AnchorStateContainer",
+        "L5FieldStateContainer", "L6ReflectionPayloadContainer", "L7EncodedApplication", "L2FrameTypeObj",
+        "L3SurfaceKeymapObj", "L4AnchorStateObj", "L5FieldStateObj", "L6ReflectionPayloadObj", "L2EpistemicStateOfFramingEnum",
+        "L1Trace", "L2Trace", "L3Trace", "L4Trace", "L5Trace", "L6Trace", "L7Trace", "SeedQAQC",
+        "get_utc_timestamp", "generate_crux_uid",
+    ],
+    "schemas.mada_schema": ["MadaSeed"],
+    "sops.sop_l1_startle": ["startle_process"],
+    "sops.sop_l2_frame_click": ["frame_click_process"],
+    "sops.sop_l3_keymap_click": ["keymap_click_process"],
+    "sops.sop_l4_anchor_click": ["anchor_click_process"],
+    "sops.sop_l5_field_click": ["field_click_process"],
+    "sops.sop_l6_reflect_boom": ["reflect_boom_process"],
+    "sops.sop_l7_apply_done": ["apply_done_process"],
+    "services.lc_mem_service": [
+        "PBI_OBJECT_TYPE", "mock_lc_mem_core_ensure_uid", "mock_lc_mem_core_create_object", "mock_lc_mem_core_get_object",
+        "mock_lc_mem_core_query_objects", "create_pbi", "get_pbi_details", "link_pbis", "add_comment_to_pbi",
+    ],
+}
+
+
+def _module(name: str) -> types.ModuleType:
+    module = sys.modules.get(name)
+    if module is None:
+        module = types.ModuleType(name)
+        module.__path__ = [] # importable as a package
+        setattr(module, STUB_MARKER, True)
+        sys.modules[name] = module
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(_module(parent), child, module)
+    return module
+
+
+def stub_backends_installed() -> bool:
+    return getattr(sys.modules.get("lc_python_core"), STUB_MARKER, False)
+
+
+def install_stub_backends():
+    """
+    Registers the stub lc_python_core package. Idempotent.
+    """
+    existing = sys.modules.get("lc_python_core")
+    if existing is not None and not getattr(existing, STUB_MARKER, False):
+        raise RuntimeError("The real lc_python_core is already imported; refusing to install benchmark stubs over it.")
+    root = _module("lc_python_core")
+    root.__version__ = "benchmark-stub"
+    this_module = sys.modules[__name__]
+    for suffix, names in _MODULE_CONTENTS.items():
+        module = _module(f"lc_python_core.{suffix}")
+        for name in names:
+            setattr(module, name, getattr(this_module, name))
+    sys.modules["lc_python_core.mada_seed_types"].PYDANTIC_AVAILABLE = True
@@ -0,0 +1,407 @@
+"""
+Content-addressed, chunked storage for large node inputs.
+
+A multi-megabyte input_text embedded in a MadaSeed is copied into the L1
+input event, the RawSignalItem and every serialized form of the seed. With
+out-of-band storage the text is encoded once, split into fixed-size chunks
+stored under their SHA-256, and the seed carries only a reference:
+
+    lc-content:sha256:<digest of the whole content>
+
+Consumers resolve references when (and only as far as) they need the
+content:
+
+    from .content_store import get_content_store, is_content_ref
+    if is_content_ref(raw_signal):
+        head = get_content_store().read_text(raw_signal, max_bytes=4096)
+        full = get_content_store().read_text(raw_signal)
+
+Chunks live in memory (LRU bounded by LC_EPISTEMIC_CONTENT_STORE_MAX_BYTES,
+default 256 MiB) and, if LC_EPISTEMIC_CONTENT_STORE_DIR is set, on disk, so
+references stay resolvable after eviction, across worker processes and
+across restarts. Without that directory, chunks evicted from memory are
+spilled to a temporary directory that lives as long as the process, so a
+seed's reference never dangles while the seed is in use. Identical content
+is stored once.
+
+The L2-L7 SOPs read raw_input_signal as text, so the nodes and the pipeline
+call them through with_resolved_content(), which swaps the references in the
+seed's raw signals for their text for the duration of the call only.
+"""
+import atexit
+import codecs
+import hashlib
+import inspect
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .lc_logging import get_logger
+from .seed_paths import compile_path
+
+logger = get_logger(__name__)
+
+CONTENT_REF_PREFIX = "lc-content:sha256:"
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_MEMORY_BYTES = 256 * 1024 * 1024
+_MANIFEST_SUFFIX = ".manifest"
+
+
+class ContentNotFoundError(KeyError):
+    pass
+
+
+class ContentRef(NamedTuple):
+    ref: str
+    byte_size: int
+    chunk_count: int
+
+
+def is_content_ref(value) -> bool:
+    return isinstance(value, str) and value.startswith(CONTENT_REF_PREFIX)
+
+
+_RAW_SIGNALS = compile_path("seed_content.raw_signals")
+
+
+def _digest_of(ref: str) -> str:
+    if not is_content_ref(ref):
+        raise ValueError(f"Not a content reference: {ref!r}")
+    return ref[len(CONTENT_REF_PREFIX):]
+
+
+class ContentStore:
+    """
+    Thread-safe chunk store. Manifests (the chunk list of each content
+    digest) are small and always kept in memory once seen.
+
+    With no `disk_dir`, chunks evicted from memory are written to a
+    per-store temporary spill directory (removed at exit) instead of being
+    dropped, unless `spill_evicted` is False.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+                 disk_dir: Optional[str] = None, spill_evicted: bool = True):
+        self.chunk_size = max(1, chunk_size)
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = disk_dir
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+        self.spill_evicted = spill_evicted and not disk_dir
+        self._spill_dir: Optional[str] = None
+        self._spilled_chunks = 0
+        self._lock = threading.Lock()
+        self._chunks: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._manifests: Dict[str, List[str]] = {}
+
+    # --- disk tier ---
+
+    def _disk_path(self, name: str, base_dir: Optional[str] = None) -> str:
+        return os.path.join(base_dir or self.disk_dir, name[:2], name)
+
+    def _write_disk(self, name: str, data: bytes, base_dir: Optional[str] = None):
+        path = self._disk_path(name, base_dir)
+        if os.path.exists(path):
+            return # content-addressed: an existing file already has these bytes
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("ContentStore: Failed to write %s: %s", name, e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _read_disk(self, name: str) -> Optional[bytes]:
+        base_dir = self.disk_dir or self._spill_dir
+        if not base_dir:
+            return None
+        try:
+            with open(self._disk_path(name, base_dir), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _spill(self, chunk_digest: str, chunk: bytes):
+        # Caller holds the lock, so readers never see a chunk that is in neither tier.
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="lc-content-spill-")
+            atexit.register(shutil.rmtree, self._spill_dir, True)
+        self._write_disk(chunk_digest, chunk, self._spill_dir)
+        self._spilled_chunks += 1
+
+    # --- memory tier ---
+
+    def _remember_chunk(self, chunk_digest: str, chunk: bytes):
+        # Caller holds the lock.
+        if chunk_digest in self._chunks:
+            self._chunks.move_to_end(chunk_digest)
+            return
+        self._chunks[chunk_digest] = chunk
+        self._memory_bytes += len(chunk)
+        while self._memory_bytes > self.max_memory_bytes and len(self._chunks) > 1:
+            evicted_digest, evicted = self._chunks.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            if self.spill_evicted:
+                self._spill(evicted_digest, evicted)
+
+    def put_bytes(self, data: bytes) -> ContentRef:
+        digest = hashlib.sha256(data).hexdigest()
+        view = memoryview(data)
+        chunk_digests = []
+        for start in range(0, len(data), self.chunk_size):
+            chunk = bytes(view[start:start + self.chunk_size])
+            chunk_digest = hashlib.sha256(chunk).hexdigest()
+            chunk_digests.append(chunk_digest)
+            with self._lock:
+                self._remember_chunk(chunk_digest, chunk)
+            if self.disk_dir:
+                self._write_disk(chunk_digest, chunk)
+        with self._lock:
+            self._manifests[digest] = chunk_digests
+        if self.disk_dir:
+            self._write_disk(digest + _MANIFEST_SUFFIX, "\n".join(chunk_digests).encode("ascii"))
+        return ContentRef(CONTENT_REF_PREFIX + digest, len(data), len(chunk_digests))
+
+    def put_text(self, text: str) -> ContentRef:
+        return self.put_bytes(text.encode("utf-8"))
+
+    def _manifest(self, digest: str) -> List[str]:
+        with self._lock:
+            chunk_digests = self._manifests.get(digest)
+        if chunk_digests is not None:
+            return chunk_digests
+        data = self._read_disk(digest + _MANIFEST_SUFFIX)
+        if data is None:
+            raise ContentNotFoundError(CONTENT_REF_PREFIX + digest)
+        chunk_digests = data.decode("ascii").split("\n") if data else []
+        with self._lock:
+            self._manifests[digest] = chunk_digests
+        return chunk_digests
+
+    def _chunk(self, chunk_digest: str, ref: str) -> bytes:
+        with self._lock:
+            chunk = self._chunks.get(chunk_digest)
+            if chunk is not None:
+                self._chunks.move_to_end(chunk_digest)
+                return chunk
+        chunk = self._read_disk(chunk_digest)
+        if chunk is None:
+            raise ContentNotFoundError(f"{ref}: chunk {chunk_digest} is no longer available")
+        with self._lock:
+            self._remember_chunk(chunk_digest, chunk)
+        return chunk
+
+    def contains(self, ref: str) -> bool:
+        try:
+            self._manifest(_digest_of(ref))
+        except ContentNotFoundError:
+            return False
+        return True
+
+    def byte_size(self, ref: str) -> int:
+        return sum(len(self._chunk(chunk_digest, ref)) for chunk_digest in self._manifest(_digest_of(ref)))
+
+    def iter_chunks(self, ref: str) -> Iterator[bytes]:
+        """
+        Yields the content's chunks in order, loading each only when reached.
+        """
+        for chunk_digest in self._manifest(_digest_of(ref)):
+            yield self._chunk(chunk_digest, ref)
+
+    def iter_text(self, ref: str) -> Iterator[str]:
+        """
+        iter_chunks() decoded as UTF-8; characters split across chunk
+        boundaries are carried over to the next piece.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for chunk in self.iter_chunks(ref):
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    def read_bytes(self, ref: str, max_bytes: Optional[int] = None) -> bytes:
+        parts = []
+        remaining = max_bytes
+        for chunk in self.iter_chunks(ref):
+            if remaining is not None:
+                if remaining <= 0:
+                    break
+                chunk = chunk[:remaining]
+                remaining -= len(chunk)
+            parts.append(chunk)
+        return b"".join(parts)
+
+    def read_text(self, ref: str, max_bytes: Optional[int] = None) -> str:
+        """
+        The content as text, or only its first `max_bytes` bytes (a
+        character cut at that boundary is dropped).
+        """
+        data = self.read_bytes(ref, max_bytes)
+        return data.decode("utf-8", errors="ignore" if max_bytes is not None else "strict")
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "memory_chunks": len(self._chunks),
+                "memory_bytes": self._memory_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "contents": len(self._manifests),
+                "chunk_size": self.chunk_size,
+                "disk_dir": self.disk_dir,
+                "spilled_chunks": self._spilled_chunks,
+            }
+
+
+def large_input_threshold(value: Optional[int] = None) -> int:
+    """
+    Effective out-of-band threshold in bytes: `value` if given, else
+    LC_EPISTEMIC_LARGE_INPUT_THRESHOLD, else 0 (disabled).
+    """
+    if value is None:
+        value = _env_int("LC_EPISTEMIC_LARGE_INPUT_THRESHOLD", 0)
+    return max(0, int(value))
+
+
+def text_data_component(text: str, role_hint: str, type_hint: str, threshold: int = 0) -> Dict[str, object]:
+    """
+    An L1 input-event data component for `text`. When `threshold` is positive
+    and the UTF-8 size reaches it, the text goes to the content store and the
+    component's content_handle_placeholder is the reference. The text is
+    encoded at most once either way.
+    """
+    if not text:
+        return {"role_hint": role_hint, "content_handle_placeholder": text, "size_hint": 0, "type_hint": type_hint}
+    # A UTF-8 character takes at most 4 bytes, so short strings skip the store without encoding twice.
+    if threshold <= 0 or len(text) * 4 < threshold:
+        return {"role_hint": role_hint, "content_handle_placeholder": text, "size_hint": len(text.encode("utf-8")), "type_hint": type_hint}
+    data = text.encode("utf-8")
+    if len(data) < threshold:
+        return {"role_hint": role_hint, "content_handle_placeholder": text, "size_hint": len(data), "type_hint": type_hint}
+    content_ref = get_content_store().put_bytes(data)
+    return {"role_hint": role_hint, "content_handle_placeholder": content_ref.ref, "size_hint": content_ref.byte_size, "type_hint": type_hint}
+
+
+def resolve_content(value):
+    """
+    Returns the full text for a content reference and any other value
+    unchanged, e.g. for a RawSignalItem.raw_input_signal.
+    """
+    if is_content_ref(value):
+        return get_content_store().read_text(value)
+    return value
+
+
+def _resolve_raw_signals(mada_seed: Any) -> List[Tuple[Any, str, str]]:
+    # Swaps each referenced raw_input_signal for its text; returns (item, ref, text) per swap.
+    raw_signals = _RAW_SIGNALS(mada_seed)
+    if not raw_signals:
+        return []
+    swapped = []
+    for item in raw_signals:
+        ref = item.get("raw_input_signal") if type(item) is dict else getattr(item, "raw_input_signal", None)
+        if not is_content_ref(ref):
+            continue
+        text = get_content_store().read_text(ref)
+        _set_raw_signal(item, text)
+        swapped.append((item, ref, text))
+    return swapped
+
+
+def _set_raw_signal(item: Any, value: str):
+    if type(item) is dict:
+        item["raw_input_signal"] = value
+    else:
+        item.raw_input_signal = value
+
+
+def _restore_raw_signals(mada_seed: Any, swapped: List[Tuple[Any, str, str]]):
+    for item, ref, text in swapped:
+        if getattr(item, "raw_input_signal", None) is text or (type(item) is dict and item.get("raw_input_signal") is text):
+            _set_raw_signal(item, ref)
+    # An SOP that returns a copy of its input carries the text in the copy's own items.
+    texts = {text: ref for _, ref, text in swapped}
+    for item in _RAW_SIGNALS(mada_seed) or ():
+        value = item.get("raw_input_signal") if type(item) is dict else getattr(item, "raw_input_signal", None)
+        if isinstance(value, str) and value in texts:
+            _set_raw_signal(item, texts[value])
+
+
+async def _restore_after(awaitable: Any, mada_seed: Any, swapped: List[Tuple[Any, str, str]]) -> Any:
+    try:
+        result = await awaitable
+    finally:
+        _restore_raw_signals(mada_seed, swapped)
+    if result is not mada_seed:
+        _restore_raw_signals(result, swapped)
+    return result
+
+
+def with_resolved_content(mada_seed: Any, call: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Returns call(*args, **kwargs), run while `mada_seed`'s raw signals hold
+    the text behind their content references instead of the references. The
+    references are put back afterwards, in `mada_seed` and in the returned
+    seed, so seeds stay small between layers. If `call` returns an awaitable
+    (an async SOP), an awaitable is returned that restores them once it is
+    done. Raises ContentNotFoundError if referenced content is gone.
+    """
+    swapped = _resolve_raw_signals(mada_seed)
+    if not swapped:
+        return call(*args, **kwargs)
+    try:
+        result = call(*args, **kwargs)
+    except BaseException:
+        _restore_raw_signals(mada_seed, swapped)
+        raise
+    if inspect.isawaitable(result):
+        return _restore_after(result, mada_seed, swapped)
+    _restore_raw_signals(mada_seed, swapped)
+    if result is not mada_seed:
+        _restore_raw_signals(result, swapped)
+    return result
+
+
+_store: Optional[ContentStore] = None
+_store_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name, "").strip()
+    try:
+        return int(value) if value else default
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, value)
+        return default
+
+
+def get_content_store() -> ContentStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ContentStore(
+                    chunk_size=_env_int("LC_EPISTEMIC_CONTENT_CHUNK_SIZE", DEFAULT_CHUNK_SIZE),
+                    max_memory_bytes=_env_int("LC_EPISTEMIC_CONTENT_STORE_MAX_BYTES", DEFAULT_MAX_MEMORY_BYTES),
+                    disk_dir=os.environ.get("LC_EPISTEMIC_CONTENT_STORE_DIR") or None,
+                )
+    return _store
+
+
+def configure_content_store(chunk_size: int = DEFAULT_CHUNK_SIZE, max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+                            disk_dir: Optional[str] = None, spill_evicted: bool = True) -> ContentStore:
+    global _store
+    with _store_lock:
+        _store = ContentStore(chunk_size, max_memory_bytes, disk_dir, spill_evicted)
+    return _store
@@ -1,6 +1,11 @@
 from typing import Optional, List, Dict, Any
 import json
-from lc_python_core.services.lc_mem_service import create_pbi
+
+from .lc_logging import get_logger
+from .storage_backends import get_storage_backend
+
+logger = get_logger(__name__)
+
 # Potentially import PBI field enums if defined in a central schema place for ComfyUI dropdowns
 # For now, using string inputs for enums and validating/casting in Python if necessary.
 
@@ -90,22 +95,22 @@ class CreatePbiNode:
                 pbi_data["attachments"] = attachments
             else:
                 pbi_data["attachments"] = []
-                print("Warning: attachments_json_str was not a valid JSON list. Defaulting to empty list.")
+                logger.warning("attachments_json_str was not a valid JSON list. Defaulting to empty list.")
         except json.JSONDecodeError:
             pbi_data["attachments"] = []
-            print("Warning: attachments_json_str was not valid JSON. Defaulting to empty list.")
+            logger.warning("attachments_json_str was not valid JSON. Defaulting to empty list.")
 
 
         # Remove None values for optional fields not provided, so they use schema defaults if any, or are just absent
         pbi_data_cleaned = {k: v for k, v in pbi_data.items() if v is not None and (not isinstance(v, list) or v)}
 
 
-        print(f"CreatePbiNode: Calling create_pbi with data: {pbi_data_cleaned}")
+        logger.debug("CreatePbiNode: Calling create_pbi with data: %s", pbi_data_cleaned)
         # Assuming persona_context is not strictly needed by the file-based create_pbi for now
-        new_pbi_uid = create_pbi(pbi_data=pbi_data_cleaned, requesting_persona_context=None) 
+        new_pbi_uid = get_storage_backend().create_pbi(pbi_data=pbi_data_cleaned, requesting_persona_context=None) 
 
         if new_pbi_uid is None:
             raise Exception("Failed to create PBI. Check console for errors from lc_python_core.")
         
-        print(f"CreatePbiNode: PBI {new_pbi_uid} created.")
+        logger.info("CreatePbiNode: PBI %s created.", new_pbi_uid)
         return (new_pbi_uid,)
@@ -1,5 +1,12 @@
 from typing import Optional, List, Dict, Any
-from lc_python_core.sops.meta_sops.sop_rdsotm_management import create_rdsotm_component
+
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+from .mada_read_cache import invalidate_mada_objects
+
+logger = get_logger(__name__)
+
+create_rdsotm_component = lazy_import("lc_python_core.sops.meta_sops.sop_rdsotm_management", "create_rdsotm_component")
 
 # Enum-like class for ComfyUI dropdown
 class RDSOTMComponentTypes:
@@ -44,17 +51,21 @@ class CreateRDSOTMComponentNode:
             except json.JSONDecodeError as e:
                 raise Exception(f"Invalid JSON in specific_fields_json: {e}")
 
-        print(f"CreateRDSOTMComponentNode: Adding {component_type} '{name}' to cycle {cycle_linkage_uid}")
-        component_uid = create_rdsotm_component(
-            cycle_linkage_uid=cycle_linkage_uid,
-            component_type=component_type,
-            name=name,
-            description=description,
-            content_text=content_text,
-            related_component_uids=related_uids,
-            specific_fields=specific_fields_dict
-        )
+        logger.debug("CreateRDSOTMComponentNode: Adding %s '%s' to cycle %s", component_type, name, cycle_linkage_uid)
+        try:
+            component_uid = create_rdsotm_component(
+                cycle_linkage_uid=cycle_linkage_uid,
+                component_type=component_type,
+                name=name,
+                description=description,
+                content_text=content_text,
+                related_component_uids=related_uids,
+                specific_fields=specific_fields_dict
+            )
+        finally:
+            # Cached cycle details no longer list all components
+            invalidate_mada_objects(cycle_linkage_uid, *related_uids)
         if component_uid is None:
             raise Exception(f"Failed to create RDSOTM component '{name}'. Check console.")
-        print(f"CreateRDSOTMComponentNode: Component {component_uid} created.")
+        logger.info("CreateRDSOTMComponentNode: Component %s created.", component_uid)
         return (cycle_linkage_uid, component_uid) # Pass through cycle_uid for chaining
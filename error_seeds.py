@@ -0,0 +1,288 @@
+"""
+Shared factory for error MadaSeeds (failure paths of L1-L7).
+
+Every error seed has the same shape as the L1 seed shell: placeholder objects
+for all seven layers, with the failing layer's object and trace carrying the
+failure state and error details. The factory resolves the model types once
+per types module and reuses L1's shell template dict
+(l1_startle_node._get_seed_shell_template), so each failure costs one
+MadaSeed.model_validate() call. No imports or per-object constructors run
+on the hot path, which matters under a flood of bad input.
+
+Usage:
+    from .error_seeds import get_error_seed_factory
+    factory = get_error_seed_factory()  # lc_python_core.mada_seed_types (L1/L2)
+    seed = factory.make(2, trace_id, "Invalid L1 seed", state=L2EpistemicStateOfFramingEnum.LCL_FAILURE_INTERNAL_L2)
+    factory.attach(existing_seed, 2, "frame_click_process failed")
+
+Nodes built on lc_python_core.schemas.mada_schema (the pipeline, L3-L7) use
+get_error_seed_factory("lc_python_core.schemas.mada_schema").
+"""
+import copy
+import importlib
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TYPES_MODULE = "lc_python_core.mada_seed_types"
+LAYERS = (1, 2, 3, 4, 5, 6, 7)
+
+LAYER_SOP_NAMES = {
+    1: "lC.SOP.startle", 2: "lC.SOP.frame_click", 3: "lC.SOP.keymap_click", 4: "lC.SOP.anchor_click",
+    5: "lC.SOP.field_click", 6: "lC.SOP.reflect_boom", 7: "lC.SOP.apply_done",
+}
+DEFAULT_FAILURE_STATES = {layer: f"LCL-Failure-Internal_L{layer}" for layer in LAYERS}
+
+# Key path from the seed_content dict to each layer's object.
+_L1_REFLEX = ("L1_startle_reflex",)
+_L2_CONTAINER = _L1_REFLEX + ("L2_frame_type",)
+_L3_CONTAINER = _L2_CONTAINER + ("L3_surface_keymap",)
+_L4_CONTAINER = _L3_CONTAINER + ("L4_anchor_state",)
+_L5_CONTAINER = _L4_CONTAINER + ("L5_field_state",)
+_L6_CONTAINER = _L5_CONTAINER + ("L6_reflection_payload",)
+LAYER_OBJECT_PATHS = {
+    1: _L1_REFLEX + ("L1_startle_context",),
+    2: _L2_CONTAINER + ("L2_frame_type_obj",),
+    3: _L3_CONTAINER + ("L3_surface_keymap_obj",),
+    4: _L4_CONTAINER + ("L4_anchor_state_obj",),
+    5: _L5_CONTAINER + ("L5_field_state_obj",),
+    6: _L6_CONTAINER + ("L6_reflection_payload_obj",),
+    7: _L6_CONTAINER + ("L7_encoded_application",),
+}
+# Field holding the layer's epistemic state on its object, where the schema has one.
+_STATE_FIELDS = {1: "L1_epistemic_state_of_startle", 2: "L2_epistemic_state_of_framing"}
+# Trace class per layer; L7's is aliased in some modules (see l1_startle_node).
+_TRACE_CLASS_NAMES = {layer: (f"L{layer}Trace",) for layer in LAYERS}
+_TRACE_CLASS_NAMES[7] = ("L7Trace", "L7TraceObj")
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _state_value(state: Any) -> Any:
+    return state.value if hasattr(state, "value") else state
+
+
+def _replace_path(data: Dict[str, Any], path: tuple, value: Any) -> Dict[str, Any]:
+    # Copies only the dicts along `path`; the rest is shared with `data`.
+    if len(path) == 1:
+        return dict(data, **{path[0]: value})
+    return dict(data, **{path[0]: _replace_path(data[path[0]], path[1:], value)})
+
+
+def _get_path(data: Dict[str, Any], path: tuple) -> Any:
+    for key in path:
+        data = data[key]
+    return data
+
+
+def _container_ids(value: Any, ids: set) -> set:
+    if isinstance(value, dict):
+        ids.add(id(value))
+        for item in value.values():
+            _container_ids(item, ids)
+    elif isinstance(value, list):
+        ids.add(id(value))
+        for item in value:
+            _container_ids(item, ids)
+    return ids
+
+
+def shares_template_containers(template: Dict[str, Any], validated: Any) -> bool:
+    """
+    True if `validated` (the result of model_validate(template)) holds any
+    dict or list object from `template` itself. Pydantic rebuilds containers
+    for model-typed fields but keeps Any-typed and extra field values as
+    given, so such a template cannot be reused without copying it first.
+    """
+    ids = _container_ids(template, set())
+    stack = [validated]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (dict, list)):
+            if id(value) in ids:
+                return True
+            stack.extend(value.values() if isinstance(value, dict) else value)
+        elif hasattr(value, "__pydantic_fields_set__"):
+            stack.extend(value.__dict__.values())
+            stack.extend((value.__pydantic_extra__ or {}).values())
+    return False
+
+
+def _l1_shell_template() -> Optional[Dict[str, Any]]:
+    # The L1 seed shell template; imported here because l1_startle_node uses this module.
+    from . import l1_startle_node
+    l1_startle_node._ensure_imports()
+    return l1_startle_node._get_seed_shell_template()
+
+
+def _trace_dict(layer: int, trace_id: str, error_message: str, state: Any, now: datetime) -> Dict[str, Any]:
+    if layer == 1:
+        return {
+            "version_L1_trace_schema": "0.1.0", "sop_name": LAYER_SOP_NAMES[1],
+            "completion_timestamp_L1": now, "epistemic_state_L1": state,
+            "L1_trace_creation_time_from_context": now,
+            "L1_signal_component_count": 0, "L1_generated_trace_id": trace_id,
+            "error_details": error_message,
+        }
+    return {
+        "version_Lx_trace_schema": "0.1.0", "sop_name": LAYER_SOP_NAMES[layer],
+        "completion_timestamp_Lx": now, "epistemic_state_Lx": state,
+        "error_details": error_message,
+    }
+
+
+class ErrorSeedFactory:
+    """
+    Builds error seeds for one types module. Types and the shell template are
+    resolved on first use; `available` is False when the module cannot be
+    imported or has no Pydantic models, and make() then returns None.
+    """
+
+    def __init__(self, types_module: str = DEFAULT_TYPES_MODULE):
+        self.types_module = types_module
+        self._lock = threading.Lock()
+        self._ready = False
+        self._types: Dict[str, Any] = {}
+        self._template: Optional[Dict[str, Any]] = None
+        self._copy_template = False
+
+    def _prepare(self):
+        if self._ready:
+            return
+        with self._lock:
+            if self._ready:
+                return
+            try:
+                module = importlib.import_module(self.types_module)
+                seed_cls = getattr(module, "MadaSeed")
+                if hasattr(seed_cls, "model_validate"):
+                    template = _l1_shell_template()
+                    if template is None:
+                        raise ImportError("the L1 seed shell template is unavailable")
+                    # Fails here, once, if the shell does not fit the schema
+                    self._copy_template = shares_template_containers(template, seed_cls.model_validate(template))
+                    self._types["MadaSeed"] = seed_cls
+                    for layer, names in _TRACE_CLASS_NAMES.items():
+                        trace_cls = next((getattr(module, name) for name in names if hasattr(module, name)), None)
+                        if trace_cls is not None:
+                            self._types[f"L{layer}_trace"] = trace_cls
+                    self._template = template
+            except Exception as e:
+                logger.error("ErrorSeedFactory: %s is unusable, error seeds are unavailable: %r", self.types_module, e)
+            self._ready = True
+
+    @property
+    def available(self) -> bool:
+        self._prepare()
+        return self._template is not None
+
+    def make(self, layer: int, trace_id: str, error_message: str, state: Any = None,
+             raw_signals: Optional[List[Any]] = None, object_fields: Optional[Dict[str, Any]] = None,
+             trace_fields: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        A new error seed for a failure in `layer` (1-7). `state` defaults to
+        "LCL-Failure-Internal_L<layer>"; `object_fields` / `trace_fields`
+        add or override fields of the failing layer's object and trace.
+        """
+        self._prepare()
+        template = self._template
+        if template is None:
+            return None
+        if self._copy_template:
+            template = copy.deepcopy(template)
+        now = _now()
+        state = _state_value(state) if state is not None else DEFAULT_FAILURE_STATES[layer]
+
+        layer_obj = dict(_get_path(template["seed_content"], LAYER_OBJECT_PATHS[layer]), error_details=error_message)
+        if layer in _STATE_FIELDS:
+            layer_obj[_STATE_FIELDS[layer]] = state
+        if layer == 1:
+            layer_obj["trace_creation_time_L1"] = now
+            layer_obj["signal_components_metadata_L1"] = [{
+                "component_role_L1": "error_placeholder", "raw_signal_ref_uid_L1": "error_uid", "encoding_status_L1": "Unknown_L1",
+            }]
+        if object_fields:
+            layer_obj.update(object_fields)
+        seed_content = template["seed_content"]
+        if layer != 1:
+            l1_context = _get_path(seed_content, LAYER_OBJECT_PATHS[1])
+            seed_content = _replace_path(seed_content, LAYER_OBJECT_PATHS[1], dict(l1_context, trace_creation_time_L1=now))
+        seed_content = _replace_path(seed_content, LAYER_OBJECT_PATHS[layer], layer_obj)
+        if raw_signals is not None:
+            seed_content["raw_signals"] = raw_signals
+
+        trace = _trace_dict(layer, trace_id, error_message, state, now)
+        if trace_fields:
+            trace.update(trace_fields)
+        trace_meta = dict(template["trace_metadata"], trace_id=trace_id)
+        if layer != 1:
+            trace_meta["L1_trace"] = dict(trace_meta["L1_trace"], completion_timestamp_L1=now, L1_trace_creation_time_from_context=now)
+        trace_meta[f"L{layer}_trace"] = trace
+
+        data = dict(template, seed_id=trace_id, seed_content=seed_content, trace_metadata=trace_meta, seed_completion_timestamp=now)
+        seed_cls = self._types["MadaSeed"]
+        try:
+            return seed_cls.model_validate(data)
+        except Exception as e:
+            # Caller-supplied fields (or a schema change) did not validate; keep the
+            # error visible on the layer object and leave the trace at its default.
+            logger.warning("ErrorSeedFactory: L%d error seed did not validate, dropping extra fields: %r", layer, e)
+        trace_meta = dict(template["trace_metadata"], trace_id=trace_id)
+        try:
+            layer_obj = dict(_get_path(template["seed_content"], LAYER_OBJECT_PATHS[layer]), error_details=error_message)
+            seed_content = _replace_path(template["seed_content"], LAYER_OBJECT_PATHS[layer], layer_obj)
+            return seed_cls.model_validate(dict(template, seed_id=trace_id, seed_content=seed_content, trace_metadata=trace_meta))
+        except Exception as e:
+            # The shell itself validated in _prepare(); return it with just the IDs
+            logger.error("ErrorSeedFactory: L%d error seed without extra fields did not validate, returning the bare shell: %r", layer, e)
+            return seed_cls.model_validate(dict(template, seed_id=trace_id, trace_metadata=trace_meta))
+
+    def attach(self, mada_seed: Any, layer: int, error_message: str, state: Any = None) -> Any:
+        """
+        Records a failure in `layer` on an existing seed, in place: sets the
+        error (and state) on the layer's object if the seed has one, and
+        replaces the layer's trace. Returns the seed.
+        """
+        self._prepare()
+        if state is None:
+            state = DEFAULT_FAILURE_STATES[layer]
+        try:
+            parent = mada_seed.seed_content
+            path = LAYER_OBJECT_PATHS[layer]
+            for key in path[:-1]:
+                parent = getattr(parent, key, None)
+                if parent is None:
+                    break
+            layer_obj = getattr(parent, path[-1], None) if parent is not None else None
+            if layer_obj is not None:
+                layer_obj.error_details = error_message
+                if layer in _STATE_FIELDS:
+                    setattr(layer_obj, _STATE_FIELDS[layer], state) # assignment is not validated: pass the enum member
+        except Exception as e:
+            logger.warning("ErrorSeedFactory: Could not mark the L%d object as failed: %r", layer, e)
+        trace_cls = self._types.get(f"L{layer}_trace")
+        if trace_cls is not None and hasattr(mada_seed, "trace_metadata"):
+            try:
+                trace = trace_cls.model_validate(_trace_dict(layer, getattr(mada_seed, "seed_id", ""), error_message, _state_value(state), _now()))
+                setattr(mada_seed.trace_metadata, f"L{layer}_trace", trace)
+            except Exception as e:
+                logger.warning("ErrorSeedFactory: Could not set the L%d error trace: %r", layer, e)
+        return mada_seed
+
+
+_factories: Dict[str, ErrorSeedFactory] = {}
+_factories_lock = threading.Lock()
+
+
+def get_error_seed_factory(types_module: str = DEFAULT_TYPES_MODULE) -> ErrorSeedFactory:
+    factory = _factories.get(types_module)
+    if factory is None:
+        with _factories_lock:
+            factory = _factories.setdefault(types_module, ErrorSeedFactory(types_module))
+    return factory
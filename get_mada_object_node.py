@@ -1,9 +1,12 @@
 import json
 from typing import Optional, Dict, Any
 
-# Assuming mock_lc_core_services are accessible via this path
-# This might need adjustment based on actual lc_python_core structure and PYTHONPATH
-from lc_python_core.services.lc_mem_service import mock_lc_mem_core_get_object
+from .lc_logging import get_logger
+from .mada_bulk import is_missing_object
+from .mada_read_cache import cache_variant, get_mada_read_cache
+from .storage_backends import get_storage_backend
+
+logger = get_logger(__name__)
 
 class GetMadaObjectNode:
     CATEGORY = "LearntCloud/MADA" # New category for MADA related nodes
@@ -18,10 +21,14 @@ class GetMadaObjectNode:
                 "object_uid": ("STRING", {"multiline": False, "default": "urn:crux:uid::example_uid"}),
                 # For now, persona_context is a simple string; future might involve more structured input
                 "requesting_persona_context_json": ("STRING", {"multiline": True, "default": "{}"}), 
+            },
+            "optional": {
+                # Serve the object from the shared read cache (see mada_read_cache); writes through the MADA nodes evict it
+                "use_read_cache": ("BOOLEAN", {"default": True}),
             }
         }
 
-    def get_object(self, object_uid: str, requesting_persona_context_json: str):
+    def get_object(self, object_uid: str, requesting_persona_context_json: str, use_read_cache: bool = True):
         retrieval_status = ""
         mada_object_content_str = ""
 
@@ -32,18 +39,26 @@ class GetMadaObjectNode:
                     persona_context_dict = json.loads(requesting_persona_context_json)
                 except json.JSONDecodeError as e:
                     retrieval_status = f"Error decoding persona_context JSON: {e}"
-                    print(f"GetMadaObjectNode: {retrieval_status}")
+                    logger.error("GetMadaObjectNode: %s", retrieval_status)
                     return (mada_object_content_str, retrieval_status)
             
-            print(f"GetMadaObjectNode: Calling mock_lc_mem_core_get_object for UID: {object_uid}")
+            logger.debug("GetMadaObjectNode: Calling get_object for UID: %s", object_uid)
             
-            # Call the mock service function
+            # Call the storage backend (lc_mem_service unless configured otherwise)
             # mock_lc_mem_core_get_object(object_uid: str, version_hint: Optional[str] = None, requesting_persona_context: Optional[Dict] = None, default_value: Any = None)
-            retrieved_object = mock_lc_mem_core_get_object(
-                object_uid=object_uid,
-                requesting_persona_context=persona_context_dict 
-                # default_value could be set to a specific error indicator if object not in mock_mada_store
-            )
+            def load_object():
+                return get_storage_backend().get_object(
+                    object_uid=object_uid,
+                    requesting_persona_context=persona_context_dict 
+                    # default_value could be set to a specific error indicator if object not in mock_mada_store
+                )
+
+            if use_read_cache:
+                retrieved_object = get_mada_read_cache().get_or_load(
+                    "object", object_uid, load_object, variant=cache_variant(persona_context_dict),
+                    cacheable=lambda obj: not is_missing_object(obj))
+            else:
+                retrieved_object = load_object()
 
             if retrieved_object is not None:
                 # We need to serialize the object to a JSON string for the output
@@ -61,13 +76,13 @@ class GetMadaObjectNode:
                 except TypeError as te:
                     mada_object_content_str = f"Error: Retrieved object for UID {object_uid} is not JSON serializable."
                     retrieval_status = f"Error: Retrieved object for UID {object_uid} is not JSON serializable: {te}"
-                    print(f"GetMadaObjectNode: {retrieval_status}")
+                    logger.error("GetMadaObjectNode: %s", retrieval_status)
             else:
                 retrieval_status = f"Error: No object found for UID {object_uid} (or mock service returned None)."
-                print(f"GetMadaObjectNode: {retrieval_status}")
+                logger.warning("GetMadaObjectNode: %s", retrieval_status)
 
         except Exception as e:
             retrieval_status = f"Exception during get_object: {e}"
-            print(f"GetMadaObjectNode: {retrieval_status}")
+            logger.error("GetMadaObjectNode: %s", retrieval_status)
         
         return (mada_object_content_str, retrieval_status)
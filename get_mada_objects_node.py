@@ -0,0 +1,67 @@
+import json
+from typing import Optional, Dict, Any
+
+from .lc_logging import get_logger
+from .mada_bulk import DEFAULT_GET_WORKERS, get_mada_objects
+from .pipeline_node import split_batch_input
+
+logger = get_logger(__name__)
+
+
+class GetMadaObjectsNode:
+    CATEGORY = "LearntCloud/MADA"
+    RETURN_TYPES = ("STRING", "STRING", "STRING",)
+    RETURN_NAMES = ("mada_objects_json", "missing_uids_json", "retrieval_status",)
+    FUNCTION = "get_objects"
+
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                # One UID per line, or a JSON array of UIDs; duplicates are fetched once
+                "object_uids": ("STRING", {"multiline": True, "default": ""}),
+                "requesting_persona_context_json": ("STRING", {"multiline": True, "default": "{}"}),
+            },
+            "optional": {
+                # Concurrent reads when the service has no batch get call
+                "max_workers": ("INT", {"default": DEFAULT_GET_WORKERS, "min": 1, "max": 64}),
+                # Serve UIDs from the shared read cache (see mada_read_cache); writes through the MADA nodes evict them
+                "use_read_cache": ("BOOLEAN", {"default": True}),
+            }
+        }
+
+    def get_objects(self, object_uids: str, requesting_persona_context_json: str, max_workers: int = DEFAULT_GET_WORKERS,
+                    use_read_cache: bool = True):
+        uids = split_batch_input(object_uids)
+        if not uids:
+            retrieval_status = "Error: No object UIDs provided."
+            logger.error("GetMadaObjectsNode: %s", retrieval_status)
+            return (json.dumps({}), json.dumps([]), retrieval_status)
+
+        try:
+            persona_context_dict: Optional[Dict[str, Any]] = None
+            if requesting_persona_context_json and requesting_persona_context_json.strip():
+                try:
+                    persona_context_dict = json.loads(requesting_persona_context_json)
+                except json.JSONDecodeError as e:
+                    retrieval_status = f"Error decoding persona_context JSON: {e}"
+                    logger.error("GetMadaObjectsNode: %s", retrieval_status)
+                    return (json.dumps({}), json.dumps([]), retrieval_status)
+
+            result = get_mada_objects(uids, persona_context_dict, max_workers, use_read_cache)
+            # One serialization for the whole map; missing UIDs map to null
+            mada_objects_str = json.dumps(result.objects, default=str)
+        except Exception as e:
+            retrieval_status = f"Exception during get_objects: {e}"
+            logger.error("GetMadaObjectsNode: %s", retrieval_status)
+            return (json.dumps({}), json.dumps([]), retrieval_status)
+
+        found = len(result.objects) - len(result.missing)
+        if result.missing:
+            retrieval_status = f"Partial: retrieved {found} of {len(result.objects)} objects; {len(result.missing)} missing."
+            logger.warning("GetMadaObjectsNode: %s", retrieval_status)
+        else:
+            retrieval_status = f"Success: retrieved {found} objects."
+        for uid, error in result.errors.items():
+            logger.error("GetMadaObjectsNode: %s: %s", uid, error)
+        return (mada_objects_str, json.dumps(result.missing), retrieval_status)
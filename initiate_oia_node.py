@@ -1,5 +1,11 @@
 from typing import Optional
-from lc_python_core.sops.meta_sops.sop_oia_cycle_management import initiate_oia_cycle
+
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+initiate_oia_cycle = lazy_import("lc_python_core.sops.meta_sops.sop_oia_cycle_management", "initiate_oia_cycle")
 
 class InitiateOiaNode:
     CATEGORY = "LearntCloud/OIA"
@@ -22,7 +28,7 @@ class InitiateOiaNode:
         effective_prompt = initial_focus_prompt if initial_focus_prompt and initial_focus_prompt.strip() else None
         effective_trace_id = related_trace_id if related_trace_id and related_trace_id.strip() else None
         
-        print(f"InitiateOiaNode: Calling initiate_oia_cycle with name: {effective_name}, prompt: {effective_prompt}, trace: {effective_trace_id}")
+        logger.debug("InitiateOiaNode: Calling initiate_oia_cycle with name: %s, prompt: %s, trace: %s", effective_name, effective_prompt, effective_trace_id)
         oia_cycle_uid = initiate_oia_cycle(
             name=effective_name,
             initial_focus_prompt=effective_prompt,
@@ -31,5 +37,5 @@ class InitiateOiaNode:
         if oia_cycle_uid is None:
             # Raise an exception or return an error tuple to ComfyUI
             raise Exception("Failed to initiate OIA cycle. Check console for errors from lc_python_core.")
-        print(f"InitiateOiaNode: OIA Cycle UID {oia_cycle_uid} initiated.")
+        logger.info("InitiateOiaNode: OIA Cycle UID %s initiated.", oia_cycle_uid)
         return (oia_cycle_uid,)
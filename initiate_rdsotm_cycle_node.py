@@ -1,5 +1,11 @@
 from typing import Optional
-from lc_python_core.sops.meta_sops.sop_rdsotm_management import initiate_rdsotm_cycle
+
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+initiate_rdsotm_cycle = lazy_import("lc_python_core.sops.meta_sops.sop_rdsotm_management", "initiate_rdsotm_cycle")
 
 class InitiateRDSOTMCycleNode:
     CATEGORY = "LearntCloud/RDSOTM"
@@ -18,10 +24,10 @@ class InitiateRDSOTMCycleNode:
     def initiate_cycle(self, cycle_name: Optional[str]=None):
         effective_name = cycle_name if cycle_name and cycle_name.strip() else "Default RDSOTM Cycle"
         
-        print(f"InitiateRDSOTMCycleNode: Calling initiate_rdsotm_cycle with name: {effective_name}")
+        logger.debug("InitiateRDSOTMCycleNode: Calling initiate_rdsotm_cycle with name: %s", effective_name)
         cycle_uid = initiate_rdsotm_cycle(name=effective_name)
 
         if cycle_uid is None:
             raise Exception("Failed to initiate RDSOTM cycle. Check console.")
-        print(f"InitiateRDSOTMCycleNode: RDSOTM Cycle UID {cycle_uid} initiated.")
+        logger.info("InitiateRDSOTMCycleNode: RDSOTM Cycle UID %s initiated.", cycle_uid)
         return (cycle_uid,)
@@ -0,0 +1,260 @@
+"""
+Bulk L1 Startle from a JSON-lines (NDJSON) file.
+
+The file is read one line at a time, so memory use is bounded by the batch
+size rather than the file size. Each non-blank line is one record: either a
+JSON string (the input text) or an object with
+
+    input_text (or text)            required
+    origin_hint                     optional, defaults to the node input
+    attachments_ref                 optional string or list of strings
+    reception_timestamp_utc_iso     optional ISO-8601, defaults to now
+
+which map onto the data_components of the L1 input event exactly as
+LcStartleNode's inputs do (see l1_startle_node.build_startle_input_event).
+
+Usage outside ComfyUI:
+    for batch in iter_startle_jsonl(path, batch_size=500):
+        for record in batch:
+            handle(record.mada_seed)
+"""
+import itertools
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from . import l1_startle_node
+from .content_store import large_input_threshold
+from .error_seeds import get_error_seed_factory
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+_TEXT_KEYS = ("input_text", "text")
+_ATTACHMENT_KEYS = ("attachments_ref", "optional_attachments_ref")
+_TIMESTAMP_KEYS = ("reception_timestamp_utc_iso", "timestamp")
+
+
+class IngestedRecord(NamedTuple):
+    line_number: int
+    mada_seed: Any
+    error: Optional[str] = None
+
+
+def _first(record: Dict[str, Any], keys) -> Any:
+    for key in keys:
+        if record.get(key) is not None:
+            return record[key]
+    return None
+
+
+def record_to_input_event(record: Any, default_origin_hint: str, threshold: int = 0) -> Dict[str, Any]:
+    """
+    Maps one decoded JSON-lines record to a startle_process_py input event.
+    Raises ValueError for records without input text.
+    """
+    if isinstance(record, str):
+        record = {"input_text": record}
+    if not isinstance(record, dict):
+        raise ValueError(f"Record must be a JSON object or string, got {type(record).__name__}")
+    input_text = _first(record, _TEXT_KEYS)
+    if not isinstance(input_text, str):
+        raise ValueError("Record has no input_text string")
+    attachments = _first(record, _ATTACHMENT_KEYS)
+    if isinstance(attachments, list):
+        attachments = "\n".join(str(item) for item in attachments)
+    elif attachments is not None:
+        attachments = str(attachments)
+    timestamp = _first(record, _TIMESTAMP_KEYS)
+    return l1_startle_node.build_startle_input_event(
+        input_text, record.get("origin_hint") or default_origin_hint, attachments,
+        reception_timestamp_utc_iso=str(timestamp) if timestamp is not None else None,
+        large_input_threshold_bytes=threshold,
+    )
+
+
+def _startle_line(line_number: int, line: bytes, default_origin_hint: str, threshold: int) -> IngestedRecord:
+    try:
+        input_event = record_to_input_event(json.loads(line.decode("utf-8")), default_origin_hint, threshold)
+    except ValueError as e: # json.JSONDecodeError and UnicodeDecodeError are ValueErrors
+        error = f"line {line_number}: {e}"
+        seed = get_error_seed_factory().make(
+            1, l1_startle_node._generate_crux_uid_py("jsonl_ingest_error", {"line": line_number}), error,
+            object_fields={"input_origin_L1": default_origin_hint}
+        )
+        return IngestedRecord(line_number, seed, error)
+    # startle_process_py reports its own failures as L1 error seeds
+    mada_seed = l1_startle_node.startle_process_py(input_event)
+    error = None
+    try:
+        error = mada_seed.seed_content.L1_startle_reflex.L1_startle_context.error_details
+    except AttributeError:
+        pass
+    return IngestedRecord(line_number, mada_seed, error)
+
+
+# Where records start, per file version: (path, mtime_ns, size) -> {record index:
+# (byte offset, line number)}. Filled as the node reads its pages, so batch k
+# seeks to where batch k-1 stopped instead of re-reading the file from line 1.
+_MAX_OFFSET_FILES = 32
+_record_offsets: "OrderedDict[Tuple[str, int, int], Dict[int, Tuple[int, int]]]" = OrderedDict()
+_record_offsets_lock = threading.Lock()
+
+
+def _file_key(path: str) -> Tuple[str, int, int]:
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def _cached_offset(key: Tuple[str, int, int], record_index: int) -> Tuple[int, int, int]:
+    # (record index, byte offset, line number) of the nearest known record at or before record_index.
+    with _record_offsets_lock:
+        offsets = _record_offsets.get(key)
+        if not offsets:
+            return 0, 0, 1
+        _record_offsets.move_to_end(key)
+        best = max((index for index in offsets if index <= record_index), default=None)
+        if best is None:
+            return 0, 0, 1
+        offset, line_number = offsets[best]
+        return best, offset, line_number
+
+
+def _remember_offset(key: Tuple[str, int, int], record_index: int, offset: int, line_number: int):
+    with _record_offsets_lock:
+        offsets = _record_offsets.get(key)
+        if offsets is None:
+            offsets = _record_offsets[key] = {}
+            while len(_record_offsets) > _MAX_OFFSET_FILES:
+                _record_offsets.popitem(last=False)
+        offsets[record_index] = (offset, line_number)
+
+
+def _iter_record_lines_at(path: str, offset: int = 0, line_number: int = 1, skip_records: int = 0) -> Iterator[Tuple[int, int, bytes]]:
+    # (byte offset, line number, raw line) for each non-blank line from `offset`,
+    # which must be the start of line `line_number`, after the first `skip_records`.
+    # Lines are decoded per record (_startle_line), so a bad one fails only itself.
+    with open(path, "rb") as f:
+        f.seek(offset)
+        while skip_records > 0:
+            raw = f.readline()
+            if not raw:
+                return
+            if raw.strip():
+                skip_records -= 1
+            offset += len(raw)
+            line_number += 1
+        for raw in f:
+            if raw.strip():
+                yield offset, line_number, raw
+            offset += len(raw)
+            line_number += 1
+
+
+def _iter_record_lines(path: str, skip_records: int = 0) -> Iterator[Tuple[int, bytes]]:
+    # (line number, raw line) for each non-blank line after the first `skip_records`.
+    for _, line_number, line in _iter_record_lines_at(path, skip_records=skip_records):
+        yield line_number, line
+
+
+def _read_page(path: str, first_record: int, count: int) -> List[Tuple[int, int, bytes]]:
+    # Records first_record .. first_record + count - 1 (0-based) as (byte offset,
+    # line number, line), starting from the nearest cached offset, and caches
+    # where the page and the record after it start.
+    key = _file_key(path)
+    known_index, offset, line_number = _cached_offset(key, first_record)
+    page = list(itertools.islice(_iter_record_lines_at(path, offset, line_number, first_record - known_index), count))
+    if page:
+        _remember_offset(key, first_record, page[0][0], page[0][1])
+        if len(page) == count and count > 1:
+            _remember_offset(key, first_record + count - 1, page[-1][0], page[-1][1])
+    return page
+
+
+def iter_startle_jsonl(path: str, batch_size: int = 100, origin_hint: str = "ComfyUI_LcStartleJsonlIngestNode",
+                       large_input_threshold_bytes: Optional[int] = None, skip_records: int = 0) -> Iterator[List[IngestedRecord]]:
+    """
+    Yields lists of up to `batch_size` IngestedRecords (all remaining records
+    in one list if batch_size <= 0). The first `skip_records` records are
+    skipped without being decoded.
+    """
+    l1_startle_node._ensure_imports()
+    threshold = large_input_threshold(large_input_threshold_bytes)
+    batch: List[IngestedRecord] = []
+    for line_number, line in _iter_record_lines(path, skip_records):
+        batch.append(_startle_line(line_number, line, origin_hint, threshold))
+        if 0 < batch_size <= len(batch):
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class LcStartleJsonlIngestNode:
+    CATEGORY = "LearntCloud/EpistemicOSI"
+    RETURN_TYPES = ("MADA_SEED", "STRING", "STRING",)
+    RETURN_NAMES = ("mada_seeds_L1", "trace_ids_json", "ingest_report_json",)
+    FUNCTION = "execute"
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "jsonl_path": ("STRING", {"default": ""}),
+            },
+            "optional": {
+                "origin_hint": ("STRING", {"default": "ComfyUI_LcStartleJsonlIngestNode"}),
+                # Records per run; 0 reads the whole file in one run
+                "batch_size": ("INT", {"default": 100, "min": 0, "max": 1000000}),
+                # Which batch this run emits (records before it are skipped undecoded)
+                "batch_index": ("INT", {"default": 0, "min": 0, "max": 1000000}),
+                "large_input_threshold_bytes": ("INT", {"default": large_input_threshold(), "min": 0, "max": 2**31 - 1}),
+            }
+        }
+
+    @classmethod
+    def IS_CHANGED(cls, jsonl_path: str = "", **kwargs):
+        # Re-run when the file changes, not only when the path does.
+        try:
+            stat = os.stat(jsonl_path)
+        except OSError:
+            return ""
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def execute(self, jsonl_path: str, origin_hint: str = "ComfyUI_LcStartleJsonlIngestNode", batch_size: int = 100,
+                batch_index: int = 0, large_input_threshold_bytes: Optional[int] = None):
+        report: Dict[str, Any] = {"path": jsonl_path, "batch_size": batch_size, "batch_index": batch_index}
+        records: List[IngestedRecord] = []
+        try:
+            l1_startle_node._ensure_imports()
+            threshold = large_input_threshold(large_input_threshold_bytes)
+            if batch_size > 0:
+                # Read one record past the batch to tell whether another batch exists; it is
+                # not processed, but its offset is cached for the run that reads the next batch.
+                lines = _read_page(jsonl_path, batch_size * batch_index, batch_size + 1)
+                report["has_more"] = len(lines) > batch_size
+                lines = [(line_number, line) for _, line_number, line in lines[:batch_size]]
+            else:
+                lines = _iter_record_lines(jsonl_path)
+                report["has_more"] = False
+            for line_number, line in lines:
+                records.append(_startle_line(line_number, line, origin_hint, threshold))
+        except OSError as e:
+            logger.error("LcStartleJsonlIngestNode: Cannot read %s: %s", jsonl_path, e)
+            report["error"] = f"Cannot read {jsonl_path}: {e}"
+            report["has_more"] = False
+
+        errors = [{"line": record.line_number, "error": record.error} for record in records if record.error]
+        report.update({
+            "records": len(records),
+            "failed": len(errors),
+            "errors": errors,
+            "next_batch_index": batch_index + 1 if report["has_more"] else None,
+        })
+        logger.info("LcStartleJsonlIngestNode: %d record(s) from %s, %d failed.", len(records), jsonl_path, len(errors))
+        seeds = [record.mada_seed for record in records]
+        trace_ids = [getattr(seed, "seed_id", None) for seed in seeds]
+        # The seeds list is passed on as a single MADA_SEED value, like the pipeline batch node does.
+        return (seeds, json.dumps(trace_ids), json.dumps(report, indent=2))
@@ -1,222 +1,248 @@
 import json
+import threading
 from typing import Any, Dict, List, Tuple, Optional
-from datetime import datetime # Import datetime directly
+from datetime import datetime, timezone # Import datetime directly
 
+from .content_store import large_input_threshold, text_data_component
+from .error_seeds import get_error_seed_factory, shares_template_containers
+from .lazy_imports import register_preload
+from .lc_logging import get_logger
+from .seed_clone import compile_model_clone
+
+logger = get_logger(__name__)
+
+# The lc_python_core types are imported on first execute (see _ensure_imports
+# below and lazy_imports), not when ComfyUI loads the package.
 # Assuming mada_seed_types.py is in lab.modules.lC.pythonCore
 # Adjust path if ComfyUI's custom node loading requires a different relative path.
 # For development, ensure lC.pythonCore is in PYTHONPATH or use appropriate relative imports.
-try:
-    # Attempting a relative import path suitable for ComfyUI custom nodes
-    # when this node is in a subfolder of custom_nodes
-    from ...lC_pythonCore.mada_seed_types import ( 
-        MadaSeed, RawSignalItem, L1StartleContext, SignalComponentMetadataL1, L1Trace,
-        SeedContent, TraceMetadata, L1StartleReflexContainer,
-        L2FrameTypeContainer, L3SurfaceKeymapContainer, L4AnchorStateContainer,
-        L5FieldStateContainer, L6ReflectionPayloadContainer, L7EncodedApplication,
-        L2FrameTypeObj, L3SurfaceKeymapObj, L4AnchorStateObj, L5FieldStateObj,
-        L6ReflectionPayloadObj, L7EncodedApplication as L7EncodedApplicationObj, # Alias to avoid class name conflict if any
-        L2Trace, L3Trace, L4Trace, L5Trace, L6Trace, L7Trace as L7TraceObj, # Alias for trace
-        SeedQAQC,
-        get_utc_timestamp, generate_crux_uid, PYDANTIC_AVAILABLE
-    )
-except ImportError as e1:
-    print(f"[LcStartleNode] Relative import failed: {e1}. Trying direct import assuming lC_pythonCore is in sys.path.")
-    try:
-        from lc_python_core.mada_seed_types import ( # Direct import, corrected case
-            MadaSeed, RawSignalItem, L1StartleContext, SignalComponentMetadataL1, L1Trace,
-            SeedContent, TraceMetadata, L1StartleReflexContainer,
-            L2FrameTypeContainer, L3SurfaceKeymapContainer, L4AnchorStateContainer,
-            L5FieldStateContainer, L6ReflectionPayloadContainer, L7EncodedApplication,
-            L2FrameTypeObj, L3SurfaceKeymapObj, L4AnchorStateObj, L5FieldStateObj,
-            L6ReflectionPayloadObj, L7EncodedApplication as L7EncodedApplicationObj,
-            L2Trace, L3Trace, L4Trace, L5Trace, L6Trace, L7Trace as L7TraceObj,
-            SeedQAQC,
-            get_utc_timestamp, generate_crux_uid, PYDANTIC_AVAILABLE
-        )
-    except ImportError as e2:
-        print(f"[LcStartleNode] Direct import failed: {e2}. Providing dummy classes.")
-        PYDANTIC_AVAILABLE = False
-        # Define dummy classes for the script to be parsable by ComfyUI if imports fail
-        class MadaSeed:
-            def __init__(self, version=None, seed_id=None, seed_content=None, trace_metadata=None, seed_QA_QC=None, seed_completion_timestamp=None):
-                self.version = version
-                self.seed_id = seed_id
-                self.seed_content = seed_content
-                self.trace_metadata = trace_metadata
-                self.seed_QA_QC = seed_QA_QC
-                self.seed_completion_timestamp = seed_completion_timestamp
-        class RawSignalItem:
-            def __init__(self, raw_input_id=None, raw_input_signal=None):
-                self.raw_input_id = raw_input_id
-                self.raw_input_signal = raw_input_signal
-        class L1StartleContext:
-            def __init__(self, version=None, L1_epistemic_state_of_startle=None, trace_creation_time_L1=None, input_origin_L1=None, signal_components_metadata_L1=None, error_details=None):
-                self.version = version
-                self.L1_epistemic_state_of_startle = L1_epistemic_state_of_startle
-                self.trace_creation_time_L1 = trace_creation_time_L1
-                self.input_origin_L1 = input_origin_L1
-                self.signal_components_metadata_L1 = signal_components_metadata_L1
-                self.error_details = error_details
-        class SignalComponentMetadataL1:
-            def __init__(self, component_role_L1=None, raw_signal_ref_uid_L1=None, encoding_status_L1=None, byte_size_hint_L1=None, media_type_hint_L1=None, error_details=None):
-                self.component_role_L1 = component_role_L1
-                self.raw_signal_ref_uid_L1 = raw_signal_ref_uid_L1
-                self.encoding_status_L1 = encoding_status_L1
-                self.byte_size_hint_L1 = byte_size_hint_L1
-                self.media_type_hint_L1 = media_type_hint_L1
-                self.error_details = error_details # Adding error_details as it's a common field, though not in the immediate failing call
-        class L1Trace:
-            def __init__(self, version_L1_trace_schema=None, sop_name=None, completion_timestamp_L1=None, epistemic_state_L1=None, L1_trace_creation_time_from_context=None, L1_input_origin_from_context=None, L1_signal_component_count=None, L1_generated_trace_id=None, L1_generated_raw_signal_ref_uids_summary=None, L1_applied_policy_refs=None, error_details=None):
-                self.version_L1_trace_schema = version_L1_trace_schema
-                self.sop_name = sop_name
-                self.completion_timestamp_L1 = completion_timestamp_L1
-                self.epistemic_state_L1 = epistemic_state_L1
-                self.L1_trace_creation_time_from_context = L1_trace_creation_time_from_context
-                self.L1_input_origin_from_context = L1_input_origin_from_context
-                self.L1_signal_component_count = L1_signal_component_count
-                self.L1_generated_trace_id = L1_generated_trace_id
-                self.L1_generated_raw_signal_ref_uids_summary = L1_generated_raw_signal_ref_uids_summary
-                self.L1_applied_policy_refs = L1_applied_policy_refs if L1_applied_policy_refs is not None else []
-                self.error_details = error_details
-        class SeedContent:
-            def __init__(self, raw_signals=None, L1_startle_reflex=None):
-                self.raw_signals = raw_signals if raw_signals is not None else []
-                self.L1_startle_reflex = L1_startle_reflex
-        class TraceMetadata:
-            def __init__(self, trace_id=None, L1_trace=None, L2_trace=None, L3_trace=None, L4_trace=None, L5_trace=None, L6_trace=None, L7_trace=None):
-                self.trace_id = trace_id
-                self.L1_trace = L1_trace
-                self.L2_trace = L2_trace
-                self.L3_trace = L3_trace
-                self.L4_trace = L4_trace
-                self.L5_trace = L5_trace
-                self.L6_trace = L6_trace
-                self.L7_trace = L7_trace
-        class L1StartleReflexContainer:
-            def __init__(self, L1_startle_context=None, L2_frame_type=None):
-                self.L1_startle_context = L1_startle_context
-                self.L2_frame_type = L2_frame_type
-        class L2FrameTypeContainer:
-            def __init__(self, L2_frame_type_obj=None, L3_surface_keymap=None):
-                self.L2_frame_type_obj = L2_frame_type_obj
-                self.L3_surface_keymap = L3_surface_keymap
-        class L3SurfaceKeymapContainer:
-            def __init__(self, L3_surface_keymap_obj=None, L4_anchor_state=None):
-                self.L3_surface_keymap_obj = L3_surface_keymap_obj
-                self.L4_anchor_state = L4_anchor_state
-        class L4AnchorStateContainer:
-            def __init__(self, L4_anchor_state_obj=None, L5_field_state=None):
-                self.L4_anchor_state_obj = L4_anchor_state_obj
-                self.L5_field_state = L5_field_state
-        class L5FieldStateContainer:
-            def __init__(self, L5_field_state_obj=None, L6_reflection_payload=None):
-                self.L5_field_state_obj = L5_field_state_obj
-                self.L6_reflection_payload = L6_reflection_payload
-        class L6ReflectionPayloadContainer:
-            def __init__(self, L6_reflection_payload_obj=None, L7_encoded_application=None):
-                self.L6_reflection_payload_obj = L6_reflection_payload_obj
-                self.L7_encoded_application = L7_encoded_application
-        class L7EncodedApplication: 
-            def __init__(self, version=None, description=None, error_details=None):
-                self.version = version
-                self.description = description
-                self.error_details = error_details
-        class L7EncodedApplicationObj:
-            def __init__(self, version=None, description=None, error_details=None):
-                self.version = version
-                self.description = description
-                self.error_details = error_details
-        class L2FrameTypeObj:
-            def __init__(self, version=None, description=None, error_details=None, input_class_L2=None, frame_type_L2=None, temporal_hint_L2=None, communication_context_L2=None, L2_validation_status_of_frame=None, L2_epistemic_state_of_framing=None):
-                self.version = version
-                self.description = description
-                self.error_details = error_details
-                self.input_class_L2 = input_class_L2
-                self.frame_type_L2 = frame_type_L2
-                self.temporal_hint_L2 = temporal_hint_L2
-                self.communication_context_L2 = communication_context_L2
-                self.L2_validation_status_of_frame = L2_validation_status_of_frame
-                self.L2_epistemic_state_of_framing = L2_epistemic_state_of_framing
-        class L3SurfaceKeymapObj:
-            def __init__(self, version=None, description=None, error_details=None):
-                self.version = version
-                self.description = description
-                self.error_details = error_details
-        class L4AnchorStateObj:
-            def __init__(self, version=None, description=None, error_details=None):
-                self.version = version
-                self.description = description
-                self.error_details = error_details
-        class L5FieldStateObj:
-            def __init__(self, version=None, description=None, error_details=None):
-                self.version = version
-                self.description = description
-                self.error_details = error_details
-        class L6ReflectionPayloadObj:
-            def __init__(self, version=None, description=None, error_details=None):
-                self.version = version
-                self.description = description
-                self.error_details = error_details
-        class L2Trace:
-            def __init__(self, version_Lx_trace_schema=None, sop_name=None, completion_timestamp_Lx=None, epistemic_state_Lx=None, error_details=None):
-                self.version_Lx_trace_schema = version_Lx_trace_schema
-                self.sop_name = sop_name
-                self.completion_timestamp_Lx = completion_timestamp_Lx
-                self.epistemic_state_Lx = epistemic_state_Lx
-                self.error_details = error_details
-        class L3Trace:
-            def __init__(self, version_Lx_trace_schema=None, sop_name=None, completion_timestamp_Lx=None, epistemic_state_Lx=None, error_details=None):
-                self.version_Lx_trace_schema = version_Lx_trace_schema
-                self.sop_name = sop_name
-                self.completion_timestamp_Lx = completion_timestamp_Lx
-                self.epistemic_state_Lx = epistemic_state_Lx
-                self.error_details = error_details
-        class L4Trace:
-            def __init__(self, version_Lx_trace_schema=None, sop_name=None, completion_timestamp_Lx=None, epistemic_state_Lx=None, error_details=None):
-                self.version_Lx_trace_schema = version_Lx_trace_schema
-                self.sop_name = sop_name
-                self.completion_timestamp_Lx = completion_timestamp_Lx
-                self.epistemic_state_Lx = epistemic_state_Lx
-                self.error_details = error_details
-        class L5Trace:
-            def __init__(self, version_Lx_trace_schema=None, sop_name=None, completion_timestamp_Lx=None, epistemic_state_Lx=None, error_details=None):
-                self.version_Lx_trace_schema = version_Lx_trace_schema
-                self.sop_name = sop_name
-                self.completion_timestamp_Lx = completion_timestamp_Lx
-                self.epistemic_state_Lx = epistemic_state_Lx
-                self.error_details = error_details
-        class L6Trace:
-            def __init__(self, version_Lx_trace_schema=None, sop_name=None, completion_timestamp_Lx=None, epistemic_state_Lx=None, error_details=None):
-                self.version_Lx_trace_schema = version_Lx_trace_schema
-                self.sop_name = sop_name
-                self.completion_timestamp_Lx = completion_timestamp_Lx
-                self.epistemic_state_Lx = epistemic_state_Lx
-                self.error_details = error_details
-        class L7TraceObj: 
-            def __init__(self, version_Lx_trace_schema=None, sop_name=None, completion_timestamp_Lx=None, epistemic_state_Lx=None, error_details=None):
-                self.version_Lx_trace_schema = version_Lx_trace_schema
-                self.sop_name = sop_name
-                self.completion_timestamp_Lx = completion_timestamp_Lx
-                self.epistemic_state_Lx = epistemic_state_Lx
-                self.error_details = error_details
-        class SeedQAQC:
-            def __init__(self, version_seed_qa_qc_schema=None, overall_seed_integrity_status=None, qa_qc_assessment_timestamp=None, integrity_findings=None, error_details=None):
-                self.version_seed_qa_qc_schema = version_seed_qa_qc_schema
-                self.overall_seed_integrity_status = overall_seed_integrity_status
-                self.qa_qc_assessment_timestamp = qa_qc_assessment_timestamp
-                self.integrity_findings = integrity_findings if integrity_findings is not None else []
-                self.error_details = error_details
-
-        def get_utc_timestamp(): import datetime as dt; return dt.datetime.now(dt.timezone.utc) # Fallback
-        def generate_crux_uid(hint: str = ""): import uuid; return f"dummy_uid::{hint}::{uuid.uuid4().hex}"
+_MADA_SEED_TYPE_NAMES = (
+    "MadaSeed", "RawSignalItem", "L1StartleContext", "SignalComponentMetadataL1", "L1Trace",
+    "SeedContent", "TraceMetadata", "L1StartleReflexContainer",
+    "L2FrameTypeContainer", "L3SurfaceKeymapContainer", "L4AnchorStateContainer",
+    "L5FieldStateContainer", "L6ReflectionPayloadContainer", "L7EncodedApplication",
+    "L2FrameTypeObj", "L3SurfaceKeymapObj", "L4AnchorStateObj", "L5FieldStateObj",
+    "L6ReflectionPayloadObj",
+    "L2Trace", "L3Trace", "L4Trace", "L5Trace", "L6Trace",
+    "SeedQAQC",
+    "get_utc_timestamp", "generate_crux_uid", "PYDANTIC_AVAILABLE",
+)
+# Module-level name -> name in mada_seed_types (aliases avoid class name conflicts)
+_MADA_SEED_TYPE_ALIASES = {"L7EncodedApplicationObj": "L7EncodedApplication", "L7TraceObj": "L7Trace"}
+_imports_resolved = False
+_imports_lock = threading.Lock()
+
+PYDANTIC_AVAILABLE = False
+# Dummy classes, used until _ensure_imports() binds the real lc_python_core types
+# (and kept if those cannot be imported), so the node stays loadable without them.
+class MadaSeed:
+    def __init__(self, version=None, seed_id=None, seed_content=None, trace_metadata=None, seed_QA_QC=None, seed_completion_timestamp=None):
+        self.version = version
+        self.seed_id = seed_id
+        self.seed_content = seed_content
+        self.trace_metadata = trace_metadata
+        self.seed_QA_QC = seed_QA_QC
+        self.seed_completion_timestamp = seed_completion_timestamp
+class RawSignalItem:
+    def __init__(self, raw_input_id=None, raw_input_signal=None):
+        self.raw_input_id = raw_input_id
+        self.raw_input_signal = raw_input_signal
+class L1StartleContext:
+    def __init__(self, version=None, L1_epistemic_state_of_startle=None, trace_creation_time_L1=None, input_origin_L1=None, signal_components_metadata_L1=None, error_details=None):
+        self.version = version
+        self.L1_epistemic_state_of_startle = L1_epistemic_state_of_startle
+        self.trace_creation_time_L1 = trace_creation_time_L1
+        self.input_origin_L1 = input_origin_L1
+        self.signal_components_metadata_L1 = signal_components_metadata_L1
+        self.error_details = error_details
+class SignalComponentMetadataL1:
+    def __init__(self, component_role_L1=None, raw_signal_ref_uid_L1=None, encoding_status_L1=None, byte_size_hint_L1=None, media_type_hint_L1=None, error_details=None):
+        self.component_role_L1 = component_role_L1
+        self.raw_signal_ref_uid_L1 = raw_signal_ref_uid_L1
+        self.encoding_status_L1 = encoding_status_L1
+        self.byte_size_hint_L1 = byte_size_hint_L1
+        self.media_type_hint_L1 = media_type_hint_L1
+        self.error_details = error_details # Adding error_details as it's a common field, though not in the immediate failing call
+class L1Trace:
+    def __init__(self, version_L1_trace_schema=None, sop_name=None, completion_timestamp_L1=None, epistemic_state_L1=None, L1_trace_creation_time_from_context=None, L1_input_origin_from_context=None, L1_signal_component_count=None, L1_generated_trace_id=None, L1_generated_raw_signal_ref_uids_summary=None, L1_applied_policy_refs=None, error_details=None):
+        self.version_L1_trace_schema = version_L1_trace_schema
+        self.sop_name = sop_name
+        self.completion_timestamp_L1 = completion_timestamp_L1
+        self.epistemic_state_L1 = epistemic_state_L1
+        self.L1_trace_creation_time_from_context = L1_trace_creation_time_from_context
+        self.L1_input_origin_from_context = L1_input_origin_from_context
+        self.L1_signal_component_count = L1_signal_component_count
+        self.L1_generated_trace_id = L1_generated_trace_id
+        self.L1_generated_raw_signal_ref_uids_summary = L1_generated_raw_signal_ref_uids_summary
+        self.L1_applied_policy_refs = L1_applied_policy_refs if L1_applied_policy_refs is not None else []
+        self.error_details = error_details
+class SeedContent:
+    def __init__(self, raw_signals=None, L1_startle_reflex=None):
+        self.raw_signals = raw_signals if raw_signals is not None else []
+        self.L1_startle_reflex = L1_startle_reflex
+class TraceMetadata:
+    def __init__(self, trace_id=None, L1_trace=None, L2_trace=None, L3_trace=None, L4_trace=None, L5_trace=None, L6_trace=None, L7_trace=None):
+        self.trace_id = trace_id
+        self.L1_trace = L1_trace
+        self.L2_trace = L2_trace
+        self.L3_trace = L3_trace
+        self.L4_trace = L4_trace
+        self.L5_trace = L5_trace
+        self.L6_trace = L6_trace
+        self.L7_trace = L7_trace
+class L1StartleReflexContainer:
+    def __init__(self, L1_startle_context=None, L2_frame_type=None):
+        self.L1_startle_context = L1_startle_context
+        self.L2_frame_type = L2_frame_type
+class L2FrameTypeContainer:
+    def __init__(self, L2_frame_type_obj=None, L3_surface_keymap=None):
+        self.L2_frame_type_obj = L2_frame_type_obj
+        self.L3_surface_keymap = L3_surface_keymap
+class L3SurfaceKeymapContainer:
+    def __init__(self, L3_surface_keymap_obj=None, L4_anchor_state=None):
+        self.L3_surface_keymap_obj = L3_surface_keymap_obj
+        self.L4_anchor_state = L4_anchor_state
+class L4AnchorStateContainer:
+    def __init__(self, L4_anchor_state_obj=None, L5_field_state=None):
+        self.L4_anchor_state_obj = L4_anchor_state_obj
+        self.L5_field_state = L5_field_state
+class L5FieldStateContainer:
+    def __init__(self, L5_field_state_obj=None, L6_reflection_payload=None):
+        self.L5_field_state_obj = L5_field_state_obj
+        self.L6_reflection_payload = L6_reflection_payload
+class L6ReflectionPayloadContainer:
+    def __init__(self, L6_reflection_payload_obj=None, L7_encoded_application=None):
+        self.L6_reflection_payload_obj = L6_reflection_payload_obj
+        self.L7_encoded_application = L7_encoded_application
+class L7EncodedApplication: 
+    def __init__(self, version=None, description=None, error_details=None):
+        self.version = version
+        self.description = description
+        self.error_details = error_details
+class L7EncodedApplicationObj:
+    def __init__(self, version=None, description=None, error_details=None):
+        self.version = version
+        self.description = description
+        self.error_details = error_details
+class L2FrameTypeObj:
+    def __init__(self, version=None, description=None, error_details=None, input_class_L2=None, frame_type_L2=None, temporal_hint_L2=None, communication_context_L2=None, L2_validation_status_of_frame=None, L2_epistemic_state_of_framing=None):
+        self.version = version
+        self.description = description
+        self.error_details = error_details
+        self.input_class_L2 = input_class_L2
+        self.frame_type_L2 = frame_type_L2
+        self.temporal_hint_L2 = temporal_hint_L2
+        self.communication_context_L2 = communication_context_L2
+        self.L2_validation_status_of_frame = L2_validation_status_of_frame
+        self.L2_epistemic_state_of_framing = L2_epistemic_state_of_framing
+class L3SurfaceKeymapObj:
+    def __init__(self, version=None, description=None, error_details=None):
+        self.version = version
+        self.description = description
+        self.error_details = error_details
+class L4AnchorStateObj:
+    def __init__(self, version=None, description=None, error_details=None):
+        self.version = version
+        self.description = description
+        self.error_details = error_details
+class L5FieldStateObj:
+    def __init__(self, version=None, description=None, error_details=None):
+        self.version = version
+        self.description = description
+        self.error_details = error_details
+class L6ReflectionPayloadObj:
+    def __init__(self, version=None, description=None, error_details=None):
+        self.version = version
+        self.description = description
+        self.error_details = error_details
+class L2Trace:
+    def __init__(self, version_Lx_trace_schema=None, sop_name=None, completion_timestamp_Lx=None, epistemic_state_Lx=None, error_details=None):
+        self.version_Lx_trace_schema = version_Lx_trace_schema
+        self.sop_name = sop_name
+        self.completion_timestamp_Lx = completion_timestamp_Lx
+        self.epistemic_state_Lx = epistemic_state_Lx
+        self.error_details = error_details
+class L3Trace:
+    def __init__(self, version_Lx_trace_schema=None, sop_name=None, completion_timestamp_Lx=None, epistemic_state_Lx=None, error_details=None):
+        self.version_Lx_trace_schema = version_Lx_trace_schema
+        self.sop_name = sop_name
+        self.completion_timestamp_Lx = completion_timestamp_Lx
+        self.epistemic_state_Lx = epistemic_state_Lx
+        self.error_details = error_details
+class L4Trace:
+    def __init__(self, version_Lx_trace_schema=None, sop_name=None, completion_timestamp_Lx=None, epistemic_state_Lx=None, error_details=None):
+        self.version_Lx_trace_schema = version_Lx_trace_schema
+        self.sop_name = sop_name
+        self.completion_timestamp_Lx = completion_timestamp_Lx
+        self.epistemic_state_Lx = epistemic_state_Lx
+        self.error_details = error_details
+class L5Trace:
+    def __init__(self, version_Lx_trace_schema=None, sop_name=None, completion_timestamp_Lx=None, epistemic_state_Lx=None, error_details=None):
+        self.version_Lx_trace_schema = version_Lx_trace_schema
+        self.sop_name = sop_name
+        self.completion_timestamp_Lx = completion_timestamp_Lx
+        self.epistemic_state_Lx = epistemic_state_Lx
+        self.error_details = error_details
+class L6Trace:
+    def __init__(self, version_Lx_trace_schema=None, sop_name=None, completion_timestamp_Lx=None, epistemic_state_Lx=None, error_details=None):
+        self.version_Lx_trace_schema = version_Lx_trace_schema
+        self.sop_name = sop_name
+        self.completion_timestamp_Lx = completion_timestamp_Lx
+        self.epistemic_state_Lx = epistemic_state_Lx
+        self.error_details = error_details
+class L7TraceObj: 
+    def __init__(self, version_Lx_trace_schema=None, sop_name=None, completion_timestamp_Lx=None, epistemic_state_Lx=None, error_details=None):
+        self.version_Lx_trace_schema = version_Lx_trace_schema
+        self.sop_name = sop_name
+        self.completion_timestamp_Lx = completion_timestamp_Lx
+        self.epistemic_state_Lx = epistemic_state_Lx
+        self.error_details = error_details
+class SeedQAQC:
+    def __init__(self, version_seed_qa_qc_schema=None, overall_seed_integrity_status=None, qa_qc_assessment_timestamp=None, integrity_findings=None, error_details=None):
+        self.version_seed_qa_qc_schema = version_seed_qa_qc_schema
+        self.overall_seed_integrity_status = overall_seed_integrity_status
+        self.qa_qc_assessment_timestamp = qa_qc_assessment_timestamp
+        self.integrity_findings = integrity_findings if integrity_findings is not None else []
+        self.error_details = error_details
+
+def get_utc_timestamp(): import datetime as dt; return dt.datetime.now(dt.timezone.utc) # Fallback
+def generate_crux_uid(hint: str = ""): import uuid; return f"dummy_uid::{hint}::{uuid.uuid4().hex}"
+
+
+@register_preload
+def _ensure_imports():
+    global _imports_resolved
+    if _imports_resolved:
+        return
+    with _imports_lock:
+        if _imports_resolved:
+            return
+        types_module = None
+        try:
+            # Attempting a relative import path suitable for ComfyUI custom nodes
+            # when this node is in a subfolder of custom_nodes
+            from ...lC_pythonCore import mada_seed_types as types_module
+        except ImportError as e1:
+            logger.debug("[LcStartleNode] Relative import failed: %s. Trying direct import assuming lC_pythonCore is in sys.path.", e1)
+            try:
+                from lc_python_core import mada_seed_types as types_module # Direct import, corrected case
+            except ImportError as e2:
+                logger.warning("[LcStartleNode] Direct import failed: %s. Providing dummy classes.", e2)
+        if types_module is not None:
+            module_globals = globals()
+            for name in _MADA_SEED_TYPE_NAMES:
+                module_globals[name] = getattr(types_module, name)
+            for alias, name in _MADA_SEED_TYPE_ALIASES.items():
+                module_globals[alias] = getattr(types_module, name)
+        _imports_resolved = True
 
 
 # Helper function to log internal errors (conceptually from SOP)
 def _log_internal_error(helper_name: str, context: Dict[str, Any]):
-    print(f"[LcStartleNode_INTERNAL_ERROR] in {helper_name}: {context}")
+    logger.error("[LcStartleNode_INTERNAL_ERROR] in %s: %s", helper_name, context)
 
 def _log_critical_error(process_name: str, context: Dict[str, Any]):
-    print(f"[LcStartleNode_CRITICAL_ERROR] in {process_name}: {context}")
+    logger.critical("[LcStartleNode_CRITICAL_ERROR] in %s: %s", process_name, context)
 
 # Python version of _generate_crux_uid from SOP (uses imported version)
 def _generate_crux_uid_py(type_hint: str, context_hint: Dict) -> str:
@@ -244,7 +270,7 @@ def _process_input_components_for_startle_py(
     signal_meta_for_L1_context: List[SignalComponentMetadataL1] = []
 
     if not input_data_components or len(input_data_components) == 0:
-        print("[LcStartleNode_WARNING] Helper:_process_input_components_for_startle_py: No data_components found in input_event.")
+        logger.warning("[LcStartleNode_WARNING] Helper:_process_input_components_for_startle_py: No data_components found in input_event.")
         placeholder_comp_uid = _generate_crux_uid_py("raw_signal_placeholder", {"trace_id": trace_id_for_context})
         
         signal_meta_item_args = {
@@ -291,9 +317,10 @@ def _process_input_components_for_startle_py(
             
     return raw_signals_for_madaSeed, signal_meta_for_L1_context
 
-# Python version of _create_initial_madaSeed_shell from SOP
-def _create_initial_madaSeed_shell_py(seed_uid: str, trace_id_val: str, raw_signals_list: List[RawSignalItem]) -> MadaSeed:
-    current_time_placeholder = _get_current_timestamp_utc_py()
+# Python version of _create_initial_madaSeed_shell from SOP (validated path; see
+# _create_initial_madaSeed_shell_py for the cloned fast path)
+def _build_initial_madaSeed_shell_py(seed_uid: str, trace_id_val: str, raw_signals_list: List[RawSignalItem],
+                                     current_time_placeholder: datetime) -> MadaSeed:
 
     l2_frame_obj = L2FrameTypeObj(version="0.1.2", description="L2 Frame Placeholder")
     l3_keymap_obj = L3SurfaceKeymapObj(version="0.1.1", description="L3 Keymap Placeholder")
@@ -348,6 +375,93 @@ def _create_initial_madaSeed_shell_py(seed_uid: str, trace_id_val: str, raw_sign
     }
     return MadaSeed(**mada_seed_args)
 
+# The shell is identical for every seed apart from its IDs, timestamps and raw
+# signals. It is built once per process and kept as a plain dict of the fields
+# the validated path sets explicitly (also the base of error_seeds' shell).
+# That dict is validated once more into a prototype seed, and each seed is a
+# compiled structural clone of the prototype with the per-seed values passed
+# in (see seed_clone): no validation and no per-object constructors per seed,
+# and default_factory fields are still generated per seed. If the prototype
+# holds values that cannot be cloned, each seed is one model_validate() of the
+# template dict instead.
+_shell_template: Optional[Dict[str, Any]] = None
+_shell_clone = None
+_shell_template_ready = False
+_shell_template_lock = threading.Lock()
+
+_SHELL_CLONE_HOLES = {
+    ("seed_id",): "seed_id",
+    ("seed_content", "raw_signals"): "raw_signals",
+    ("seed_content", "L1_startle_reflex", "L1_startle_context", "trace_creation_time_L1"): "created",
+    ("trace_metadata", "trace_id"): "trace_id",
+    ("trace_metadata", "L1_trace", "completion_timestamp_L1"): "created",
+    ("trace_metadata", "L1_trace", "L1_trace_creation_time_from_context"): "created",
+}
+
+
+def _prepare_seed_shell_template():
+    global _shell_template, _shell_clone, _shell_template_ready
+    if _shell_template_ready:
+        return
+    with _shell_template_lock:
+        if _shell_template_ready:
+            return
+        template = None
+        try:
+            if hasattr(MadaSeed, "model_validate"):
+                placeholder_time = datetime(2000, 1, 1, tzinfo=timezone.utc)
+                shell = _build_initial_madaSeed_shell_py("template_seed_uid", "template_trace_id", [], placeholder_time)
+                template = shell.model_dump(exclude_unset=True)
+                prototype = MadaSeed.model_validate(template)
+                try:
+                    _shell_clone = compile_model_clone(prototype, _SHELL_CLONE_HOLES)
+                except (TypeError, ValueError) as e:
+                    logger.debug("[LcStartleNode] Seed shell is not clonable, validating per seed: %s", e)
+                    if shares_template_containers(template, prototype):
+                        # Any-typed fields would alias the template; validate every shell instead
+                        template = None
+        except Exception as e:
+            _log_internal_error("Helper:_get_seed_shell_template", {"error": str(e)})
+            template = None
+        _shell_template = template
+        _shell_template_ready = True
+
+
+def _get_seed_shell_template() -> Optional[Dict[str, Any]]:
+    """
+    The template dict (fields the shell sets explicitly, placeholder IDs and
+    timestamps), or None when the types are the no-Pydantic fallbacks. Shared:
+    callers copy what they change.
+    """
+    _prepare_seed_shell_template()
+    return _shell_template
+
+
+def _create_initial_madaSeed_shell_py(seed_uid: str, trace_id_val: str, raw_signals_list: List[RawSignalItem]) -> MadaSeed:
+    current_time_placeholder = _get_current_timestamp_utc_py()
+    _prepare_seed_shell_template()
+    if _shell_clone is not None:
+        # The raw_signals list (built per call) and its items are used as-is, so large signals are not copied.
+        return _shell_clone(seed_id=seed_uid, raw_signals=raw_signals_list, created=current_time_placeholder, trace_id=trace_id_val)
+    if _shell_template is None:
+        return _build_initial_madaSeed_shell_py(seed_uid, trace_id_val, raw_signals_list, current_time_placeholder)
+    return _validate_initial_madaSeed_shell_py(seed_uid, trace_id_val, raw_signals_list, current_time_placeholder)
+
+
+def _validate_initial_madaSeed_shell_py(seed_uid: str, trace_id_val: str, raw_signals_list: List[RawSignalItem],
+                                        current_time_placeholder: datetime) -> MadaSeed:
+    # One model_validate() of the template with the per-seed values swapped in.
+    # Copy only the dicts on the paths being changed; the rest of the template is
+    # read by model_validate, never modified.
+    template = _shell_template
+    l1_reflex = dict(template["seed_content"]["L1_startle_reflex"])
+    l1_reflex["L1_startle_context"] = dict(l1_reflex["L1_startle_context"], trace_creation_time_L1=current_time_placeholder)
+    seed_content = dict(template["seed_content"], raw_signals=raw_signals_list, L1_startle_reflex=l1_reflex)
+    l1_trace = dict(template["trace_metadata"]["L1_trace"], completion_timestamp_L1=current_time_placeholder,
+                    L1_trace_creation_time_from_context=current_time_placeholder)
+    trace_meta = dict(template["trace_metadata"], trace_id=trace_id_val, L1_trace=l1_trace)
+    return MadaSeed.model_validate(dict(template, seed_id=seed_uid, seed_content=seed_content, trace_metadata=trace_meta))
+
 # Python version of startle_process from SOP
 def startle_process_py(input_event: Dict[str, Any]) -> MadaSeed:
     generated_trace_id = "ERROR_TRACE_ID_AT_STARTLE_INIT" 
@@ -410,13 +524,29 @@ def startle_process_py(input_event: Dict[str, Any]) -> MadaSeed:
         error_details_for_trace = str(critical_process_error)
         
         current_time_init_fail = _get_current_timestamp_utc_py()
-        reception_ts_str_on_error = input_event.get('reception_timestamp_utc_iso', current_time_init_fail.isoformat())
-        if reception_ts_str_on_error.endswith("Z"):
-            trace_creation_on_error_dt = datetime.fromisoformat(reception_ts_str_on_error[:-1] + "+00:00")
-        else:
-            trace_creation_on_error_dt = datetime.fromisoformat(reception_ts_str_on_error)
+        # The timestamp itself may be what failed validation (missing or malformed).
+        reception_ts_str_on_error = input_event.get('reception_timestamp_utc_iso')
+        try:
+            if reception_ts_str_on_error.endswith("Z"):
+                trace_creation_on_error_dt = datetime.fromisoformat(reception_ts_str_on_error[:-1] + "+00:00")
+            else:
+                trace_creation_on_error_dt = datetime.fromisoformat(reception_ts_str_on_error)
+        except (AttributeError, TypeError, ValueError):
+            trace_creation_on_error_dt = current_time_init_fail
 
         raw_signals_on_error = [RawSignalItem(raw_input_id="ERROR_RAW_ID", raw_input_signal="ERROR_RAW_SIGNAL")]
+        error_seed = get_error_seed_factory().make(
+            1, generated_trace_id, error_details_for_obj, raw_signals=raw_signals_on_error,
+            object_fields={"trace_creation_time_L1": trace_creation_on_error_dt, "input_origin_L1": input_event.get('origin_hint')},
+            trace_fields={"completion_timestamp_L1": current_time_init_fail,
+                          "L1_trace_creation_time_from_context": trace_creation_on_error_dt,
+                          "L1_input_origin_from_context": input_event.get('origin_hint'),
+                          "error_details": error_details_for_trace}
+        )
+        if error_seed is not None:
+            return error_seed
+
+        # No Pydantic models: build the error shell from the fallback classes.
         error_seed_shell = _create_initial_madaSeed_shell_py(generated_trace_id, generated_trace_id, raw_signals_on_error)
         
         error_l1_context_args = {
@@ -440,9 +570,41 @@ def startle_process_py(input_event: Dict[str, Any]) -> MadaSeed:
         error_seed_shell.trace_metadata.L1_trace = L1Trace(**error_l1_trace_args)
         return error_seed_shell
 
+def build_startle_input_event(input_text: str, origin_hint: Optional[str], attachments_ref: Optional[str] = None,
+                              reception_timestamp_utc_iso: Optional[str] = None,
+                              large_input_threshold_bytes: int = 0) -> Dict[str, Any]:
+    """
+    The input_event dict startle_process_py expects: the text as the primary
+    data component (out of band above `large_input_threshold_bytes`, see
+    content_store) plus an attachment reference component if one is given.
+    The reception timestamp defaults to now.
+    """
+    if reception_timestamp_utc_iso is None:
+        # The get_utc_timestamp() from mada_seed_types returns a timezone-aware datetime object.
+        # .isoformat() on a timezone-aware object correctly includes timezone information (e.g., +00:00 or Z).
+        reception_timestamp_utc_iso = get_utc_timestamp().isoformat()
+
+    data_components = [text_data_component(input_text, "primary_text_content", "text/plain", large_input_threshold_bytes)]
+    if attachments_ref and attachments_ref.strip():
+        data_components.append({
+            "role_hint": "attachment_reference",
+            "content_handle_placeholder": attachments_ref,
+            "size_hint": None, "type_hint": "text/uri-list" 
+        })
+
+    return {
+        "reception_timestamp_utc_iso": reception_timestamp_utc_iso,
+        "origin_hint": origin_hint,
+        "data_components": data_components
+    }
+
 class LcStartleNode:
-    RETURN_TYPES = ("STRING", "STRING",) 
-    RETURN_NAMES = ("mada_seed_L1", "trace_id",)
+    # The seed is handed downstream as a live object, like L3-L7 do. Workflows
+    # saved before that wired output 0 (then a JSON STRING) into L2's
+    # mada_seed_L1_json input; they rewire to mada_seed_in, or to the
+    # mada_seed_L1_json output with emit_seed_json enabled (see README).
+    RETURN_TYPES = ("MADA_SEED", "STRING", "STRING",) 
+    RETURN_NAMES = ("mada_seed_L1", "trace_id", "mada_seed_L1_json",)
     FUNCTION = "execute"
 
     @classmethod
@@ -454,76 +616,73 @@ class LcStartleNode:
                 "origin_hint": ("STRING", {"default": "ComfyUI_LcStartleNode_Py"}),
                 "optional_attachments_ref": ("STRING", {"default": "", "multiline": True}),
                 "user_id": ("STRING", {"default": "ComfyUI_User"}),
+            },
+            "optional": {
+                # 0 keeps input_text inline in the seed. Larger inputs are stored in
+                # content_store and the seed carries an lc-content: reference.
+                "large_input_threshold_bytes": ("INT", {"default": large_input_threshold(), "min": 0, "max": 2**31 - 1}),
+                # Off by default: fills mada_seed_L1_json for JSON consumers, at the cost of a full dump per run.
+                "emit_seed_json": ("BOOLEAN", {"default": False}),
             }
         }
 
-    def execute(self, input_text: str, origin_hint: str, optional_attachments_ref: str, user_id: str):
-        print("=== [LcStartleNode] execute() PYTHON LOGIC ===")
+    def execute(self, input_text: str, origin_hint: str, optional_attachments_ref: str, user_id: str,
+                large_input_threshold_bytes: Optional[int] = None, emit_seed_json: bool = False):
+        logger.debug("=== [LcStartleNode] execute() PYTHON LOGIC ===")
         try:
-            reception_time_iso = get_utc_timestamp().isoformat()
-            # The get_utc_timestamp() from mada_seed_types returns a timezone-aware datetime object.
-            # .isoformat() on a timezone-aware object correctly includes timezone information (e.g., +00:00 or Z).
-            
-            data_components = [{
-                "role_hint": "primary_text_content",
-                "content_handle_placeholder": input_text,
-                "size_hint": len(input_text.encode("utf-8")) if input_text else 0,
-                "type_hint": "text/plain"
-            }]
-
-            if optional_attachments_ref and optional_attachments_ref.strip():
-                data_components.append({
-                    "role_hint": "attachment_reference",
-                    "content_handle_placeholder": optional_attachments_ref,
-                    "size_hint": None, "type_hint": "text/uri-list" 
-                })
-
-            input_event_dict = {
-                "reception_timestamp_utc_iso": reception_time_iso,
-                "origin_hint": origin_hint,
-                "data_components": data_components
-            }
+            _ensure_imports()
+            input_event_dict = build_startle_input_event(
+                input_text, origin_hint, optional_attachments_ref,
+                large_input_threshold_bytes=large_input_threshold(large_input_threshold_bytes)
+            )
             mada_seed_obj = startle_process_py(input_event_dict)
             
-            mada_seed_json_str = ""
-            final_trace_id = "ERROR_NO_SEED_ID_FALLBACK"
-
-            if mada_seed_obj:
-                final_trace_id = mada_seed_obj.seed_id
-                if PYDANTIC_AVAILABLE and hasattr(mada_seed_obj, 'model_dump_json'):
-                    mada_seed_json_str = mada_seed_obj.model_dump_json(indent=2)
-                else: 
-                    def dt_handler(o):
-                        if isinstance(o, datetime): return o.isoformat()
-                        raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
-                    try:
-                        import dataclasses
-                        if dataclasses.is_dataclass(mada_seed_obj):
-                           dict_obj = dataclasses.asdict(mada_seed_obj)
-                           mada_seed_json_str = json.dumps(dict_obj, default=dt_handler, indent=2)
-                        else: 
-                           mada_seed_json_str = json.dumps({"error": "Object is not a Pydantic model or dataclass"}, indent=2)
-                    except Exception as json_e:
-                        print(f"[LcStartleNode] JSON serialization error: {json_e}")
-                        mada_seed_json_str = f'{{"error": "Failed to serialize MadaSeed: {json_e}", "seed_id": "{final_trace_id}"}}'
-            
-            print(f"[LcStartleNode] Python logic trace_id: {final_trace_id}")
-            return (mada_seed_json_str, final_trace_id)
+            final_trace_id = mada_seed_obj.seed_id if mada_seed_obj else "ERROR_NO_SEED_ID_FALLBACK"
+            logger.debug("[LcStartleNode] Python logic trace_id: %s", final_trace_id)
+            return (mada_seed_obj, final_trace_id, _seed_json_output(mada_seed_obj, final_trace_id) if emit_seed_json else "")
 
         except Exception as e:
-            print(f"[LcStartleNode] ERROR in Python logic execute(): {type(e).__name__}: {e}")
+            logger.error("[LcStartleNode] ERROR in Python logic execute(): %s: %s", type(e).__name__, e)
             _log_critical_error("LcStartleNode.execute", {"error": str(e)})
             # Ensure generate_crux_uid is available for error trace_id
             try: error_trace_id_gen = generate_crux_uid("error_execute")
             except: error_trace_id_gen = "ERROR_UID_GEN_FAILED"
-            
-            error_json = json.dumps({
-                "seed_id": error_trace_id_gen,
-                "error_message": "LcStartleNode execution failed", 
-                "error_details_execute": str(e),
-                "trace_metadata": { "trace_id": error_trace_id_gen, "L1_trace": { "error_details": str(e) } }
-            }, indent=2)
-            return (error_json, error_trace_id_gen)
+            error_seed = _create_execute_error_seed_py(error_trace_id_gen, str(e))
+            return (error_seed, error_trace_id_gen, _seed_json_output(error_seed, error_trace_id_gen) if emit_seed_json else "")
+
+def _seed_json_output(mada_seed_obj: Any, trace_id: str) -> str:
+    # The JSON LcStartleNode emitted before it returned live objects, for L2's mada_seed_L1_json input.
+    try:
+        if hasattr(mada_seed_obj, 'model_dump_json'):
+            return mada_seed_obj.model_dump_json(indent=2)
+        return json.dumps(vars(mada_seed_obj), default=lambda o: o.isoformat() if isinstance(o, datetime) else vars(o), indent=2)
+    except Exception as json_e:
+        logger.error("[LcStartleNode] JSON serialization error: %s", json_e)
+        return json.dumps({"error": f"Failed to serialize MadaSeed: {json_e}", "seed_id": trace_id}, indent=2)
+
+def _create_execute_error_seed_py(trace_id: str, error_details: str) -> Optional[MadaSeed]:
+    # Same shape as the error seed in startle_process_py, for failures outside the SOP.
+    try:
+        error_message = f"LcStartleNode execution failed: {error_details}"
+        error_seed = get_error_seed_factory().make(
+            1, trace_id, error_message, raw_signals=[RawSignalItem(raw_input_id="ERROR_RAW_ID", raw_input_signal="ERROR_RAW_SIGNAL")]
+        )
+        if error_seed is not None:
+            return error_seed
+        error_seed = _create_initial_madaSeed_shell_py(
+            trace_id, trace_id, [RawSignalItem(raw_input_id="ERROR_RAW_ID", raw_input_signal="ERROR_RAW_SIGNAL")]
+        )
+        error_seed.seed_content.L1_startle_reflex.L1_startle_context = L1StartleContext(
+            version="0.1.1", L1_epistemic_state_of_startle="LCL-Failure-Internal_L1",
+            trace_creation_time_L1=_get_current_timestamp_utc_py(),
+            signal_components_metadata_L1=[SignalComponentMetadataL1(
+                component_role_L1="error_placeholder", raw_signal_ref_uid_L1="error_uid", encoding_status_L1="Unknown_L1")],
+            error_details=error_message
+        )
+        return error_seed
+    except Exception as shell_error:
+        _log_critical_error("LcStartleNode._create_execute_error_seed_py", {"error": str(shell_error)})
+        return None
 
 # Standard ComfyUI registration (if file is directly used as a custom node)
 # NODE_CLASS_MAPPINGS = { "LcStartleNode": LcStartleNode }
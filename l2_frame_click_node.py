@@ -1,85 +1,109 @@
 import json
+import threading
+import time
 from typing import Any, Dict, List, Tuple, Optional # Keep standard typing imports
 from datetime import datetime # Keep standard datetime
 
-# Placeholder for actual imports, to be populated correctly by the node's logic
-# This try-except is for runtime resilience if lc_python_core is not perfectly set up.
+from .content_store import with_resolved_content
+from .error_seeds import get_error_seed_factory
+from .lazy_imports import register_preload
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+# lc_python_core is imported on first execute (see _ensure_imports below and
+# lazy_imports), not when ComfyUI loads the package.
 IMPORTS_OK = False
 PYDANTIC_AVAILABLE_L2 = False # Local flag for this node
+_imports_resolved = False
+_imports_lock = threading.Lock()
 
-try:
-    from lc_python_core.mada_seed_types import (
-        MadaSeed, 
-        PYDANTIC_AVAILABLE as CORE_PYDANTIC_AVAILABLE, # Get the flag from the core types
-        L2FrameTypeObj, # Needed for extracting output fields
-        L2EpistemicStateOfFramingEnum # Needed for output state
-    )
-    from lc_python_core.sops.sop_l2_frame_click import frame_click_process
-    IMPORTS_OK = True
-    PYDANTIC_AVAILABLE_L2 = CORE_PYDANTIC_AVAILABLE 
-    print("[LcFrameClickNode] Successfully imported types and SOP from lc_python_core.")
-except ImportError as e:
-    print(f"[LcFrameClickNode] ERROR: Failed to import from lc_python_core: {e!r}. Using dummy classes for LcFrameClickNode.")
-    
-    # Define minimal dummy classes if imports fail, to allow ComfyUI to load the node
-    # These are specific to LcFrameClickNode's direct needs for error reporting / basic structure
-    PYDANTIC_AVAILABLE_L2 = False
-
-    class MadaSeed: # Minimal dummy
-        def __init__(self, seed_id="ERROR_SEED_ID_L2_IMPORT_FAIL", **kwargs):
-            self.seed_id = seed_id
-            # Simulate the nested structure enough for error reporting path in execute to work
-            self.seed_content = type('SeedContent', (object,), {
-                'L1_startle_reflex': type('L1StartleReflex', (object,), {
-                    'L2_frame_type': type('L2FrameTypeContainer', (object,), {
-                        'L2_frame_type_obj': None # Will be set to an error obj
-                    })
+# Minimal dummy classes, used until _ensure_imports() binds the real ones (and
+# kept if lc_python_core cannot be imported), to allow ComfyUI to load the node.
+# These are specific to LcFrameClickNode's direct needs for error reporting / basic structure
+class MadaSeed: # Minimal dummy
+    def __init__(self, seed_id="ERROR_SEED_ID_L2_IMPORT_FAIL", **kwargs):
+        self.seed_id = seed_id
+        # Simulate the nested structure enough for error reporting path in execute to work
+        self.seed_content = type('SeedContent', (object,), {
+            'L1_startle_reflex': type('L1StartleReflex', (object,), {
+                'L2_frame_type': type('L2FrameTypeContainer', (object,), {
+                    'L2_frame_type_obj': None # Will be set to an error obj
                 })
-            })()
-            self.trace_metadata = type('TraceMetadata', (object,), {'L2_trace': None})()
-            self.error_details_L2_node = "LcFrameClickNode failed to import lc_python_core. Check console for specific import error details."
-
-        def model_dump_json(self, indent=None): # match Pydantic method
-            # Crude serialization for the dummy
-            error_obj = {
-                "seed_id": self.seed_id, 
-                "error": "ImportError in LcFrameClickNode",
-                "details": self.error_details_L2_node
-            }
-            if self.seed_content.L1_startle_reflex.L2_frame_type.L2_frame_type_obj:
-                 error_obj["L2_frame_type_obj_error"] = self.seed_content.L1_startle_reflex.L2_frame_type.L2_frame_type_obj.__dict__
-
-            return json.dumps(error_obj, indent=indent)
-
-    class L2FrameTypeObj: # Dummy for L2 object
-        def __init__(self, version="error", frame_type_L2="error", L2_epistemic_state_of_framing="error", error_details="dummy L2FrameTypeObj due to import fail"):
-            self.version = version
-            self.frame_type_L2 = frame_type_L2
-            self.L2_epistemic_state_of_framing = L2_epistemic_state_of_framing
-            self.error_details = error_details
-
-    class L2EpistemicStateOfFramingEnum: # Dummy Enum
-        FRAMED = "Framed_Node_Import_Fail"
-        LCL_CLARIFY_STRUCTURE = "LCL-Clarify-Structure_Node_Import_Fail"
-        LCL_DEFER_STRUCTURE = "LCL-Defer-Structure_Node_Import_Fail"
-        LCL_FAILURE_SIZE_NOISE = "LCL-Failure-SizeNoise_Node_Import_Fail"
-        LCL_FAILURE_AMBIGUOUS_FRAME = "LCL-Failure-AmbiguousFrame_Node_Import_Fail"
-        LCL_FAILURE_MISSING_COMMS_CONTEXT = "LCL-Failure-MissingCommsContext_Node_Import_Fail"
-        LCL_FAILURE_INTERNAL_L2 = "LCL-Failure-Internal_L2_Node_Import_Fail" # Existing one, slightly modified for consistency
-
-    def frame_click_process(mada_seed_input): # Dummy process
-        print("[LcFrameClickNode] Called DUMMY frame_click_process.")
-        # Simulate error population in the dummy MadaSeed
-        if hasattr(mada_seed_input, 'seed_content') and mada_seed_input.seed_content:
-            error_l2_obj = L2FrameTypeObj(
-                error_details=f"Dummy frame_click_process called due to import failure. Original error: {getattr(mada_seed_input, 'error_details_L2_node', 'Unknown import error')}"
-            )
-            mada_seed_input.seed_content.L1_startle_reflex.L2_frame_type.L2_frame_type_obj = error_l2_obj
-        # Ensure it has a seed_id if it's the dummy from this file
-        if not hasattr(mada_seed_input, 'seed_id') or not mada_seed_input.seed_id.startswith("ERROR_SEED_ID"):
-             mada_seed_input.seed_id = "ERROR_SEED_ID_L2_DUMMY_PROCESS"
+            })
+        })()
+        self.trace_metadata = type('TraceMetadata', (object,), {'L2_trace': None})()
+        self.error_details_L2_node = "LcFrameClickNode failed to import lc_python_core. Check console for specific import error details."
+
+    def model_dump_json(self, indent=None): # match Pydantic method
+        # Crude serialization for the dummy
+        error_obj = {
+            "seed_id": self.seed_id, 
+            "error": "ImportError in LcFrameClickNode",
+            "details": self.error_details_L2_node
+        }
+        if self.seed_content.L1_startle_reflex.L2_frame_type.L2_frame_type_obj:
+             error_obj["L2_frame_type_obj_error"] = self.seed_content.L1_startle_reflex.L2_frame_type.L2_frame_type_obj.__dict__
 
-        return mada_seed_input
+        return json.dumps(error_obj, indent=indent)
+
+class L2FrameTypeObj: # Dummy for L2 object
+    def __init__(self, version="error", frame_type_L2="error", L2_epistemic_state_of_framing="error", error_details="dummy L2FrameTypeObj due to import fail"):
+        self.version = version
+        self.frame_type_L2 = frame_type_L2
+        self.L2_epistemic_state_of_framing = L2_epistemic_state_of_framing
+        self.error_details = error_details
+
+class L2EpistemicStateOfFramingEnum: # Dummy Enum
+    FRAMED = "Framed_Node_Import_Fail"
+    LCL_CLARIFY_STRUCTURE = "LCL-Clarify-Structure_Node_Import_Fail"
+    LCL_DEFER_STRUCTURE = "LCL-Defer-Structure_Node_Import_Fail"
+    LCL_FAILURE_SIZE_NOISE = "LCL-Failure-SizeNoise_Node_Import_Fail"
+    LCL_FAILURE_AMBIGUOUS_FRAME = "LCL-Failure-AmbiguousFrame_Node_Import_Fail"
+    LCL_FAILURE_MISSING_COMMS_CONTEXT = "LCL-Failure-MissingCommsContext_Node_Import_Fail"
+    LCL_FAILURE_INTERNAL_L2 = "LCL-Failure-Internal_L2_Node_Import_Fail" # Existing one, slightly modified for consistency
+
+def generate_crux_uid(hint: str = ""): import uuid; return f"dummy_uid::{hint}::{uuid.uuid4().hex}"
+
+def frame_click_process(mada_seed_input): # Dummy process
+    logger.warning("[LcFrameClickNode] Called DUMMY frame_click_process.")
+    # Simulate error population in the dummy MadaSeed
+    if hasattr(mada_seed_input, 'seed_content') and mada_seed_input.seed_content:
+        error_l2_obj = L2FrameTypeObj(
+            error_details=f"Dummy frame_click_process called due to import failure. Original error: {getattr(mada_seed_input, 'error_details_L2_node', 'Unknown import error')}"
+        )
+        mada_seed_input.seed_content.L1_startle_reflex.L2_frame_type.L2_frame_type_obj = error_l2_obj
+    # Ensure it has a seed_id if it's the dummy from this file
+    if not hasattr(mada_seed_input, 'seed_id') or not mada_seed_input.seed_id.startswith("ERROR_SEED_ID"):
+         mada_seed_input.seed_id = "ERROR_SEED_ID_L2_DUMMY_PROCESS"
+
+    return mada_seed_input
+
+
+@register_preload
+def _ensure_imports():
+    global _imports_resolved, IMPORTS_OK, PYDANTIC_AVAILABLE_L2
+    global MadaSeed, L2FrameTypeObj, L2EpistemicStateOfFramingEnum, generate_crux_uid, frame_click_process
+    if _imports_resolved:
+        return
+    with _imports_lock:
+        if _imports_resolved:
+            return
+        try:
+            from lc_python_core.mada_seed_types import (
+                MadaSeed,
+                PYDANTIC_AVAILABLE as CORE_PYDANTIC_AVAILABLE, # Get the flag from the core types
+                L2FrameTypeObj, # Needed for extracting output fields
+                L2EpistemicStateOfFramingEnum, # Needed for output state
+                generate_crux_uid # For error trace IDs
+            )
+            from lc_python_core.sops.sop_l2_frame_click import frame_click_process
+            IMPORTS_OK = True
+            PYDANTIC_AVAILABLE_L2 = CORE_PYDANTIC_AVAILABLE
+            logger.debug("[LcFrameClickNode] Successfully imported types and SOP from lc_python_core.")
+        except ImportError as e:
+            logger.error("[LcFrameClickNode] ERROR: Failed to import from lc_python_core: %r. Using dummy classes for LcFrameClickNode.", e)
+        _imports_resolved = True
 
 class LcFrameClickNode:
     NODE_NAME = "LcFrameClickNode"
@@ -88,22 +112,33 @@ class LcFrameClickNode:
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "mada_seed_L1_json": ("STRING", {"default": "{}", "multiline": True, "dynamicPrompts": False}),
                 "trace_id_L1": ("STRING", {"default": "N/A", "dynamicPrompts": False}),
+            },
+            "optional": {
+                # Live MadaSeed object from LcStartleNode (preferred; no serialization on the edge)
+                "mada_seed_in": ("MADA_SEED",),
+                # Compatibility input for workflows that still pass the L1 seed as JSON.
+                # Only used when mada_seed_in is not connected.
+                "mada_seed_L1_json": ("STRING", {"default": "{}", "multiline": True, "dynamicPrompts": False}),
+                # Off by default: measuring the savings costs the round trip it reports.
+                "measure_transfer_savings": ("BOOLEAN", {"default": False}),
             }
         }
 
-    RETURN_TYPES = ("STRING", "STRING", "STRING", "STRING",)
-    RETURN_NAMES = ("mada_seed_L2", "trace_id", "l2_frame_type", "l2_epistemic_state",)
+    RETURN_TYPES = ("MADA_SEED", "STRING", "STRING", "STRING", "STRING",)
+    RETURN_NAMES = ("mada_seed_L2", "trace_id", "l2_frame_type", "l2_epistemic_state", "l2_transfer_metadata_json",)
     FUNCTION = "execute"
     CATEGORY = "learnt.cloud/Epistemic"
 
-    def execute(self, mada_seed_L1_json: str, trace_id_L1: str):
-        print(f"=== [{self.NODE_NAME}] execute() PYTHON LOGIC ===")
-        
+    def execute(self, trace_id_L1: str, mada_seed_in: Optional[Any] = None, mada_seed_L1_json: str = "{}",
+                measure_transfer_savings: bool = False):
+        logger.debug("=== [%s] execute() PYTHON LOGIC ===", self.NODE_NAME)
+        _ensure_imports()
+
         current_trace_id = trace_id_L1 if trace_id_L1 != "N/A" else "UNKNOWN_TRACE_AT_L2_EXEC_START"
         current_mada_seed_obj = None
         error_prefix = f"[{self.NODE_NAME}] ERROR:"
+        transfer_meta: Dict[str, Any] = {"input_mode": "object" if mada_seed_in is not None else "json"}
 
         if not IMPORTS_OK:
             # Imports failed during node loading, use dummy MadaSeed to report this
@@ -126,31 +161,51 @@ class LcFrameClickNode:
             except AttributeError: # If even the dummy structure is not as expected
                 pass
 
-            output_json = current_mada_seed_obj.model_dump_json(indent=2)
-            print(f"{error_prefix} Critical import failure for lc_python_core. Node cannot operate correctly.")
-            return (output_json, current_mada_seed_obj.seed_id, l2_frame_type_str, l2_epistemic_state_str)
+            logger.error("%s Critical import failure for lc_python_core. Node cannot operate correctly.", error_prefix)
+            return (current_mada_seed_obj, current_mada_seed_obj.seed_id, l2_frame_type_str, l2_epistemic_state_str, json.dumps(transfer_meta))
+
+        if mada_seed_in is not None:
+            # Live object from L1: no parse/validate step.
+            current_mada_seed_obj = mada_seed_in
+            current_trace_id = getattr(mada_seed_in, "seed_id", current_trace_id)
+            if PYDANTIC_AVAILABLE_L2 and not isinstance(mada_seed_in, MadaSeed) and hasattr(mada_seed_in, 'model_dump'):
+                # A seed built from another MadaSeed model class; revalidate it instead of failing.
+                try:
+                    current_mada_seed_obj = MadaSeed.model_validate(mada_seed_in.model_dump())
+                    transfer_meta["input_mode"] = "object_revalidated"
+                except Exception as e_revalidate:
+                    logger.error("%s Revalidating mada_seed_in failed: %r", error_prefix, e_revalidate)
+            if measure_transfer_savings:
+                transfer_meta.update(self._measure_json_input_cost(mada_seed_in))
 
         try:
-            if not mada_seed_L1_json or mada_seed_L1_json.strip() == "{}":
-                print(f"{error_prefix} Empty or default mada_seed_L1_json received.")
+            if current_mada_seed_obj is None and (not mada_seed_L1_json or mada_seed_L1_json.strip() in ("", "{}")):
+                # Also what a workflow saved before L1 returned MADA_SEED gets once rewired
+                # to L1's mada_seed_L1_json output with emit_seed_json left off.
+                logger.error("%s No mada_seed_in connected and empty or default mada_seed_L1_json received "
+                             "(connect L1's mada_seed_L1 to mada_seed_in, or enable emit_seed_json on L1).", error_prefix)
                 # This shouldn't happen if L1 is working. Create an error MadaSeed.
+                transfer_meta["input_mode"] = "none"
                 current_trace_id = trace_id_L1 if trace_id_L1 != "N/A" else self._generate_error_uid_l2("EMPTY_INPUT")
                 current_mada_seed_obj = self._create_error_mada_seed_l2(
                     current_trace_id, "Received empty MadaSeed JSON from L1", L2EpistemicStateOfFramingEnum.LCL_FAILURE_INTERNAL_L2
                 )
-                # Fall through to serialization and return
+                # Fall through to the SOP call and return
 
-            if current_mada_seed_obj is None: # If not set by the empty JSON case above
+            if current_mada_seed_obj is None: # JSON compatibility path
+                decode_start = time.perf_counter()
+                transfer_meta["input_json_bytes"] = len(mada_seed_L1_json.encode("utf-8"))
                 data_L1 = json.loads(mada_seed_L1_json)
                 if PYDANTIC_AVAILABLE_L2: # True if from lc_python_core.mada_seed_types, Pydantic V2 is available
                     current_mada_seed_obj = MadaSeed.model_validate(data_L1)
                     current_trace_id = current_mada_seed_obj.seed_id # Get the actual trace_id
+                    transfer_meta["input_decode_seconds"] = time.perf_counter() - decode_start
                 else:
                     # This case implies mada_seed_types.py set its PYDANTIC_AVAILABLE to False
                     # (meaning Pydantic library itself failed to import there).
                     # The object from L1 would be a dict/dataclass, not matching our Pydantic MadaSeed.
                     # This is a severe issue with the lc_python_core setup.
-                    print(f"{error_prefix} lc_python_core.mada_seed_types.PYDANTIC_AVAILABLE is False. Cannot process with Pydantic models.")
+                    logger.error("%s lc_python_core.mada_seed_types.PYDANTIC_AVAILABLE is False. Cannot process with Pydantic models.", error_prefix)
                     current_trace_id = data_L1.get("seed_id", current_trace_id)
                     current_mada_seed_obj = self._create_error_mada_seed_l2(
                         current_trace_id, 
@@ -160,13 +215,13 @@ class LcFrameClickNode:
                     # Fall through
 
         except json.JSONDecodeError as e_deserialize:
-            print(f"{error_prefix} Deserializing MadaSeed from L1 failed: {e_deserialize!r}")
+            logger.error("%s Deserializing MadaSeed from L1 failed: %r", error_prefix, e_deserialize)
             current_trace_id = trace_id_L1 if trace_id_L1 != "N/A" else self._generate_error_uid_l2("DESERIALIZE_FAIL")
             current_mada_seed_obj = self._create_error_mada_seed_l2(
                 current_trace_id, f"JSON Deserialization error in L2: {e_deserialize!r}", L2EpistemicStateOfFramingEnum.LCL_FAILURE_INTERNAL_L2
             )
         except Exception as e_validate: # Catches Pydantic's ValidationError if model_validate fails
-            print(f"{error_prefix} Validating MadaSeed from L1 failed: {e_validate!r}")
+            logger.error("%s Validating MadaSeed from L1 failed: %r", error_prefix, e_validate)
             current_trace_id = trace_id_L1 if trace_id_L1 != "N/A" else self._generate_error_uid_l2("VALIDATE_FAIL")
             # Try to get seed_id from the raw JSON if validation fails partway
             try:
@@ -182,7 +237,7 @@ class LcFrameClickNode:
         if not isinstance(current_mada_seed_obj, MadaSeed):
              # This can happen if PYDANTIC_AVAILABLE_L2 was false and data_L1 was not directly usable
              # by the dummy MadaSeed constructor, or if an error path above failed to set it.
-            print(f"{error_prefix} MadaSeed object is not of expected type after L1 processing. Type: {type(current_mada_seed_obj)}")
+            logger.error("%s MadaSeed object is not of expected type after L1 processing. Type: %s", error_prefix, type(current_mada_seed_obj))
             current_trace_id = trace_id_L1 if trace_id_L1 != "N/A" else self._generate_error_uid_l2("TYPE_ERROR_POST_L1")
             current_mada_seed_obj = self._create_error_mada_seed_l2(
                 current_trace_id, 
@@ -192,28 +247,15 @@ class LcFrameClickNode:
 
         # Call the L2 SOP processing function
         try:
-            mada_seed_obj_L2 = frame_click_process(current_mada_seed_obj)
+            # Hands the SOP the text behind any lc-content: reference from L1
+            mada_seed_obj_L2 = with_resolved_content(current_mada_seed_obj, frame_click_process, current_mada_seed_obj)
         except Exception as e_sop:
-            print(f"{error_prefix} L2 SOP 'frame_click_process' failed: {e_sop!r}")
-            # Populate L2 error details into the existing mada_seed_obj_L1 (now current_mada_seed_obj)
-            if hasattr(current_mada_seed_obj, 'seed_content'): # Should exist even for dummy
-                 l2_error_obj = L2FrameTypeObj( # Use our (potentially dummy) L2FrameTypeObj
-                    version="0.1.2", # From schema
-                    L2_epistemic_state_of_framing=L2EpistemicStateOfFramingEnum.LCL_FAILURE_INTERNAL_L2, # This will use the real Enum if IMPORTS_OK else dummy
-                    error_details=f"L2 SOP frame_click_process failed: {e_sop!r}"
-                )
-                 current_mada_seed_obj.seed_content.L1_startle_reflex.L2_frame_type.L2_frame_type_obj = l2_error_obj
-            # Also update L2 trace with error
-            if hasattr(current_mada_seed_obj, 'trace_metadata'):
-                from lc_python_core.mada_seed_types import L2Trace # Assuming IMPORTS_OK for this path
-                from datetime import timezone # Ensure timezone is available
-                current_mada_seed_obj.trace_metadata.L2_trace = L2Trace(
-                    version_L2_trace_schema="0.1.0", 
-                    sop_name="lC.SOP.frame_click",
-                    completion_timestamp_L2=datetime.now(timezone.utc),
-                    epistemic_state_L2=L2EpistemicStateOfFramingEnum.LCL_FAILURE_INTERNAL_L2, # This will use the real Enum if IMPORTS_OK else dummy
-                    error_detail=f"L2 SOP frame_click_process failed: {e_sop!r}"
-                )
+            logger.error("%s L2 SOP 'frame_click_process' failed: %r", error_prefix, e_sop)
+            # Record the L2 failure on the existing seed (object and trace)
+            get_error_seed_factory().attach(
+                current_mada_seed_obj, 2, f"L2 SOP frame_click_process failed: {e_sop!r}",
+                state=L2EpistemicStateOfFramingEnum.LCL_FAILURE_INTERNAL_L2
+            )
             mada_seed_obj_L2 = current_mada_seed_obj # Return the seed with error info
 
         # Extract outputs
@@ -227,134 +269,84 @@ class LcFrameClickNode:
                 l2_frame_type_str = str(getattr(l2_frame_obj, 'frame_type_L2', "N/A_FT"))
                 l2_epistemic_state_str = str(getattr(l2_frame_obj, 'L2_epistemic_state_of_framing', "N/A_ES"))
         except AttributeError:
-            print(f"{error_prefix} Could not extract L2 frame_type or epistemic_state from MadaSeed. Structure might be incorrect.")
+            logger.warning("%s Could not extract L2 frame_type or epistemic_state from MadaSeed. Structure might be incorrect.", error_prefix)
             # l2_frame_type_str and l2_epistemic_state_str will remain "N/A" or their last set value
 
-        # Serialize the MadaSeed L2 object back to JSON string
-        output_mada_seed_json = "{}"
+        if measure_transfer_savings and PYDANTIC_AVAILABLE_L2 and hasattr(mada_seed_obj_L2, 'model_dump_json'):
+            # What the old STRING output would have cost (indent=2, exclude_none=True).
+            dump_start = time.perf_counter()
+            output_json_bytes = len(mada_seed_obj_L2.model_dump_json(indent=2, exclude_none=True).encode("utf-8"))
+            transfer_meta["avoided_output_json_bytes"] = output_json_bytes
+            transfer_meta["avoided_output_serialize_seconds"] = time.perf_counter() - dump_start
+        if measure_transfer_savings:
+            transfer_meta["avoided_bytes_total"] = transfer_meta.get("avoided_input_json_bytes", 0) + transfer_meta.get("avoided_output_json_bytes", 0)
+            transfer_meta["avoided_seconds_total"] = (transfer_meta.get("avoided_input_serialize_seconds", 0.0)
+                                                      + transfer_meta.get("avoided_input_decode_seconds", 0.0)
+                                                      + transfer_meta.get("avoided_output_serialize_seconds", 0.0))
+
+        logger.debug("=== [%s] End of execute(). Trace ID: %s ===", self.NODE_NAME, final_trace_id)
+        return (mada_seed_obj_L2, final_trace_id, l2_frame_type_str, l2_epistemic_state_str, json.dumps(transfer_meta))
+
+    def _measure_json_input_cost(self, mada_seed_in: Any) -> Dict[str, Any]:
+        # Replays the old L1 -> L2 edge (dump with indent=2, json.loads, model_validate)
+        # on the live seed so the avoided cost can be reported. The result is discarded.
+        if not (PYDANTIC_AVAILABLE_L2 and hasattr(mada_seed_in, 'model_dump_json')):
+            return {}
         try:
-            # Check if the object is a Pydantic model and PYDANTIC_AVAILABLE_L2 was true
-            is_real_pydantic_model = PYDANTIC_AVAILABLE_L2 and hasattr(mada_seed_obj_L2, 'model_dump_json')
-            
-            if is_real_pydantic_model:
-                output_mada_seed_json = mada_seed_obj_L2.model_dump_json(indent=2, exclude_none=True)
-            else: # Fallback for dummy objects or if Pydantic failed within mada_seed_types
-                # This uses the custom serializer or __dict__ approach for our simple dummy classes
-                def fallback_serializer_l2(obj):
-                    if isinstance(obj, datetime):
-                        return obj.isoformat()
-                    if hasattr(obj, 'name') and callable(obj.name): # For Enums in dummy objects
-                        return obj.name 
-                    if hasattr(obj, '__dict__'):
-                        return obj.__dict__
-                    try:
-                        return str(obj) 
-                    except:
-                        raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable in L2 fallback")
-                output_mada_seed_json = json.dumps(mada_seed_obj_L2, default=fallback_serializer_l2, indent=2)
-
-        except TypeError as te:
-            print(f"{error_prefix} Serializing MadaSeed L2 (TypeError): {te!r}")
-            output_mada_seed_json = json.dumps({"error": f"TypeError during MadaSeed L2 serialization: {te!r}", "seed_id": final_trace_id}, indent=2)
-        except Exception as e_serialize:
-            print(f"{error_prefix} Serializing MadaSeed L2 failed: {e_serialize!r}")
-            output_mada_seed_json = json.dumps({"error": f"Failed to serialize MadaSeed L2: {e_serialize!r}", "seed_id": final_trace_id}, indent=2)
-
-        print(f"=== [{self.NODE_NAME}] End of execute(). Trace ID: {final_trace_id} ===")
-        return (output_mada_seed_json, final_trace_id, l2_frame_type_str, l2_epistemic_state_str)
+            dump_start = time.perf_counter()
+            seed_json = mada_seed_in.model_dump_json(indent=2)
+            decode_start = time.perf_counter()
+            MadaSeed.model_validate(json.loads(seed_json))
+            decode_end = time.perf_counter()
+        except Exception as e_measure:
+            logger.warning("[%s] Could not measure JSON transfer cost: %r", self.NODE_NAME, e_measure)
+            return {}
+        return {
+            "avoided_input_json_bytes": len(seed_json.encode("utf-8")),
+            "avoided_input_serialize_seconds": decode_start - dump_start,
+            "avoided_input_decode_seconds": decode_end - decode_start,
+        }
 
     # Helper to create an error MadaSeed object using the node's MadaSeed class (real or dummy)
     def _create_error_mada_seed_l2(self, trace_id: str, error_message: str, l2_state: Any) -> MadaSeed:
-        # Uses the MadaSeed class available in the node's scope (could be dummy or real)
-        # This is a simplified error seed, focusing on L2.
-        # A more robust version would try to use the real Pydantic models if IMPORTS_OK is True.
-        
-        # Use the L2FrameTypeObj and L2EpistemicStateOfFramingEnum available in this scope
-        # (which could be dummies if IMPORTS_OK is False)
-        
-        # If IMPORTS_OK is False, l2_state might be a string from the dummy enum.
-        # If IMPORTS_OK is True, l2_state should be an actual Enum member.
-        # The L2FrameTypeObj constructor (real or dummy) should handle this.
-        # The dummy L2FrameTypeObj takes a string for L2_epistemic_state_of_framing.
-        # The real L2FrameTypeObj (Pydantic) can take an Enum member.
+        # With lc_python_core available, error seeds come from the shared factory
+        # (error_seeds), which caches the types and the seed template. Otherwise the
+        # dummy MadaSeed defined in this file carries the error.
+        if IMPORTS_OK:
+            error_seed = get_error_seed_factory().make(2, trace_id, error_message, state=l2_state)
+            if error_seed is not None:
+                return error_seed
+
+        # If IMPORTS_OK is False, l2_state is a string from the dummy enum, which the
+        # dummy L2FrameTypeObj accepts.
         error_l2_obj = L2FrameTypeObj(
             version="0.1.2", 
             L2_epistemic_state_of_framing=l2_state, # Pass Enum member or string
             error_details=error_message
         )
-        
-        # Create a basic MadaSeed structure for error reporting
-        # This structure needs to be compatible with what frame_click_process expects
-        # or how the dummy MadaSeed is defined if imports failed.
-        
-        if IMPORTS_OK: # Use real Pydantic models if they were imported
-            from lc_python_core.mada_seed_types import (
-                SeedContent, L1StartleReflexContainer, L2FrameTypeContainer, 
-                TraceMetadata, L1Trace, L2Trace, SeedQAQC
-            )
-            from datetime import timezone # Ensure timezone is available
-            # Create a somewhat valid shell for error reporting
-            error_seed = MadaSeed(
-                version="0.3.0",
-                seed_id=trace_id,
-                seed_content=SeedContent(
-                    raw_signals=[], # Empty for L2 error
-                    L1_startle_reflex=L1StartleReflexContainer(
-                        L1_startle_context=None, # L1 context might be missing or invalid
-                        L2_frame_type=L2FrameTypeContainer(
-                            L2_frame_type_obj=error_l2_obj,
-                            L3_surface_keymap=None # Placeholder
-                        )
-                    )
-                ),
-                trace_metadata=TraceMetadata(
-                    trace_id=trace_id,
-                    L1_trace=None, # Placeholder
-                    L2_trace=L2Trace( # Ensure this is the Pydantic L2Trace model
-                        version_Lx_trace_schema="0.1.0", # Correct field name from PlaceholderTraceObj
-                        sop_name="lC.SOP.frame_click", # Correctly overridden in L2Trace model
-                        completion_timestamp_Lx=datetime.now(timezone.utc), # Correct field name from PlaceholderTraceObj
-                        epistemic_state_Lx=l2_state.value if hasattr(l2_state, 'value') else str(l2_state), # Use .value for Enum
-                        error_details=error_message # Correct field name from PlaceholderTraceObj
-                        # Add any other L2Trace specific fields with defaults if needed.
-                        # Based on sop_l2_frame_click.py, other fields like L2_input_class_determined_in_trace etc.
-                        # are typically not populated in this minimal error trace, which is acceptable.
-                    )
-                    # Other traces can be default/None
-                ),
-                seed_QA_QC=SeedQAQC(), # Default
-                seed_completion_timestamp=datetime.now(timezone.utc)
-            )
-        else: # IMPORTS_OK is False, use the dummy MadaSeed defined in this file
-            error_seed = MadaSeed(seed_id=trace_id)
-            error_seed.error_details_L2_node = getattr(error_seed, 'error_details_L2_node', '') + f" | L2 Error: {error_message}"
-            # Populate the nested dummy structure for L2 error object
-            error_seed.seed_content.L1_startle_reflex.L2_frame_type.L2_frame_type_obj = error_l2_obj
-            # Minimal L2 trace for dummy
-            # Cannot import L2Trace here if IMPORTS_OK is false.
-            # The dummy MadaSeed has trace_metadata.L2_trace = None initially.
-            # We can create a simple object/dict here if needed for the dummy model_dump_json
-            dummy_l2_trace_dict = {
-                "version_Lx_trace_schema": "0.1.0_dummy", # Consistent field name
-                "sop_name": "lC.SOP.frame_click_dummy",
-                "completion_timestamp_Lx": datetime.now().isoformat(), # Consistent field name
-                "epistemic_state_Lx": str(l2_state.value if hasattr(l2_state, 'value') else l2_state), # Consistent field name
-                "error_details": error_message # Consistent field name
-            }
-            if hasattr(error_seed, 'trace_metadata'):
-                 error_seed.trace_metadata.L2_trace = type('DummyL2Trace', (object,), dummy_l2_trace_dict)()
-
+        error_seed = MadaSeed(seed_id=trace_id)
+        error_seed.error_details_L2_node = getattr(error_seed, 'error_details_L2_node', '') + f" | L2 Error: {error_message}"
+        # Populate the nested dummy structure for L2 error object
+        error_seed.seed_content.L1_startle_reflex.L2_frame_type.L2_frame_type_obj = error_l2_obj
+        # Minimal L2 trace for dummy
+        # Cannot import L2Trace here if IMPORTS_OK is false.
+        # The dummy MadaSeed has trace_metadata.L2_trace = None initially.
+        # We can create a simple object/dict here if needed for the dummy model_dump_json
+        dummy_l2_trace_dict = {
+            "version_Lx_trace_schema": "0.1.0_dummy", # Consistent field name
+            "sop_name": "lC.SOP.frame_click_dummy",
+            "completion_timestamp_Lx": datetime.now().isoformat(), # Consistent field name
+            "epistemic_state_Lx": str(l2_state.value if hasattr(l2_state, 'value') else l2_state), # Consistent field name
+            "error_details": error_message # Consistent field name
+        }
+        if hasattr(error_seed, 'trace_metadata'):
+             error_seed.trace_metadata.L2_trace = type('DummyL2Trace', (object,), dummy_l2_trace_dict)()
 
         return error_seed
 
     def _generate_error_uid_l2(self, hint: str) -> str:
-        # Uses the generate_crux_uid available in this scope (could be dummy or real)
-        if IMPORTS_OK:
-            from lc_python_core.mada_seed_types import generate_crux_uid as real_gen_uid
-            return real_gen_uid(f"L2_Node_Error_{hint}")
-        else: # Fallback to node's dummy if main one not available
-            import uuid
-            return f"dummy_uid::L2_Node_Error_{hint}::{uuid.uuid4().hex}"
+        # Bound by _ensure_imports(); the module's dummy if lc_python_core is unavailable
+        return generate_crux_uid(f"L2_Node_Error_{hint}")
 
 NODE_CLASS_MAPPINGS = {
     "LcFrameClickNode": LcFrameClickNode
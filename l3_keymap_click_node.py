@@ -1,6 +1,14 @@
-import asyncio # Added to run the async keymap_click_process
-from lc_python_core.sops.sop_l3_keymap_click import keymap_click_process
-from lc_python_core.schemas.mada_schema import MadaSeed # For type hinting
+from typing import Any, List
+
+from .async_runner import resolve_awaitable, resolve_awaitables
+from .content_store import with_resolved_content
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+keymap_click_process = lazy_import("lc_python_core.sops.sop_l3_keymap_click", "keymap_click_process")
+MadaSeed = lazy_import("lc_python_core.schemas.mada_schema", "MadaSeed")
 
 class LcKeymapClickNode:
     CATEGORY = "LearntCloud/EpistemicOSI"
@@ -13,16 +21,43 @@ class LcKeymapClickNode:
         return {
             "required": {
                 "mada_seed_in": ("MADA_SEED",), # Input is the MadaSeed object from L2
+            },
+            "optional": {
+                # 0 uses the package default (LC_EPISTEMIC_ASYNC_TIMEOUT, unset means no limit)
+                "timeout_seconds": ("FLOAT", {"default": 0.0, "min": 0.0, "max": 3600.0, "step": 1.0}),
             }
-            # No other inputs specified for L3 in the issue description
         }
 
-    def execute(self, mada_seed_in: MadaSeed):
-        print(f"LcKeymapClickNode: Calling keymap_click_process with mada_seed.")
+    def execute(self, mada_seed_in: MadaSeed, timeout_seconds: float = 0.0):
+        timeout = timeout_seconds if timeout_seconds and timeout_seconds > 0 else None
+        if isinstance(mada_seed_in, list):
+            # A list of seeds (e.g. from the batch pipeline node): run L3 for all of them concurrently
+            return (self._execute_many(mada_seed_in, timeout),)
+
+        logger.debug("LcKeymapClickNode: Calling keymap_click_process with mada_seed.")
         
         # Call the L3 SOP function from lc_python_core
-        # keymap_click_process is now an async function, so we need asyncio.run()
-        mada_seed_result: MadaSeed = asyncio.run(keymap_click_process(mada_seed_input=mada_seed_in))
+        # keymap_click_process is an async function; it runs on the package's shared event loop (see async_runner)
+        mada_seed_result: MadaSeed = resolve_awaitable(with_resolved_content(mada_seed_in, keymap_click_process, mada_seed_input=mada_seed_in), timeout)
         
-        print(f"LcKeymapClickNode: keymap_click_process returned.")
+        logger.debug("LcKeymapClickNode: keymap_click_process returned.")
         return (mada_seed_result,)
+
+    def _execute_many(self, mada_seeds: List[Any], timeout):
+        logger.debug("LcKeymapClickNode: Calling keymap_click_process for %d seeds.", len(mada_seeds))
+        indexes = [i for i, seed in enumerate(mada_seeds) if seed is not None]
+        calls: List[Any] = []
+        for i in indexes:
+            try:
+                calls.append(with_resolved_content(mada_seeds[i], keymap_click_process, mada_seed_input=mada_seeds[i]))
+            except Exception as e: # e.g. the seed's out-of-band input is gone; resolve_awaitables passes it through
+                calls.append(e)
+        results = resolve_awaitables(calls, timeout, return_exceptions=True)
+        # Failed items become None, matching the batch node's convention
+        mada_seed_results: List[Any] = [None] * len(mada_seeds)
+        for i, result in zip(indexes, results):
+            if isinstance(result, Exception):
+                logger.error("LcKeymapClickNode: keymap_click_process failed for seed %d: %s: %s", i, type(result).__name__, result)
+                continue
+            mada_seed_results[i] = result
+        return mada_seed_results
@@ -1,6 +1,13 @@
 from typing import Optional
-from lc_python_core.sops.sop_l4_anchor_click import anchor_click_process
-from lc_python_core.schemas.mada_schema import MadaSeed # For type hinting
+
+from .content_store import with_resolved_content
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+anchor_click_process = lazy_import("lc_python_core.sops.sop_l4_anchor_click", "anchor_click_process")
+MadaSeed = lazy_import("lc_python_core.schemas.mada_schema", "MadaSeed")
 
 class LcAnchorClickNode:
     CATEGORY = "LearntCloud/EpistemicOSI"
@@ -24,12 +31,13 @@ class LcAnchorClickNode:
         # An empty string from ComfyUI should be treated as None if the SOP expects None for default.
         effective_persona_profile_uid = persona_profile_uid if persona_profile_uid and persona_profile_uid.strip() else None
 
-        print(f"LcAnchorClickNode: Calling anchor_click_process with mada_seed and persona_profile_uid: {effective_persona_profile_uid}")
+        logger.debug("LcAnchorClickNode: Calling anchor_click_process with mada_seed and persona_profile_uid: %s", effective_persona_profile_uid)
         
-        mada_seed_result: MadaSeed = anchor_click_process(
+        mada_seed_result: MadaSeed = with_resolved_content(
+            mada_seed_in, anchor_click_process,
             mada_seed_input=mada_seed_in, 
             persona_profile_uid_override_l4=effective_persona_profile_uid # Parameter name from L4 MR pseudo-code
         )
         
-        print(f"LcAnchorClickNode: anchor_click_process returned.")
+        logger.debug("LcAnchorClickNode: anchor_click_process returned.")
         return (mada_seed_result,)
@@ -1,6 +1,13 @@
 from typing import Optional
-from lc_python_core.sops.sop_l5_field_click import field_click_process
-from lc_python_core.schemas.mada_schema import MadaSeed # For type hinting
+
+from .content_store import with_resolved_content
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+field_click_process = lazy_import("lc_python_core.sops.sop_l5_field_click", "field_click_process")
+MadaSeed = lazy_import("lc_python_core.schemas.mada_schema", "MadaSeed")
 
 class LcFieldClickNode:
     CATEGORY = "LearntCloud/EpistemicOSI"
@@ -22,13 +29,14 @@ class LcFieldClickNode:
     def execute(self, mada_seed_in: MadaSeed, field_instance_uid_override: Optional[str] = None):
         effective_field_instance_uid_override = field_instance_uid_override if field_instance_uid_override and field_instance_uid_override.strip() else None
 
-        print(f"LcFieldClickNode: Calling field_click_process with mada_seed and field_instance_uid_override: {effective_field_instance_uid_override}")
+        logger.debug("LcFieldClickNode: Calling field_click_process with mada_seed and field_instance_uid_override: %s", effective_field_instance_uid_override)
         
         # The L5 SOP Python function expects `field_instance_uid_override_l5`
-        mada_seed_result: MadaSeed = field_click_process(
+        mada_seed_result: MadaSeed = with_resolved_content(
+            mada_seed_in, field_click_process,
             mada_seed_input=mada_seed_in, 
             field_instance_uid_override_l5=effective_field_instance_uid_override
         )
         
-        print(f"LcFieldClickNode: field_click_process returned.")
+        logger.debug("LcFieldClickNode: field_click_process returned.")
         return (mada_seed_result,)
@@ -1,8 +1,16 @@
-from typing import Optional, Dict, Any
-import json # For potentially summarizing complex objects as JSON string
+import json
+from typing import Optional
 
-from lc_python_core.sops.sop_l6_reflect_boom import reflect_boom_process
-from lc_python_core.schemas.mada_schema import MadaSeed, L6ReflectionPayloadObj # For type hinting
+from .content_store import with_resolved_content
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+from .seed_paths import L6_API_PAYLOAD, L6_FORMATTED_TEXT, L6_MULTIMODAL_PACKAGE, L6_PAYLOAD_OBJ, L6_STRUCTURED_DATA
+
+logger = get_logger(__name__)
+
+reflect_boom_process = lazy_import("lc_python_core.sops.sop_l6_reflect_boom", "reflect_boom_process")
+MadaSeed = lazy_import("lc_python_core.schemas.mada_schema", "MadaSeed")
+L6ReflectionPayloadObj = lazy_import("lc_python_core.schemas.mada_schema", "L6ReflectionPayloadObj")
 
 class LcReflectBoomNode:
     CATEGORY = "LearntCloud/EpistemicOSI"
@@ -24,44 +32,46 @@ class LcReflectBoomNode:
     def execute(self, mada_seed_in: MadaSeed, presentation_intent_override: Optional[str] = None):
         effective_presentation_intent_override = presentation_intent_override if presentation_intent_override and presentation_intent_override.strip() else None
 
-        print(f"LcReflectBoomNode: Calling reflect_boom_process with mada_seed and presentation_intent_override: {effective_presentation_intent_override}")
+        logger.debug("LcReflectBoomNode: Calling reflect_boom_process with mada_seed and presentation_intent_override: %s", effective_presentation_intent_override)
         
         # The L6 SOP Python function expects `presentation_intent_override_l6`
-        mada_seed_result: MadaSeed = reflect_boom_process(
+        mada_seed_result: MadaSeed = with_resolved_content(
+            mada_seed_in, reflect_boom_process,
             mada_seed_input=mada_seed_in, 
             presentation_intent_override_l6=effective_presentation_intent_override
         )
         
-        reflection_summary = "No L6 reflection payload content found or content is not text."
-        try:
-            if mada_seed_result.seed_content.L1_startle_reflex.L2_frame_type.L3_surface_keymap.L4_anchor_state.L5_field_state.L6_reflection_payload:
-                l6_payload: L6ReflectionPayloadObj = mada_seed_result.seed_content.L1_startle_reflex.L2_frame_type.L3_surface_keymap.L4_anchor_state.L5_field_state.L6_reflection_payload.L6_reflection_payload_obj
-                
-                # Attempt to extract a human-readable summary
-                if l6_payload.payload_content:
-                    if l6_payload.payload_content.formatted_text:
-                        reflection_summary = l6_payload.payload_content.formatted_text
-                    elif l6_payload.payload_content.structured_data:
-                        # Summarize structured data as JSON string for now
-                        try:
-                            reflection_summary = json.dumps(l6_payload.payload_content.structured_data, indent=2)
-                        except TypeError:
-                            reflection_summary = "L6 Payload (structured_data) is not JSON serializable."
-                    elif l6_payload.payload_content.multimodal_package:
-                        reflection_summary = f"L6 Payload: Multimodal package with {len(l6_payload.payload_content.multimodal_package)} components."
-                    elif l6_payload.payload_content.api_payload:
-                         reflection_summary = f"L6 Payload: API Payload provided."
-                
-                # Add L6 epistemic state to summary
-                reflection_summary = f"[L6 State: {l6_payload.l6_epistemic_state}]\n{reflection_summary}"
+        reflection_summary = _summarize_reflection(mada_seed_result)
+
+        logger.debug("LcReflectBoomNode: reflect_boom_process returned.")
+        return (mada_seed_result, reflection_summary)
 
-        except AttributeError as e:
-            print(f"LcReflectBoomNode: Error accessing L6 payload for summary: {e}")
-            reflection_summary = "Error accessing L6 reflection payload."
-        except Exception as e: # Catch any other unexpected error during summary creation
-            print(f"LcReflectBoomNode: Unexpected error creating summary: {e}")
-            reflection_summary = "Unexpected error creating L6 summary."
 
+def _summarize_reflection(mada_seed_result: MadaSeed) -> str:
+    """
+    Human-readable summary of an L6 output seed's reflection payload.
+    """
+    reflection_summary = "No L6 reflection payload content found or content is not text."
+    l6_payload = L6_PAYLOAD_OBJ(mada_seed_result)
+    if not l6_payload:
+        return reflection_summary
 
-        print(f"LcReflectBoomNode: reflect_boom_process returned.")
-        return (mada_seed_result, reflection_summary)
+    # Attempt to extract a human-readable summary
+    formatted_text = L6_FORMATTED_TEXT(mada_seed_result)
+    structured_data = L6_STRUCTURED_DATA(mada_seed_result)
+    multimodal_package = L6_MULTIMODAL_PACKAGE(mada_seed_result)
+    if formatted_text:
+        reflection_summary = formatted_text
+    elif structured_data:
+        # Summarize structured data as JSON string for now
+        try:
+            reflection_summary = json.dumps(structured_data, indent=2)
+        except TypeError:
+            reflection_summary = "L6 Payload (structured_data) is not JSON serializable."
+    elif multimodal_package:
+        reflection_summary = f"L6 Payload: Multimodal package with {len(multimodal_package)} components."
+    elif L6_API_PAYLOAD(mada_seed_result):
+        reflection_summary = f"L6 Payload: API Payload provided."
+
+    # Add L6 epistemic state to summary
+    return f"[L6 State: {l6_payload.l6_epistemic_state}]\n{reflection_summary}"
@@ -1,8 +1,17 @@
-from typing import Optional, Dict, Any
-import json # For potentially summarizing complex objects as JSON string
+from typing import Optional, Tuple
 
-from lc_python_core.sops.sop_l7_apply_done import apply_done_process
-from lc_python_core.schemas.mada_schema import MadaSeed, L7EncodedApplication, SeedQAQC # For type hinting
+from .content_store import with_resolved_content
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+from .seed_paths import (L7_APPLICATION, L7_BACKLOG, L7_EPISTEMIC_STATE, L7_FIRST_OUTPUT_OPTIONS, L7_SEED_OUTPUTS, L7_TRACE,
+                         SEED_INTEGRITY_STATUS, SEED_QA_QC, enum_value)
+
+logger = get_logger(__name__)
+
+apply_done_process = lazy_import("lc_python_core.sops.sop_l7_apply_done", "apply_done_process")
+MadaSeed = lazy_import("lc_python_core.schemas.mada_schema", "MadaSeed")
+L7EncodedApplication = lazy_import("lc_python_core.schemas.mada_schema", "L7EncodedApplication")
+SeedQAQC = lazy_import("lc_python_core.schemas.mada_schema", "SeedQAQC")
 
 class LcApplyDoneNode:
     CATEGORY = "LearntCloud/EpistemicOSI"
@@ -24,7 +33,7 @@ class LcApplyDoneNode:
     def execute(self, mada_seed_in: MadaSeed, l7_action_intent_override: Optional[str] = None):
         effective_l7_action_intent_override = l7_action_intent_override if l7_action_intent_override and l7_action_intent_override.strip() else None
 
-        print(f"LcApplyDoneNode: Calling apply_done_process with mada_seed and l7_action_intent_override: {effective_l7_action_intent_override}")
+        logger.debug("LcApplyDoneNode: Calling apply_done_process with mada_seed and l7_action_intent_override: %s", effective_l7_action_intent_override)
         
         # The L7 SOP Python function expects `l7_action_intent_override_l7`
         # and the input mada_seed is actually the L6 output package in the doctrinal sense.
@@ -62,64 +71,65 @@ class LcApplyDoneNode:
         # (This might need adjustment after reviewing `sop_l7_apply_done.py` in detail in the next plan step)
 
         # If apply_done_process expects a MadaSeed:
-        final_mada_seed_result: MadaSeed = apply_done_process(
+        final_mada_seed_result: MadaSeed = with_resolved_content(
+            mada_seed_in, apply_done_process,
             mada_seed_input=mada_seed_in, # Assuming apply_done_process was updated for MadaSeed input
             l7_action_intent_override_l7=effective_l7_action_intent_override
         )
 
-        app_summary = "No L7 application summary found."
-        next_steps = "No next step options provided."
-
-        try:
-            if final_mada_seed_result.seed_content.L1_startle_reflex.L2_frame_type.L3_surface_keymap.L4_anchor_state.L5_field_state.L6_reflection_payload.L7_encoded_application:
-                l7_app: L7EncodedApplication = final_mada_seed_result.seed_content.L1_startle_reflex.L2_frame_type.L3_surface_keymap.L4_anchor_state.L5_field_state.L6_reflection_payload.L7_encoded_application
-                
-                # Summarize L7 action and seed QA/QC
-                qa_qc_summary = "QA/QC: " + (final_mada_seed_result.seed_QA_QC.overall_seed_integrity_status.value if final_mada_seed_result.seed_QA_QC else "Status N/A")
-                
-                action_summary_parts = []
-                if l7_app.L7_backlog and (l7_app.L7_backlog.single_loop or l7_app.L7_backlog.double_loop or l7_app.L7_backlog.triple_loop):
-                    action_summary_parts.append(f"Backlog items updated/created.")
-                
-                if l7_app.seed_outputs:
-                    action_summary_parts.append(f"{len(l7_app.seed_outputs)} output stream(s) generated.")
-                    
-                    # Check for ADK agent output specifically
-                    for output_item in l7_app.seed_outputs:
-                        if isinstance(output_item.target_consumer_hint, dict) and \
-                           output_item.target_consumer_hint.get("invoked_agent") == "lc_adk_agent":
-                            adk_output_summary = "ADK agent output present."
-                            if isinstance(output_item.content, str) and len(output_item.content) < 100: # Show short ADK outputs
-                                adk_output_summary = f"ADK Agent Output: '{output_item.content[:100]}'" # Removed ellipsis as it's <100
-                            elif isinstance(output_item.content, str):
-                                adk_output_summary = f"ADK Agent Output (summary): '{output_item.content[:100]}...'"
-                            action_summary_parts.append(adk_output_summary)
-                            break # Assuming only one ADK output for now
-
-                    # For next_step_options_text, concatenate labels from the first output stream's options
-                    if l7_app.seed_outputs and l7_app.seed_outputs[0].seed_options and l7_app.seed_outputs[0].seed_options.options:
-                        next_steps_list = [opt.label for opt in l7_app.seed_outputs[0].seed_options.options]
-                        if next_steps_list:
-                            next_steps = "Next Steps: " + " | ".join(next_steps_list)
-                        else:
-                            next_steps = "No specific next step options defined in first output."
-                    else:
-                         next_steps = "No seed_options found in the first output."
-
-                app_summary = f"[L7 State: {final_mada_seed_result.trace_metadata.L7_trace.epistemic_state_L7.value if final_mada_seed_result.trace_metadata.L7_trace else 'N/A'}] "
-                app_summary += qa_qc_summary
-                if action_summary_parts:
-                    app_summary += " | Actions: " + "; ".join(action_summary_parts)
-                else:
-                    app_summary += " | No specific actions logged in L7_encoded_application."
-
-
-        except AttributeError as e:
-            print(f"LcApplyDoneNode: Error accessing L7 payload for summary: {e}")
-            app_summary = "Error accessing L7 application payload."
-        except Exception as e:
-            print(f"LcApplyDoneNode: Unexpected error creating summary: {e}")
-            app_summary = "Unexpected error creating L7 summary."
-
-        print(f"LcApplyDoneNode: apply_done_process returned.")
+        app_summary, next_steps = _summarize_application(final_mada_seed_result)
+
+        logger.debug("LcApplyDoneNode: apply_done_process returned.")
         return (final_mada_seed_result, app_summary, next_steps)
+
+
+def _summarize_application(final_mada_seed_result: MadaSeed) -> Tuple[str, str]:
+    """
+    (application summary, next step options) for an L7 output seed.
+    """
+    app_summary = "No L7 application summary found."
+    next_steps = "No next step options provided."
+    l7_app = L7_APPLICATION(final_mada_seed_result)
+    if not l7_app:
+        return app_summary, next_steps
+
+    # Summarize L7 action and seed QA/QC
+    qa_qc = SEED_QA_QC(final_mada_seed_result)
+    qa_qc_summary = "QA/QC: " + (str(enum_value(SEED_INTEGRITY_STATUS(final_mada_seed_result), "Status N/A")) if qa_qc else "Status N/A")
+
+    action_summary_parts = []
+    backlog = L7_BACKLOG(final_mada_seed_result)
+    if backlog and (backlog.single_loop or backlog.double_loop or backlog.triple_loop):
+        action_summary_parts.append(f"Backlog items updated/created.")
+
+    seed_outputs = L7_SEED_OUTPUTS(final_mada_seed_result)
+    if seed_outputs:
+        action_summary_parts.append(f"{len(seed_outputs)} output stream(s) generated.")
+
+        # Check for ADK agent output specifically
+        for output_item in seed_outputs:
+            if isinstance(output_item.target_consumer_hint, dict) and \
+               output_item.target_consumer_hint.get("invoked_agent") == "lc_adk_agent":
+                adk_output_summary = "ADK agent output present."
+                if isinstance(output_item.content, str) and len(output_item.content) < 100: # Show short ADK outputs
+                    adk_output_summary = f"ADK Agent Output: '{output_item.content[:100]}'" # Removed ellipsis as it's <100
+                elif isinstance(output_item.content, str):
+                    adk_output_summary = f"ADK Agent Output (summary): '{output_item.content[:100]}...'"
+                action_summary_parts.append(adk_output_summary)
+                break # Assuming only one ADK output for now
+
+        # For next_step_options_text, concatenate labels from the first output stream's options
+        options = L7_FIRST_OUTPUT_OPTIONS(final_mada_seed_result)
+        if options:
+            next_steps = "Next Steps: " + " | ".join([opt.label for opt in options])
+        else:
+            next_steps = "No seed_options found in the first output."
+
+    l7_state = enum_value(L7_EPISTEMIC_STATE(final_mada_seed_result)) if L7_TRACE(final_mada_seed_result) else "N/A"
+    app_summary = f"[L7 State: {l7_state}] "
+    app_summary += qa_qc_summary
+    if action_summary_parts:
+        app_summary += " | Actions: " + "; ".join(action_summary_parts)
+    else:
+        app_summary += " | No specific actions logged in L7_encoded_application."
+    return app_summary, next_steps
@@ -0,0 +1,167 @@
+"""
+Per-layer checkpoints for the L1-L7 pipeline.
+
+Each layer's output seed is stored under a key chained from the key of its
+input seed and the parameters that layer reads:
+
+    key(L1) = H(lc_python_core version, input_text, L1 params)
+    key(Lk) = H(key(Lk-1), Lk, Lk params)
+
+so changing only, say, the L6 presentation intent produces new keys for L6
+and L7 while L1-L5 are reused. Chaining stands in for hashing the input seed
+itself: seeds carry fresh UIDs and timestamps, so their content would never
+match across runs even when the upstream inputs are identical.
+
+SOPs mutate their input seed in place. Checkpoints are therefore stored in
+the seed_codec wire format as soon as a layer returns, and every lookup
+decodes a new seed object; nothing downstream can reach a cached copy.
+
+Usage:
+    from .layer_cache import get_layer_cache
+    run_pipeline(input_text, params, timings, layer_cache=get_layer_cache())
+    get_layer_cache().stats()["layers"]["L3_keymap_click"]
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .lc_logging import get_logger
+from .pipeline_cache import lc_python_core_version
+from .seed_codec import SeedCodecError, decode_seed, encode_seed
+
+logger = get_logger(__name__)
+
+# Bump when key derivation or the stored format changes.
+LAYER_CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_ENTRIES = 256
+
+
+def _digest(material: Any) -> str:
+    canonical = json.dumps(material, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def layer_keys(input_text: str, params: Dict[str, Any], layers: Sequence[Tuple[str, Sequence[str]]]) -> List[str]:
+    """
+    Chained checkpoint keys, one per (layer name, param names) entry of
+    `layers` (see pipeline_node.PIPELINE_LAYERS).
+    """
+    keys: List[str] = []
+    previous = _digest({"format": LAYER_CACHE_FORMAT_VERSION, "lc_python_core": lc_python_core_version(), "input_text": input_text})
+    for layer, param_names in layers:
+        previous = _digest([previous, layer, {name: params.get(name) for name in param_names}])
+        keys.append(previous)
+    return keys
+
+
+class LayerCheckpointCache:
+    """
+    Thread-safe LRU of encoded layer outputs with per-layer counters. A layer
+    counts a hit when a run reuses its output (directly or because a later
+    layer's checkpoint covered it) and a miss when it has to run.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self.max_entries = max(0, max_entries)
+        self._layer_stats: Dict[str, Dict[str, int]] = {}
+        self._evictions = 0
+
+    def _stats_for(self, layer: str) -> Dict[str, int]:
+        # Caller holds the lock.
+        stats = self._layer_stats.get(layer)
+        if stats is None:
+            stats = self._layer_stats[layer] = {"hits": 0, "misses": 0, "stores": 0}
+        return stats
+
+    def resume(self, layers: Sequence[str], keys: Sequence[str], seed_cls: Any) -> Tuple[int, Any]:
+        """
+        Finds the deepest checkpointed layer. Returns (index of the first
+        layer that still has to run, decoded seed to feed it), or (0, None).
+        """
+        for index in range(len(keys) - 1, -1, -1):
+            with self._lock:
+                blob = self._entries.get(keys[index])
+                if blob is not None:
+                    self._entries.move_to_end(keys[index])
+            if blob is None:
+                continue
+            try:
+                mada_seed = decode_seed(blob, seed_cls)
+            except (SeedCodecError, ValueError) as e:
+                logger.warning("LayerCheckpointCache: Dropping unreadable %s checkpoint: %s", layers[index], e)
+                with self._lock:
+                    self._entries.pop(keys[index], None)
+                continue
+            self._count(layers, index + 1)
+            return index + 1, mada_seed
+        self._count(layers, 0)
+        return 0, None
+
+    def _count(self, layers: Sequence[str], reused: int):
+        with self._lock:
+            for index, layer in enumerate(layers):
+                self._stats_for(layer)["hits" if index < reused else "misses"] += 1
+
+    def put(self, layer: str, key: str, mada_seed: Any):
+        """
+        Snapshots `mada_seed` as the output of `layer`. Must be called before
+        the seed is passed to the next (mutating) SOP.
+        """
+        if self.max_entries == 0 or not hasattr(mada_seed, "model_dump"):
+            return
+        blob = encode_seed(mada_seed)
+        with self._lock:
+            self._entries[key] = blob
+            self._entries.move_to_end(key)
+            self._stats_for(layer)["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            layers = {}
+            for layer, counts in self._layer_stats.items():
+                lookups = counts["hits"] + counts["misses"]
+                layers[layer] = dict(counts, hit_rate=(counts["hits"] / lookups) if lookups else 0.0)
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self._evictions,
+                "bytes": sum(len(blob) for blob in self._entries.values()),
+                "layers": layers,
+            }
+
+
+_cache: Optional[LayerCheckpointCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_layer_cache() -> LayerCheckpointCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    max_entries = int(os.environ.get("LC_EPISTEMIC_LAYER_CACHE_SIZE", DEFAULT_MAX_ENTRIES))
+                except ValueError:
+                    logger.warning("Ignoring invalid LC_EPISTEMIC_LAYER_CACHE_SIZE")
+                    max_entries = DEFAULT_MAX_ENTRIES
+                _cache = LayerCheckpointCache(max_entries)
+    return _cache
+
+
+def configure_layer_cache(max_entries: int = DEFAULT_MAX_ENTRIES) -> LayerCheckpointCache:
+    global _cache
+    with _cache_lock:
+        _cache = LayerCheckpointCache(max_entries)
+    return _cache
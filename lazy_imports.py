@@ -0,0 +1,142 @@
+"""
+Deferred imports for lc_python_core and the other heavy backends.
+
+Importing every SOP, lc_mem_service, the agent services (Playwright) and the
+ADK agent when ComfyUI loads the package makes start-up slow, even though
+most workflows only use a few nodes. Node modules therefore bind their
+backends with lazy_import() instead of `from ... import ...`:
+
+    keymap_click_process = lazy_import("lc_python_core.sops.sop_l3_keymap_click", "keymap_click_process")
+
+The returned LazyBackend imports the module the first time it is called or
+an attribute is read, i.e. on the node's first execute. Node classes and
+their INPUT_TYPES stay importable without lc_python_core, so registration in
+__init__.py costs almost nothing.
+
+A `fallback` replaces the old try/except ImportError dummies: it is used
+(and the failure logged once) if the import fails.
+
+preload_backends() resolves everything up front, e.g. in process-pool
+workers or for an eager start-up.
+"""
+import importlib
+import threading
+from typing import Any, Callable, List, Optional, Sequence, Union
+
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+_UNRESOLVED = object()
+
+_registry: List["LazyBackend"] = []
+_preload_hooks: List[Callable[[], Any]] = []
+_registry_lock = threading.Lock()
+
+
+class LazyBackend:
+    """
+    Stand-in for a module or a module attribute that is imported on first use.
+    Calls and attribute reads are forwarded to the resolved object.
+    """
+
+    __slots__ = ("_module_name", "_attr", "_fallback", "_value", "_available", "_lock")
+
+    def __init__(self, module_name: str, attr: Optional[str] = None, fallback: Any = _UNRESOLVED):
+        self._module_name = module_name
+        self._attr = attr
+        self._fallback = fallback
+        self._value = _UNRESOLVED
+        self._available = False
+        self._lock = threading.Lock()
+
+    @property
+    def module_name(self) -> str:
+        return self._module_name
+
+    def resolve(self) -> Any:
+        value = self._value
+        if value is not _UNRESOLVED:
+            return value
+        with self._lock:
+            if self._value is _UNRESOLVED:
+                try:
+                    module = importlib.import_module(self._module_name)
+                    self._value = getattr(module, self._attr) if self._attr else module
+                    self._available = True
+                except ImportError as e:
+                    if self._fallback is _UNRESOLVED:
+                        raise
+                    logger.warning("Failed to import %s from %s: %s. Ensure lc_python_core is in PYTHONPATH. Using fallback.", self._attr or "module", self._module_name, e)
+                    self._value = self._fallback
+            return self._value
+
+    def is_available(self) -> bool:
+        """
+        True if the real backend imported (as opposed to the fallback).
+        """
+        try:
+            self.resolve()
+        except ImportError:
+            return False
+        return self._available
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        # typing, copy and pickle probe dunder attributes (e.g. when a backend
+        # class is used in an annotation); answering those must not import it.
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __repr__(self):
+        target = f"{self._module_name}.{self._attr}" if self._attr else self._module_name
+        state = "unresolved" if self._value is _UNRESOLVED else ("resolved" if self._available else "fallback")
+        return f"<LazyBackend {target} ({state})>"
+
+
+def lazy_import(module_name: str, attr: Optional[str] = None, fallback: Any = _UNRESOLVED) -> LazyBackend:
+    backend = LazyBackend(module_name, attr, fallback)
+    with _registry_lock:
+        _registry.append(backend)
+    return backend
+
+
+def register_preload(hook: Callable[[], Any]):
+    """
+    Registers a function that performs a module's deferred imports (for
+    nodes that need more than lazy_import, e.g. L1/L2 with their dummy types).
+    """
+    with _registry_lock:
+        _preload_hooks.append(hook)
+    return hook
+
+
+def preload_backends(prefixes: Optional[Union[str, Sequence[str]]] = None) -> int:
+    """
+    Resolves registered backends whose module name starts with one of
+    `prefixes` (all of them, plus preload hooks, if None). Import errors are
+    logged, not raised. Returns the number of backends resolved.
+    """
+    if isinstance(prefixes, str):
+        prefixes = (prefixes,)
+    with _registry_lock:
+        backends = list(_registry)
+        hooks = list(_preload_hooks) if prefixes is None else []
+    resolved = 0
+    for backend in backends:
+        if prefixes is not None and not backend.module_name.startswith(tuple(prefixes)):
+            continue
+        try:
+            backend.resolve()
+            resolved += 1
+        except Exception as e:
+            logger.warning("Preloading %r failed: %s", backend, e)
+    for hook in hooks:
+        try:
+            hook()
+        except Exception as e:
+            logger.warning("Preload hook %s failed: %s", getattr(hook, "__qualname__", hook), e)
+    return resolved
@@ -0,0 +1,144 @@
+"""
+Lazy, read-only views of serialized MadaSeeds.
+
+Summary nodes read a handful of deep fields, e.g.
+
+    seed_content.L1_startle_reflex.L2_frame_type.L3_surface_keymap.L4_anchor_state
+        .L5_field_state.L6_reflection_payload.L6_reflection_payload_obj.payload_content.formatted_text
+
+but a seed loaded with `MadaSeed.model_validate(json.loads(...))` is
+validated and turned into model objects in full first. A LazySeedView reads
+the decoded JSON (or seed_codec) data directly: nothing is validated, and a
+sub-tree becomes a model only when materialize() is called on it. Views
+also wrap live MadaSeed objects, so the same accessors work on every form
+of seed.
+
+    view = seed_view(seed_json)           # str/bytes JSON, seed_codec bytes, dict or MadaSeed
+    view.seed_content.L1_startle_reflex   # another view; scalars come back as plain values
+    view.get("@L6.L6_reflection_payload_obj.payload_content.formatted_text")
+    view.get("seed_content.raw_signals[0].raw_input_signal")
+    l6_obj = view.get("@L6.L6_reflection_payload_obj").materialize(L6ReflectionPayloadObj)
+
+Values read from JSON are JSON values: enums are their values, timestamps
+are ISO strings. Paths may start with one of the seed_paths.LAYER_PATHS aliases
+(`@L1`...`@L7`) for the nested layer containers.
+"""
+import json
+from typing import Any, List, Type, Union
+
+from .seed_codec import decode_data, is_encoded_seed
+from .seed_paths import MISSING, compile_path
+
+
+class LazySeedView:
+    """
+    Read-only view of one object or array of a seed. Attribute and item
+    access return child views for objects/arrays and plain values otherwise;
+    missing keys raise AttributeError/KeyError, get() returns a default.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Any):
+        self._data = data
+
+    def _child(self, key: Union[str, int]) -> Any:
+        data = self._data
+        if isinstance(data, dict):
+            value = data.get(key, MISSING)
+        elif isinstance(data, (list, tuple)):
+            value = data[key] if isinstance(key, int) and -len(data) <= key < len(data) else MISSING
+        elif isinstance(key, str) and not key.startswith("_"):
+            value = getattr(data, key, MISSING)
+        else:
+            value = MISSING
+        return _wrap(value)
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """
+        Value at a dotted path ("a.b[0].c"), or `default` if any link is
+        missing or None.
+        """
+        value = compile_path(path)(self._data)
+        return default if value is None or value is MISSING else _wrap(value)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = self._child(name)
+        if value is MISSING:
+            raise AttributeError(name)
+        return value
+
+    def __getitem__(self, key: Union[str, int]) -> Any:
+        value = self._child(key)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Union[str, int]) -> bool:
+        return self._child(key) is not MISSING
+
+    def keys(self) -> List[str]:
+        if isinstance(self._data, dict):
+            return list(self._data)
+        fields = getattr(type(self._data), "model_fields", None)
+        return list(fields) if fields else []
+
+    def __len__(self) -> int:
+        if isinstance(self._data, (dict, list, tuple)):
+            return len(self._data)
+        return len(self.keys())
+
+    def __bool__(self) -> bool:
+        if not isinstance(self._data, (dict, list, tuple)):
+            return True # a model instance, like the attribute it stands in for
+        return len(self._data) > 0
+
+    def to_python(self) -> Any:
+        """
+        The sub-tree as plain JSON-compatible data.
+        """
+        if hasattr(self._data, "model_dump"):
+            return self._data.model_dump(mode="json")
+        return self._data
+
+    def materialize(self, model_cls: Type) -> Any:
+        """
+        The sub-tree validated as `model_cls` (the original object if it
+        already is one).
+        """
+        if isinstance(self._data, model_cls):
+            return self._data
+        return model_cls.model_validate(self.to_python())
+
+    def __repr__(self):
+        return f"<LazySeedView {type(self._data).__name__} keys={self.keys()[:8]}>"
+
+
+def _wrap(value: Any) -> Any:
+    if isinstance(value, (dict, list, tuple)) or hasattr(value, "model_dump"):
+        return LazySeedView(value)
+    return value
+
+
+def seed_view(source: Any) -> LazySeedView:
+    """
+    A LazySeedView over JSON text (str or bytes), seed_codec bytes, a dict
+    or a MadaSeed object. Serialized forms are decoded (with the C JSON
+    decoder or seed_codec) but not validated.
+    """
+    if isinstance(source, LazySeedView):
+        return source
+    if is_encoded_seed(source):
+        return LazySeedView(decode_data(source))
+    if isinstance(source, (bytes, bytearray, memoryview, str)):
+        data = json.loads(bytes(source) if isinstance(source, memoryview) else source)
+        if not isinstance(data, (dict, list)):
+            raise ValueError("Seed JSON must be an object or array")
+        return LazySeedView(data)
+    return LazySeedView(source)
+
+
+def get_seed_field(source: Any, path: str, default: Any = None) -> Any:
+    return seed_view(source).get(path, default)
@@ -1,20 +1,11 @@
 import json
 from typing import Optional, Tuple, Dict, Any
 
-# Attempt to import the backend service
-try:
-    # Adjust path based on actual ComfyUI loading and project structure
-    from lc_python_core.services.lc_mem_service import add_comment_to_pbi
-except ImportError:
-    print("\n!!! lc_add_comment_to_pbi_node.py: Failed to import add_comment_to_pbi from default path. !!!")
-    print("!!! Ensure lc_python_core is in PYTHONPATH or adjust import path. !!!\n")
-    # Dummy for ComfyUI registration
-    def add_comment_to_pbi(*args, **kwargs) -> Dict[str, Any]:
-        return {
-            "status": "Error: lc_mem_service.add_comment_to_pbi not found. Backend not imported.",
-            "pbi_uid": kwargs.get("pbi_uid"),
-            "comment_id": None,
-        }
+from .lc_logging import get_logger
+from .mada_read_cache import invalidate_mada_objects
+from .storage_backends import get_storage_backend
+
+logger = get_logger(__name__)
 
 # Define a minimal MadaSeed type string for ComfyUI type system
 MADA_SEED_TYPE = "MADA_SEED"
@@ -59,17 +50,17 @@ class LcAddCommentToPbiNode:
         """
         if not pbi_uid or not pbi_uid.strip():
             status_out = "Error: PBI UID is required."
-            print(f"[LcAddCommentToPbiNode] {status_out}")
+            logger.warning("[LcAddCommentToPbiNode] %s", status_out)
             return (mada_seed_in, None, status_out)
         
         if not comment_text or not comment_text.strip():
             status_out = "Error: Comment text is required."
-            print(f"[LcAddCommentToPbiNode] {status_out}")
+            logger.warning("[LcAddCommentToPbiNode] %s", status_out)
             return (mada_seed_in, None, status_out)
 
         if not author_persona_uid or not author_persona_uid.strip():
             status_out = "Error: Author Persona UID is required."
-            print(f"[LcAddCommentToPbiNode] {status_out}")
+            logger.warning("[LcAddCommentToPbiNode] %s", status_out)
             return (mada_seed_in, None, status_out)
 
         persona_context_dict: Optional[Dict[str, Any]] = None
@@ -78,11 +69,11 @@ class LcAddCommentToPbiNode:
                 persona_context_dict = json.loads(requesting_persona_context_json)
             except json.JSONDecodeError as e:
                 status_out = f"Error: Invalid JSON in requesting_persona_context_json: {e}"
-                print(f"[LcAddCommentToPbiNode] {status_out}")
+                logger.warning("[LcAddCommentToPbiNode] %s", status_out)
                 return (mada_seed_in, None, status_out)
         
         try:
-            result = add_comment_to_pbi(
+            result = get_storage_backend().add_comment_to_pbi(
                 pbi_uid=pbi_uid,
                 comment_text=comment_text,
                 author_persona_uid=author_persona_uid,
@@ -90,13 +81,16 @@ class LcAddCommentToPbiNode:
             )
         except Exception as e:
             error_message = f"Error calling add_comment_to_pbi service: {type(e).__name__} - {str(e)}"
-            print(f"[LcAddCommentToPbiNode] {error_message}")
+            logger.error("[LcAddCommentToPbiNode] %s", error_message)
             return (mada_seed_in, None, error_message)
+        finally:
+            # Cached reads of the PBI are stale even if the call failed part-way
+            invalidate_mada_objects(pbi_uid.strip())
 
         comment_id_out = result.get("comment_id")
         status_out = result.get("status", "Error: Status not returned from backend.")
         
-        print(f"[LcAddCommentToPbiNode] PBI UID: {pbi_uid}, Author: {author_persona_uid}, CommentID: {comment_id_out}, Status: {status_out}")
+        logger.debug("[LcAddCommentToPbiNode] PBI UID: %s, Author: %s, CommentID: %s, Status: %s", pbi_uid, author_persona_uid, comment_id_out, status_out)
 
         return (mada_seed_in, comment_id_out, status_out)
 
@@ -1,29 +1,17 @@
 # import os # Removed as os.getenv is no longer used
 
-# Attempt to import the CoreADKAgent
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+# CoreADKAgent is imported on first execute (see lazy_imports).
 # It's acknowledged that there were issues testing lc_python_core due to its name.
 # ComfyUI's runtime environment might handle this path correctly.
 # However, given the persistent ModuleNotFoundError: No module named 'lC'
 # when sys.path includes /app/lab/modules, it's highly probable this import
 # will fail in ComfyUI's environment too if lc_python_core is not renamed.
-core_agent_imported = False
-try:
-    # Assuming ComfyUI's execution environment might have /app/lab/modules in sys.path
-    # or a similar mechanism that would make 'lc_python_core' findable if the naming was standard.
-    from lc_python_core.lc_adk_agent.adk_core_agent import CoreADKAgent
-    if CoreADKAgent is not None:
-        core_agent_imported = True
-        print("INFO: CoreADKAgent imported successfully into lc_adk_config_node.")
-    else:
-        print("WARNING: CoreADKAgent was None after import in lc_adk_config_node.")
-        CoreADKAgent = object # Placeholder to prevent NameError if import returns None
-except ImportError as e:
-    print(f"ERROR: Failed to import CoreADKAgent in lc_adk_config_node: {e}")
-    print("Ensure lc_python_core is accessible. This might be a path issue related to 'lc_python_core' naming.")
-    CoreADKAgent = object # Define a placeholder to allow class definition
-except Exception as e: # Catch any other exception during import
-    print(f"ERROR: An unexpected error occurred during CoreADKAgent import in lc_adk_config_node: {e}")
-    CoreADKAgent = object
+CoreADKAgent = lazy_import("lc_python_core.lc_adk_agent.adk_core_agent", "CoreADKAgent", fallback=None)
 
 
 class LcADKConfigNode:
@@ -65,7 +53,7 @@ class LcADKConfigNode:
             "api_key": api_key,  # This is now the direct key value
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "core_agent_imported": core_agent_imported # For debugging/info
+            "core_agent_imported": CoreADKAgent.is_available() and CoreADKAgent.resolve() is not None # For debugging/info
             # Add any other relevant ADK parameters here
         }
         
@@ -80,5 +68,5 @@ class LcADKConfigNode:
 #     "LcADKConfigNode": "ADK Configuration Node"
 # }
 
-# Print a message to confirm the class definition is processed
-print("INFO: LcADKConfigNode class defined with direct API key input.")
+# Log a message to confirm the class definition is processed
+logger.debug("LcADKConfigNode class defined with direct API key input.")
@@ -1,21 +1,22 @@
 import json
 from typing import Optional, Tuple, Dict, Any
 
-# Attempt to import the backend service
-try:
-    # Adjust path based on actual ComfyUI loading and project structure
-    from lc_python_core.services.lc_api_agent_service import execute_api_call
-except ImportError:
-    print("\n!!! lc_api_llm_agent_node.py: Failed to import execute_api_call from default path. !!!")
-    print("!!! Ensure lc_python_core is in PYTHONPATH or adjust import path. !!!\n")
-    # Dummy for ComfyUI registration
-    def execute_api_call(*args, **kwargs) -> Dict[str, Any]:
-        return {
-            "status": "Error: lc_api_agent_service.execute_api_call not found. Backend not imported.",
-            "agent_response_text": None,
-            "full_response_json": {"error": "Backend service not imported"},
-            "http_status_code": None
-        }
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+# The backend service is imported on first execute (see lazy_imports). If that
+# import fails, this stand-in returns an error status instead.
+def _execute_api_call_unavailable(*args, **kwargs) -> Dict[str, Any]:
+    return {
+        "status": "Error: lc_api_agent_service.execute_api_call not found. Backend not imported.",
+        "agent_response_text": None,
+        "full_response_json": {"error": "Backend service not imported"},
+        "http_status_code": None
+    }
+
+execute_api_call = lazy_import("lc_python_core.services.lc_api_agent_service", "execute_api_call", fallback=_execute_api_call_unavailable)
 
 # Define a minimal MadaSeed type string for ComfyUI type system
 MADA_SEED_TYPE = "MADA_SEED"
@@ -65,12 +66,12 @@ class LcApiLlmAgentNode:
         """
         if not api_endpoint_url or not api_endpoint_url.strip():
             status_out = "Error: API Endpoint URL is required."
-            print(f"[LcApiLlmAgentNode] {status_out}")
+            logger.warning("[LcApiLlmAgentNode] %s", status_out)
             return (mada_seed_in, None, "{}", status_out)
         
         if not prompt_text or not prompt_text.strip(): # Prompt text is generally essential
             status_out = "Error: Prompt text is required."
-            print(f"[LcApiLlmAgentNode] {status_out}")
+            logger.warning("[LcApiLlmAgentNode] %s", status_out)
             return (mada_seed_in, None, "{}", status_out)
 
         # Helper to convert empty/whitespace-only strings to None for optional service params
@@ -90,7 +91,7 @@ class LcApiLlmAgentNode:
             )
         except Exception as e:
             error_message = f"Error calling execute_api_call service: {type(e).__name__} - {str(e)}"
-            print(f"[LcApiLlmAgentNode] {error_message}")
+            logger.error("[LcApiLlmAgentNode] %s", error_message)
             return (mada_seed_in, None, "{}", error_message)
 
         agent_response_text_out = result.get("agent_response_text")
@@ -102,12 +103,12 @@ class LcApiLlmAgentNode:
             full_response_json_str = json.dumps(full_response_dict, indent=2) if full_response_dict else "{}"
         except TypeError as e: # Should not happen if full_response_dict is JSON serializable
             status_out = f"Error: Failed to serialize full API response to JSON: {e}. Original status: {status_out}"
-            print(f"[LcApiLlmAgentNode] Serialization error: {e}")
+            logger.error("[LcApiLlmAgentNode] Serialization error: %s", e)
             # full_response_json_str remains "{}"
         
-        print(f"[LcApiLlmAgentNode] Endpoint: {api_endpoint_url}, Status: {status_out}, HTTP Code: {result.get('http_status_code')}")
+        logger.debug("[LcApiLlmAgentNode] Endpoint: %s, Status: %s, HTTP Code: %s", api_endpoint_url, status_out, result.get('http_status_code'))
         if agent_response_text_out:
-             print(f"  Agent Response Snippet: {agent_response_text_out[:100]}...")
+             logger.debug("  Agent Response Snippet: %s...", agent_response_text_out[:100])
 
 
         return (mada_seed_in, agent_response_text_out, full_response_json_str, status_out)
@@ -1,19 +1,11 @@
 import json
 from typing import Optional, Tuple, Dict, Any
 
-# Attempt to import the backend service
-try:
-    from lc_python_core.services.lc_mem_service import get_pbi_details
-except ImportError:
-    print("\n!!! lc_get_pbi_details_node.py: Failed to import get_pbi_details from default path. !!!")
-    print("!!! Ensure lc_python_core is in PYTHONPATH or adjust import path. !!!\n")
-    # Dummy for ComfyUI registration
-    def get_pbi_details(*args, **kwargs) -> Dict[str, Any]:
-        return {
-            "status": "Error: lc_mem_service.get_pbi_details not found. Backend not imported.",
-            "pbi_uid": kwargs.get("pbi_uid"),
-            "details": None,
-        }
+from .lc_logging import get_logger
+from .mada_read_cache import cache_variant, get_mada_read_cache
+from .storage_backends import get_storage_backend
+
+logger = get_logger(__name__)
 
 # Define a minimal MadaSeed type string for ComfyUI type system
 MADA_SEED_TYPE = "MADA_SEED"
@@ -40,6 +32,8 @@ class LcGetPbiDetailsNode:
             "optional": {
                 "requesting_persona_context_json": ("STRING", {"multiline": True, "default": "{}"}),
                 "mada_seed_in": (MADA_SEED_TYPE,),
+                # Serve the PBI from the shared read cache (see mada_read_cache); PBI writes through the nodes evict it
+                "use_read_cache": ("BOOLEAN", {"default": True}),
             }
         }
 
@@ -47,14 +41,15 @@ class LcGetPbiDetailsNode:
         self,
         pbi_uid: str,
         requesting_persona_context_json: str = "{}",
-        mada_seed_in: Optional[Any] = None  # MadaSeed can be any type for passthrough
+        mada_seed_in: Optional[Any] = None,  # MadaSeed can be any type for passthrough
+        use_read_cache: bool = True
     ) -> Tuple[Optional[Any], str, str]:
         """
         Executes the PBI details retrieval operation.
         """
         if not pbi_uid or not pbi_uid.strip():
             status_out = "Error: PBI UID is required."
-            print(f"[LcGetPbiDetailsNode] {status_out}")
+            logger.warning("[LcGetPbiDetailsNode] %s", status_out)
             return (mada_seed_in, "{}", status_out)
 
         persona_context_dict: Optional[Dict[str, Any]] = None
@@ -63,17 +58,26 @@ class LcGetPbiDetailsNode:
                 persona_context_dict = json.loads(requesting_persona_context_json)
             except json.JSONDecodeError as e:
                 status_out = f"Error: Invalid JSON in requesting_persona_context_json: {e}"
-                print(f"[LcGetPbiDetailsNode] {status_out}")
+                logger.warning("[LcGetPbiDetailsNode] %s", status_out)
                 return (mada_seed_in, "{}", status_out)
         
-        try:
-            result = get_pbi_details(
+        def load_details() -> Dict[str, Any]:
+            return get_storage_backend().get_pbi_details(
                 pbi_uid=pbi_uid,
                 requesting_persona_context=persona_context_dict
             )
+
+        try:
+            if use_read_cache:
+                # Only successful lookups are cached
+                result = get_mada_read_cache().get_or_load(
+                    "pbi_details", pbi_uid, load_details, variant=cache_variant(persona_context_dict),
+                    cacheable=lambda value: isinstance(value, dict) and str(value.get("status", "")).startswith("Success"))
+            else:
+                result = load_details()
         except Exception as e:
             error_message = f"Error calling get_pbi_details: {type(e).__name__} - {str(e)}"
-            print(f"[LcGetPbiDetailsNode] {error_message}")
+            logger.error("[LcGetPbiDetailsNode] %s", error_message)
             return (mada_seed_in, "{}", error_message)
 
         status_out = result.get("status", "Error: Status not returned from backend.")
@@ -85,15 +89,15 @@ class LcGetPbiDetailsNode:
                 pbi_details_json_str = json.dumps(pbi_details, indent=4)
             except TypeError as e: # Should not happen if details is a dict from valid JSON
                 status_out = f"Error: Failed to serialize PBI details to JSON: {e}"
-                print(f"[LcGetPbiDetailsNode] {status_out}")
+                logger.warning("[LcGetPbiDetailsNode] %s", status_out)
                 # Keep pbi_details_json_str as "{}"
         elif status_out.startswith("Success") and pbi_details is None:
             # If backend reports success but details are None, it's a bit ambiguous.
             # For robustness, we'll output empty JSON.
-            print(f"[LcGetPbiDetailsNode] Warning: Status is Success but PBI details are None for UID {pbi_uid}.")
+            logger.warning("[LcGetPbiDetailsNode] Status is Success but PBI details are None for UID %s.", pbi_uid)
 
 
-        print(f"[LcGetPbiDetailsNode] UID: {pbi_uid}, Status: {status_out}, Details fetched: {pbi_details is not None}")
+        logger.debug("[LcGetPbiDetailsNode] UID: %s, Status: %s, Details fetched: %s", pbi_uid, status_out, pbi_details is not None)
 
         return (mada_seed_in, pbi_details_json_str, status_out)
 
@@ -1,21 +1,11 @@
 import json
 from typing import Optional, Tuple, Dict, Any
 
-# Attempt to import the backend service
-try:
-    # Adjust path based on actual ComfyUI loading and project structure
-    from lc_python_core.services.lc_mem_service import link_pbis 
-except ImportError:
-    print("\n!!! lc_link_pbi_node.py: Failed to import link_pbis from default path. !!!")
-    print("!!! Ensure lc_python_core is in PYTHONPATH or adjust import path. !!!\n")
-    # Dummy for ComfyUI registration
-    def link_pbis(*args, **kwargs) -> Dict[str, Any]:
-        return {
-            "status": "Error: lc_mem_service.link_pbis not found. Backend not imported.",
-            "source_pbi_uid": kwargs.get("source_pbi_uid"),
-            "target_pbi_uid": kwargs.get("target_pbi_uid"),
-            "link_type": kwargs.get("link_type"),
-        }
+from .lc_logging import get_logger
+from .mada_read_cache import invalidate_mada_objects
+from .storage_backends import get_storage_backend
+
+logger = get_logger(__name__)
 
 # Define a minimal MadaSeed type string for ComfyUI type system
 MADA_SEED_TYPE = "MADA_SEED"
@@ -61,17 +51,17 @@ class LcLinkPbiNode:
         """
         if not source_pbi_uid or not source_pbi_uid.strip():
             status_out = "Error: Source PBI UID is required."
-            print(f"[LcLinkPbiNode] {status_out}")
+            logger.warning("[LcLinkPbiNode] %s", status_out)
             return (mada_seed_in, status_out)
         
         if not target_pbi_uid or not target_pbi_uid.strip():
             status_out = "Error: Target PBI UID is required."
-            print(f"[LcLinkPbiNode] {status_out}")
+            logger.warning("[LcLinkPbiNode] %s", status_out)
             return (mada_seed_in, status_out)
 
         if source_pbi_uid.strip() == target_pbi_uid.strip():
             status_out = "Error: Source and Target PBI UIDs cannot be the same."
-            print(f"[LcLinkPbiNode] {status_out}")
+            logger.warning("[LcLinkPbiNode] %s", status_out)
             return (mada_seed_in, status_out)
 
         persona_context_dict: Optional[Dict[str, Any]] = None
@@ -80,11 +70,11 @@ class LcLinkPbiNode:
                 persona_context_dict = json.loads(requesting_persona_context_json)
             except json.JSONDecodeError as e:
                 status_out = f"Error: Invalid JSON in requesting_persona_context_json: {e}"
-                print(f"[LcLinkPbiNode] {status_out}")
+                logger.warning("[LcLinkPbiNode] %s", status_out)
                 return (mada_seed_in, status_out)
         
         try:
-            result = link_pbis(
+            result = get_storage_backend().link_pbis(
                 source_pbi_uid=source_pbi_uid,
                 target_pbi_uid=target_pbi_uid,
                 link_type=link_type,
@@ -92,12 +82,15 @@ class LcLinkPbiNode:
             )
         except Exception as e:
             error_message = f"Error calling link_pbis service: {type(e).__name__} - {str(e)}"
-            print(f"[LcLinkPbiNode] {error_message}")
+            logger.error("[LcLinkPbiNode] %s", error_message)
             return (mada_seed_in, error_message)
+        finally:
+            # Cached reads of either PBI are stale even if the call failed part-way
+            invalidate_mada_objects(source_pbi_uid.strip(), target_pbi_uid.strip())
 
         status_out = result.get("status", "Error: Status not returned from backend.")
         
-        print(f"[LcLinkPbiNode] Source: {source_pbi_uid}, Target: {target_pbi_uid}, Type: {link_type}, Status: {status_out}")
+        logger.debug("[LcLinkPbiNode] Source: %s, Target: %s, Type: %s, Status: %s", source_pbi_uid, target_pbi_uid, link_type, status_out)
 
         return (mada_seed_in, status_out)
 
@@ -0,0 +1,121 @@
+"""
+Package-wide logging for the lC epistemic nodes.
+
+All nodes log through children of the "lc_epistemic_nodes" logger instead of
+printing. Messages use %-style arguments so nothing is formatted unless the
+level is enabled, and the default level (WARNING) keeps per-execution
+progress messages off the console entirely.
+
+Configuration:
+  - LC_EPISTEMIC_LOG_LEVEL: initial level name (default "WARNING").
+  - LC_EPISTEMIC_LOG_RING_BUFFER: if set to a positive integer, a ring buffer
+    of that many records is installed at import time.
+  - set_log_level() / enable_ring_buffer() / disable_ring_buffer() at runtime.
+
+The ring buffer keeps raw LogRecords in a bounded deque and only formats them
+when get_recent_log_messages() is called, so recent activity can be inspected
+without any console I/O.
+"""
+import logging
+import os
+import threading
+from collections import deque
+from typing import List, Optional, Union
+
+LOGGER_NAME = "lc_epistemic_nodes"
+LEVEL_ENV_VAR = "LC_EPISTEMIC_LOG_LEVEL"
+RING_BUFFER_ENV_VAR = "LC_EPISTEMIC_LOG_RING_BUFFER"
+DEFAULT_LEVEL = logging.WARNING
+DEFAULT_RING_BUFFER_CAPACITY = 1000
+
+_FORMAT = "%(asctime)s [%(name)s] %(levelname)s: %(message)s"
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Keeps the most recent `capacity` records in memory.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_RING_BUFFER_CAPACITY):
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+        self.setFormatter(logging.Formatter(_FORMAT))
+
+    def emit(self, record: logging.LogRecord):
+        # deque.append with maxlen is atomic; no formatting happens here.
+        self.records.append(record)
+
+    def get_messages(self, limit: Optional[int] = None) -> List[str]:
+        records = list(self.records)
+        if limit is not None:
+            records = records[-limit:]
+        return [self.format(record) for record in records]
+
+    def clear(self):
+        self.records.clear()
+
+
+_package_logger = logging.getLogger(LOGGER_NAME)
+_ring_buffer: Optional[RingBufferHandler] = None
+_config_lock = threading.Lock()
+
+
+def _parse_level(level: Union[int, str]) -> int:
+    if isinstance(level, int):
+        return level
+    parsed = logging.getLevelName(str(level).strip().upper())
+    return parsed if isinstance(parsed, int) else DEFAULT_LEVEL
+
+
+def get_logger(name: Optional[str] = None) -> logging.Logger:
+    """
+    Returns the package logger, or a child of it for `name`. Dotted module
+    names are reduced to their last component.
+    """
+    if not name:
+        return _package_logger
+    return _package_logger.getChild(name.rsplit(".", 1)[-1])
+
+
+def set_log_level(level: Union[int, str]):
+    _package_logger.setLevel(_parse_level(level))
+
+
+def enable_ring_buffer(capacity: int = DEFAULT_RING_BUFFER_CAPACITY, propagate: bool = True) -> RingBufferHandler:
+    """
+    Installs (or resizes) the ring buffer handler. With propagate=False the
+    package's records stop reaching the root logger's console handlers.
+    """
+    global _ring_buffer
+    with _config_lock:
+        if _ring_buffer is not None:
+            _package_logger.removeHandler(_ring_buffer)
+        _ring_buffer = RingBufferHandler(capacity)
+        _package_logger.addHandler(_ring_buffer)
+        _package_logger.propagate = propagate
+        return _ring_buffer
+
+
+def disable_ring_buffer():
+    global _ring_buffer
+    with _config_lock:
+        if _ring_buffer is not None:
+            _package_logger.removeHandler(_ring_buffer)
+        _ring_buffer = None
+        _package_logger.propagate = True
+
+
+def get_recent_log_messages(limit: Optional[int] = None) -> List[str]:
+    """
+    Formatted messages from the ring buffer, oldest first. Empty if the ring
+    buffer is not enabled.
+    """
+    if _ring_buffer is None:
+        return []
+    return _ring_buffer.get_messages(limit)
+
+
+set_log_level(os.environ.get(LEVEL_ENV_VAR, DEFAULT_LEVEL))
+_ring_capacity_env = os.environ.get(RING_BUFFER_ENV_VAR, "").strip()
+if _ring_capacity_env.isdigit() and int(_ring_capacity_env) > 0:
+    enable_ring_buffer(int(_ring_capacity_env))
@@ -1,20 +1,21 @@
 import json
 from typing import Optional, Tuple, Dict, Any, List
 
-# Attempt to import the backend service
-try:
-    # Adjust path based on actual ComfyUI loading and project structure
-    from lc_python_core.services.lc_web_agent_service import execute_web_interaction
-except ImportError:
-    print("\n!!! lc_web_llm_agent_node.py: Failed to import execute_web_interaction from default path. !!!")
-    print("!!! Ensure lc_python_core is in PYTHONPATH or adjust import path. !!!\n")
-    # Dummy for ComfyUI registration
-    def execute_web_interaction(*args, **kwargs) -> Dict[str, Any]:
-        return {
-            "status": "Error: lc_web_agent_service.execute_web_interaction not found. Backend not imported.",
-            "extracted_data": None,
-            "log": ["Backend service not imported."],
-        }
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+# The backend service is imported on first execute (see lazy_imports). If that
+# import fails, this stand-in returns an error status instead.
+def _execute_web_interaction_unavailable(*args, **kwargs) -> Dict[str, Any]:
+    return {
+        "status": "Error: lc_web_agent_service.execute_web_interaction not found. Backend not imported.",
+        "extracted_data": None,
+        "log": ["Backend service not imported."],
+    }
+
+execute_web_interaction = lazy_import("lc_python_core.services.lc_web_agent_service", "execute_web_interaction", fallback=_execute_web_interaction_unavailable)
 
 # Define a minimal MadaSeed type string for ComfyUI type system
 MADA_SEED_TYPE = "MADA_SEED"
@@ -69,12 +70,12 @@ class LcWebLlmAgentNode:
         """
         if not target_url or not target_url.strip():
             status_out = "Error: Target URL is required."
-            print(f"[LcWebLlmAgentNode] {status_out}")
+            logger.warning("[LcWebLlmAgentNode] %s", status_out)
             return (mada_seed_in, "{}", "[]", status_out)
         
         if not interaction_script_json or not interaction_script_json.strip():
             status_out = "Error: Interaction Script JSON is required."
-            print(f"[LcWebLlmAgentNode] {status_out}")
+            logger.warning("[LcWebLlmAgentNode] %s", status_out)
             return (mada_seed_in, "{}", "[]", status_out)
 
         # Validate interaction_script_json (basic check, service does more)
@@ -82,7 +83,7 @@ class LcWebLlmAgentNode:
             json.loads(interaction_script_json)
         except json.JSONDecodeError as e:
             status_out = f"Error: Invalid JSON in Interaction Script: {e}"
-            print(f"[LcWebLlmAgentNode] {status_out}")
+            logger.warning("[LcWebLlmAgentNode] %s", status_out)
             return (mada_seed_in, "{}", "[]", status_out)
 
         # Validate browser_control_params_json if provided (basic check)
@@ -93,7 +94,7 @@ class LcWebLlmAgentNode:
                 parsed_browser_params_json_str = browser_control_params_json
             except json.JSONDecodeError as e:
                 status_out = f"Error: Invalid JSON in Browser Control Params: {e}"
-                print(f"[LcWebLlmAgentNode] {status_out}")
+                logger.warning("[LcWebLlmAgentNode] %s", status_out)
                 return (mada_seed_in, "{}", "[]", status_out)
         
         try:
@@ -106,7 +107,7 @@ class LcWebLlmAgentNode:
             )
         except Exception as e:
             error_message = f"Error calling execute_web_interaction service: {type(e).__name__} - {str(e)}"
-            print(f"[LcWebLlmAgentNode] {error_message}")
+            logger.error("[LcWebLlmAgentNode] %s", error_message)
             return (mada_seed_in, "{}", "[]", error_message)
 
         extracted_data_dict = result.get("extracted_data", {})
@@ -120,19 +121,19 @@ class LcWebLlmAgentNode:
             extracted_data_json_str = json.dumps(extracted_data_dict, indent=2) if extracted_data_dict is not None else "{}"
         except TypeError as e:
             status_out = f"Error serializing extracted_data: {e}. Original status: {status_out}"
-            print(f"[LcWebLlmAgentNode] Extracted data serialization error: {e}")
+            logger.error("[LcWebLlmAgentNode] Extracted data serialization error: %s", e)
             # extracted_data_json_str remains "{}"
 
         try:
             interaction_log_json_str = json.dumps(log_list, indent=2) if log_list is not None else "[]"
         except TypeError as e:
             status_out = f"Error serializing interaction_log: {e}. Original status: {status_out}"
-            print(f"[LcWebLlmAgentNode] Interaction log serialization error: {e}")
+            logger.error("[LcWebLlmAgentNode] Interaction log serialization error: %s", e)
             # interaction_log_json_str remains "[]"
         
-        print(f"[LcWebLlmAgentNode] Target URL: {target_url}, Status: {status_out}")
+        logger.debug("[LcWebLlmAgentNode] Target URL: %s, Status: %s", target_url, status_out)
         if extracted_data_dict:
-             print(f"  Extracted Data Snippet: {str(extracted_data_dict)[:100]}...")
+             logger.debug("  Extracted Data Snippet: %s...", str(extracted_data_dict)[:100])
         # print(f"  Interaction Log: {interaction_log_json_str}")
 
 
@@ -0,0 +1,248 @@
+"""
+Bulk storage and retrieval of MADA objects.
+
+StoreMadaObjectNode pays for three json.loads, an ensure_uid call and a
+create_object call per object. store_mada_objects() handles a whole batch:
+the payloads are parsed in one pass (a JSON array or NDJSON), the persona
+context and metadata once, UIDs are allocated for the batch up front and
+the objects are then written together:
+
+    result = store_mada_objects(payloads_text, "Observation", persona_context)
+    result.object_uids   # one per item, "" where the item failed
+    result.statuses      # [{"index": 0, "object_uid": "...", "status": "stored"}, ...]
+
+If the storage backend has the batch calls ensure_uids and create_objects
+(see storage_backends.MadaStorageBackend.batch_call; SQLite always has them,
+lc_mem_service if it provides mock_lc_mem_core_ensure_uids/_create_objects)
+they are used, one call each per batch, and the backend writes the batch in
+one transaction. `objects` are dicts with object_uid, object_type,
+object_payload and initial_metadata. Otherwise the single-object calls are
+made in a loop over the already-parsed batch, and each item succeeds or
+fails on its own.
+
+get_mada_objects() is the read side: the UIDs are de-duplicated and fetched
+with one get_objects batch call (returning a dict by UID) if the backend has
+it, or else with concurrent single-object reads on a thread pool. Reads go
+through the mada_read_cache, and stored UIDs are invalidated there.
+"""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .lc_logging import get_logger
+from .mada_read_cache import cache_variant, get_mada_read_cache, invalidate_mada_objects
+from .storage_backends import get_storage_backend
+
+logger = get_logger(__name__)
+
+STORED = "stored"
+ERROR = "error"
+
+
+class BulkStoreResult(NamedTuple):
+    object_uids: List[str]
+    statuses: List[Dict[str, Any]]
+    batched: bool # whether the service's batch calls were used
+
+    def counts(self) -> Dict[str, int]:
+        stored = sum(1 for status in self.statuses if status["status"] == STORED)
+        return {"total": len(self.statuses), STORED: stored, ERROR: len(self.statuses) - stored}
+
+
+def parse_payloads(payloads_text: str) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Splits a JSON array of payload objects, NDJSON (one object per line) or
+    a single JSON object into (payload, error) pairs, one per item.
+
+    A malformed JSON array is an error for the whole batch (ValueError); a
+    malformed NDJSON line or a non-object item only fails that item.
+    """
+    text = payloads_text.strip() if payloads_text else ""
+    if not text:
+        return []
+    if text.startswith("["):
+        try:
+            items = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Error decoding payloads JSON array: {e}") from e
+    else:
+        try:
+            items = [json.loads(text)] # a single (possibly multi-line) object
+        except json.JSONDecodeError:
+            items = None
+        if items is None:
+            parsed: List[Tuple[Optional[Dict[str, Any]], Optional[str]]] = []
+            for line_number, line in enumerate(text.splitlines(), 1):
+                if not line.strip():
+                    continue
+                try:
+                    parsed.append(_checked_payload(json.loads(line)))
+                except json.JSONDecodeError as e:
+                    parsed.append((None, f"Error decoding payload on line {line_number}: {e}"))
+            return parsed
+    return [_checked_payload(item) for item in items]
+
+
+def _checked_payload(item: Any) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    if isinstance(item, dict):
+        return item, None
+    return None, f"Payload must be a JSON object, got {type(item).__name__}"
+
+
+def _uid_error(uid: Any) -> Optional[str]:
+    # The mock service reports failures as strings containing "Error"/"ERROR".
+    if not isinstance(uid, str) or not uid:
+        return f"Error ensuring UID: {uid!r}"
+    if "Error" in uid or "ERROR" in uid:
+        return f"Error ensuring UID: {uid}"
+    return None
+
+
+def store_mada_objects(payloads: Any, object_type: str, requesting_persona_context: Optional[Dict[str, Any]] = None,
+                       initial_metadata: Optional[Dict[str, Any]] = None) -> BulkStoreResult:
+    """
+    Stores a batch of payloads as `object_type` objects. `payloads` is the
+    text accepted by parse_payloads() or an already-parsed list of dicts.
+    Every item gets a status entry, in input order.
+    """
+    items = parse_payloads(payloads) if isinstance(payloads, str) else [_checked_payload(item) for item in payloads]
+    statuses: List[Dict[str, Any]] = [{"index": index, "object_uid": "", "status": STORED} for index in range(len(items))]
+    for status, (_, error) in zip(statuses, items):
+        if error:
+            status.update(status=ERROR, error=error)
+    pending = [index for index, (_, error) in enumerate(items) if error is None]
+    if not pending:
+        return BulkStoreResult(["" for _ in items], statuses, False)
+
+    backend = get_storage_backend()
+    ensure_uids, create_objects = backend.batch_call("ensure_uids"), backend.batch_call("create_objects")
+    context_description = f"ComfyUI bulk store of {len(pending)} {object_type} object(s)"
+
+    # Allocate all UIDs before writing anything.
+    if ensure_uids is not None:
+        try:
+            uids = list(ensure_uids(object_type=object_type, count=len(pending), context_description=context_description))
+            if len(uids) != len(pending):
+                raise ValueError(f"expected {len(pending)} UIDs, got {len(uids)}")
+        except Exception as e:
+            uids = [f"Error ensuring UIDs: {e}"] * len(pending)
+    else:
+        ensure_uid = backend.ensure_uid
+        uids = []
+        for _ in pending:
+            try:
+                uids.append(ensure_uid(object_type=object_type, context_description=context_description))
+            except Exception as e:
+                uids.append(f"Error ensuring UID: {e}")
+
+    writable: List[int] = []
+    for index, uid in zip(pending, uids):
+        error = _uid_error(uid)
+        if error:
+            statuses[index].update(status=ERROR, error=error)
+        else:
+            statuses[index]["object_uid"] = uid
+            writable.append(index)
+
+    if create_objects is not None and writable:
+        objects = [{"object_uid": statuses[index]["object_uid"], "object_type": object_type, "object_payload": items[index][0],
+                    "initial_metadata": initial_metadata} for index in writable]
+        try:
+            results = list(create_objects(objects=objects, requesting_persona_context=requesting_persona_context))
+            if len(results) != len(writable):
+                raise ValueError(f"expected {len(writable)} results, got {len(results)}")
+        except Exception as e:
+            results = [f"Exception during batch create: {e}"] * len(writable)
+    else:
+        create_object = backend.create_object
+        results = []
+        for index in writable:
+            try:
+                results.append(create_object(object_uid=statuses[index]["object_uid"], object_payload=items[index][0],
+                                             initial_metadata=initial_metadata, requesting_persona_context=requesting_persona_context))
+            except Exception as e:
+                results.append(f"Exception during create_object: {e}")
+
+    for index, success_or_error in zip(writable, results):
+        if success_or_error is not True: # the service returns True on success
+            statuses[index].update(object_uid="", status=ERROR, error=f"Error storing object: {success_or_error}")
+
+    invalidate_mada_objects(*(status["object_uid"] for status in statuses))
+    batched = ensure_uids is not None and create_objects is not None
+    result = BulkStoreResult([status["object_uid"] for status in statuses], statuses, batched)
+    counts = result.counts()
+    logger.info("Bulk stored %d of %d %s object(s)%s.", counts[STORED], counts["total"], object_type, " in one batch" if batched else "")
+    return result
+
+
+DEFAULT_GET_WORKERS = 8
+
+
+class BulkGetResult(NamedTuple):
+    objects: Dict[str, Any] # by UID in first-requested order; None for missing UIDs
+    missing: List[str]
+    errors: Dict[str, str]
+    batched: bool
+
+
+def is_missing_object(obj: Any) -> bool:
+    # The mock service may return its default string instead of None.
+    return obj is None or (isinstance(obj, str) and "not found in mock_mada_store" in obj)
+
+
+def get_mada_objects(object_uids: Iterable[str], requesting_persona_context: Optional[Dict[str, Any]] = None,
+                     max_workers: int = DEFAULT_GET_WORKERS, use_cache: bool = True) -> BulkGetResult:
+    """
+    Fetches each distinct UID once. With `use_cache`, UIDs held by the
+    mada_read_cache are not fetched at all and found objects are stored
+    there. A UID whose read raised is reported in `errors` and, like a UID
+    the service does not have, in `missing`.
+    """
+    uids = list(dict.fromkeys(uid for uid in object_uids if uid))
+    objects: Dict[str, Any] = dict.fromkeys(uids)
+    errors: Dict[str, str] = {}
+    cache = get_mada_read_cache() if use_cache else None
+    variant = cache_variant(requesting_persona_context)
+    to_fetch = uids
+    if cache is not None:
+        to_fetch = []
+        for uid in uids:
+            hit, obj = cache.get("object", uid, variant=variant)
+            if hit:
+                objects[uid] = obj
+            else:
+                to_fetch.append(uid)
+        epoch = cache.current_epoch()
+    backend = get_storage_backend()
+    get_objects = backend.batch_call("get_objects") if to_fetch else None
+
+    if get_objects is not None:
+        found = get_objects(object_uids=to_fetch, requesting_persona_context=requesting_persona_context) or {}
+        fetched = [found.get(uid) for uid in to_fetch]
+    elif to_fetch:
+        get_object = backend.get_object
+
+        def fetch(uid: str) -> Any:
+            try:
+                return get_object(object_uid=uid, requesting_persona_context=requesting_persona_context)
+            except Exception as e:
+                errors[uid] = f"Exception during get_object: {e}"
+                return None
+
+        if len(to_fetch) == 1 or max_workers <= 1:
+            fetched = [fetch(uid) for uid in to_fetch]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(to_fetch)), thread_name_prefix="lc-mada-get") as pool:
+                fetched = list(pool.map(fetch, to_fetch))
+    else:
+        fetched = []
+
+    for uid, obj in zip(to_fetch, fetched):
+        objects[uid] = obj
+        if cache is not None and not is_missing_object(obj):
+            cache.put("object", uid, obj, variant=variant, epoch=epoch)
+
+    missing = [uid for uid, obj in objects.items() if is_missing_object(obj)]
+    for uid in missing:
+        objects[uid] = None
+    return BulkGetResult(objects, missing, errors, get_objects is not None)
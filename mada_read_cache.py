@@ -0,0 +1,244 @@
+"""
+Process-wide read-through cache for lc_mem_service object reads.
+
+GetMadaObjectNode, GetMadaObjectsNode, LcGetPbiDetailsNode and
+ViewRDSOTMCycleDetailsNode call the service (or the SOP getters) on every
+run. They read through this cache instead:
+
+    obj = get_mada_read_cache().get_or_load(
+        "object", object_uid, lambda: mock_lc_mem_core_get_object(object_uid=object_uid),
+        variant=persona_context)
+
+Entries are keyed by (kind, object_uid, version, variant). Reads that do not
+name a version use version None ("latest"). `variant` covers every other
+input that changes the answer, e.g. the persona context. Missing objects
+and errors are not cached.
+
+Writes evict: LcMemWriteNode, StoreMadaObjectNode, StoreMadaObjectsBulkNode,
+LcLinkPbiNode, LcAddCommentToPbiNode and CreateRDSOTMComponentNode call
+invalidate_mada_objects() with the UIDs they touched. An entry is also
+indexed under every CRUX UID that appears in its value (linked PBIs, cycle
+components), so a write to a referenced object evicts it as well.
+
+Writes made outside these nodes (another process, a script) are only seen
+once an entry's TTL has expired. The LRU holds LC_EPISTEMIC_MADA_CACHE_SIZE
+entries (default 512, 0 disables the cache). LC_EPISTEMIC_MADA_CACHE_TTL
+sets the TTL in seconds (default 300, 0 means entries never expire).
+stats() reports hits, misses, expirations, evictions, invalidations and
+hit_rate.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL_SECONDS = 300.0
+UID_PREFIX = "urn:crux:uid::"
+
+CacheKey = Tuple[str, str, Optional[str], Hashable]
+
+
+def _env_number(name: str, default: float) -> float:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, value)
+        return default
+
+
+def cache_variant(value: Any) -> Hashable:
+    """
+    Hashable key part for a dict/list input such as the persona context.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def referenced_uids(value: Any, limit: int = 256) -> Set[str]:
+    """
+    CRUX UIDs that appear as string values anywhere in `value`.
+    """
+    found: Set[str] = set()
+    stack = [value]
+    while stack and len(found) < limit:
+        item = stack.pop()
+        if isinstance(item, str):
+            if item.startswith(UID_PREFIX):
+                found.add(item)
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return found
+
+
+class MadaReadCache:
+    """
+    Thread-safe LRU with a TTL and an index from object UID to entries.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any, Set[str]]]" = OrderedDict()
+        self._by_uid: Dict[str, Set[CacheKey]] = {}
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        # Bumped on every invalidation; a load that overlapped one is not stored.
+        self._epoch = 0
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "stores": 0, "evictions": 0, "invalidations": 0}
+
+    def _unlink(self, key: CacheKey, uids: Set[str]):
+        # Caller holds the lock.
+        for uid in uids:
+            keys = self._by_uid.get(uid)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_uid[uid]
+
+    def _drop(self, key: CacheKey):
+        # Caller holds the lock.
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unlink(key, entry[2])
+
+    def get(self, kind: str, object_uid: str, version: Optional[str] = None, variant: Hashable = None) -> Tuple[bool, Any]:
+        """
+        (True, value) for a live entry, else (False, None).
+        """
+        key = (kind, object_uid, version, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value, _ = entry
+                if expires_at and expires_at <= time.monotonic():
+                    self._drop(key)
+                    self._stats["expired"] += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return True, value
+            self._stats["misses"] += 1
+            return False, None
+
+    def put(self, kind: str, object_uid: str, value: Any, version: Optional[str] = None, variant: Hashable = None,
+            epoch: Optional[int] = None):
+        """
+        Stores `value`; skipped if an invalidation happened after `epoch`
+        (from current_epoch(), taken before the value was read).
+        """
+        if self.max_entries == 0:
+            return
+        key = (kind, object_uid, version, variant)
+        uids = referenced_uids(value)
+        uids.add(object_uid)
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else 0.0
+        with self._lock:
+            if epoch is not None and epoch != self._epoch:
+                return
+            self._drop(key)
+            self._entries[key] = (expires_at, value, uids)
+            for uid in uids:
+                self._by_uid.setdefault(uid, set()).add(key)
+            self._stats["stores"] += 1
+            while len(self._entries) > self.max_entries:
+                old_key, (_, _, old_uids) = self._entries.popitem(last=False)
+                self._unlink(old_key, old_uids)
+                self._stats["evictions"] += 1
+
+    def current_epoch(self) -> int:
+        with self._lock:
+            return self._epoch
+
+    def get_or_load(self, kind: str, object_uid: str, loader: Callable[[], Any], version: Optional[str] = None,
+                    variant: Hashable = None, cacheable: Callable[[Any], bool] = lambda value: value is not None) -> Any:
+        """
+        The cached value, or loader()'s result (stored if `cacheable`).
+        The value is shared between callers: treat it as read-only.
+        """
+        hit, value = self.get(kind, object_uid, version, variant)
+        if hit:
+            return value
+        epoch = self.current_epoch()
+        value = loader()
+        if cacheable(value):
+            self.put(kind, object_uid, value, version, variant, epoch)
+        return value
+
+    def invalidate(self, object_uids: Iterable[Optional[str]]) -> int:
+        """
+        Drops every entry for, or referencing, the given UIDs. Returns the
+        number of entries dropped.
+        """
+        dropped = 0
+        with self._lock:
+            self._epoch += 1
+            for uid in object_uids:
+                if not uid:
+                    continue
+                for key in list(self._by_uid.get(uid, ())):
+                    self._drop(key)
+                    dropped += 1
+            self._stats["invalidations"] += dropped
+        return dropped
+
+    def clear(self):
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._by_uid.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+
+_cache: Optional[MadaReadCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_mada_read_cache() -> MadaReadCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = MadaReadCache(
+                    max_entries=int(_env_number("LC_EPISTEMIC_MADA_CACHE_SIZE", DEFAULT_MAX_ENTRIES)),
+                    ttl_seconds=_env_number("LC_EPISTEMIC_MADA_CACHE_TTL", DEFAULT_TTL_SECONDS),
+                )
+    return _cache
+
+
+def configure_mada_read_cache(max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> MadaReadCache:
+    """
+    Replaces the shared cache (dropping its entries).
+    """
+    global _cache
+    with _cache_lock:
+        _cache = MadaReadCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+    return _cache
+
+
+def invalidate_mada_objects(*object_uids: Optional[str]) -> int:
+    """
+    Evicts cached reads of, or referencing, the given UIDs. Called by the
+    write nodes after the backend call, whatever its status.
+    """
+    return get_mada_read_cache().invalidate(object_uids)
@@ -0,0 +1,62 @@
+import json
+from typing import Optional
+
+from .lc_logging import get_logger
+from .pipeline_node import run_pipeline_batch, split_batch_input
+
+logger = get_logger(__name__)
+
+class LcEpistemicPipelineBatchNode:
+    CATEGORY = "LearntCloud/EpistemicOSI"
+    RETURN_TYPES = ("MADA_SEED", "STRING", "STRING",)
+    RETURN_NAMES = ("final_mada_seeds", "batch_results_json", "batch_timing_json",)
+    FUNCTION = "execute_batch"
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                # One input per line, or a JSON array of strings
+                "batch_input_text": ("STRING", {"multiline": True, "default": ""}),
+            },
+            "optional": {
+                "l1_origin_hint": ("STRING", {"multiline": False, "default": "ComfyUI_LcPipelineBatchNode"}),
+                "l1_optional_attachments_ref": ("STRING", {"multiline": False, "default": ""}),
+                "l2_communication_context_hints": ("STRING", {"multiline": True, "default": "{}"}), # JSON string
+                "l4_persona_profile_uid_override": ("STRING", {"multiline": False, "default": ""}),
+                "l5_field_instance_uid_override": ("STRING", {"multiline": False, "default": ""}),
+                "l6_presentation_intent_override": ("STRING", {"multiline": False, "default": ""}),
+                "l7_action_intent_override": ("STRING", {"multiline": False, "default": ""}),
+                # 0 runs on the calling thread; >0 fans the batch out to a persistent process pool
+                "workers": ("INT", {"default": 0, "min": 0, "max": 64}),
+            }
+        }
+
+    def execute_batch(self, batch_input_text: str,
+                      l1_origin_hint: Optional[str] = None,
+                      l1_optional_attachments_ref: Optional[str] = None,
+                      l2_communication_context_hints: Optional[str] = None,
+                      l4_persona_profile_uid_override: Optional[str] = None,
+                      l5_field_instance_uid_override: Optional[str] = None,
+                      l6_presentation_intent_override: Optional[str] = None,
+                      l7_action_intent_override: Optional[str] = None,
+                      workers: int = 0):
+        inputs = split_batch_input(batch_input_text)
+        logger.debug("LcEpistemicPipelineBatchNode: Running %d input(s) through L1-L7.", len(inputs))
+
+        result = run_pipeline_batch(
+            inputs,
+            workers=workers,
+            l1_origin_hint=l1_origin_hint,
+            l1_optional_attachments_ref=l1_optional_attachments_ref,
+            l2_communication_context_hints=l2_communication_context_hints,
+            l4_persona_profile_uid_override=l4_persona_profile_uid_override,
+            l5_field_instance_uid_override=l5_field_instance_uid_override,
+            l6_presentation_intent_override=l6_presentation_intent_override,
+            l7_action_intent_override=l7_action_intent_override,
+        )
+
+        timing = result["timing"]
+        logger.info("LcEpistemicPipelineBatchNode: %d succeeded, %d failed in %.3fs.", timing["succeeded"], timing["failed"], timing["total_seconds"])
+        # The seeds list is passed on as a single MADA_SEED value; failed items are None.
+        return (result["seeds"], json.dumps(result["items"], indent=2), json.dumps(timing, indent=2))
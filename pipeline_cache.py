@@ -0,0 +1,261 @@
+"""
+Content-addressed result cache for the L1-L7 pipeline.
+
+A pipeline run is keyed by a SHA-256 over the input text, the attachment
+ref, every (normalized) layer override and the installed lc_python_core
+version, so upgrading the SOPs never serves stale seeds. Entries hold the
+final seed in the seed_codec wire format plus the summary strings; each hit
+decodes a fresh MadaSeed, so downstream nodes that mutate their input cannot
+corrupt the cached copy.
+
+Tiers:
+    memory - LRU, LC_EPISTEMIC_PIPELINE_CACHE_SIZE entries (default 128).
+    disk   - optional, enabled with LC_EPISTEMIC_PIPELINE_CACHE_DIR or
+             configure_pipeline_cache(disk_dir=...). One zlib-compressed file
+             per key; never evicted automatically (clear(disk=True) empties it).
+
+Usage:
+    from .pipeline_cache import get_pipeline_cache, pipeline_cache_key
+    key = pipeline_cache_key(input_text, params)
+    result = get_pipeline_cache().get(key)
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .lc_logging import get_logger
+from .seed_codec import SeedCodecError, decode_data, encode_data
+
+logger = get_logger(__name__)
+
+# Bump when the entry layout or key derivation changes.
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_ENTRIES = 128
+_DISK_SUFFIX = ".lcsd"
+
+_core_version: Optional[str] = None
+
+
+def lc_python_core_version() -> str:
+    """
+    Installed lc_python_core version: package metadata if it is installed as
+    a distribution, else the module's __version__, else "unknown".
+    """
+    global _core_version
+    if _core_version is not None:
+        return _core_version
+    version = None
+    try:
+        from importlib import metadata
+        for dist_name in ("lc_python_core", "lc-python-core"):
+            try:
+                version = metadata.version(dist_name)
+                break
+            except metadata.PackageNotFoundError:
+                continue
+    except ImportError:
+        pass
+    if version is None:
+        try:
+            import lc_python_core
+            version = getattr(lc_python_core, "__version__", None)
+        except ImportError:
+            version = "unavailable"
+    _core_version = str(version or "unknown")
+    return _core_version
+
+
+def pipeline_cache_key(input_text: str, params: Dict[str, Any]) -> str:
+    """
+    Stable key for one run. `params` is the dict from
+    pipeline_node.prepare_pipeline_params().
+    """
+    material = {
+        "format": CACHE_FORMAT_VERSION,
+        "lc_python_core": lc_python_core_version(),
+        "input_text": input_text,
+        "params": params,
+    }
+    canonical = json.dumps(material, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, value)
+        return default
+
+
+class PipelineResultCache:
+    """
+    Thread-safe LRU of pipeline results with an optional disk tier.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, disk_dir: Optional[str] = None):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self.max_entries = max(0, max_entries)
+        self.disk_dir = disk_dir
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+        self._stats = {"hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0}
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key + _DISK_SUFFIX)
+
+    def _remember(self, key: str, blob: bytes):
+        # Caller holds the lock.
+        if self.max_entries == 0:
+            return
+        self._entries[key] = blob
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("PipelineResultCache: Failed to read %s: %s", key, e)
+            return None
+
+    def _write_disk(self, key: str, blob: bytes):
+        if not self.disk_dir:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, self._disk_path(key))
+        except OSError as e:
+            logger.warning("PipelineResultCache: Failed to write %s: %s", key, e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            if key in self._entries:
+                return True
+        return bool(self.disk_dir) and os.path.exists(self._disk_path(key))
+
+    def get(self, key: str, seed_cls: Any = None) -> Optional[Tuple[Any, str, str, str, str]]:
+        """
+        Returns (final_mada_seed, trace_id, l6_summary, l7_summary,
+        l7_next_steps) or None. `seed_cls` defaults to the schemas MadaSeed.
+        """
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+        if blob is None:
+            blob = self._read_disk(key)
+            with self._lock:
+                if blob is None:
+                    self._stats["misses"] += 1
+                    return None
+                self._stats["disk_hits"] += 1
+                self._remember(key, blob)
+        try:
+            entry = decode_data(blob)
+            if seed_cls is None:
+                from lc_python_core.schemas.mada_schema import MadaSeed as seed_cls
+            seed = seed_cls.model_validate(entry["seed"])
+        except (SeedCodecError, KeyError, ValueError) as e:
+            # A corrupt or incompatible entry is treated as a miss.
+            logger.warning("PipelineResultCache: Dropping unreadable entry %s: %s", key, e)
+            self.discard(key)
+            with self._lock:
+                self._stats["errors"] += 1
+                self._stats["misses"] += 1
+            return None
+        return (seed, entry["trace_id"], entry["l6_summary"], entry["l7_summary"], entry["l7_next_steps"])
+
+    def put(self, key: str, result: Tuple[Any, str, str, str, str]):
+        final_mada_seed, trace_id, l6_summary, l7_summary, l7_next_steps = result
+        if not hasattr(final_mada_seed, "model_dump"):
+            return
+        blob = encode_data({
+            "seed": final_mada_seed.model_dump(mode="json"),
+            "trace_id": trace_id,
+            "l6_summary": l6_summary,
+            "l7_summary": l7_summary,
+            "l7_next_steps": l7_next_steps,
+        }, compress=True)
+        with self._lock:
+            self._remember(key, blob)
+            self._stats["stores"] += 1
+        self._write_disk(key, blob)
+
+    def discard(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.disk_dir:
+            try:
+                os.unlink(self._disk_path(key))
+            except OSError:
+                pass
+
+    def clear(self, disk: bool = False):
+        with self._lock:
+            self._entries.clear()
+        if disk and self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith(_DISK_SUFFIX):
+                    try:
+                        os.unlink(os.path.join(self.disk_dir, name))
+                    except OSError:
+                        pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._entries)
+        stats["max_entries"] = self.max_entries
+        stats["disk_dir"] = self.disk_dir
+        lookups = stats["hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+
+_cache: Optional[PipelineResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_pipeline_cache() -> PipelineResultCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PipelineResultCache(
+                    max_entries=_env_int("LC_EPISTEMIC_PIPELINE_CACHE_SIZE", DEFAULT_MAX_ENTRIES),
+                    disk_dir=os.environ.get("LC_EPISTEMIC_PIPELINE_CACHE_DIR") or None,
+                )
+    return _cache
+
+
+def configure_pipeline_cache(max_entries: int = DEFAULT_MAX_ENTRIES, disk_dir: Optional[str] = None) -> PipelineResultCache:
+    """
+    Replaces the shared cache (dropping its in-memory entries).
+    """
+    global _cache
+    with _cache_lock:
+        _cache = PipelineResultCache(max_entries=max_entries, disk_dir=disk_dir)
+    return _cache
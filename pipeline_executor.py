@@ -0,0 +1,163 @@
+"""
+Process-pool execution engine for the L1-L7 pipeline.
+
+The SOP chain is CPU bound and runs under the GIL, so running it on the
+ComfyUI worker thread pins it to one core. This module keeps a persistent
+ProcessPoolExecutor whose workers import lc_python_core once at start-up and
+then run pipeline_node.run_pipeline for chunks of inputs. Final seeds cross
+the process boundary in the seed_codec wire format rather than as pickled
+Pydantic object graphs.
+
+Worker processes must be able to import this package by name, which is the
+case when ComfyUI's custom_nodes directory is on sys.path.
+"""
+import atexit
+import math
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .layer_cache import get_layer_cache
+from .lc_logging import get_logger
+from .pipeline_metrics import SPAN_SEED_TRANSFER, timed_span
+from .pipeline_node import MadaSeed, run_batch_item, run_pipeline, summarize_batch_timing
+from .seed_codec import decode_seed, encode_seed
+
+logger = get_logger(__name__)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+# Each worker gets roughly this many chunks per batch, which keeps IPC
+# overhead low while still balancing uneven item costs.
+_CHUNKS_PER_WORKER = 4
+
+
+def _init_worker():
+    # Pay the lc_python_core import cost once per worker instead of per task.
+    from .lazy_imports import preload_backends
+    preload_backends(("lc_python_core.sops", "lc_python_core.schemas"))
+
+
+def get_process_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Returns the shared pool, (re)creating it if the requested size changed.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        # A worker crash leaves the executor permanently broken; replace it.
+        if _pool is None or _pool_workers != workers or getattr(_pool, "_broken", False):
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_process_pool(wait: bool = True):
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait)
+        _pool = None
+        _pool_workers = 0
+
+
+atexit.register(shutdown_process_pool)
+
+
+def _dump_seed(mada_seed: Any) -> Optional[Tuple[str, bytes]]:
+    if mada_seed is None:
+        return None
+    if hasattr(mada_seed, "model_dump"):
+        return ("codec", encode_seed(mada_seed))
+    return ("pickle", pickle.dumps(mada_seed, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _load_seed(payload: Optional[Tuple[str, bytes]]) -> Any:
+    if payload is None:
+        return None
+    seed_format, data = payload
+    if seed_format == "codec":
+        return decode_seed(data, MadaSeed)
+    return pickle.loads(data)
+
+
+def _run_chunk_in_worker(chunk: List[Tuple[int, str]], params: Dict[str, Any]) -> List[Tuple[Dict[str, Any], Optional[Tuple[str, bytes]]]]:
+    results = []
+    for index, input_text in chunk:
+        final_mada_seed, item = run_batch_item(index, input_text, params)
+        with timed_span(item["layer_timings"], SPAN_SEED_TRANSFER):
+            seed_payload = _dump_seed(final_mada_seed)
+        results.append((item, seed_payload))
+    return results
+
+
+def _run_single_in_worker(input_text: str, params: Dict[str, Any], use_layer_cache: bool = False):
+    timings: Dict[str, float] = {}
+    layer_cache = get_layer_cache() if use_layer_cache else None # per worker process
+    final_mada_seed, trace_id, l6_summary, l7_summary, l7_next_steps = run_pipeline(input_text, params, timings, layer_cache)
+    with timed_span(timings, SPAN_SEED_TRANSFER):
+        seed_payload = _dump_seed(final_mada_seed)
+    return (seed_payload, trace_id, l6_summary, l7_summary, l7_next_steps, timings)
+
+
+def run_pipeline_in_pool(input_text: str, params: Dict[str, Any], workers: int, timings: Optional[Dict[str, float]] = None,
+                         use_layer_cache: bool = False):
+    """
+    Process-pool equivalent of pipeline_node.run_pipeline. Exceptions raised
+    by the SOPs propagate to the caller exactly as in the serial path. The
+    worker's span timings (plus seed transfer time) are merged into `timings`.
+    """
+    pool = get_process_pool(workers)
+    seed_payload, trace_id, l6_summary, l7_summary, l7_next_steps, worker_timings = pool.submit(_run_single_in_worker, input_text, params, use_layer_cache).result()
+    if timings is not None:
+        timings.update(worker_timings)
+    with timed_span(timings, SPAN_SEED_TRANSFER):
+        final_mada_seed = _load_seed(seed_payload)
+    return (final_mada_seed, trace_id, l6_summary, l7_summary, l7_next_steps)
+
+
+def run_batch_in_pool(inputs: List[str], params: Dict[str, Any], workers: int) -> Dict[str, Any]:
+    """
+    Process-pool equivalent of the serial loop in pipeline_node.run_pipeline_batch.
+    Returns the same {"seeds", "items", "timing"} dict, in input order.
+    """
+    batch_start = time.perf_counter()
+    indexed = list(enumerate(inputs))
+    chunk_size = max(1, math.ceil(len(indexed) / (workers * _CHUNKS_PER_WORKER))) if indexed else 1
+    chunks = [indexed[i:i + chunk_size] for i in range(0, len(indexed), chunk_size)]
+
+    pool = get_process_pool(workers)
+    futures = [pool.submit(_run_chunk_in_worker, chunk, params) for chunk in chunks]
+
+    seeds: List[Any] = []
+    items: List[Dict[str, Any]] = []
+    for chunk, future in zip(chunks, futures):
+        try:
+            chunk_results = future.result()
+        except Exception as e:
+            # The worker itself died (e.g. BrokenProcessPool); fail only this chunk's items.
+            logger.error("LcEpistemicPipelineNode: Worker failed for items %d-%d: %s: %s", chunk[0][0], chunk[-1][0], type(e).__name__, e)
+            for index, _ in chunk:
+                items.append({"index": index, "status": "error", "trace_id": None,
+                              "error": f"{type(e).__name__}: {e}", "elapsed_seconds": 0.0})
+                seeds.append(None)
+            continue
+        for item, seed_payload in chunk_results:
+            try:
+                with timed_span(item["layer_timings"], SPAN_SEED_TRANSFER):
+                    seeds.append(_load_seed(seed_payload))
+            except Exception as e:
+                item["status"] = "error"
+                item["error"] = f"Seed transfer failed: {type(e).__name__}: {e}"
+                seeds.append(None)
+            items.append(item)
+    total_seconds = time.perf_counter() - batch_start
+
+    timing = summarize_batch_timing(items, total_seconds)
+    timing["workers"] = workers
+    return {"seeds": seeds, "items": items, "timing": timing}
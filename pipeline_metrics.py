@@ -0,0 +1,109 @@
+"""
+In-process latency metrics for the L1-L7 pipeline.
+
+pipeline_node.run_pipeline fills a plain dict of span name -> seconds for
+each run (one span per SOP call plus parse, summary and total time). The
+nodes record those dicts into PIPELINE_METRICS so other code can query
+per-layer aggregates without parsing node outputs:
+
+    from .pipeline_metrics import get_pipeline_metrics
+    get_pipeline_metrics().snapshot()["L3_keymap_click"]["mean_seconds"]
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+# Span names, in pipeline order, as they appear in timing dicts.
+SPAN_PARSE = "parse_params"
+LAYER_SPANS = (
+    "L1_startle",
+    "L2_frame_click",
+    "L3_keymap_click",
+    "L4_anchor_click",
+    "L5_field_click",
+    "L6_reflect_boom",
+    "L7_apply_done",
+)
+SPAN_SUMMARIES = "summaries"
+SPAN_SEED_TRANSFER = "seed_transfer"
+SPAN_CACHE_LOOKUP = "cache_lookup"
+SPAN_CACHE_STORE = "cache_store"
+SPAN_TOTAL = "total"
+
+
+@contextmanager
+def timed_span(timings: Optional[Dict[str, float]], span: str) -> Iterator[None]:
+    """
+    Adds the elapsed perf_counter time of the block to timings[span].
+    Does nothing if timings is None.
+    """
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[span] = timings.get(span, 0.0) + (time.perf_counter() - start)
+
+
+class PipelineMetricsRegistry:
+    """
+    Thread-safe per-span aggregates (count, total, min, max, last).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._spans: Dict[str, Dict[str, float]] = {}
+        self._runs = 0
+
+    def record(self, span: str, seconds: float):
+        with self._lock:
+            self._record_locked(span, seconds)
+
+    def record_run(self, timings: Dict[str, float]):
+        with self._lock:
+            self._runs += 1
+            for span, seconds in timings.items():
+                self._record_locked(span, seconds)
+
+    def _record_locked(self, span: str, seconds: float):
+        stats = self._spans.get(span)
+        if stats is None:
+            self._spans[span] = {"count": 1, "total_seconds": seconds, "min_seconds": seconds,
+                                 "max_seconds": seconds, "last_seconds": seconds}
+            return
+        stats["count"] += 1
+        stats["total_seconds"] += seconds
+        stats["last_seconds"] = seconds
+        if seconds < stats["min_seconds"]: stats["min_seconds"] = seconds
+        if seconds > stats["max_seconds"]: stats["max_seconds"] = seconds
+
+    @property
+    def run_count(self) -> int:
+        return self._runs
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns a copy of the aggregates with mean_seconds filled in.
+        """
+        with self._lock:
+            result = {}
+            for span, stats in self._spans.items():
+                entry = dict(stats)
+                entry["mean_seconds"] = stats["total_seconds"] / stats["count"]
+                result[span] = entry
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+            self._runs = 0
+
+
+PIPELINE_METRICS = PipelineMetricsRegistry()
+
+
+def get_pipeline_metrics() -> PipelineMetricsRegistry:
+    return PIPELINE_METRICS
@@ -1,21 +1,34 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Generator, Iterable, List, NamedTuple, Tuple
 from datetime import datetime, timezone
 import json
+import time
 
-# Import all SOP processes and the MadaSeed schema
-from lc_python_core.schemas.mada_schema import MadaSeed
-from lc_python_core.sops.sop_l1_startle import startle_process
-from lc_python_core.sops.sop_l2_frame_click import frame_click_process
-from lc_python_core.sops.sop_l3_keymap_click import keymap_click_process
-from lc_python_core.sops.sop_l4_anchor_click import anchor_click_process
-from lc_python_core.sops.sop_l5_field_click import field_click_process
-from lc_python_core.sops.sop_l6_reflect_boom import reflect_boom_process
-from lc_python_core.sops.sop_l7_apply_done import apply_done_process
+from .async_runner import resolve_awaitable
+from .content_store import with_resolved_content
+from .lazy_imports import lazy_import
+from .layer_cache import get_layer_cache, layer_keys
+from .lc_logging import get_logger
+from .pipeline_cache import get_pipeline_cache, pipeline_cache_key
+from .pipeline_metrics import PIPELINE_METRICS, SPAN_CACHE_LOOKUP, SPAN_CACHE_STORE, SPAN_PARSE, SPAN_SUMMARIES, SPAN_TOTAL, timed_span
+from .seed_paths import (L6_EPISTEMIC_STATE, L6_FORMATTED_TEXT, L6_PAYLOAD_OBJ, L6_STRUCTURED_DATA, L7_EPISTEMIC_STATE,
+                         L7_FIRST_OUTPUT_OPTIONS, L7_SEED_OUTPUTS, SEED_INTEGRITY_STATUS, enum_name)
+
+logger = get_logger(__name__)
+
+# All SOP processes and the MadaSeed schema; imported on first use (see lazy_imports)
+MadaSeed = lazy_import("lc_python_core.schemas.mada_schema", "MadaSeed")
+startle_process = lazy_import("lc_python_core.sops.sop_l1_startle", "startle_process")
+frame_click_process = lazy_import("lc_python_core.sops.sop_l2_frame_click", "frame_click_process")
+keymap_click_process = lazy_import("lc_python_core.sops.sop_l3_keymap_click", "keymap_click_process")
+anchor_click_process = lazy_import("lc_python_core.sops.sop_l4_anchor_click", "anchor_click_process")
+field_click_process = lazy_import("lc_python_core.sops.sop_l5_field_click", "field_click_process")
+reflect_boom_process = lazy_import("lc_python_core.sops.sop_l6_reflect_boom", "reflect_boom_process")
+apply_done_process = lazy_import("lc_python_core.sops.sop_l7_apply_done", "apply_done_process")
 
 class LcEpistemicPipelineNode:
     CATEGORY = "LearntCloud/EpistemicOSI"
-    RETURN_TYPES = ("MADA_SEED", "STRING", "STRING", "STRING", "STRING",)
-    RETURN_NAMES = ("final_mada_seed", "trace_id", "l6_reflection_summary", "l7_application_summary", "l7_next_steps",)
+    RETURN_TYPES = ("MADA_SEED", "STRING", "STRING", "STRING", "STRING", "STRING", "STRING",)
+    RETURN_NAMES = ("final_mada_seed", "trace_id", "l6_reflection_summary", "l7_application_summary", "l7_next_steps", "pipeline_timings_json", "layer_cache_stats_json",)
     FUNCTION = "execute_pipeline"
 
     @classmethod
@@ -32,9 +45,24 @@ class LcEpistemicPipelineNode:
                 "l5_field_instance_uid_override": ("STRING", {"multiline": False, "default": ""}),
                 "l6_presentation_intent_override": ("STRING", {"multiline": False, "default": ""}),
                 "l7_action_intent_override": ("STRING", {"multiline": False, "default": ""}),
+                # 0 runs on the calling thread; >0 runs in a persistent pool of that many processes
+                "workers": ("INT", {"default": 0, "min": 0, "max": 64}),
+                # Reuse the stored result for identical inputs (see pipeline_cache)
+                "use_cache": ("BOOLEAN", {"default": False}),
+                # Checkpoint every layer so a changed override only reruns that layer and those below it (see layer_cache)
+                "use_layer_cache": ("BOOLEAN", {"default": False}),
             }
         }
 
+    @classmethod
+    def IS_CHANGED(cls, input_text: str = "", use_cache: bool = False, **kwargs):
+        # With the cache on, the content key (which includes the lc_python_core
+        # version) tells ComfyUI whether its own output cache is still valid.
+        if not use_cache:
+            return ""
+        params = prepare_pipeline_params(**{name: kwargs.get(name) for name in _OVERRIDE_INPUT_NAMES})
+        return pipeline_cache_key(input_text, params)
+
     def execute_pipeline(self, input_text: str, 
                          l1_origin_hint: Optional[str] = None, 
                          l1_optional_attachments_ref: Optional[str] = None,
@@ -42,79 +70,397 @@ class LcEpistemicPipelineNode:
                          l4_persona_profile_uid_override: Optional[str] = None,
                          l5_field_instance_uid_override: Optional[str] = None,
                          l6_presentation_intent_override: Optional[str] = None,
-                         l7_action_intent_override: Optional[str] = None):
-
-        print("LcEpistemicPipelineNode: Starting L1 Startle...")
-        # L1 Startle
-        input_event = {
-            "reception_timestamp_utc_iso": datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z'),
-            "origin_hint": l1_origin_hint,
-            "data_components": [{"role_hint": "primary_text_content", "content_handle_placeholder": input_text, "size_hint": len(input_text.encode('utf-8')), "type_hint": "text/plain"}]
-        }
-        if l1_optional_attachments_ref:
-            input_event["data_components"].append({"role_hint": "attachment_reference", "content_handle_placeholder": l1_optional_attachments_ref, "size_hint": len(l1_optional_attachments_ref.encode('utf-8')), "type_hint": "text/uri-reference"})
-        
-        current_mada_seed: MadaSeed = startle_process(input_event)
-        trace_id = current_mada_seed.trace_metadata.L1_trace.L1_generated_trace_id if current_mada_seed.trace_metadata.L1_trace else current_mada_seed.seed_id
-        print(f"L1 Complete. Trace ID: {trace_id}")
-
-        # L2 FrameClick
-        print("LcEpistemicPipelineNode: Starting L2 FrameClick...")
-        comm_context_hints_dict: Optional[Dict[str, Any]] = None
-        if l2_communication_context_hints and l2_communication_context_hints.strip():
-            try: comm_context_hints_dict = json.loads(l2_communication_context_hints)
-            except json.JSONDecodeError as e: print(f"Pipeline L2: Invalid JSON for comm_context_hints: {e}")
-        current_mada_seed = frame_click_process(current_mada_seed, comm_context_hints_dict)
-        print("L2 Complete.")
-
-        # L3 KeymapClick
-        print("LcEpistemicPipelineNode: Starting L3 KeymapClick...")
-        current_mada_seed = keymap_click_process(current_mada_seed)
-        print("L3 Complete.")
-
-        # L4 AnchorClick
-        print("LcEpistemicPipelineNode: Starting L4 AnchorClick...")
-        eff_persona_uid = l4_persona_profile_uid_override if l4_persona_profile_uid_override and l4_persona_profile_uid_override.strip() else None
-        current_mada_seed = anchor_click_process(current_mada_seed, eff_persona_uid)
-        print("L4 Complete.")
-
-        # L5 FieldClick
-        print("LcEpistemicPipelineNode: Starting L5 FieldClick...")
-        eff_field_uid = l5_field_instance_uid_override if l5_field_instance_uid_override and l5_field_instance_uid_override.strip() else None
-        current_mada_seed = field_click_process(current_mada_seed, eff_field_uid)
-        print("L5 Complete.")
-
-        # L6 ReflectBoom
-        print("LcEpistemicPipelineNode: Starting L6 ReflectBoom...")
-        eff_pres_intent = l6_presentation_intent_override if l6_presentation_intent_override and l6_presentation_intent_override.strip() else None
-        current_mada_seed = reflect_boom_process(current_mada_seed, eff_pres_intent)
-        l6_summary = "L6: No text content in reflection payload."
+                         l7_action_intent_override: Optional[str] = None,
+                         workers: int = 0,
+                         use_cache: bool = False,
+                         use_layer_cache: bool = False):
+
+        timings: Dict[str, float] = {}
+        run_start = time.perf_counter()
+        with timed_span(timings, SPAN_PARSE):
+            params = prepare_pipeline_params(
+                l1_origin_hint=l1_origin_hint,
+                l1_optional_attachments_ref=l1_optional_attachments_ref,
+                l2_communication_context_hints=l2_communication_context_hints,
+                l4_persona_profile_uid_override=l4_persona_profile_uid_override,
+                l5_field_instance_uid_override=l5_field_instance_uid_override,
+                l6_presentation_intent_override=l6_presentation_intent_override,
+                l7_action_intent_override=l7_action_intent_override,
+            )
+        result = None
+        if use_cache:
+            cache = get_pipeline_cache()
+            with timed_span(timings, SPAN_CACHE_LOOKUP):
+                cache_key = pipeline_cache_key(input_text, params)
+                result = cache.get(cache_key, MadaSeed)
+            if result is not None:
+                logger.info("LcEpistemicPipelineNode: Cache hit for %s.", cache_key[:12])
+        if result is None:
+            if workers and workers > 0:
+                from .pipeline_executor import run_pipeline_in_pool
+                result = run_pipeline_in_pool(input_text, params, workers, timings, use_layer_cache)
+            else:
+                # Stream the layers so ComfyUI shows per-layer progress and can interrupt between them
+                steps = iter_pipeline(input_text, params, timings, get_layer_cache() if use_layer_cache else None,
+                                      cancel=_comfy_interrupt_check(), snapshot=False)
+                result = drain_pipeline(steps, _comfy_progress_hook())
+            if use_cache:
+                cache.put(cache_key, result)
+        timings[SPAN_TOTAL] = time.perf_counter() - run_start
+        PIPELINE_METRICS.record_run(timings)
+
+        # In pool mode the checkpoints (and their stats) live in the worker processes.
+        layer_cache_stats = get_layer_cache().stats() if use_layer_cache and not (workers and workers > 0) else {}
+        return result + (json.dumps(timings, indent=2), json.dumps(layer_cache_stats, indent=2))
+
+
+def _comfy_progress_hook() -> Optional[Callable[["PipelineStep"], None]]:
+    # ComfyUI is an optional runtime dependency; outside it there is no progress bar.
+    try:
+        from comfy.utils import ProgressBar
+    except ImportError:
+        return None
+    total = len(PIPELINE_LAYERS)
+    progress_bar = ProgressBar(total)
+    layer_positions = {layer: index + 1 for index, (layer, _) in enumerate(PIPELINE_LAYERS)}
+    return lambda step: progress_bar.update_absolute(layer_positions[step.layer], total)
+
+
+def _comfy_interrupt_check() -> Optional[Callable[[], bool]]:
+    try:
+        import comfy.model_management as model_management
+    except ImportError:
+        return None
+
+    def check() -> bool:
+        # Raises ComfyUI's InterruptProcessingException when the user cancels the prompt
+        model_management.throw_exception_if_processing_interrupted()
+        return False
+    return check
+
+
+# Optional node inputs that prepare_pipeline_params() turns into SOP parameters
+_OVERRIDE_INPUT_NAMES = (
+    "l1_origin_hint", "l1_optional_attachments_ref", "l2_communication_context_hints",
+    "l4_persona_profile_uid_override", "l5_field_instance_uid_override",
+    "l6_presentation_intent_override", "l7_action_intent_override",
+)
+
+
+def _effective_override(value: Optional[str]) -> Optional[str]:
+    # An empty string from ComfyUI means "no override" for the SOPs.
+    return value if value and value.strip() else None
+
+
+def prepare_pipeline_params(l1_origin_hint: Optional[str] = None,
+                            l1_optional_attachments_ref: Optional[str] = None,
+                            l2_communication_context_hints: Optional[str] = None,
+                            l4_persona_profile_uid_override: Optional[str] = None,
+                            l5_field_instance_uid_override: Optional[str] = None,
+                            l6_presentation_intent_override: Optional[str] = None,
+                            l7_action_intent_override: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Normalizes the per-layer overrides once so they can be shared by every
+    input that goes through run_pipeline (see run_pipeline_batch).
+    """
+    comm_context_hints_dict: Optional[Dict[str, Any]] = None
+    if l2_communication_context_hints and l2_communication_context_hints.strip():
+        try: comm_context_hints_dict = json.loads(l2_communication_context_hints)
+        except json.JSONDecodeError as e: logger.warning("Pipeline L2: Invalid JSON for comm_context_hints: %s", e)
+
+    return {
+        "l1_origin_hint": l1_origin_hint,
+        "l1_optional_attachments_ref": l1_optional_attachments_ref,
+        "l2_communication_context_hints": comm_context_hints_dict,
+        "l4_persona_profile_uid": _effective_override(l4_persona_profile_uid_override),
+        "l5_field_instance_uid": _effective_override(l5_field_instance_uid_override),
+        "l6_presentation_intent": _effective_override(l6_presentation_intent_override),
+        "l7_action_intent": _effective_override(l7_action_intent_override),
+    }
+
+
+def _build_l1_input_event(input_text: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    input_event = {
+        "reception_timestamp_utc_iso": datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z'),
+        "origin_hint": params["l1_origin_hint"],
+        "data_components": [{"role_hint": "primary_text_content", "content_handle_placeholder": input_text, "size_hint": len(input_text.encode('utf-8')), "type_hint": "text/plain"}]
+    }
+    attachments_ref = params["l1_optional_attachments_ref"]
+    if attachments_ref:
+        input_event["data_components"].append({"role_hint": "attachment_reference", "content_handle_placeholder": attachments_ref, "size_hint": len(attachments_ref.encode('utf-8')), "type_hint": "text/uri-reference"})
+    return input_event
+
+
+def _summarize_l6(mada_seed: MadaSeed) -> str:
+    l6_summary = "L6: No text content in reflection payload."
+    l6_payload_obj = L6_PAYLOAD_OBJ(mada_seed)
+    if not l6_payload_obj:
+        return l6_summary
+    formatted_text = L6_FORMATTED_TEXT(mada_seed)
+    structured_data = L6_STRUCTURED_DATA(mada_seed)
+    if formatted_text:
+        l6_summary = formatted_text
+    elif structured_data:
+        try:
+            l6_summary = json.dumps(structured_data, indent=2)
+        except TypeError:
+            return "L6: No text content in reflection payload."
+    return f"[L6 State: {enum_name(L6_EPISTEMIC_STATE(mada_seed))}]\n{l6_summary}"
+
+
+def _summarize_l7(final_mada_seed: MadaSeed) -> Tuple[str, str]:
+    l7_next_steps = "L7: No next steps."
+    seed_outputs = L7_SEED_OUTPUTS(final_mada_seed)
+    qa_qc_summary = f"QA/QC: {enum_name(SEED_INTEGRITY_STATUS(final_mada_seed))}"
+    action_summary_parts = []
+    if seed_outputs: action_summary_parts.append(f"{len(seed_outputs)} output(s).")
+    l7_summary = f"[L7 State: {enum_name(L7_EPISTEMIC_STATE(final_mada_seed))}] {qa_qc_summary} {' '.join(action_summary_parts)}"
+    options = L7_FIRST_OUTPUT_OPTIONS(final_mada_seed)
+    if options:
+        l7_next_steps = "Options: " + " | ".join([opt.label for opt in options])
+    return l7_summary, l7_next_steps
+
+
+# (span name, params the layer's SOP reads) in pipeline order. A layer's
+# checkpoint key covers these params and everything upstream (see layer_cache).
+PIPELINE_LAYERS = (
+    ("L1_startle", ("l1_origin_hint", "l1_optional_attachments_ref")),
+    ("L2_frame_click", ("l2_communication_context_hints",)),
+    ("L3_keymap_click", ()),
+    ("L4_anchor_click", ("l4_persona_profile_uid",)),
+    ("L5_field_click", ("l5_field_instance_uid",)),
+    ("L6_reflect_boom", ("l6_presentation_intent",)),
+    ("L7_apply_done", ("l7_action_intent",)),
+)
+
+# Layer name -> fn(mada_seed, input_text, params) returning the layer's output seed.
+# L2-L7 see the text behind any lc-content: reference in the raw signals (see content_store).
+_LAYER_CALLS = {
+    "L1_startle": lambda mada_seed, input_text, params: startle_process(_build_l1_input_event(input_text, params)),
+    "L2_frame_click": lambda mada_seed, input_text, params: with_resolved_content(mada_seed, frame_click_process, mada_seed, params["l2_communication_context_hints"]),
+    # keymap_click_process is async
+    "L3_keymap_click": lambda mada_seed, input_text, params: resolve_awaitable(with_resolved_content(mada_seed, keymap_click_process, mada_seed)),
+    "L4_anchor_click": lambda mada_seed, input_text, params: with_resolved_content(mada_seed, anchor_click_process, mada_seed, params["l4_persona_profile_uid"]),
+    "L5_field_click": lambda mada_seed, input_text, params: with_resolved_content(mada_seed, field_click_process, mada_seed, params["l5_field_instance_uid"]),
+    "L6_reflect_boom": lambda mada_seed, input_text, params: with_resolved_content(mada_seed, reflect_boom_process, mada_seed, params["l6_presentation_intent"]),
+    "L7_apply_done": lambda mada_seed, input_text, params: with_resolved_content(mada_seed, apply_done_process, mada_seed, params["l7_action_intent"]),
+}
+
+
+class PipelineStep(NamedTuple):
+    """
+    One layer's result from iter_pipeline(). `cached` is True for the layer
+    restored from a layer_cache checkpoint (seconds is then 0.0).
+    """
+    layer: str
+    mada_seed: Any
+    seconds: float
+    cached: bool = False
+
+
+class PipelineCancelled(Exception):
+    pass
+
+
+def _is_cancelled(cancel: Any) -> bool:
+    if cancel is None:
+        return False
+    if hasattr(cancel, "is_set"):
+        return cancel.is_set()
+    return bool(cancel())
+
+
+def iter_pipeline(input_text: str, params: Dict[str, Any], timings: Optional[Dict[str, float]] = None,
+                  layer_cache: Optional[Any] = None, cancel: Any = None,
+                  snapshot: bool = True) -> Generator[PipelineStep, None, Tuple[MadaSeed, str, str, str, str]]:
+    """
+    Streaming form of run_pipeline(): yields a PipelineStep after every SOP,
+    so callers can act on L2/L3 output while L4-L7 are still to run. The
+    generator's return value (StopIteration.value) is run_pipeline()'s tuple.
+
+    SOPs mutate the seed in place, so each step carries a deep copy unless
+    `snapshot` is False (the live seed, only valid until the next step).
+    `cancel` (a threading.Event or a callable returning True) is checked
+    before every layer and raises PipelineCancelled; closing the generator
+    also stops the run between layers.
+    """
+    layer_names = [layer for layer, _ in PIPELINE_LAYERS]
+    current_mada_seed: Optional[MadaSeed] = None
+    start_index = 0
+    if layer_cache is not None:
+        with timed_span(timings, SPAN_CACHE_LOOKUP):
+            keys = layer_keys(input_text, params, PIPELINE_LAYERS)
+            start_index, current_mada_seed = layer_cache.resume(layer_names, keys, MadaSeed)
+        if start_index:
+            logger.debug("LcEpistemicPipelineNode: Reusing checkpoints for %s-%s.", layer_names[0], layer_names[start_index - 1])
+            # Checkpoints are decoded into new objects, so no copy is needed
+            yield PipelineStep(layer_names[start_index - 1], current_mada_seed, 0.0, True)
+
+    l6_summary = None
+    for index in range(start_index, len(layer_names)):
+        layer = layer_names[index]
+        if _is_cancelled(cancel):
+            logger.info("LcEpistemicPipelineNode: Cancelled before %s.", layer)
+            raise PipelineCancelled(f"Pipeline cancelled before {layer}")
+        logger.debug("LcEpistemicPipelineNode: Starting %s...", layer)
+        layer_start = time.perf_counter()
+        current_mada_seed = _LAYER_CALLS[layer](current_mada_seed, input_text, params)
+        seconds = time.perf_counter() - layer_start
+        if timings is not None:
+            timings[layer] = timings.get(layer, 0.0) + seconds
+        if layer_cache is not None:
+            with timed_span(timings, SPAN_CACHE_STORE):
+                layer_cache.put(layer, keys[index], current_mada_seed)
+        if layer == "L6_reflect_boom":
+            with timed_span(timings, SPAN_SUMMARIES):
+                l6_summary = _summarize_l6(current_mada_seed)
+        logger.debug("%s Complete.", layer)
+        step_seed = current_mada_seed
+        if snapshot and hasattr(step_seed, "model_copy"):
+            step_seed = step_seed.model_copy(deep=True)
+        yield PipelineStep(layer, step_seed, seconds)
+
+    final_mada_seed = current_mada_seed
+    trace_id = final_mada_seed.trace_metadata.L1_trace.L1_generated_trace_id if final_mada_seed.trace_metadata.L1_trace else final_mada_seed.seed_id
+    with timed_span(timings, SPAN_SUMMARIES):
+        if l6_summary is None: # L6 was restored from a checkpoint
+            l6_summary = _summarize_l6(final_mada_seed)
+        l7_summary, l7_next_steps = _summarize_l7(final_mada_seed)
+    logger.debug("Pipeline finished. Trace ID: %s", trace_id)
+
+    return (final_mada_seed, trace_id, l6_summary, l7_summary, l7_next_steps)
+
+
+def drain_pipeline(steps: Generator[PipelineStep, None, Any], on_step: Optional[Callable[[PipelineStep], Any]] = None):
+    """
+    Runs an iter_pipeline() generator to completion, passing each step to
+    `on_step`, and returns its final result tuple.
+    """
+    while True:
         try:
-            l6_payload_obj = current_mada_seed.seed_content.L1_startle_reflex.L2_frame_type.L3_surface_keymap.L4_anchor_state.L5_field_state.L6_reflection_payload.L6_reflection_payload_obj
-            if l6_payload_obj and l6_payload_obj.payload_content:
-                if l6_payload_obj.payload_content.formatted_text:
-                    l6_summary = l6_payload_obj.payload_content.formatted_text
-                elif l6_payload_obj.payload_content.structured_data:
-                    l6_summary = json.dumps(l6_payload_obj.payload_content.structured_data, indent=2)
-            l6_summary = f"[L6 State: {l6_payload_obj.l6_epistemic_state.name if l6_payload_obj.l6_epistemic_state else 'N/A'}]\n{l6_summary}"
-        except Exception: pass # Keep default summary
-        print("L6 Complete.")
-
-        # L7 ApplyDone
-        print("LcEpistemicPipelineNode: Starting L7 ApplyDone...")
-        eff_l7_intent = l7_action_intent_override if l7_action_intent_override and l7_action_intent_override.strip() else None
-        final_mada_seed = apply_done_process(current_mada_seed, eff_l7_intent)
-        l7_summary = "L7: No summary."
-        l7_next_steps = "L7: No next steps."
+            step = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        if on_step is not None:
+            on_step(step)
+
+
+def run_pipeline(input_text: str, params: Dict[str, Any], timings: Optional[Dict[str, float]] = None,
+                 layer_cache: Optional[Any] = None, cancel: Any = None) -> Tuple[MadaSeed, str, str, str, str]:
+    """
+    Runs a single input through the L1-L7 SOPs.
+
+    `params` is the dict returned by prepare_pipeline_params(). Returns the
+    same tuple as LcEpistemicPipelineNode.execute_pipeline. If `timings` is
+    given, the perf_counter duration of every SOP call and of the summary
+    extraction is added to it under the span names in pipeline_metrics.
+    With a `layer_cache` (layer_cache.LayerCheckpointCache) the run resumes
+    after the deepest checkpointed layer and checkpoints every layer it runs.
+    See iter_pipeline() for `cancel` and for a layer-by-layer variant.
+    """
+    return drain_pipeline(iter_pipeline(input_text, params, timings, layer_cache, cancel, snapshot=False))
+
+
+def split_batch_input(batch_input: str) -> List[str]:
+    """
+    Splits a batch input into individual input texts.
+
+    A JSON array of strings is used as-is; anything else is treated as
+    newline-delimited text with one input per non-blank line.
+    """
+    if not batch_input or not batch_input.strip():
+        return []
+    stripped = batch_input.strip()
+    if stripped.startswith("["):
         try:
-            l7_app_obj = final_mada_seed.seed_content.L1_startle_reflex.L2_frame_type.L3_surface_keymap.L4_anchor_state.L5_field_state.L6_reflection_payload.L7_encoded_application
-            qa_qc_summary = "QA/QC: " + (final_mada_seed.seed_QA_QC.overall_seed_integrity_status.name if final_mada_seed.seed_QA_QC and final_mada_seed.seed_QA_QC.overall_seed_integrity_status else "N/A")
-            action_summary_parts = []
-            if l7_app_obj and l7_app_obj.seed_outputs: action_summary_parts.append(f"{len(l7_app_obj.seed_outputs)} output(s).")
-            l7_summary = f"[L7 State: {final_mada_seed.trace_metadata.L7_trace.epistemic_state_L7.name if final_mada_seed.trace_metadata.L7_trace and final_mada_seed.trace_metadata.L7_trace.epistemic_state_L7 else 'N/A'}] {qa_qc_summary} {' '.join(action_summary_parts)}"
-            if l7_app_obj and l7_app_obj.seed_outputs and l7_app_obj.seed_outputs[0].seed_options and l7_app_obj.seed_outputs[0].seed_options.options:
-                l7_next_steps = "Options: " + " | ".join([opt.label for opt in l7_app_obj.seed_outputs[0].seed_options.options])
-        except Exception: pass # Keep default summaries
-        print("L7 Complete. Pipeline finished.")
-
-        return (final_mada_seed, trace_id, l6_summary, l7_summary, l7_next_steps)
+            parsed = json.loads(stripped)
+            if isinstance(parsed, list):
+                return [str(item) for item in parsed]
+        except json.JSONDecodeError:
+            pass # Not a JSON list, fall back to line splitting
+    return [line.strip() for line in batch_input.splitlines() if line.strip()]
+
+
+def run_batch_item(index: int, input_text: str, params: Dict[str, Any]) -> Tuple[Optional[MadaSeed], Dict[str, Any]]:
+    """
+    Runs one batch entry and returns (final_seed_or_None, item_result).
+    Exceptions are captured in the item result instead of being raised.
+    """
+    item_start = time.perf_counter()
+    item: Dict[str, Any] = {"index": index, "status": "ok", "trace_id": None, "error": None}
+    layer_timings: Dict[str, float] = {}
+    final_mada_seed: Optional[MadaSeed] = None
+    try:
+        final_mada_seed, trace_id, l6_summary, l7_summary, l7_next_steps = run_pipeline(input_text, params, layer_timings)
+        item.update({
+            "trace_id": trace_id,
+            "l6_reflection_summary": l6_summary,
+            "l7_application_summary": l7_summary,
+            "l7_next_steps": l7_next_steps,
+        })
+    except Exception as e:
+        logger.warning("LcEpistemicPipelineNode: Batch item %d failed: %s: %s", index, type(e).__name__, e)
+        item["status"] = "error"
+        item["error"] = f"{type(e).__name__}: {e}"
+    item["elapsed_seconds"] = time.perf_counter() - item_start
+    item["layer_timings"] = layer_timings
+    return final_mada_seed, item
+
+
+def _record_batch_metrics(items: List[Dict[str, Any]]):
+    for item in items:
+        layer_timings = item.get("layer_timings")
+        if layer_timings:
+            PIPELINE_METRICS.record_run(dict(layer_timings, **{SPAN_TOTAL: item["elapsed_seconds"]}))
+
+
+def summarize_batch_timing(items: List[Dict[str, Any]], total_seconds: float) -> Dict[str, Any]:
+    item_seconds = [item["elapsed_seconds"] for item in items]
+    failed = sum(1 for item in items if item["status"] != "ok")
+    return {
+        "item_count": len(items),
+        "succeeded": len(items) - failed,
+        "failed": failed,
+        "total_seconds": total_seconds,
+        "mean_item_seconds": (sum(item_seconds) / len(item_seconds)) if item_seconds else 0.0,
+        "max_item_seconds": max(item_seconds) if item_seconds else 0.0,
+        "items_per_second": (len(items) / total_seconds) if total_seconds > 0 else 0.0,
+    }
+
+
+def run_pipeline_batch(inputs: Iterable[str], workers: int = 0, **overrides: Optional[str]) -> Dict[str, Any]:
+    """
+    Runs many inputs through the L1-L7 SOPs with shared setup.
+
+    `overrides` accepts the same keyword arguments as prepare_pipeline_params
+    and is parsed once for the whole batch. A failure in one item is recorded
+    in its result entry and does not stop the remaining items. With
+    `workers` > 0 the items are fanned out to the persistent process pool in
+    pipeline_executor; ordering and error isolation are the same as serial.
+
+    Returns a dict with:
+      - "seeds": the final MadaSeed per input (None for failed items), in input order.
+      - "items": per-item dicts with index, status, trace_id, summaries, error,
+        elapsed_seconds and layer_timings.
+      - "timing": aggregate counts and wall-clock timings for the batch.
+    Per-item layer timings are also recorded into pipeline_metrics.PIPELINE_METRICS.
+    """
+    params = prepare_pipeline_params(**overrides)
+
+    if workers and workers > 0:
+        from .pipeline_executor import run_batch_in_pool
+        result = run_batch_in_pool(list(inputs), params, workers)
+        _record_batch_metrics(result["items"])
+        return result
+
+    seeds: List[Optional[MadaSeed]] = []
+    items: List[Dict[str, Any]] = []
+    batch_start = time.perf_counter()
+    for index, input_text in enumerate(inputs):
+        final_mada_seed, item = run_batch_item(index, input_text, params)
+        seeds.append(final_mada_seed)
+        items.append(item)
+    total_seconds = time.perf_counter() - batch_start
+    _record_batch_metrics(items)
+
+    return {"seeds": seeds, "items": items, "timing": summarize_batch_timing(items, total_seconds)}
@@ -1,6 +1,11 @@
 from typing import Optional, List, Dict, Any
 import json
-from lc_python_core.services.lc_mem_service import mock_lc_mem_core_query_objects, PBI_OBJECT_TYPE
+
+from .lc_logging import get_logger
+from .storage_backends import get_storage_backend
+
+logger = get_logger(__name__)
+
 
 class QueryPbisNode:
     CATEGORY = "LearntCloud/Backlog"
@@ -26,7 +31,8 @@ class QueryPbisNode:
         }
 
     def query_pbis_from_mada(self, **kwargs):
-        query_params: Dict[str, Any] = {"object_type": PBI_OBJECT_TYPE} # Ensure we always query for PBIs
+        backend = get_storage_backend()
+        query_params: Dict[str, Any] = {"object_type": backend.pbi_object_type} # Ensure we always query for PBIs
 
         for key, value in kwargs.items():
             # Handle 'None' string from ComfyUI dropdown if it was used for cynefin_domain_context
@@ -36,9 +42,9 @@ class QueryPbisNode:
             if value is not None and value != "Any" and (not isinstance(value, str) or value.strip()):
                 query_params[key] = value
             
-        print(f"QueryPbisNode: Calling mock_lc_mem_core_query_objects with params: {query_params}")
+        logger.debug("QueryPbisNode: Calling query_objects with params: %s", query_params)
         
-        results_list = mock_lc_mem_core_query_objects(query_params=query_params, requesting_persona_context=None) # Persona context for query TBD
+        results_list = backend.query_objects(query_params=query_params, requesting_persona_context=None) # Persona context for query TBD
 
         results_json_str = "[]"
         summary_str = f"Found {len(results_list)} PBIs matching criteria."
@@ -56,7 +62,7 @@ class QueryPbisNode:
                      results_json_str = f"Error during fallback UID serialization: {e}"
 
 
-        print(f"QueryPbisNode: {summary_str}")
+        logger.info("QueryPbisNode: %s", summary_str)
         # For direct UI display in node:
         # ComfyUI's default text widget might not be large enough for many results.
         # It's better to output the string and use a ShowTextNode if the user wants to see it all.
@@ -0,0 +1,334 @@
+"""
+Append-only archive of finished MadaSeeds, read through mmap.
+
+Loading stored seeds with `MadaSeed.model_validate(json.loads(...))` reads
+and validates every seed in full. An archive keeps seeds in the seed_codec
+wire format in one data file plus an offset index, so a seed, a few seeds or
+a range of seeds is fetched by seed_id by decoding only those records.
+
+Files:
+    <path>      b"LCSA" | version | 3 reserved bytes, then records of
+                    id length (2 bytes) | payload length (4 bytes) | seed_id | payload
+    <path>.idx  b"LCSX" | version | 3 reserved bytes, then entries of
+                    payload offset (8 bytes) | payload length (4) | id length (2) | seed_id
+
+The index is small (tens of bytes per seed) and is loaded into memory when
+the archive is opened; seed payloads are only touched through the mmap of
+the data file when they are read. Records are appended to the data file
+before their index entry, so after an interrupted write the missing index
+entries are rebuilt from the data file, and a torn last record is ignored
+(and cut off by the next writer). Appending a seed_id again supersedes the
+earlier record for lookups by ID; ranges are in append order and include
+every record.
+
+Usage:
+    from .seed_archive import open_seed_archive
+    archive = open_seed_archive("/data/seeds.lcsa")
+    archive.append(mada_seed)
+    mada_seed = archive.get(seed_id)
+    formatted_text = archive.view(seed_id).get("@L6.L6_reflection_payload_obj.payload_content.formatted_text")
+    for seed_id, mada_seed in archive.iter_range(start_seed_id=seed_id, count=100):
+        ...
+"""
+import mmap
+import os
+import struct
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+from .lazy_seed import LazySeedView, seed_view
+from .lc_logging import get_logger
+from .seed_codec import decode_seed, encode_seed
+
+logger = get_logger(__name__)
+
+DATA_MAGIC = b"LCSA"
+INDEX_MAGIC = b"LCSX"
+ARCHIVE_FORMAT_VERSION = 1
+INDEX_SUFFIX = ".idx"
+FILE_HEADER_SIZE = 8
+
+_RECORD_HEADER = struct.Struct(">HI")
+_INDEX_ENTRY = struct.Struct(">QIH")
+_MAX_PAYLOAD = 2**32 - 1
+_MAX_ID = 2**16 - 1
+
+
+class SeedArchiveError(ValueError):
+    pass
+
+
+def _file_header(magic: bytes) -> bytes:
+    return magic + bytes([ARCHIVE_FORMAT_VERSION, 0, 0, 0])
+
+
+def _check_header(header: bytes, magic: bytes, path: str):
+    if len(header) < FILE_HEADER_SIZE or header[:4] != magic:
+        raise SeedArchiveError(f"{path} is not a seed archive file")
+    if header[4] != ARCHIVE_FORMAT_VERSION:
+        raise SeedArchiveError(f"{path}: unsupported seed archive version {header[4]}")
+
+
+class SeedArchive:
+    """
+    One archive (data file plus index). Thread-safe; several processes may
+    read the same archive, but only one should append to it at a time.
+    refresh() picks up records appended by another process.
+    """
+
+    def __init__(self, path: str, seed_cls: Optional[Type] = None):
+        self.path = path
+        self.index_path = path + INDEX_SUFFIX
+        self.seed_cls = seed_cls
+        self._lock = threading.RLock()
+        self._entries: List[Tuple[str, int, int]] = [] # (seed_id, payload offset, payload length) in append order
+        self._positions: Dict[str, int] = {} # seed_id -> index into _entries of its latest record
+        self._data_end = FILE_HEADER_SIZE # end of the last complete record
+        self._index_read = FILE_HEADER_SIZE # bytes of the index file already loaded
+        self._indexed = 0 # leading _entries that have an index entry
+        self._data_file = None
+        self._mmap: Optional[mmap.mmap] = None
+        if os.path.exists(path):
+            self.refresh()
+
+    # --- loading ---
+
+    def refresh(self) -> int:
+        """
+        Loads index entries (and unindexed records) added since the last
+        refresh. Returns the number of new records.
+        """
+        with self._lock:
+            if not os.path.exists(self.path):
+                return 0
+            before = len(self._entries)
+            self._read_index()
+            self._scan_data()
+            return len(self._entries) - before
+
+    def _add(self, seed_id: str, offset: int, length: int):
+        # Caller holds the lock.
+        self._positions[seed_id] = len(self._entries)
+        self._entries.append((seed_id, offset, length))
+        self._data_end = max(self._data_end, offset + length)
+
+    def _read_index(self):
+        # Caller holds the lock.
+        try:
+            with open(self.index_path, "rb") as f:
+                if self._index_read == FILE_HEADER_SIZE:
+                    _check_header(f.read(FILE_HEADER_SIZE), INDEX_MAGIC, self.index_path)
+                f.seek(self._index_read)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        position = 0
+        while position + _INDEX_ENTRY.size <= len(data):
+            offset, length, id_length = _INDEX_ENTRY.unpack_from(data, position)
+            end = position + _INDEX_ENTRY.size + id_length
+            if end > len(data):
+                break # torn entry; the data scan recovers it
+            self._add(data[position + _INDEX_ENTRY.size:end].decode("utf-8"), offset, length)
+            self._indexed += 1
+            position = end
+        self._index_read += position
+
+    def _scan_data(self):
+        # Records past the last indexed one were written without their index entry.
+        # Caller holds the lock.
+        view = self._view()
+        position = self._data_end
+        size = len(view)
+        while position + _RECORD_HEADER.size <= size:
+            id_length, length = _RECORD_HEADER.unpack_from(view, position)
+            payload_offset = position + _RECORD_HEADER.size + id_length
+            if payload_offset + length > size:
+                break
+            seed_id = bytes(view[position + _RECORD_HEADER.size:payload_offset]).decode("utf-8")
+            logger.debug("SeedArchive: Recovered unindexed record %s in %s", seed_id, self.path)
+            self._add(seed_id, payload_offset, length)
+            position = payload_offset + length
+
+    def _view(self) -> mmap.mmap:
+        # The mmap, remapped if the data file has grown past it. Caller holds the lock.
+        size = os.path.getsize(self.path)
+        if self._mmap is not None and len(self._mmap) >= size:
+            return self._mmap
+        if size < FILE_HEADER_SIZE:
+            raise SeedArchiveError(f"{self.path} is not a seed archive file")
+        self._close_map()
+        self._data_file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        _check_header(self._mmap[:FILE_HEADER_SIZE], DATA_MAGIC, self.path)
+        return self._mmap
+
+    def _close_map(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._data_file is not None:
+            self._data_file.close()
+            self._data_file = None
+
+    # --- writing ---
+
+    def append(self, mada_seed: Any, seed_id: Optional[str] = None) -> str:
+        return self.extend([mada_seed], [seed_id] if seed_id else None)[0]
+
+    def extend(self, mada_seeds: Iterable[Any], seed_ids: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Appends seeds (keyed by their seed_id unless `seed_ids` is given) in
+        one write. Returns the seed_ids.
+        """
+        records = []
+        for position, mada_seed in enumerate(mada_seeds):
+            seed_id = seed_ids[position] if seed_ids else getattr(mada_seed, "seed_id", None)
+            if not seed_id:
+                raise SeedArchiveError(f"Seed {position} has no seed_id")
+            id_bytes = str(seed_id).encode("utf-8")
+            payload = encode_seed(mada_seed)
+            if len(id_bytes) > _MAX_ID or len(payload) > _MAX_PAYLOAD:
+                raise SeedArchiveError(f"Seed {seed_id} is too large for the archive format")
+            records.append((str(seed_id), id_bytes, payload))
+        if not records:
+            return []
+
+        with self._lock:
+            self.refresh()
+            new_file = not os.path.exists(self.path)
+            with open(self.path, "r+b" if not new_file else "wb") as f:
+                if new_file:
+                    f.write(_file_header(DATA_MAGIC))
+                elif os.path.getsize(self.path) > self._data_end:
+                    f.truncate(self._data_end) # drop a torn record left by an interrupted write
+                f.seek(self._data_end)
+                data_parts, added = [], []
+                position = self._data_end
+                for seed_id, id_bytes, payload in records:
+                    data_parts += [_RECORD_HEADER.pack(len(id_bytes), len(payload)), id_bytes, payload]
+                    payload_offset = position + _RECORD_HEADER.size + len(id_bytes)
+                    added.append((seed_id, payload_offset, len(payload)))
+                    position = payload_offset + len(payload)
+                f.write(b"".join(data_parts))
+                f.flush()
+            for entry in added:
+                self._add(*entry)
+            # Index entries for the new records and for any recovered by the data scan
+            index_parts = []
+            for seed_id, offset, length in self._entries[self._indexed:]:
+                id_bytes = seed_id.encode("utf-8")
+                index_parts += [_INDEX_ENTRY.pack(offset, length, len(id_bytes)), id_bytes]
+            index_bytes = b"".join(index_parts)
+            with open(self.index_path, "ab") as f:
+                if f.tell() == 0:
+                    f.write(_file_header(INDEX_MAGIC))
+                    self._index_read = FILE_HEADER_SIZE
+                elif f.tell() != self._index_read:
+                    # Torn index entry from an interrupted write: rewrite the index tail.
+                    f.truncate(self._index_read)
+                f.write(index_bytes)
+            self._index_read += len(index_bytes)
+            self._indexed = len(self._entries)
+        return [seed_id for seed_id, _, _ in records]
+
+    # --- reading ---
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._positions)
+
+    def __contains__(self, seed_id: str) -> bool:
+        with self._lock:
+            return seed_id in self._positions
+
+    def seed_ids(self) -> List[str]:
+        """
+        Distinct seed_ids in the order they were first appended.
+        """
+        with self._lock:
+            return list(dict.fromkeys(seed_id for seed_id, _, _ in self._entries))
+
+    def read_raw(self, seed_id: str) -> Optional[bytes]:
+        """
+        The encoded seed (seed_codec format), or None if it is not archived.
+        """
+        with self._lock:
+            position = self._positions.get(seed_id)
+            if position is None:
+                return None
+            return self._payload(position)
+
+    def _payload(self, position: int) -> bytes:
+        # Caller holds the lock.
+        _, offset, length = self._entries[position]
+        return self._view()[offset:offset + length]
+
+    def get(self, seed_id: str, default: Any = None) -> Any:
+        data = self.read_raw(seed_id)
+        if data is None:
+            return default
+        return decode_seed(data, self.seed_cls)
+
+    def view(self, seed_id: str) -> Optional[LazySeedView]:
+        """
+        A lazy_seed view of the decoded (but not validated) seed, for
+        reading a few fields; None if it is not archived.
+        """
+        data = self.read_raw(seed_id)
+        return seed_view(data) if data is not None else None
+
+    def get_many(self, seed_ids: Iterable[str]) -> List[Any]:
+        """
+        Decoded seeds in the order of `seed_ids`; None for IDs not archived.
+        """
+        return [self.get(seed_id) for seed_id in seed_ids]
+
+    def iter_range(self, start_seed_id: Optional[str] = None, count: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields (seed_id, seed) for up to `count` records in append order,
+        starting at the latest record of `start_seed_id` (at the beginning
+        if None). Raises KeyError for an unknown start_seed_id.
+        """
+        with self._lock:
+            start = 0 if start_seed_id is None else self._positions[start_seed_id]
+            stop = len(self._entries) if count is None else min(len(self._entries), start + max(0, count))
+            selected = [(self._entries[position][0], self._payload(position)) for position in range(start, stop)]
+        for seed_id, data in selected:
+            yield seed_id, decode_seed(data, self.seed_cls)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "path": self.path,
+                "records": len(self._entries),
+                "seeds": len(self._positions),
+                "data_bytes": self._data_end,
+            }
+
+    def close(self):
+        with self._lock:
+            self._close_map()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+_archives: Dict[str, SeedArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def open_seed_archive(path: str) -> SeedArchive:
+    """
+    Shared SeedArchive for `path` (default seed class), refreshed so records
+    appended by other processes since the last call are visible.
+    """
+    key = os.path.abspath(path)
+    with _archives_lock:
+        archive = _archives.get(key)
+        if archive is None:
+            archive = _archives[key] = SeedArchive(key)
+    archive.refresh()
+    return archive
@@ -0,0 +1,106 @@
+import json
+import os
+from typing import Any, Dict, List
+
+from .lc_logging import get_logger
+from .pipeline_node import split_batch_input
+from .seed_archive import SeedArchiveError, open_seed_archive
+
+logger = get_logger(__name__)
+
+
+def _archive_changed(archive_path: str) -> str:
+    # Re-run when the archive grows, not only when the path changes.
+    try:
+        stat = os.stat(archive_path)
+    except OSError:
+        return ""
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+class LcSeedArchiveLoadNode:
+    CATEGORY = "LearntCloud/EpistemicOSI"
+    RETURN_TYPES = ("MADA_SEED", "MADA_SEED", "STRING",)
+    RETURN_NAMES = ("mada_seed", "mada_seeds", "load_report_json",)
+    FUNCTION = "load_seeds"
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "archive_path": ("STRING", {"default": ""}),
+                # One seed_id per line, or a JSON array of seed_ids
+                "seed_ids": ("STRING", {"multiline": True, "default": ""}),
+            },
+            "optional": {
+                # >0 loads this many seeds in append order, starting at the first seed_id (or the archive start)
+                "range_count": ("INT", {"default": 0, "min": 0, "max": 1000000}),
+            }
+        }
+
+    @classmethod
+    def IS_CHANGED(cls, archive_path: str = "", **kwargs):
+        return _archive_changed(archive_path)
+
+    def load_seeds(self, archive_path: str, seed_ids: str, range_count: int = 0):
+        requested = split_batch_input(seed_ids)
+        report: Dict[str, Any] = {"archive_path": archive_path, "requested": len(requested), "loaded": 0, "missing": []}
+        seeds: List[Any] = []
+        if not os.path.exists(archive_path):
+            report["error"] = f"Archive not found: {archive_path}"
+            logger.error("LcSeedArchiveLoadNode: %s", report["error"])
+            return (None, seeds, json.dumps(report, indent=2))
+        try:
+            archive = open_seed_archive(archive_path)
+            if range_count > 0:
+                start_seed_id = requested[0] if requested else None
+                if start_seed_id is not None and start_seed_id not in archive:
+                    report["missing"].append(start_seed_id)
+                else:
+                    seeds = [mada_seed for _, mada_seed in archive.iter_range(start_seed_id, range_count)]
+            else:
+                for seed_id in requested:
+                    mada_seed = archive.get(seed_id)
+                    if mada_seed is None:
+                        report["missing"].append(seed_id)
+                    else:
+                        seeds.append(mada_seed)
+        except (OSError, SeedArchiveError, ValueError) as e:
+            logger.error("LcSeedArchiveLoadNode: Failed to read %s: %s", archive_path, e)
+            report["error"] = str(e)
+        report["loaded"] = len(seeds)
+        if report["missing"]:
+            logger.warning("LcSeedArchiveLoadNode: %d seed_id(s) not in %s.", len(report["missing"]), archive_path)
+        # The first seed feeds single-seed inputs; the list is passed on as one MADA_SEED value, like the batch nodes do.
+        return (seeds[0] if seeds else None, seeds, json.dumps(report, indent=2))
+
+
+class LcSeedArchiveAppendNode:
+    CATEGORY = "LearntCloud/EpistemicOSI"
+    RETURN_TYPES = ("STRING", "STRING",)
+    RETURN_NAMES = ("seed_ids_json", "archive_stats_json",)
+    FUNCTION = "append_seeds"
+    OUTPUT_NODE = True
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                # A single seed or a list of seeds (e.g. from the batch nodes)
+                "mada_seed": ("MADA_SEED",),
+                "archive_path": ("STRING", {"default": ""}),
+            }
+        }
+
+    def append_seeds(self, mada_seed: Any, archive_path: str):
+        seeds = mada_seed if isinstance(mada_seed, list) else [mada_seed]
+        seeds = [seed for seed in seeds if seed is not None] # failed batch items are None
+        try:
+            archive = open_seed_archive(archive_path)
+            appended = archive.extend(seeds)
+            stats = archive.stats()
+        except (OSError, SeedArchiveError, ValueError) as e:
+            logger.error("LcSeedArchiveAppendNode: Failed to append to %s: %s", archive_path, e)
+            return (json.dumps([]), json.dumps({"path": archive_path, "error": str(e)}, indent=2))
+        logger.info("LcSeedArchiveAppendNode: Appended %d seed(s) to %s.", len(appended), archive_path)
+        return (json.dumps(appended), json.dumps(stats, indent=2))
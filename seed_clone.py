@@ -0,0 +1,118 @@
+"""
+Compiled structural clones of a validated Pydantic model tree.
+
+L1 builds every seed shell from the same template. Validating that template
+once and then cloning the resulting model is cheaper than validating it for
+every seed, but only if the clone itself is cheap: model_copy(deep=True) goes
+through copy.deepcopy, and a generic walk over the fields costs more than
+pydantic-core's validation. compile_model_clone() instead generates one
+straight-line function per prototype, like seed_paths does for accessors:
+
+    clone = compile_model_clone(validated_shell, {("seed_id",): "seed_id"})
+    seed = clone(seed_id="urn:...")
+
+Every model, list and dict in the tree is rebuilt, so clones share no mutable
+state with the prototype or each other; immutable leaves (str, numbers,
+datetimes, enums, ...) are shared. Fields left to a default_factory are
+filled by calling the factory per clone, as validation would. `holes` name
+attribute paths whose value is passed in per call instead; those values are
+used as given, without validation (the model_construct() contract).
+"""
+import datetime
+import decimal
+import enum
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_IMMUTABLE_TYPES = (str, int, float, bool, bytes, type(None), datetime.date, datetime.time, datetime.timedelta,
+                    decimal.Decimal, uuid.UUID, enum.Enum)
+
+
+def _is_model(value: Any) -> bool:
+    return hasattr(value, "__pydantic_fields_set__") and hasattr(value.__class__, "model_fields")
+
+
+class _CloneCompiler:
+
+    def __init__(self, holes: Dict[Tuple[str, ...], str]):
+        self.holes = holes
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {"_set": object.__setattr__}
+        self.used_holes = set()
+        self._counter = 0
+
+    def _name(self, prefix: str, value: Any = None) -> str:
+        self._counter += 1
+        name = f"{prefix}{self._counter}"
+        if value is not None:
+            self.namespace[name] = value
+        return name
+
+    def emit(self, value: Any, path: Tuple[str, ...]) -> str:
+        if path in self.holes:
+            self.used_holes.add(path)
+            return self.holes[path]
+        if _is_model(value):
+            return self._emit_model(value, path)
+        if type(value) is list:
+            return "[" + "".join(f"{self.emit(item, path + (str(i),))}, " for i, item in enumerate(value)) + "]"
+        if type(value) is dict:
+            return "{" + "".join(f"{key!r}: {self.emit(item, path + (str(key),))}, " for key, item in value.items()) + "}"
+        if type(value) is tuple:
+            return "(" + "".join(f"{self.emit(item, path + (str(i),))}, " for i, item in enumerate(value)) + ")"
+        if isinstance(value, _IMMUTABLE_TYPES):
+            return self._name("K", value) if value is not None else "None"
+        raise TypeError(f"compile_model_clone: cannot clone {type(value).__name__} at {'.'.join(path) or '<root>'}")
+
+    def _emit_model(self, model: Any, path: Tuple[str, ...]) -> str:
+        cls = model.__class__
+        fields_set = model.__pydantic_fields_set__
+        model_fields = cls.model_fields
+        items = []
+        for key, value in model.__dict__.items():
+            field = model_fields.get(key)
+            factory = getattr(field, "default_factory", None) if field is not None else None
+            if factory is not None and key not in fields_set and path + (key,) not in self.holes:
+                if getattr(field, "default_factory_takes_data", False):
+                    raise TypeError(f"compile_model_clone: default_factory of {cls.__name__}.{key} takes validated data")
+                items.append(f"{key!r}: {self._name('D', factory)}()")
+            else:
+                items.append(f"{key!r}: {self.emit(value, path + (key,))}")
+        extra = model.__pydantic_extra__
+        private = model.__pydantic_private__
+        extra_code = "None" if extra is None else self.emit(dict(extra), path)
+        private_code = "None" if private is None else self.emit(dict(private), path + ("<private>",))
+        var = self._name("n")
+        cls_name = self._name("C", cls)
+        self.lines.append(f"    {var} = {cls_name}.__new__({cls_name})")
+        self.lines.append(f"    _set({var}, '__dict__', {{{', '.join(items)}}})")
+        self.lines.append(f"    _set({var}, '__pydantic_fields_set__', set({self._name('F', frozenset(fields_set))}))")
+        self.lines.append(f"    _set({var}, '__pydantic_extra__', {extra_code})")
+        self.lines.append(f"    _set({var}, '__pydantic_private__', {private_code})")
+        return var
+
+
+def compile_model_clone(prototype: Any, holes: Optional[Dict[Tuple[str, ...], str]] = None) -> Callable[..., Any]:
+    """
+    A function returning a fresh deep copy of the validated model
+    `prototype`. `holes` maps attribute paths (e.g. ("seed_content",
+    "raw_signals")) to keyword parameters of the returned function; every
+    path must exist in the prototype, and several may share a parameter. Raises TypeError if the tree holds a value
+    that cannot be cloned safely (e.g. a set or an arbitrary object).
+    """
+    holes = dict(holes or {})
+    if not _is_model(prototype):
+        raise TypeError(f"compile_model_clone: {type(prototype).__name__} is not a Pydantic model")
+    for name in holes.values():
+        if not name.isidentifier() or name.startswith("_"):
+            raise ValueError(f"compile_model_clone: invalid parameter name {name!r}")
+    compiler = _CloneCompiler(holes)
+    root = compiler.emit(prototype, ())
+    missing = set(holes) - compiler.used_holes
+    if missing:
+        raise ValueError(f"compile_model_clone: paths not in the prototype: {sorted(missing)}")
+    # Several paths may share one parameter
+    signature = ("*, " + ", ".join(dict.fromkeys(holes.values()))) if holes else ""
+    source = f"def clone({signature}):\n" + "\n".join(compiler.lines) + f"\n    return {root}\n"
+    exec(source, compiler.namespace)
+    return compiler.namespace["clone"]
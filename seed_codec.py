@@ -0,0 +1,314 @@
+"""
+Compact wire format for MadaSeed objects.
+
+Pretty-printed JSON repeats every key of the deeply nested
+L1_startle_reflex -> ... -> L7_encoded_application structure in full. This
+module encodes the seed's JSON-mode dump into a small tagged binary format in
+which each distinct key (and each short string value) is written once and
+then referred to by index.
+
+Layout:
+    b"LCSD" | version (1 byte) | body format (1 byte) | flags (1 byte) | body
+
+Body formats:
+    FORMAT_TAGGED  - the built-in tagged format below (stdlib only). Smallest
+                     uncompressed output, but encoded/decoded in pure Python.
+    FORMAT_MSGPACK - msgpack, if the optional `msgpack` package is installed.
+                     Larger than tagged, but much faster. Used by default when
+                     available.
+
+Flags:
+    FLAG_ZLIB      - body is zlib-compressed (useful for on-disk copies).
+
+decode_seed() also accepts plain JSON (str or bytes without the header), so
+callers can switch to it without breaking seeds saved in the old format.
+
+Usage:
+    from .seed_codec import encode_seed, decode_seed
+    data = encode_seed(mada_seed)
+    mada_seed = decode_seed(data)
+"""
+import struct
+import zlib
+from typing import Any, Optional, Type, Union
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+MAGIC = b"LCSD"
+CODEC_VERSION = 1
+FORMAT_TAGGED = 0
+FORMAT_MSGPACK = 1
+FLAG_ZLIB = 0x01
+HEADER_SIZE = len(MAGIC) + 3
+
+FORMAT_NAMES = {"tagged": FORMAT_TAGGED, "msgpack": FORMAT_MSGPACK}
+DEFAULT_FORMAT = "msgpack" if MSGPACK_AVAILABLE else "tagged"
+
+# Tagged body value tags
+_T_NONE = 0x00
+_T_FALSE = 0x01
+_T_TRUE = 0x02
+_T_INT = 0x03       # zigzag varint
+_T_FLOAT = 0x04     # 8-byte big-endian double
+_T_STR_NEW = 0x05   # varint length + UTF-8; appended to the string table
+_T_STR_REF = 0x06   # varint index into the string table
+_T_STR_RAW = 0x07   # varint length + UTF-8; not interned
+_T_LIST = 0x08      # varint count + values
+_T_DICT = 0x09      # varint count + (string key, value) pairs
+
+# Longer strings (raw signals, summaries) are rarely repeated; interning them
+# would only grow the string table.
+_INTERN_MAX_LEN = 64
+
+_pack_double = struct.Struct(">d").pack
+_unpack_double = struct.Struct(">d").unpack_from
+
+
+class SeedCodecError(ValueError):
+    pass
+
+
+def _default_seed_class():
+    from lc_python_core.schemas.mada_schema import MadaSeed
+    return MadaSeed
+
+
+def _encode_tagged(data: Any) -> bytes:
+    out = bytearray()
+    append = out.append
+    extend = out.extend
+    table = {}
+
+    def write_varint(n: int):
+        while n > 0x7F:
+            append((n & 0x7F) | 0x80)
+            n >>= 7
+        append(n)
+
+    def write_str(s: str):
+        if len(s) <= _INTERN_MAX_LEN:
+            index = table.get(s)
+            if index is not None:
+                if index < 0x80:
+                    extend((_T_STR_REF, index))
+                else:
+                    append(_T_STR_REF)
+                    write_varint(index)
+                return
+            table[s] = len(table)
+            append(_T_STR_NEW)
+        else:
+            append(_T_STR_RAW)
+        encoded = s.encode("utf-8")
+        write_varint(len(encoded))
+        extend(encoded)
+
+    def write_int(value: int):
+        append(_T_INT)
+        write_varint((value << 1) if value >= 0 else ((-value << 1) - 1))
+
+    def write_float(value: float):
+        append(_T_FLOAT)
+        extend(_pack_double(value))
+
+    def write_dict(value: dict):
+        append(_T_DICT)
+        write_varint(len(value))
+        for key, item in value.items():
+            write_str(key if type(key) is str else str(key))
+            writer = writers.get(type(item))
+            if writer is None:
+                write_other(item)
+            else:
+                writer(item)
+
+    def write_list(value):
+        append(_T_LIST)
+        write_varint(len(value))
+        for item in value:
+            writer = writers.get(type(item))
+            if writer is None:
+                write_other(item)
+            else:
+                writer(item)
+
+    # Exact-type dispatch; subclasses (str enums, OrderedDict, ...) go through write_other.
+    writers = {
+        str: write_str,
+        dict: write_dict,
+        type(None): lambda _: append(_T_NONE),
+        bool: lambda value: append(_T_TRUE if value else _T_FALSE),
+        int: write_int,
+        float: write_float,
+        list: write_list,
+        tuple: write_list,
+    }
+
+    def write_other(value: Any):
+        for base in (bool, str, int, float, dict, list, tuple):
+            if isinstance(value, base):
+                writers[base](value)
+                return
+        raise SeedCodecError(f"Cannot encode value of type {type(value).__name__}")
+
+    writer = writers.get(type(data))
+    if writer is None:
+        write_other(data)
+    else:
+        writer(data)
+    return bytes(out)
+
+
+def _decode_tagged(body: bytes) -> Any:
+    table = []
+    pos = 0
+
+    def read_varint() -> int:
+        nonlocal pos
+        shift = 0
+        result = 0
+        while True:
+            byte = body[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_utf8() -> str:
+        nonlocal pos
+        length = read_varint()
+        if pos + length > len(body):
+            raise IndexError
+        s = body[pos:pos + length].decode("utf-8")
+        pos += length
+        return s
+
+    def read() -> Any:
+        nonlocal pos
+        tag = body[pos]
+        pos += 1
+        # Most varints in a seed (table indexes, counts) fit in one byte, so
+        # the common tags check that inline before falling back to read_varint().
+        if tag == _T_STR_REF:
+            index = body[pos]
+            if index < 0x80:
+                pos += 1
+                return table[index]
+            return table[read_varint()]
+        if tag == _T_DICT:
+            count = body[pos]
+            if count < 0x80:
+                pos += 1
+            else:
+                count = read_varint()
+            return {read(): read() for _ in range(count)}
+        if tag == _T_STR_NEW:
+            s = read_utf8()
+            table.append(s)
+            return s
+        if tag == _T_NONE:
+            return None
+        if tag == _T_LIST:
+            return [read() for _ in range(read_varint())]
+        if tag == _T_STR_RAW:
+            return read_utf8()
+        if tag == _T_TRUE:
+            return True
+        if tag == _T_FALSE:
+            return False
+        if tag == _T_INT:
+            n = read_varint()
+            return (n >> 1) if not n & 1 else -((n + 1) >> 1)
+        if tag == _T_FLOAT:
+            value = _unpack_double(body, pos)[0]
+            pos += 8
+            return value
+        raise SeedCodecError(f"Unknown tag 0x{tag:02x} at offset {pos - 1}")
+
+    try:
+        value = read()
+    except (IndexError, struct.error):
+        raise SeedCodecError("Truncated seed payload")
+    if pos != len(body):
+        raise SeedCodecError(f"{len(body) - pos} trailing bytes after seed payload")
+    return value
+
+
+def encode_data(data: Any, fmt: Optional[str] = None, compress: bool = False) -> bytes:
+    """
+    Encodes a JSON-compatible structure (dicts, lists, str, int, float,
+    bool, None) with the versioned header. `fmt` is "tagged", "msgpack" or
+    None for DEFAULT_FORMAT.
+    """
+    body_format = FORMAT_NAMES.get(fmt or DEFAULT_FORMAT)
+    if body_format is None:
+        raise SeedCodecError(f"Unknown seed wire format: {fmt!r}")
+    if body_format == FORMAT_MSGPACK:
+        if not MSGPACK_AVAILABLE:
+            raise SeedCodecError("msgpack wire format requested but the msgpack package is not installed")
+        body = msgpack.packb(data, use_bin_type=True)
+    else:
+        body = _encode_tagged(data)
+    flags = 0
+    if compress:
+        body = zlib.compress(body)
+        flags |= FLAG_ZLIB
+    return MAGIC + bytes((CODEC_VERSION, body_format, flags)) + body
+
+
+def decode_data(data: bytes) -> Any:
+    """
+    Inverse of encode_data(). Raises SeedCodecError for foreign or newer payloads.
+    """
+    if not is_encoded_seed(data):
+        raise SeedCodecError("Missing seed codec header")
+    version, body_format, flags = data[len(MAGIC)], data[len(MAGIC) + 1], data[len(MAGIC) + 2]
+    if version > CODEC_VERSION:
+        raise SeedCodecError(f"Seed codec version {version} is newer than supported version {CODEC_VERSION}")
+    body = bytes(data[HEADER_SIZE:])
+    if flags & FLAG_ZLIB:
+        try:
+            body = zlib.decompress(body)
+        except zlib.error as e:
+            raise SeedCodecError(f"Corrupt compressed seed payload: {e}") from e
+    if body_format == FORMAT_TAGGED:
+        return _decode_tagged(body)
+    if body_format == FORMAT_MSGPACK:
+        if not MSGPACK_AVAILABLE:
+            raise SeedCodecError("Payload is msgpack-encoded but the msgpack package is not installed")
+        return msgpack.unpackb(body, raw=False)
+    raise SeedCodecError(f"Unknown body format {body_format}")
+
+
+def is_encoded_seed(data: Any) -> bool:
+    return isinstance(data, (bytes, bytearray, memoryview)) and bytes(data[:len(MAGIC)]) == MAGIC
+
+
+def encode_seed(mada_seed: Any, fmt: Optional[str] = None, compress: bool = False) -> bytes:
+    """
+    Encodes a Pydantic MadaSeed. Datetimes and enums are stored as their
+    JSON-mode values and restored by model validation in decode_seed().
+    """
+    if not hasattr(mada_seed, "model_dump"):
+        raise SeedCodecError(f"Cannot encode {type(mada_seed).__name__}: not a Pydantic model")
+    return encode_data(mada_seed.model_dump(mode="json"), fmt=fmt, compress=compress)
+
+
+def decode_seed(data: Union[bytes, bytearray, memoryview, str], seed_cls: Optional[Type] = None) -> Any:
+    """
+    Decodes encode_seed() output, or plain JSON text, into `seed_cls`
+    (lc_python_core.schemas.mada_schema.MadaSeed by default).
+    """
+    if seed_cls is None:
+        seed_cls = _default_seed_class()
+    if is_encoded_seed(data):
+        return seed_cls.model_validate(decode_data(data))
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return seed_cls.model_validate_json(data)
@@ -0,0 +1,221 @@
+"""
+Structural diff between two MadaSeeds, e.g. consecutive layer outputs.
+
+diff_seeds() walks both model trees in step; it never serializes them.
+Sub-trees that are the same object are skipped without being visited, and
+only leaves that differ are recorded, so the cost is one pass over the
+changed parts plus an attribute read per unchanged field:
+
+    diff = diff_seeds(mada_seed_L2, mada_seed_L3)
+    diff.added      # {"seed_content....L3_surface_keymap": <L3SurfaceKeymapContainer>, ...}
+    diff.changed    # {"trace_metadata.L3_trace.sop_name": (None, "L3_KeymapClick"), ...}
+    diff.removed    # {path: old value}
+    mada_seed_L3 == apply_seed_diff(mada_seed_L2, diff)
+
+A model field going from None to a value counts as added and back to None
+as removed; dict keys and list items are added or removed when they appear
+or disappear. Paths use the seed_paths notation ("a.b[0].c").
+
+SOPs mutate their input seed in place: diff a copy taken before a layer
+(e.g. a layer_cache checkpoint) against the layer's output, not the same
+object with itself.
+"""
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+Step = Union[str, int]
+
+
+class DiffEntry(NamedTuple):
+    op: str
+    path: str
+    steps: Tuple[Step, ...]
+    old: Any
+    new: Any
+
+
+def _model_fields(obj: Any) -> Optional[Dict[str, Any]]:
+    # A Pydantic model's declared fields, or None for anything else.
+    if isinstance(obj, type):
+        return None
+    return getattr(type(obj), "model_fields", None)
+
+
+def _join(path: str, step: Step) -> str:
+    if isinstance(step, int):
+        return f"{path}[{step}]"
+    return f"{path}.{step}" if path else str(step)
+
+
+def _jsonable(value: Any) -> Any:
+    if _model_fields(value) is not None:
+        return value.model_dump(mode="json")
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+class SeedDiff:
+    """
+    The differences between two seeds, in walk order.
+    """
+
+    def __init__(self, entries: List[DiffEntry]):
+        self.entries = entries
+
+    def _by_op(self, op: str) -> Dict[str, Any]:
+        return {entry.path: (entry.old, entry.new) if op == CHANGED else (entry.new if op == ADDED else entry.old)
+                for entry in self.entries if entry.op == op}
+
+    @property
+    def added(self) -> Dict[str, Any]:
+        return self._by_op(ADDED)
+
+    @property
+    def changed(self) -> Dict[str, Tuple[Any, Any]]:
+        return self._by_op(CHANGED)
+
+    @property
+    def removed(self) -> Dict[str, Any]:
+        return self._by_op(REMOVED)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __bool__(self) -> bool:
+        return bool(self.entries)
+
+    def __iter__(self) -> Iterator[DiffEntry]:
+        return iter(self.entries)
+
+    def counts(self) -> Dict[str, int]:
+        counts = {ADDED: 0, CHANGED: 0, REMOVED: 0}
+        for entry in self.entries:
+            counts[entry.op] += 1
+        return counts
+
+    def to_dict(self, max_value_chars: int = 0) -> Dict[str, Any]:
+        """
+        JSON-compatible form. With `max_value_chars` > 0, string values (and
+        the JSON of larger values) longer than that are truncated.
+        """
+        def shown(value: Any) -> Any:
+            value = _jsonable(value)
+            if max_value_chars <= 0:
+                return value
+            if isinstance(value, (dict, list)):
+                text = json.dumps(value, default=str)
+                return value if len(text) <= max_value_chars else text[:max_value_chars] + "..."
+            if isinstance(value, str) and len(value) > max_value_chars:
+                return value[:max_value_chars] + "..."
+            return value
+
+        return {
+            "counts": self.counts(),
+            ADDED: {entry.path: shown(entry.new) for entry in self.entries if entry.op == ADDED},
+            CHANGED: {entry.path: {"old": shown(entry.old), "new": shown(entry.new)} for entry in self.entries if entry.op == CHANGED},
+            REMOVED: {entry.path: shown(entry.old) for entry in self.entries if entry.op == REMOVED},
+        }
+
+
+def _diff(old: Any, new: Any, path: str, steps: Tuple[Step, ...], out: List[DiffEntry]):
+    if old is new:
+        return
+    if old is None:
+        out.append(DiffEntry(ADDED, path, steps, None, new))
+        return
+    if new is None:
+        out.append(DiffEntry(REMOVED, path, steps, old, None))
+        return
+
+    fields = _model_fields(old)
+    if fields is not None and type(new) is type(old):
+        for name in fields:
+            _diff(getattr(old, name), getattr(new, name), _join(path, name), steps + (name,), out)
+        old_extra, new_extra = old.__pydantic_extra__, new.__pydantic_extra__
+        if old_extra or new_extra:
+            _diff_dicts(old_extra or {}, new_extra or {}, path, steps, out)
+        return
+    if type(old) is dict and type(new) is dict:
+        _diff_dicts(old, new, path, steps, out)
+        return
+    if isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        for index in range(common):
+            _diff(old[index], new[index], _join(path, index), steps + (index,), out)
+        for index in range(common, len(new)):
+            out.append(DiffEntry(ADDED, _join(path, index), steps + (index,), None, new[index]))
+        # Highest index first, so applying the removals in order keeps the remaining indexes valid
+        for index in range(len(old) - 1, common - 1, -1):
+            out.append(DiffEntry(REMOVED, _join(path, index), steps + (index,), old[index], None))
+        return
+    if type(old) is not type(new) or old != new:
+        out.append(DiffEntry(CHANGED, path, steps, old, new))
+
+
+def _diff_dicts(old: Dict[Any, Any], new: Dict[Any, Any], path: str, steps: Tuple[Step, ...], out: List[DiffEntry]):
+    for key, old_value in old.items():
+        step = str(key)
+        if key in new:
+            _diff(old_value, new[key], _join(path, step), steps + (step,), out)
+        else:
+            out.append(DiffEntry(REMOVED, _join(path, step), steps + (step,), old_value, None))
+    for key, new_value in new.items():
+        if key not in old:
+            step = str(key)
+            out.append(DiffEntry(ADDED, _join(path, step), steps + (step,), None, new_value))
+
+
+def diff_seeds(old_seed: Any, new_seed: Any) -> SeedDiff:
+    """
+    Differences from `old_seed` to `new_seed` (models, dicts or lists).
+    """
+    entries: List[DiffEntry] = []
+    _diff(old_seed, new_seed, "", (), entries)
+    return SeedDiff(entries)
+
+
+def _dumped(value: Any) -> Any:
+    if _model_fields(value) is not None:
+        return value.model_dump()
+    return value
+
+
+def apply_seed_diff(base_seed: Any, diff: SeedDiff, seed_cls: Optional[Type] = None) -> Any:
+    """
+    Rebuilds the newer seed from `base_seed` (the diff's old side) and the
+    diff, validated as `seed_cls` (the base seed's class by default).
+    """
+    data = base_seed.model_dump()
+    for entry in diff.entries:
+        *parent_steps, last = entry.steps
+        parent = data
+        for step in parent_steps:
+            parent = parent[step]
+        if entry.op == REMOVED:
+            model_parent = base_seed
+            for step in parent_steps:
+                model_parent = model_parent[step] if isinstance(step, int) or type(model_parent) is dict else getattr(model_parent, step)
+            if _model_fields(model_parent) is not None and last in _model_fields(model_parent):
+                parent[last] = None # a model field is cleared, not dropped
+            else:
+                del parent[last]
+        elif isinstance(parent, list) and last == len(parent):
+            parent.append(_dumped(entry.new))
+        else:
+            parent[last] = _dumped(entry.new)
+    return (seed_cls or type(base_seed)).model_validate(data)
@@ -0,0 +1,37 @@
+import json
+from typing import Any
+
+from .lc_logging import get_logger
+from .seed_diff import diff_seeds
+
+logger = get_logger(__name__)
+
+
+class LcSeedDiffNode:
+    CATEGORY = "LearntCloud/EpistemicOSI"
+    RETURN_TYPES = ("STRING", "STRING",)
+    RETURN_NAMES = ("diff_json", "diff_summary",)
+    FUNCTION = "diff"
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "mada_seed_before": ("MADA_SEED",), # e.g. the L2 output
+                "mada_seed_after": ("MADA_SEED",), # e.g. the L3 output
+            },
+            "optional": {
+                # Longer values are truncated in diff_json; 0 shows them in full
+                "max_value_chars": ("INT", {"default": 200, "min": 0, "max": 1000000}),
+            }
+        }
+
+    def diff(self, mada_seed_before: Any, mada_seed_after: Any, max_value_chars: int = 200):
+        if mada_seed_before is mada_seed_after and mada_seed_before is not None:
+            # SOPs mutate their input in place, so both inputs can be the same object
+            logger.warning("LcSeedDiffNode: Both inputs are the same seed object; the diff is empty.")
+        diff = diff_seeds(mada_seed_before, mada_seed_after)
+        counts = diff.counts()
+        summary = f"{counts['added']} added, {counts['changed']} changed, {counts['removed']} removed"
+        logger.debug("LcSeedDiffNode: %s", summary)
+        return (json.dumps(diff.to_dict(max_value_chars), indent=2, default=str), summary)
@@ -0,0 +1,67 @@
+import json
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from .lazy_seed import LazySeedView, seed_view
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_FIELD_PATHS = "\n".join([
+    "@L6.L6_reflection_payload_obj.payload_content.formatted_text",
+    "@L6.L6_reflection_payload_obj.l6_epistemic_state",
+    "trace_metadata.L7_trace.epistemic_state_L7",
+    "seed_QA_QC.overall_seed_integrity_status",
+])
+
+
+def _plain(value: Any) -> Any:
+    # JSON-compatible form of a field value read from any kind of seed view.
+    if isinstance(value, LazySeedView):
+        return value.to_python()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+class LcSeedFieldExtractNode:
+    CATEGORY = "LearntCloud/EpistemicOSI"
+    RETURN_TYPES = ("STRING", "STRING",)
+    RETURN_NAMES = ("fields_json", "first_field_text",)
+    FUNCTION = "extract_fields"
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                # One dotted path per line, e.g. seed_content.raw_signals[0].raw_input_signal; @L1..@L7 expand to the layer containers
+                "field_paths": ("STRING", {"multiline": True, "default": DEFAULT_FIELD_PATHS}),
+            },
+            "optional": {
+                "mada_seed": ("MADA_SEED",),
+                # Used when no mada_seed is connected; the JSON is decoded but not validated
+                "mada_seed_json": ("STRING", {"multiline": True, "default": ""}),
+            }
+        }
+
+    def extract_fields(self, field_paths: str, mada_seed: Optional[Any] = None, mada_seed_json: Optional[str] = None):
+        paths = [line.strip() for line in field_paths.splitlines() if line.strip()]
+        source = mada_seed if mada_seed is not None else mada_seed_json
+        if source is None or (isinstance(source, str) and not source.strip()):
+            logger.warning("LcSeedFieldExtractNode: No seed or seed JSON provided.")
+            return (json.dumps({"error": "No seed or seed JSON provided."}), "")
+        try:
+            view = seed_view(source)
+            fields: Dict[str, Any] = {path: _plain(view.get(path)) for path in paths}
+        except ValueError as e: # malformed JSON
+            logger.error("LcSeedFieldExtractNode: Cannot read seed: %s", e)
+            return (json.dumps({"error": f"Cannot read seed: {e}"}), "")
+
+        first = fields[paths[0]] if paths else None
+        if first is None:
+            first_text = ""
+        elif isinstance(first, str):
+            first_text = first
+        else:
+            first_text = json.dumps(first, indent=2, default=str)
+        return (json.dumps(fields, indent=2, default=str), first_text)
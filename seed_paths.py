@@ -0,0 +1,172 @@
+"""
+Compiled accessors for paths into a MadaSeed.
+
+Summary code walks the nested layer containers
+
+    seed_content.L1_startle_reflex.L2_frame_type.L3_surface_keymap.L4_anchor_state
+        .L5_field_state.L6_reflection_payload...
+
+where any link may be None (a layer that failed or has not run). Rather
+than repeating the attribute chain under `try/except AttributeError`,
+compile the path once and call it:
+
+    from .seed_paths import MISSING, compile_path
+    formatted_text = compile_path("@L6.L6_reflection_payload_obj.payload_content.formatted_text")
+    text = formatted_text(mada_seed)      # MISSING if a link is absent or None
+
+compile_path() caches one accessor per path string, so hot paths can call
+it inline. Accessors work on model objects and on plain decoded dicts and
+lists alike. `@L1`...`@L7` at the start of a path expand to the layer
+containers (LAYER_PATHS).
+"""
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+_L1 = "seed_content.L1_startle_reflex"
+_L2 = _L1 + ".L2_frame_type"
+_L3 = _L2 + ".L3_surface_keymap"
+_L4 = _L3 + ".L4_anchor_state"
+_L5 = _L4 + ".L5_field_state"
+_L6 = _L5 + ".L6_reflection_payload"
+
+# Path aliases for the nested per-layer containers
+LAYER_PATHS: Dict[str, str] = {
+    "@L1": _L1,
+    "@L2": _L2,
+    "@L3": _L3,
+    "@L4": _L4,
+    "@L5": _L5,
+    "@L6": _L6,
+    "@L7": _L6 + ".L7_encoded_application",
+}
+
+_PATH_STEP = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+
+
+class _Missing:
+    """
+    Returned by accessors when a link of the path is absent or None. Falsy,
+    so `if value:` treats it like None.
+    """
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "MISSING"
+
+    def __reduce__(self):
+        return (_Missing, ())
+
+
+MISSING = _Missing()
+
+
+@lru_cache(maxsize=1024)
+def parse_path(path: str) -> Tuple[Union[str, int], ...]:
+    """
+    "a.b[0].c" (or "a.b.0.c") -> ("a", "b", 0, "c"), with a leading LAYER_PATHS
+    alias expanded.
+    """
+    head, _, rest = path.partition(".")
+    if head in LAYER_PATHS:
+        path = LAYER_PATHS[head] + ("." + rest if rest else "")
+    steps: List[Union[str, int]] = []
+    for name, index in _PATH_STEP.findall(path):
+        if index:
+            steps.append(int(index))
+        else:
+            steps.append(int(name) if name.isdigit() else name)
+    return tuple(steps)
+
+
+def _compile_getter(steps: Tuple[Union[str, int], ...]) -> Callable[[Any], Any]:
+    # One straight-line function per path: no per-step calls, loops or exceptions.
+    lines = ["def getter(obj):"]
+    for step in steps:
+        lines.append("    if obj is None or obj is MISSING: return MISSING")
+        if isinstance(step, int):
+            lines.append(f"    obj = obj[{step}] if isinstance(obj, (list, tuple)) and len(obj) > {step} else "
+                         f"(obj.get({str(step)!r}, MISSING) if type(obj) is dict else MISSING)")
+        else:
+            lines.append(f"    obj = obj.get({step!r}, MISSING) if type(obj) is dict else getattr(obj, {step!r}, MISSING)")
+    lines.append("    return obj")
+    namespace: Dict[str, Any] = {"MISSING": MISSING}
+    exec("\n".join(lines), namespace)
+    return namespace["getter"]
+
+
+class SeedPath:
+    """
+    Accessor for one path. Calling it returns the value at the path, or
+    MISSING if any link before the last one is absent or None. A present
+    final value is returned as-is, even if it is None.
+    """
+
+    __slots__ = ("path", "steps", "_getter")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.steps = parse_path(path)
+        self._getter = _compile_getter(self.steps)
+
+    def __call__(self, obj: Any) -> Any:
+        return self._getter(obj)
+
+    def get(self, obj: Any, default: Any = None) -> Any:
+        """
+        Like calling the accessor, but `default` for MISSING and None.
+        """
+        value = self(obj)
+        return default if value is None or value is MISSING else value
+
+    def child(self, suffix: str) -> "SeedPath":
+        return compile_path(f"{self.path}.{suffix}")
+
+    def __repr__(self):
+        return f"SeedPath({self.path!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_path(path: str) -> SeedPath:
+    return SeedPath(path)
+
+
+def enum_name(value: Any, default: str = "N/A") -> Any:
+    """
+    An enum member's name; plain values (e.g. read from seed JSON) as-is.
+    """
+    if value is None or value is MISSING:
+        return default
+    return getattr(value, "name", value)
+
+
+def enum_value(value: Any, default: str = "N/A") -> Any:
+    if value is None or value is MISSING:
+        return default
+    return getattr(value, "value", value)
+
+
+# Accessors used by the L6/L7 summaries
+L6_PAYLOAD_OBJ = compile_path("@L6.L6_reflection_payload_obj")
+L6_PAYLOAD_CONTENT = L6_PAYLOAD_OBJ.child("payload_content")
+L6_EPISTEMIC_STATE = L6_PAYLOAD_OBJ.child("l6_epistemic_state")
+L6_FORMATTED_TEXT = L6_PAYLOAD_CONTENT.child("formatted_text")
+L6_STRUCTURED_DATA = L6_PAYLOAD_CONTENT.child("structured_data")
+L6_MULTIMODAL_PACKAGE = L6_PAYLOAD_CONTENT.child("multimodal_package")
+L6_API_PAYLOAD = L6_PAYLOAD_CONTENT.child("api_payload")
+L7_APPLICATION = compile_path("@L7")
+L7_BACKLOG = L7_APPLICATION.child("L7_backlog")
+L7_SEED_OUTPUTS = L7_APPLICATION.child("seed_outputs")
+L7_FIRST_OUTPUT_OPTIONS = L7_APPLICATION.child("seed_outputs[0].seed_options.options")
+L7_TRACE = compile_path("trace_metadata.L7_trace")
+L7_EPISTEMIC_STATE = L7_TRACE.child("epistemic_state_L7")
+SEED_QA_QC = compile_path("seed_QA_QC")
+SEED_INTEGRITY_STATUS = SEED_QA_QC.child("overall_seed_integrity_status")
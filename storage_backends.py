@@ -0,0 +1,620 @@
+"""
+Pluggable storage for the MADA and Backlog nodes.
+
+The nodes used to call lc_mem_service's mock_lc_mem_core_* functions and its
+file-based PBI helpers directly. They now go through the storage backend
+returned by get_storage_backend():
+
+    backend = get_storage_backend()
+    uid = backend.ensure_uid("Observation")
+    backend.create_object(uid, {"summary": "..."})
+    backend.get_object(uid)    # {"object_uid", "object_type", "version", "payload", "metadata", ...} or None
+
+Backends (LC_EPISTEMIC_STORAGE_BACKEND):
+    lc_mem_service - the default: forwards every call to
+                     lc_python_core.services.lc_mem_service, as before.
+    sqlite         - SQLiteStorageBackend, a local embedded store in one
+                     SQLite file (LC_EPISTEMIC_SQLITE_PATH, default
+                     lab/.data/mada_vault/mada.sqlite3). Needs no other
+                     service and keeps predictable latency at larger sizes.
+
+configure_storage_backend() swaps the backend at runtime, e.g. in tests or
+a start-up script. Batch calls (ensure_uids, create_objects, get_objects)
+are offered through batch_call(); mada_bulk uses them when a backend has
+them natively.
+"""
+import json
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+from .mada_read_cache import get_mada_read_cache
+
+logger = get_logger(__name__)
+
+PBI_OBJECT_TYPE = "PBI"
+DEFAULT_SQLITE_PATH = os.path.join("lab", ".data", "mada_vault", "mada.sqlite3")
+DEFAULT_POOL_SIZE = 8
+BATCH_CALLS = ("ensure_uids", "create_objects", "get_objects")
+
+
+def new_crux_uid(object_type: str) -> str:
+    return f"urn:crux:uid::{object_type}::{uuid.uuid4().hex}"
+
+
+class MadaStorageBackend(ABC):
+    """
+    The storage calls the nodes make. Signatures and return values follow
+    lc_mem_service, so nodes treat every backend alike. A backend implements
+    every abstract call; batch_call() and close() are optional.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def ensure_uid(self, object_type: str, context_description: Optional[str] = None) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def create_object(self, object_uid: str, object_payload: Dict[str, Any], initial_metadata: Optional[Dict[str, Any]] = None,
+                      requesting_persona_context: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        True on success, an error string otherwise.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_object(self, object_uid: str, requesting_persona_context: Optional[Dict[str, Any]] = None) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    def query_objects(self, query_params: Dict[str, Any], requesting_persona_context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Payloads of the objects of query_params["object_type"] whose payload
+        fields equal every other entry of `query_params`.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_mada_object(self, object_payload_json: str, object_type: str, requesting_persona_context_json: str = "{}",
+                          object_uid_to_update: Optional[str] = None, initial_metadata_json: str = "{}",
+                          update_metadata_json: str = "{}") -> Dict[str, Any]:
+        """
+        Creates or updates an object: {"object_uid", "status", "version"}.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def create_pbi(self, pbi_data: Dict[str, Any], requesting_persona_context: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_pbi_details(self, pbi_uid: str, requesting_persona_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def link_pbis(self, source_pbi_uid: str, target_pbi_uid: str, link_type: str,
+                  requesting_persona_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_comment_to_pbi(self, pbi_uid: str, comment_text: str, author_persona_uid: str,
+                           requesting_persona_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    @property
+    def pbi_object_type(self) -> str:
+        return PBI_OBJECT_TYPE
+
+    def batch_call(self, name: str) -> Optional[Callable[..., Any]]:
+        """
+        The native batch form of a call (one of BATCH_CALLS), or None:
+            ensure_uids(object_type, count, context_description=None) -> List[str]
+            create_objects(objects, requesting_persona_context=None) -> List[True | error]
+            get_objects(object_uids, requesting_persona_context=None) -> Dict[uid, object]
+        """
+        return None
+
+    def close(self):
+        pass
+
+
+# --- lc_mem_service ---
+
+# Stand-ins used if lc_mem_service cannot be imported: they return an error status instead.
+def _write_mada_object_unavailable(*args, **kwargs) -> Dict[str, Any]:
+    return {
+        "object_uid": None,
+        "status": "Error: lc_mem_service.write_mada_object not found. Backend not imported.",
+        "version": None,
+    }
+
+
+def _get_pbi_details_unavailable(*args, **kwargs) -> Dict[str, Any]:
+    return {
+        "status": "Error: lc_mem_service.get_pbi_details not found. Backend not imported.",
+        "pbi_uid": kwargs.get("pbi_uid"),
+        "details": None,
+    }
+
+
+def _link_pbis_unavailable(*args, **kwargs) -> Dict[str, Any]:
+    return {
+        "status": "Error: lc_mem_service.link_pbis not found. Backend not imported.",
+        "source_pbi_uid": kwargs.get("source_pbi_uid"),
+        "target_pbi_uid": kwargs.get("target_pbi_uid"),
+        "link_type": kwargs.get("link_type"),
+    }
+
+
+def _add_comment_to_pbi_unavailable(*args, **kwargs) -> Dict[str, Any]:
+    return {
+        "status": "Error: lc_mem_service.add_comment_to_pbi not found. Backend not imported.",
+        "pbi_uid": kwargs.get("pbi_uid"),
+        "comment_id": None,
+    }
+
+
+_SERVICE = "lc_python_core.services.lc_mem_service"
+lc_mem_service = lazy_import(_SERVICE)
+mock_lc_mem_core_ensure_uid = lazy_import(_SERVICE, "mock_lc_mem_core_ensure_uid")
+mock_lc_mem_core_create_object = lazy_import(_SERVICE, "mock_lc_mem_core_create_object")
+mock_lc_mem_core_get_object = lazy_import(_SERVICE, "mock_lc_mem_core_get_object")
+mock_lc_mem_core_query_objects = lazy_import(_SERVICE, "mock_lc_mem_core_query_objects")
+SERVICE_PBI_OBJECT_TYPE = lazy_import(_SERVICE, "PBI_OBJECT_TYPE")
+write_mada_object = lazy_import(_SERVICE, "write_mada_object", fallback=_write_mada_object_unavailable)
+create_pbi = lazy_import(_SERVICE, "create_pbi")
+get_pbi_details = lazy_import(_SERVICE, "get_pbi_details", fallback=_get_pbi_details_unavailable)
+link_pbis = lazy_import(_SERVICE, "link_pbis", fallback=_link_pbis_unavailable)
+add_comment_to_pbi = lazy_import(_SERVICE, "add_comment_to_pbi", fallback=_add_comment_to_pbi_unavailable)
+
+
+class LcMemServiceBackend(MadaStorageBackend):
+    """
+    Forwards to lc_python_core's lc_mem_service, imported on first use.
+    """
+
+    name = "lc_mem_service"
+
+    def ensure_uid(self, object_type, context_description=None):
+        return mock_lc_mem_core_ensure_uid(object_type=object_type, context_description=context_description)
+
+    def create_object(self, object_uid, object_payload, initial_metadata=None, requesting_persona_context=None):
+        return mock_lc_mem_core_create_object(object_uid=object_uid, object_payload=object_payload,
+                                              initial_metadata=initial_metadata, requesting_persona_context=requesting_persona_context)
+
+    def get_object(self, object_uid, requesting_persona_context=None):
+        return mock_lc_mem_core_get_object(object_uid=object_uid, requesting_persona_context=requesting_persona_context)
+
+    def query_objects(self, query_params, requesting_persona_context=None):
+        return mock_lc_mem_core_query_objects(query_params=query_params, requesting_persona_context=requesting_persona_context)
+
+    def write_mada_object(self, **kwargs):
+        return write_mada_object(**kwargs)
+
+    def create_pbi(self, pbi_data, requesting_persona_context=None):
+        return create_pbi(pbi_data=pbi_data, requesting_persona_context=requesting_persona_context)
+
+    def get_pbi_details(self, pbi_uid, requesting_persona_context=None):
+        return get_pbi_details(pbi_uid=pbi_uid, requesting_persona_context=requesting_persona_context)
+
+    def link_pbis(self, source_pbi_uid, target_pbi_uid, link_type, requesting_persona_context=None):
+        return link_pbis(source_pbi_uid=source_pbi_uid, target_pbi_uid=target_pbi_uid, link_type=link_type,
+                         requesting_persona_context=requesting_persona_context)
+
+    def add_comment_to_pbi(self, pbi_uid, comment_text, author_persona_uid, requesting_persona_context=None):
+        return add_comment_to_pbi(pbi_uid=pbi_uid, comment_text=comment_text, author_persona_uid=author_persona_uid,
+                                  requesting_persona_context=requesting_persona_context)
+
+    @property
+    def pbi_object_type(self):
+        return SERVICE_PBI_OBJECT_TYPE.resolve()
+
+    def batch_call(self, name):
+        # Only if the installed lc_mem_service provides it.
+        return getattr(lc_mem_service.resolve(), "mock_lc_mem_core_" + name, None)
+
+
+# --- SQLite ---
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mada_objects (
+    object_uid TEXT PRIMARY KEY,
+    object_type TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_mada_objects_type ON mada_objects (object_type, object_uid);
+CREATE TABLE IF NOT EXISTS mada_object_versions (
+    object_uid TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    written_at REAL NOT NULL,
+    PRIMARY KEY (object_uid, version)
+) WITHOUT ROWID;
+"""
+
+# Payload fields QueryPbisNode filters on. Expression indexes on them let such
+# queries skip the scan of every object of the type; they need SQLite's JSON
+# functions (built in since 3.38), without which payload filters run in Python.
+INDEXED_PAYLOAD_FIELDS = ("status", "priority", "pbi_type")
+_JSON_INDEXES = "".join(f"CREATE INDEX IF NOT EXISTS idx_mada_objects_{field} ON mada_objects "
+                        f"(object_type, json_extract(payload, '$.{field}'));\n" for field in INDEXED_PAYLOAD_FIELDS)
+# Keys that can be written into a JSON path literal as-is
+_JSON_FIELD = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Fixed SQL texts: each connection's statement cache prepares them once and reuses them.
+_SQL_GET = "SELECT object_uid, object_type, version, payload, metadata, created_at, updated_at FROM mada_objects WHERE object_uid = ?"
+_SQL_GET_VERSION = ("SELECT v.object_uid, o.object_type, v.version, v.payload, v.metadata, o.created_at, v.written_at "
+                    "FROM mada_object_versions v JOIN mada_objects o ON o.object_uid = v.object_uid "
+                    "WHERE v.object_uid = ? AND v.version = ?")
+_SQL_BY_TYPE = "SELECT payload FROM mada_objects WHERE object_type = ?"
+_SQL_INSERT = ("INSERT INTO mada_objects (object_uid, object_type, version, payload, metadata, created_at, updated_at) "
+               "VALUES (?, ?, 1, ?, ?, ?, ?)")
+_SQL_UPDATE = "UPDATE mada_objects SET version = ?, payload = ?, metadata = ?, updated_at = ? WHERE object_uid = ?"
+_SQL_INSERT_VERSION = "INSERT INTO mada_object_versions (object_uid, version, payload, metadata, written_at) VALUES (?, ?, ?, ?, ?)"
+# Batched reads use fixed-size IN lists, padded with NULLs, so there is one statement per chunk size.
+_GET_CHUNK = 64
+_SQL_GET_MANY = (f"SELECT object_uid, object_type, version, payload, metadata, created_at, updated_at FROM mada_objects "
+                 f"WHERE object_uid IN ({', '.join('?' * _GET_CHUNK)})")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _sql_filter(key: Any, value: Any) -> Optional[Tuple[str, tuple]]:
+    # A WHERE clause matching at least the rows whose payload[key] == value, or
+    # None if the filter can only run in Python (nested values, unusual keys).
+    # The path is a literal so that the expression indexes apply.
+    if not isinstance(key, str) or not _JSON_FIELD.match(key):
+        return None
+    expression = f"json_extract(payload, '$.{key}')"
+    if value is None: # a missing key or JSON null
+        return f"{expression} IS NULL", ()
+    if isinstance(value, int) and not isinstance(value, bool) and not -2**63 <= value < 2**63:
+        return None
+    if isinstance(value, (str, int, float)):
+        return f"{expression} = ?", (value,)
+    return None
+
+
+def _record(row: tuple) -> Dict[str, Any]:
+    object_uid, object_type, version, payload, metadata, created_at, updated_at = row
+    return {"object_uid": object_uid, "object_type": object_type, "version": version, "payload": json.loads(payload),
+            "metadata": json.loads(metadata), "created_at": created_at, "updated_at": updated_at}
+
+
+def _parse_json_arg(text: Optional[str], name: str) -> Dict[str, Any]:
+    if not text or not text.strip():
+        return {}
+    value = json.loads(text) # JSONDecodeError is reported by the caller
+    if not isinstance(value, dict):
+        raise ValueError(f"{name} must be a JSON object")
+    return value
+
+
+class SQLiteStorageBackend(MadaStorageBackend):
+    """
+    MADA objects in one SQLite database in WAL mode. The current state of
+    each object is stored in mada_objects, indexed by UID and by
+    (object_type, UID). Every version is kept in mada_object_versions,
+    keyed by (UID, version).
+
+    Connections come from a fixed-size pool and are shared across threads.
+    Reads run in parallel with the single writer. Each connection keeps its
+    prepared statements cached.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str, pool_size: int = DEFAULT_POOL_SIZE, busy_timeout: float = 30.0):
+        self.path = os.path.abspath(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.busy_timeout = busy_timeout
+        self._pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._closed = False
+        self.pool_size = max(1, int(pool_size))
+        with self.connection() as conn:
+            conn.executescript(_SCHEMA)
+            try:
+                conn.executescript(_JSON_INDEXES)
+                self._json_filters = True
+            except sqlite3.OperationalError as e:
+                logger.warning("SQLiteStorageBackend: No JSON functions in SQLite %s (%s); payload filters run in Python.",
+                               sqlite3.sqlite_version, e)
+                self._json_filters = False
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode: transactions are begun explicitly in transaction().
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None,
+                               check_same_thread=False, cached_statements=256)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrows a pooled connection; waits if all are in use. Raises
+        sqlite3.ProgrammingError once the backend is closed.
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("SQLiteStorageBackend is closed")
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._pool_lock:
+                if self._closed:
+                    raise sqlite3.ProgrammingError("SQLiteStorageBackend is closed")
+                if len(self._all) < self.pool_size:
+                    conn = self._connect()
+                    self._all.append(conn)
+            if conn is None:
+                conn = self._pool.get()
+        if conn is None: # close() wakes waiting borrowers with None
+            self._pool.put(None)
+            raise sqlite3.ProgrammingError("SQLiteStorageBackend is closed")
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction: # an exception escaped a transaction
+                conn.rollback()
+            with self._pool_lock:
+                if not self._closed:
+                    self._pool.put(conn)
+                    conn = None
+            if conn is not None: # returned after close()
+                conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def close(self):
+        """
+        Closes the idle connections now and borrowed ones when they are
+        returned. Idempotent.
+        """
+        idle = []
+        with self._pool_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._all = []
+            while True:
+                try:
+                    idle.append(self._pool.get_nowait())
+                except queue.Empty:
+                    break
+            self._pool.put(None)
+        for conn in idle:
+            conn.close()
+
+    # --- objects ---
+
+    def ensure_uid(self, object_type, context_description=None):
+        return new_crux_uid(object_type)
+
+    def ensure_uids(self, object_type: str, count: int, context_description: Optional[str] = None) -> List[str]:
+        return [new_crux_uid(object_type) for _ in range(count)]
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, object_uid: str, object_type: str, payload: Dict[str, Any], metadata: Dict[str, Any]):
+        now = time.time()
+        payload_text, metadata_text = _dumps(payload), _dumps(metadata)
+        conn.execute(_SQL_INSERT, (object_uid, object_type, payload_text, metadata_text, now, now))
+        conn.execute(_SQL_INSERT_VERSION, (object_uid, 1, payload_text, metadata_text, now))
+
+    @staticmethod
+    def _update(conn: sqlite3.Connection, record: Dict[str, Any], payload: Dict[str, Any], metadata: Dict[str, Any]) -> int:
+        version = record["version"] + 1
+        now = time.time()
+        payload_text, metadata_text = _dumps(payload), _dumps(metadata)
+        conn.execute(_SQL_UPDATE, (version, payload_text, metadata_text, now, record["object_uid"]))
+        conn.execute(_SQL_INSERT_VERSION, (record["object_uid"], version, payload_text, metadata_text, now))
+        return version
+
+    @staticmethod
+    def _object_type_of(object_uid: str) -> str:
+        # urn:crux:uid::<type>::<id>
+        parts = object_uid.split("::")
+        return parts[1] if len(parts) >= 3 else "GenericMadaObject"
+
+    def create_object(self, object_uid, object_payload, initial_metadata=None, requesting_persona_context=None):
+        return self.create_objects([{"object_uid": object_uid, "object_payload": object_payload,
+                                     "initial_metadata": initial_metadata}], requesting_persona_context)[0]
+
+    def create_objects(self, objects: List[Dict[str, Any]], requesting_persona_context: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """
+        Inserts all objects in one transaction: all succeed or all fail.
+        """
+        try:
+            with self.transaction() as conn:
+                for obj in objects:
+                    object_uid = obj["object_uid"]
+                    object_type = obj.get("object_type") or self._object_type_of(object_uid)
+                    self._insert(conn, object_uid, object_type, obj["object_payload"], obj.get("initial_metadata") or {})
+        except sqlite3.IntegrityError as e:
+            return [f"Error: {e} (UID already exists)"] * len(objects)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            return [f"Error: {type(e).__name__} - {e}"] * len(objects)
+        return [True] * len(objects)
+
+    def get_object(self, object_uid, requesting_persona_context=None, version: Optional[int] = None):
+        with self.connection() as conn:
+            if version is None:
+                row = conn.execute(_SQL_GET, (object_uid,)).fetchone()
+            else:
+                row = conn.execute(_SQL_GET_VERSION, (object_uid, int(version))).fetchone()
+        return _record(row) if row else None
+
+    def get_objects(self, object_uids: List[str], requesting_persona_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        found: Dict[str, Any] = {}
+        with self.connection() as conn:
+            for start in range(0, len(object_uids), _GET_CHUNK):
+                chunk = list(object_uids[start:start + _GET_CHUNK])
+                chunk += [None] * (_GET_CHUNK - len(chunk))
+                for row in conn.execute(_SQL_GET_MANY, chunk):
+                    found[row[0]] = _record(row)
+        return found
+
+    def query_objects(self, query_params, requesting_persona_context=None):
+        # Scalar filters narrow the rows in SQL, so only candidates are decoded;
+        # every filter is then checked in Python, as the other backends do.
+        filters = {key: value for key, value in query_params.items() if key != "object_type"}
+        sql, args = _SQL_BY_TYPE, [query_params.get("object_type")]
+        if self._json_filters:
+            for key, value in filters.items():
+                clause = _sql_filter(key, value)
+                if clause is not None:
+                    sql += f" AND {clause[0]}"
+                    args.extend(clause[1])
+        with self.connection() as conn:
+            rows = conn.execute(sql, args).fetchall()
+        results = []
+        for (payload_text,) in rows:
+            payload = json.loads(payload_text)
+            if all(payload.get(key) == value for key, value in filters.items()):
+                results.append(payload)
+        return results
+
+    def write_mada_object(self, object_payload_json, object_type, requesting_persona_context_json="{}",
+                          object_uid_to_update=None, initial_metadata_json="{}", update_metadata_json="{}"):
+        try:
+            payload = _parse_json_arg(object_payload_json, "object_payload_json")
+            initial_metadata = _parse_json_arg(initial_metadata_json, "initial_metadata_json")
+            update_metadata = _parse_json_arg(update_metadata_json, "update_metadata_json")
+        except ValueError as e: # includes JSONDecodeError
+            return {"object_uid": object_uid_to_update, "status": f"Error: Invalid JSON input: {e}", "version": None}
+        try:
+            with self.transaction() as conn:
+                if object_uid_to_update:
+                    row = conn.execute(_SQL_GET, (object_uid_to_update,)).fetchone()
+                    if row is None:
+                        return {"object_uid": object_uid_to_update, "status": f"Error: Object {object_uid_to_update} not found.", "version": None}
+                    record = _record(row)
+                    version = self._update(conn, record, payload, dict(record["metadata"], **update_metadata))
+                    return {"object_uid": object_uid_to_update, "status": "Success: Object updated.", "version": version}
+                object_uid = new_crux_uid(object_type)
+                self._insert(conn, object_uid, object_type, payload, initial_metadata)
+                return {"object_uid": object_uid, "status": "Success: Object created.", "version": 1}
+        except sqlite3.Error as e:
+            return {"object_uid": object_uid_to_update, "status": f"Error: {type(e).__name__} - {e}", "version": None}
+
+    # --- PBIs: objects of type PBI whose payload holds comments and links ---
+
+    def _modify_pbi(self, pbi_uid: str, change: Callable[[Dict[str, Any]], None]) -> bool:
+        with self.transaction() as conn:
+            row = conn.execute(_SQL_GET, (pbi_uid,)).fetchone()
+            if row is None or row[1] != PBI_OBJECT_TYPE:
+                return False
+            record = _record(row)
+            payload = record["payload"]
+            change(payload)
+            self._update(conn, record, payload, record["metadata"])
+        return True
+
+    def create_pbi(self, pbi_data, requesting_persona_context=None):
+        pbi_uid = new_crux_uid("pbi")
+        payload = dict(pbi_data, pbi_uid=pbi_uid, comments=[], links=[])
+        try:
+            with self.transaction() as conn:
+                self._insert(conn, pbi_uid, PBI_OBJECT_TYPE, payload, {})
+        except sqlite3.Error as e:
+            logger.error("SQLiteStorageBackend: Failed to create PBI: %s", e)
+            return None
+        return pbi_uid
+
+    def get_pbi_details(self, pbi_uid, requesting_persona_context=None):
+        record = self.get_object(pbi_uid)
+        if record is None or record["object_type"] != PBI_OBJECT_TYPE:
+            return {"status": f"Error: PBI {pbi_uid} not found.", "pbi_uid": pbi_uid, "details": None}
+        return {"status": "Success", "pbi_uid": pbi_uid, "details": record["payload"]}
+
+    def link_pbis(self, source_pbi_uid, target_pbi_uid, link_type, requesting_persona_context=None):
+        result = {"source_pbi_uid": source_pbi_uid, "target_pbi_uid": target_pbi_uid, "link_type": link_type}
+        if self.get_object(target_pbi_uid) is None:
+            return dict(result, status=f"Error: PBI {target_pbi_uid} not found.")
+        link = {"target_pbi_uid": target_pbi_uid, "link_type": link_type}
+
+        def add_link(payload: Dict[str, Any]):
+            links = payload.setdefault("links", [])
+            if link not in links:
+                links.append(link)
+
+        if not self._modify_pbi(source_pbi_uid, add_link):
+            return dict(result, status=f"Error: PBI {source_pbi_uid} not found.")
+        return dict(result, status="Success")
+
+    def add_comment_to_pbi(self, pbi_uid, comment_text, author_persona_uid, requesting_persona_context=None):
+        comment_id = new_crux_uid("comment")
+        comment = {"comment_id": comment_id, "author_persona_uid": author_persona_uid, "text": comment_text, "created_at": time.time()}
+        if not self._modify_pbi(pbi_uid, lambda payload: payload.setdefault("comments", []).append(comment)):
+            return {"pbi_uid": pbi_uid, "comment_id": None, "status": f"Error: PBI {pbi_uid} not found."}
+        return {"pbi_uid": pbi_uid, "comment_id": comment_id, "status": "Success"}
+
+    def batch_call(self, name):
+        return getattr(self, name) if name in BATCH_CALLS else None
+
+
+_backend: Optional[MadaStorageBackend] = None
+_backend_lock = threading.Lock()
+
+
+def _backend_from_env() -> MadaStorageBackend:
+    name = os.environ.get("LC_EPISTEMIC_STORAGE_BACKEND", "").strip().lower() or LcMemServiceBackend.name
+    if name == SQLiteStorageBackend.name:
+        path = os.environ.get("LC_EPISTEMIC_SQLITE_PATH", "").strip() or DEFAULT_SQLITE_PATH
+        logger.info("Using the SQLite storage backend at %s.", path)
+        return SQLiteStorageBackend(path)
+    if name != LcMemServiceBackend.name:
+        logger.warning("Unknown LC_EPISTEMIC_STORAGE_BACKEND=%r; using lc_mem_service.", name)
+    return LcMemServiceBackend()
+
+
+def get_storage_backend() -> MadaStorageBackend:
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _backend_from_env()
+    return _backend
+
+
+def configure_storage_backend(backend: MadaStorageBackend) -> MadaStorageBackend:
+    """
+    Replaces the shared backend, closing the previous one. The read cache is
+    cleared so objects from the previous backend are not served.
+    """
+    global _backend
+    with _backend_lock:
+        previous, _backend = _backend, backend
+    if previous is not None and previous is not backend:
+        previous.close()
+    get_mada_read_cache().clear()
+    return backend
@@ -1,8 +1,11 @@
 import json
 from typing import Optional, Dict, Any
 
-# Assuming mock_lc_core_services are accessible via this path
-from lc_python_core.services.lc_mem_service import mock_lc_mem_core_ensure_uid, mock_lc_mem_core_create_object
+from .lc_logging import get_logger
+from .mada_read_cache import invalidate_mada_objects
+from .storage_backends import get_storage_backend
+
+logger = get_logger(__name__)
 
 class StoreMadaObjectNode:
     CATEGORY = "LearntCloud/MADA"
@@ -34,11 +37,11 @@ class StoreMadaObjectNode:
                     payload_dict = json.loads(object_payload_json)
                 except json.JSONDecodeError as e:
                     storage_status = f"Error decoding object_payload_json: {e}"
-                    print(f"StoreMadaObjectNode: {storage_status}")
+                    logger.error("StoreMadaObjectNode: %s", storage_status)
                     return (new_object_uid, storage_status)
             else:
                 storage_status = "Error: object_payload_json cannot be empty."
-                print(f"StoreMadaObjectNode: {storage_status}")
+                logger.error("StoreMadaObjectNode: %s", storage_status)
                 return (new_object_uid, storage_status)
 
             persona_context_dict: Optional[Dict[str, Any]] = None
@@ -47,7 +50,7 @@ class StoreMadaObjectNode:
                     persona_context_dict = json.loads(requesting_persona_context_json)
                 except json.JSONDecodeError as e:
                     storage_status = f"Error decoding persona_context_json: {e}"
-                    print(f"StoreMadaObjectNode: {storage_status}")
+                    logger.error("StoreMadaObjectNode: %s", storage_status)
                     return (new_object_uid, storage_status)
             
             metadata_dict: Optional[Dict[str, Any]] = None
@@ -56,40 +59,43 @@ class StoreMadaObjectNode:
                     metadata_dict = json.loads(initial_metadata_json)
                 except json.JSONDecodeError as e:
                     storage_status = f"Error decoding initial_metadata_json: {e}"
-                    print(f"StoreMadaObjectNode: {storage_status}")
+                    logger.error("StoreMadaObjectNode: %s", storage_status)
                     return (new_object_uid, storage_status)
 
-            print(f"StoreMadaObjectNode: Calling mock_lc_mem_core_ensure_uid for type: {object_type}")
+            backend = get_storage_backend()
+            logger.debug("StoreMadaObjectNode: Calling ensure_uid on the %s backend for type: %s", backend.name, object_type)
             # ensure_uid(object_type: str, context_description: Optional[str] = None, existing_uid_candidate: Optional[str] = None)
-            generated_uid_or_error = mock_lc_mem_core_ensure_uid(object_type=object_type, context_description=f"ComfyUI StoreMadaObjectNode call for {object_type}")
+            generated_uid_or_error = backend.ensure_uid(object_type=object_type, context_description=f"ComfyUI StoreMadaObjectNode call for {object_type}")
 
             if "Error" in generated_uid_or_error or "ERROR" in generated_uid_or_error : # Basic error check for mock
                 storage_status = f"Error ensuring UID: {generated_uid_or_error}"
-                print(f"StoreMadaObjectNode: {storage_status}")
+                logger.error("StoreMadaObjectNode: %s", storage_status)
                 return (new_object_uid, storage_status)
             
             new_object_uid = generated_uid_or_error
-            print(f"StoreMadaObjectNode: Ensured UID {new_object_uid}. Calling mock_lc_mem_core_create_object.")
+            logger.debug("StoreMadaObjectNode: Ensured UID %s. Calling create_object.", new_object_uid)
 
             # create_object(object_uid: str, object_payload: Dict[str, Any], initial_metadata: Optional[Dict[str, Any]] = None, requesting_persona_context: Optional[Dict[str, Any]] = None)
-            success_or_error = mock_lc_mem_core_create_object(
+            success_or_error = backend.create_object(
                 object_uid=new_object_uid,
                 object_payload=payload_dict, # Must not be None here
                 initial_metadata=metadata_dict,
                 requesting_persona_context=persona_context_dict
             )
             
+            # A new UID has no cached reads, but entries that reference it may exist
+            invalidate_mada_objects(new_object_uid)
             if success_or_error == True: # Mock service returns True on success
                 storage_status = f"Success: Object stored with UID {new_object_uid}."
             else: # Mock service might return an error string or False
                 storage_status = f"Error storing object: {success_or_error}"
                 new_object_uid = "" # Clear UID if storage failed
 
-            print(f"StoreMadaObjectNode: {storage_status}")
+            logger.info("StoreMadaObjectNode: %s", storage_status)
 
         except Exception as e:
             storage_status = f"Exception during store_object: {str(e)}"
             new_object_uid = ""
-            print(f"StoreMadaObjectNode: {storage_status}")
+            logger.error("StoreMadaObjectNode: %s", storage_status)
         
         return (new_object_uid, storage_status)
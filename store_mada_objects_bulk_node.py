@@ -0,0 +1,63 @@
+import json
+from typing import Any, Dict, Optional
+
+from .lc_logging import get_logger
+from .mada_bulk import store_mada_objects
+
+logger = get_logger(__name__)
+
+
+def _parse_optional_json(text: Optional[str], name: str) -> Optional[Dict[str, Any]]:
+    if not text or not text.strip() or text.strip() == "{}":
+        return None
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Error decoding {name}: {e}") from e
+
+
+class StoreMadaObjectsBulkNode:
+    CATEGORY = "LearntCloud/MADA"
+    RETURN_TYPES = ("STRING", "STRING", "STRING",)
+    RETURN_NAMES = ("object_uids_json", "item_status_json", "storage_status",)
+    FUNCTION = "store_objects"
+
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                # A JSON array of payload objects, or NDJSON (one payload object per line)
+                "payloads_json": ("STRING", {"multiline": True, "default": "[]"}),
+                "object_type": ("STRING", {"multiline": False, "default": "GenericMadaObject"}),
+                "requesting_persona_context_json": ("STRING", {"multiline": True, "default": "{}"}),
+            },
+            "optional": {
+                # Applied to every object of the batch
+                "initial_metadata_json": ("STRING", {"multiline": True, "default": "{}"}),
+            }
+        }
+
+    def store_objects(self, payloads_json: str, object_type: str, requesting_persona_context_json: str, initial_metadata_json: Optional[str] = None):
+        try:
+            # Parsed once per batch, not once per object
+            persona_context_dict = _parse_optional_json(requesting_persona_context_json, "persona_context_json")
+            metadata_dict = _parse_optional_json(initial_metadata_json, "initial_metadata_json")
+            result = store_mada_objects(payloads_json, object_type, persona_context_dict, metadata_dict)
+        except ValueError as e:
+            storage_status = str(e)
+            logger.error("StoreMadaObjectsBulkNode: %s", storage_status)
+            return (json.dumps([]), json.dumps([]), storage_status)
+        except Exception as e:
+            storage_status = f"Exception during store_objects: {str(e)}"
+            logger.error("StoreMadaObjectsBulkNode: %s", storage_status)
+            return (json.dumps([]), json.dumps([]), storage_status)
+
+        counts = result.counts()
+        if not counts["total"]:
+            storage_status = "Error: payloads_json contains no payloads."
+        elif counts["error"]:
+            storage_status = f"Partial: stored {counts['stored']} of {counts['total']} objects ({counts['error']} failed)."
+        else:
+            storage_status = f"Success: stored {counts['stored']} objects."
+        logger.info("StoreMadaObjectsBulkNode: %s", storage_status)
+        return (json.dumps(result.object_uids), json.dumps(result.statuses, indent=2), storage_status)
@@ -0,0 +1,84 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import patch
+
+from lc_comfyui_epistemic_nodes.async_runner import AsyncCallTimeout, resolve_awaitable, resolve_awaitables, run_async
+
+
+class TestAsyncRunner(unittest.TestCase):
+
+    def test_run_async_returns_result(self):
+        async def add(a, b):
+            await asyncio.sleep(0)
+            return a + b
+
+        self.assertEqual(run_async(add(1, 2)), 3)
+
+    def test_calls_overlap(self):
+        async def slow(value):
+            await asyncio.sleep(0.2)
+            return value
+
+        start = time.perf_counter()
+        results = resolve_awaitables([slow(1), "plain", slow(2), slow(3)])
+        self.assertEqual(results, [1, "plain", 2, 3])
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_timeout(self):
+        with self.assertRaises(AsyncCallTimeout):
+            run_async(asyncio.sleep(1), timeout=0.05)
+
+    def test_usable_from_running_loop(self):
+        async def caller():
+            # e.g. a node executed from code that already runs an event loop
+            return resolve_awaitable(asyncio.sleep(0, result="ok"))
+
+        self.assertEqual(asyncio.run(caller()), "ok")
+
+    def test_exceptions_propagate(self):
+        async def fail():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            run_async(fail())
+        results = resolve_awaitables([fail()], return_exceptions=True)
+        self.assertIsInstance(results[0], ValueError)
+
+    def test_timeout_with_return_exceptions_keeps_finished_results(self):
+        slow_cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+            return "slow"
+
+        async def fast():
+            return "fast"
+
+        start = time.perf_counter()
+        results = resolve_awaitables([slow(), fast()], timeout=0.1, return_exceptions=True)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertIsInstance(results[0], AsyncCallTimeout)
+        self.assertEqual(results[1], "fast")
+        run_async(asyncio.sleep(0.01)) # let the cancellation reach the slow call
+        self.assertTrue(slow_cancelled.is_set())
+
+    def test_keymap_list_only_fails_slow_seed(self):
+        from lc_comfyui_epistemic_nodes import l3_keymap_click_node
+
+        async def keymap_click_process(mada_seed_input):
+            await asyncio.sleep(mada_seed_input["delay"])
+            return dict(mada_seed_input, L3="done")
+
+        with patch.object(l3_keymap_click_node, "keymap_click_process", keymap_click_process):
+            (results,) = l3_keymap_click_node.LcKeymapClickNode().execute(
+                [{"delay": 5}, None, {"delay": 0}], timeout_seconds=0.1)
+        self.assertEqual(results, [None, None, {"delay": 0, "L3": "done"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import asyncio
+import copy
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from lc_comfyui_epistemic_nodes.async_runner import resolve_awaitable
+from lc_comfyui_epistemic_nodes.content_store import (ContentNotFoundError, ContentStore, configure_content_store, is_content_ref,
+                                                      with_resolved_content)
+
+
+class TestContentStore(unittest.TestCase):
+
+    def test_round_trip_across_chunk_boundaries(self):
+        store = ContentStore(chunk_size=5)
+        text = "héllo wörld ✓ " * 3
+        content_ref = store.put_text(text)
+        self.assertTrue(is_content_ref(content_ref.ref))
+        self.assertEqual(content_ref.byte_size, len(text.encode("utf-8")))
+        self.assertEqual(store.read_text(content_ref.ref), text)
+        self.assertEqual("".join(store.iter_text(content_ref.ref)), text)
+        self.assertEqual(store.read_text(content_ref.ref, max_bytes=2), "h")
+        self.assertEqual(store.put_text(text).ref, content_ref.ref)
+
+    def test_evicted_chunks_come_back_from_disk(self):
+        with tempfile.TemporaryDirectory() as disk_dir:
+            store = ContentStore(chunk_size=4, max_memory_bytes=8, disk_dir=disk_dir)
+            ref = store.put_text("abcdefghijklmnop").ref
+            self.assertLessEqual(store.stats()["memory_bytes"], 8)
+            self.assertEqual(ContentStore(disk_dir=disk_dir).read_text(ref), "abcdefghijklmnop")
+
+        store = ContentStore(chunk_size=4, max_memory_bytes=4, spill_evicted=False)
+        ref = store.put_text("abcdefgh").ref
+        with self.assertRaises(ContentNotFoundError):
+            store.read_text(ref)
+
+    def test_memory_only_store_spills_evicted_chunks(self):
+        store = ContentStore(chunk_size=4, max_memory_bytes=4)
+        ref = store.put_text("abcdefghijkl").ref
+        self.assertEqual(store.stats()["memory_chunks"], 1)
+        self.assertEqual(store.stats()["spilled_chunks"], 2)
+        self.assertEqual(store.read_text(ref), "abcdefghijkl")
+
+
+class TestWithResolvedContent(unittest.TestCase):
+
+    def setUp(self):
+        self.store = configure_content_store(chunk_size=8)
+        self.addCleanup(configure_content_store)
+        self.text = "large input " * 10
+        self.ref = self.store.put_text(self.text).ref
+
+    def _seed(self):
+        raw_signals = [SimpleNamespace(raw_input_signal=self.ref), SimpleNamespace(raw_input_signal="inline")]
+        return SimpleNamespace(seed_content=SimpleNamespace(raw_signals=raw_signals))
+
+    def test_sop_sees_text_and_seed_keeps_reference(self):
+        seed = self._seed()
+        seen = []
+
+        def sop(mada_seed_input):
+            seen.extend(item.raw_input_signal for item in mada_seed_input.seed_content.raw_signals)
+            return mada_seed_input
+
+        self.assertIs(with_resolved_content(seed, sop, mada_seed_input=seed), seed)
+        self.assertEqual(seen, [self.text, "inline"])
+        self.assertEqual([item.raw_input_signal for item in seed.seed_content.raw_signals], [self.ref, "inline"])
+
+    def test_copy_returned_by_sop_keeps_reference(self):
+        seed = self._seed()
+        result = with_resolved_content(seed, copy.deepcopy, seed)
+        self.assertIsNot(result, seed)
+        self.assertEqual(result.seed_content.raw_signals[0].raw_input_signal, self.ref)
+        self.assertEqual(seed.seed_content.raw_signals[0].raw_input_signal, self.ref)
+
+    def test_async_sop(self):
+        seed = self._seed()
+
+        async def sop(mada_seed_input):
+            await asyncio.sleep(0)
+            return mada_seed_input.seed_content.raw_signals[0].raw_input_signal
+
+        self.assertEqual(resolve_awaitable(with_resolved_content(seed, sop, mada_seed_input=seed)), self.text)
+        self.assertEqual(seed.seed_content.raw_signals[0].raw_input_signal, self.ref)
+
+    def test_l1_to_l2_large_input(self):
+        from lc_comfyui_epistemic_nodes import l1_startle_node, l2_frame_click_node
+
+        seen = []
+
+        def frame_click_process(mada_seed_input):
+            seen.append(mada_seed_input.seed_content.raw_signals[0].raw_input_signal)
+            return mada_seed_input
+
+        mada_seed, trace_id, _ = l1_startle_node.LcStartleNode().execute(
+            self.text, "ContentStoreTest", "", "TestUser", large_input_threshold_bytes=16)
+        self.assertTrue(is_content_ref(mada_seed.seed_content.raw_signals[0].raw_input_signal))
+
+        l2_patches = {"IMPORTS_OK": True, "_imports_resolved": True, "PYDANTIC_AVAILABLE_L2": False,
+                      "MadaSeed": type(mada_seed), "frame_click_process": frame_click_process}
+        with patch.multiple(l2_frame_click_node, **l2_patches):
+            mada_seed_L2, *_ = l2_frame_click_node.LcFrameClickNode().execute(trace_id, mada_seed_in=mada_seed)
+
+        self.assertEqual(seen, [self.text])
+        self.assertTrue(is_content_ref(mada_seed_L2.seed_content.raw_signals[0].raw_input_signal))
+
+
+if __name__ == "__main__":
+    unittest.main()
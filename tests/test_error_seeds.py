@@ -0,0 +1,94 @@
+import unittest
+from unittest.mock import patch
+
+from lc_comfyui_epistemic_nodes import l1_startle_node
+from lc_comfyui_epistemic_nodes.benchmarks import stub_backends
+from lc_comfyui_epistemic_nodes.benchmarks.stub_backends import L2EpistemicStateOfFramingEnum
+from lc_comfyui_epistemic_nodes.error_seeds import ErrorSeedFactory
+
+# The benchmark stand-ins have the MadaSeed model tree without needing lc_python_core.
+_TYPES_MODULE = "lc_comfyui_epistemic_nodes.benchmarks.stub_backends"
+
+
+def _l1_with_stub_types():
+    # L1 bound to the stand-in types, with its shell template rebuilt from them
+    names = {name: getattr(stub_backends, name) for name in l1_startle_node._MADA_SEED_TYPE_NAMES if name != "PYDANTIC_AVAILABLE"}
+    names.update({alias: getattr(stub_backends, name) for alias, name in l1_startle_node._MADA_SEED_TYPE_ALIASES.items()})
+    return patch.multiple(l1_startle_node, _imports_resolved=True, PYDANTIC_AVAILABLE=True, _shell_template=None, _shell_clone=None,
+                          _shell_template_ready=False, **names)
+
+
+def _layer_obj(seed, layer):
+    container = seed.seed_content.L1_startle_reflex
+    if layer == 1:
+        return container.L1_startle_context
+    for name in ("L2_frame_type", "L3_surface_keymap", "L4_anchor_state", "L5_field_state", "L6_reflection_payload")[:layer - 1]:
+        container = getattr(container, name)
+    return getattr(container, {2: "L2_frame_type_obj", 3: "L3_surface_keymap_obj", 4: "L4_anchor_state_obj", 5: "L5_field_state_obj",
+                               6: "L6_reflection_payload_obj", 7: "L7_encoded_application"}[layer])
+
+
+class TestErrorSeedFactory(unittest.TestCase):
+
+    def setUp(self):
+        l1_types = _l1_with_stub_types()
+        l1_types.start()
+        self.addCleanup(l1_types.stop)
+        self.factory = ErrorSeedFactory(_TYPES_MODULE)
+
+    def test_error_seed_for_each_layer(self):
+        for layer in range(1, 8):
+            seed = self.factory.make(layer, f"trace_{layer}", "boom")
+            self.assertEqual((seed.seed_id, seed.trace_metadata.trace_id), (f"trace_{layer}", f"trace_{layer}"))
+            self.assertEqual(_layer_obj(seed, layer).error_details, "boom")
+            trace = getattr(seed.trace_metadata, f"L{layer}_trace")
+            self.assertEqual(trace.error_details, "boom")
+            self.assertEqual(getattr(trace, "epistemic_state_L1" if layer == 1 else "epistemic_state_Lx"), f"LCL-Failure-Internal_L{layer}")
+            for other in range(1, 8):
+                if other != layer:
+                    self.assertIsNone(_layer_obj(seed, other).error_details)
+
+    def test_seeds_do_not_share_state(self):
+        first = self.factory.make(1, "a", "first")
+        _layer_obj(first, 1).signal_components_metadata_L1.clear()
+        _layer_obj(first, 4).description = "mutated"
+        second = self.factory.make(1, "b", "second")
+        self.assertEqual(_layer_obj(second, 4).description, "L4 Anchor Placeholder")
+        self.assertEqual(len(_layer_obj(second, 1).signal_components_metadata_L1), 1)
+        self.assertEqual(_layer_obj(second, 1).error_details, "second")
+
+    def test_attach_marks_existing_seed(self):
+        seed = self.factory.make(1, "trace", "unrelated")
+        self.factory.attach(seed, 2, "sop failed", state=L2EpistemicStateOfFramingEnum.LCL_FAILURE_SIZE_NOISE)
+        self.assertEqual(_layer_obj(seed, 2).error_details, "sop failed")
+        self.assertIs(_layer_obj(seed, 2).L2_epistemic_state_of_framing, L2EpistemicStateOfFramingEnum.LCL_FAILURE_SIZE_NOISE)
+        self.assertEqual(seed.trace_metadata.L2_trace.epistemic_state_Lx, "LCL-Failure-SizeNoise")
+
+    def test_shell_is_l1_template(self):
+        seed = self.factory.make(3, "trace", "boom")
+        self.assertEqual(seed.seed_content.raw_signals, [])
+        template = l1_startle_node._get_seed_shell_template()
+        self.assertEqual(seed.version, template["version"])
+        self.assertEqual(_layer_obj(seed, 5).description, template["seed_content"]["L1_startle_reflex"]["L2_frame_type"]["L3_surface_keymap"]
+                         ["L4_anchor_state"]["L5_field_state"]["L5_field_state_obj"]["description"])
+
+    def test_invalid_fields_fall_back_to_shell(self):
+        seed = self.factory.make(2, "trace", "boom", object_fields={"version": object()})
+        self.assertEqual(_layer_obj(seed, 2).error_details, "boom")
+        self.assertEqual(seed.seed_id, "trace")
+
+        # error_details itself does not fit: the bare shell, still with the IDs
+        seed = self.factory.make(2, "trace", object(), object_fields={"version": object()})
+        self.assertEqual((seed.seed_id, seed.trace_metadata.trace_id), ("trace", "trace"))
+        self.assertIsNone(_layer_obj(seed, 2).error_details)
+
+    def test_unavailable_types_module(self):
+        self.assertIsNone(ErrorSeedFactory("lc_test_missing_types_module").make(2, "trace", "boom"))
+
+    def test_unavailable_l1_template(self):
+        with patch.object(l1_startle_node, "_get_seed_shell_template", return_value=None):
+            self.assertFalse(ErrorSeedFactory(_TYPES_MODULE).available)
+
+
+if __name__ == "__main__":
+    unittest.main()
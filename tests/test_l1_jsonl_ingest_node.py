@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from lc_comfyui_epistemic_nodes import l1_jsonl_ingest_node
+from lc_comfyui_epistemic_nodes.l1_jsonl_ingest_node import LcStartleJsonlIngestNode, record_to_input_event
+
+
+class TestLcStartleJsonlIngestNode(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".jsonl")
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+            f.write(json.dumps("plain text record") + "\n")
+            f.write(json.dumps({"input_text": "second", "origin_hint": "record_origin",
+                                "attachments_ref": ["urn:a", "urn:b"], "reception_timestamp_utc_iso": "2024-01-02T03:04:05Z"}) + "\n")
+            f.write("\n")
+            f.write("{not json\n")
+            f.write(json.dumps({"text": "fourth"}) + "\n")
+            f.write(json.dumps({"input_text": "fifth"}) + "\n")
+        self.addCleanup(os.unlink, self.path)
+
+    def test_record_maps_to_data_components(self):
+        event = record_to_input_event({"input_text": "hello", "attachments_ref": ["urn:a", "urn:b"],
+                                       "reception_timestamp_utc_iso": "2024-01-02T03:04:05Z"}, "default_origin")
+        self.assertEqual(event["origin_hint"], "default_origin")
+        self.assertEqual(event["reception_timestamp_utc_iso"], "2024-01-02T03:04:05Z")
+        self.assertEqual([c["role_hint"] for c in event["data_components"]], ["primary_text_content", "attachment_reference"])
+        self.assertEqual(event["data_components"][0]["size_hint"], 5)
+        self.assertEqual(event["data_components"][1]["content_handle_placeholder"], "urn:a\nurn:b")
+        with self.assertRaises(ValueError):
+            record_to_input_event({"origin_hint": "no text"}, "default_origin")
+
+    def test_batches_and_bad_lines(self):
+        node = LcStartleJsonlIngestNode()
+        seeds, trace_ids_json, report_json = node.execute(self.path, batch_size=2, batch_index=1)
+        report = json.loads(report_json)
+        self.assertEqual((report["records"], report["failed"], report["has_more"], report["next_batch_index"]), (2, 1, True, 2))
+        self.assertEqual(report["errors"][0]["line"], 4)
+        self.assertEqual(len(seeds), 2)
+        self.assertEqual(len(json.loads(trace_ids_json)), 2)
+
+        seeds, _, report_json = node.execute(self.path, batch_size=2, batch_index=2)
+        report = json.loads(report_json)
+        self.assertEqual((report["records"], report["has_more"], report["next_batch_index"]), (1, False, None))
+
+    def test_pages_seek_to_cached_offsets(self):
+        all_lines = list(l1_jsonl_ingest_node._iter_record_lines(self.path))
+        reads = []
+        real_iter = l1_jsonl_ingest_node._iter_record_lines_at
+
+        def recording_iter(path, offset=0, line_number=1, skip_records=0):
+            reads.append(offset)
+            return real_iter(path, offset, line_number, skip_records)
+
+        with patch.object(l1_jsonl_ingest_node, "_iter_record_lines_at", recording_iter):
+            pages = [l1_jsonl_ingest_node._read_page(self.path, first, 3) for first in (0, 2, 4)]
+            # A different page size starts from the nearest cached record
+            odd_page = l1_jsonl_ingest_node._read_page(self.path, 3, 2)
+        self.assertEqual([[(n, line) for _, n, line in page] for page in pages], [all_lines[0:3], all_lines[2:5], all_lines[4:]])
+        self.assertEqual([(n, line) for _, n, line in odd_page], all_lines[3:5])
+        with open(self.path, "rb") as f:
+            data = f.read()
+        self.assertEqual(reads[0], 0)
+        self.assertEqual(reads[1:], [data.index(all_lines[2][1]), data.index(all_lines[4][1]), data.index(all_lines[2][1])])
+
+        # A changed file is a new cache entry
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps("sixth") + "\n")
+        page = l1_jsonl_ingest_node._read_page(self.path, 4, 3)
+        self.assertEqual([json.loads(line) for _, _, line in page][-1], "sixth")
+
+    def test_invalid_utf8_line_fails_alone(self):
+        with open(self.path, "ab") as f:
+            f.write(b"\xff\xfe bad\n")
+            f.write(json.dumps({"input_text": "after"}).encode("utf-8") + b"\n")
+        seeds, _, report_json = LcStartleJsonlIngestNode().execute(self.path, batch_size=0)
+        report = json.loads(report_json)
+        self.assertNotIn("error", report)
+        self.assertEqual((report["records"], report["failed"]), (7, 2))
+        self.assertEqual([error["line"] for error in report["errors"]], [4, 7])
+        self.assertIn("utf-8", report["errors"][1]["error"])
+        self.assertEqual(len(seeds), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
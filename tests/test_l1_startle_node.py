@@ -38,13 +38,18 @@ except ImportError as e:
 
 
 from ..l1_startle_node import LcStartleNode # Import the node to be tested
+from .. import l1_startle_node
 
 class TestLcStartleNode(unittest.TestCase):
 
     def setUp(self):
         self.node = LcStartleNode()
 
-    def _parse_mada_seed(self, json_string: str) -> MadaSeed:
+    def _parse_mada_seed(self, mada_seed_out) -> MadaSeed:
+        # LcStartleNode returns the live MadaSeed object. Round-trip it through JSON
+        # here so the assertions also cover what a JSON consumer (e.g. L2's
+        # mada_seed_L1_json input) would receive.
+        json_string = mada_seed_out.model_dump_json() if hasattr(mada_seed_out, 'model_dump_json') else json.dumps(vars(mada_seed_out), default=str)
         data = json.loads(json_string)
         if PYDANTIC_AVAILABLE:
             try:
@@ -60,27 +65,30 @@ class TestLcStartleNode(unittest.TestCase):
             return data # Return as dict if no Pydantic, assertions will be on dict keys/values
 
     def test_basic_successful_execution(self):
-        mada_seed_json, trace_id = self.node.execute(
+        mada_seed_out, trace_id, _ = self.node.execute(
             input_text="Test Startle",
             origin_hint="TestOrigin",
             optional_attachments_ref="",
             user_id="TestUser"
         )
-        self.assertIsInstance(mada_seed_json, str)
+        self.assertNotIsInstance(mada_seed_out, str)
         self.assertIsInstance(trace_id, str)
-        
-        try:
-            data = json.loads(mada_seed_json)
-        except json.JSONDecodeError:
-            self.fail("Output is not valid JSON.")
 
-        self.assertIn("seed_id", data)
-        self.assertEqual(data["seed_id"], trace_id)
+        self.assertEqual(mada_seed_out.seed_id, trace_id)
         self.assertTrue(trace_id.startswith("urn:crux:uid::trace_event_L1::"))
 
+    def test_seed_json_output(self):
+        _, _, seed_json = self.node.execute("Test", "TestOrigin", "", "TestUser")
+        self.assertEqual(seed_json, "") # off by default
+
+        mada_seed_out, trace_id, seed_json = self.node.execute("Test", "TestOrigin", "", "TestUser", emit_seed_json=True)
+        self.assertEqual(json.loads(seed_json)["seed_id"], trace_id)
+        if PYDANTIC_AVAILABLE:
+            self.assertEqual(MadaSeed.model_validate_json(seed_json).model_dump(), mada_seed_out.model_dump())
+
     def test_top_level_mada_seed_fields(self):
-        mada_seed_json, trace_id = self.node.execute("Test", "TestOrigin", "", "TestUser")
-        mada_seed = self._parse_mada_seed(mada_seed_json)
+        mada_seed_out, trace_id, _ = self.node.execute("Test", "TestOrigin", "", "TestUser")
+        mada_seed = self._parse_mada_seed(mada_seed_out)
 
         if PYDANTIC_AVAILABLE:
             self.assertEqual(mada_seed.version, "0.3.0")
@@ -100,8 +108,8 @@ class TestLcStartleNode(unittest.TestCase):
 
     def test_raw_signals_single_input(self):
         input_text = "Hello Startle"
-        mada_seed_json, _ = self.node.execute(input_text, "TestOrigin", "", "TestUser")
-        mada_seed = self._parse_mada_seed(mada_seed_json)
+        mada_seed_out, _, _ = self.node.execute(input_text, "TestOrigin", "", "TestUser")
+        mada_seed = self._parse_mada_seed(mada_seed_out)
         
         if PYDANTIC_AVAILABLE:
             sc = mada_seed.seed_content
@@ -117,8 +125,8 @@ class TestLcStartleNode(unittest.TestCase):
 
     def test_l1_startle_context_fields(self):
         origin = "TestOriginL1Context"
-        mada_seed_json, _ = self.node.execute("Test", origin, "", "TestUser")
-        mada_seed = self._parse_mada_seed(mada_seed_json)
+        mada_seed_out, _, _ = self.node.execute("Test", origin, "", "TestUser")
+        mada_seed = self._parse_mada_seed(mada_seed_out)
 
         if PYDANTIC_AVAILABLE:
             l1_context = mada_seed.seed_content.L1_startle_reflex.L1_startle_context
@@ -158,8 +166,8 @@ class TestLcStartleNode(unittest.TestCase):
 
     def test_l1_trace_fields(self):
         origin = "TestOriginL1Trace"
-        mada_seed_json, trace_id = self.node.execute("Test L1 Trace", origin, "", "TestUser")
-        mada_seed = self._parse_mada_seed(mada_seed_json)
+        mada_seed_out, trace_id, _ = self.node.execute("Test L1 Trace", origin, "", "TestUser")
+        mada_seed = self._parse_mada_seed(mada_seed_out)
 
         if PYDANTIC_AVAILABLE:
             l1_trace = mada_seed.trace_metadata.L1_trace
@@ -217,8 +225,8 @@ class TestLcStartleNode(unittest.TestCase):
                 self.fail(f"Could not parse L1_trace_creation_time_from_context string: {ts_creation_context_str}")
 
     def test_l2_l7_placeholders(self):
-        mada_seed_json, _ = self.node.execute("Test Placeholders", "TestOrigin", "", "TestUser")
-        mada_seed = self._parse_mada_seed(mada_seed_json)
+        mada_seed_out, _, _ = self.node.execute("Test Placeholders", "TestOrigin", "", "TestUser")
+        mada_seed = self._parse_mada_seed(mada_seed_out)
 
         if PYDANTIC_AVAILABLE:
             # Content Objects (L2-L7)
@@ -260,8 +268,8 @@ class TestLcStartleNode(unittest.TestCase):
 
 
     def test_empty_input_text(self):
-        mada_seed_json, _ = self.node.execute(input_text="", origin_hint="EmptyInputTest", optional_attachments_ref="", user_id="TestUser")
-        mada_seed = self._parse_mada_seed(mada_seed_json)
+        mada_seed_out, _, _ = self.node.execute(input_text="", origin_hint="EmptyInputTest", optional_attachments_ref="", user_id="TestUser")
+        mada_seed = self._parse_mada_seed(mada_seed_out)
 
         if PYDANTIC_AVAILABLE:
             l1_context = mada_seed.seed_content.L1_startle_reflex.L1_startle_context
@@ -282,8 +290,8 @@ class TestLcStartleNode(unittest.TestCase):
             # ... other dict checks
 
     def test_crux_uid_format(self):
-        mada_seed_json, trace_id = self.node.execute("UID Test", "TestOrigin", "", "TestUser")
-        mada_seed = self._parse_mada_seed(mada_seed_json)
+        mada_seed_out, trace_id, _ = self.node.execute("UID Test", "TestOrigin", "", "TestUser")
+        mada_seed = self._parse_mada_seed(mada_seed_out)
         
         self.assertTrue(trace_id.startswith("urn:crux:uid::"))
         if PYDANTIC_AVAILABLE:
@@ -300,13 +308,13 @@ class TestLcStartleNode(unittest.TestCase):
 
     def test_attachment_handling(self):
         attachment_ref = "urn:crux:uid::some_attachment_reference"
-        mada_seed_json, _ = self.node.execute(
+        mada_seed_out, _, _ = self.node.execute(
             input_text="Text with attachment",
             origin_hint="AttachmentTest",
             optional_attachments_ref=attachment_ref,
             user_id="TestUser"
         )
-        mada_seed = self._parse_mada_seed(mada_seed_json)
+        mada_seed = self._parse_mada_seed(mada_seed_out)
 
         if PYDANTIC_AVAILABLE:
             l1_context = mada_seed.seed_content.L1_startle_reflex.L1_startle_context
@@ -330,6 +338,23 @@ class TestLcStartleNode(unittest.TestCase):
             
             self.assertEqual(len(mada_seed.seed_content.raw_signals), 2)
 
+    def test_template_shell_matches_validated_shell(self):
+        if not PYDANTIC_AVAILABLE:
+            self.skipTest("Pydantic not available")
+        raw_signals = [RawSignalItem(raw_input_id="raw_id", raw_input_signal="signal")]
+        fast = l1_startle_node._create_initial_madaSeed_shell_py("seed_uid", "trace_id", raw_signals)
+        created = fast.seed_content.L1_startle_reflex.L1_startle_context.trace_creation_time_L1
+        validated = l1_startle_node._build_initial_madaSeed_shell_py("seed_uid", "trace_id", raw_signals, created)
+        self.assertEqual(fast.model_dump(), validated.model_dump())
+        self.assertEqual(fast.model_dump(exclude_unset=True), validated.model_dump(exclude_unset=True))
+
+        # Mutating one shell must not leak into the next
+        fast.seed_content.L1_startle_reflex.L2_frame_type.L2_frame_type_obj.description = "mutated"
+        fast.seed_content.L1_startle_reflex.L1_startle_context.signal_components_metadata_L1.clear()
+        again = l1_startle_node._create_initial_madaSeed_shell_py("seed_uid_2", "trace_id_2", raw_signals)
+        self.assertEqual(again.seed_content.L1_startle_reflex.L2_frame_type.L2_frame_type_obj.description, "L2 Frame Placeholder")
+        self.assertEqual(len(again.seed_content.L1_startle_reflex.L1_startle_context.signal_components_metadata_L1), 1)
+        self.assertEqual(again.trace_metadata.trace_id, "trace_id_2")
 
 if __name__ == '__main__':
     unittest.main()
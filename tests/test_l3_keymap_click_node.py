@@ -34,8 +34,8 @@ class TestLcKeymapClickNode(unittest.TestCase):
         mock_output_mada_seed.seed_id = "test_output_seed_l3"
         
         # Configure the mocked keymap_click_process SOP to return the mock output MadaSeed
-        # Since asyncio.run is used inside the node, the mock for keymap_click_process
-        # doesn't need to be async itself from the perspective of this test.
+        # The node only runs the result on the shared event loop if it is awaitable,
+        # so the mock for keymap_click_process doesn't need to be async itself.
         mock_keymap_click_process_sop.return_value = mock_output_mada_seed
 
         # Call the execute method
@@ -0,0 +1,50 @@
+import unittest
+from typing import List
+
+from pydantic import BaseModel
+
+from lc_comfyui_epistemic_nodes.layer_cache import LayerCheckpointCache, layer_keys
+
+LAYERS = (("L1", ("a",)), ("L2", ("b",)), ("L3", ("c",)))
+LAYER_NAMES = [name for name, _ in LAYERS]
+
+
+class _Seed(BaseModel):
+    seed_id: str
+    log: List[str] = []
+
+
+class TestLayerCheckpointCache(unittest.TestCase):
+
+    def test_keys_change_from_the_changed_layer_down(self):
+        base = layer_keys("text", {"a": 1, "b": 2, "c": 3}, LAYERS)
+        changed = layer_keys("text", {"a": 1, "b": 20, "c": 3}, LAYERS)
+        self.assertEqual(base[0], changed[0])
+        self.assertNotEqual(base[1], changed[1])
+        self.assertNotEqual(base[2], changed[2])
+
+    def test_resume_from_deepest_checkpoint_with_isolated_copy(self):
+        cache = LayerCheckpointCache()
+        keys = layer_keys("text", {}, LAYERS)
+        seed = _Seed(seed_id="s", log=["L1"])
+        cache.put("L1", keys[0], seed)
+        seed.log.append("L2") # an SOP mutating the seed after the checkpoint
+        cache.put("L2", keys[1], seed)
+
+        index, resumed = cache.resume(LAYER_NAMES, keys, _Seed)
+        self.assertEqual(index, 2)
+        self.assertEqual(resumed.log, ["L1", "L2"])
+        resumed.log.append("L3")
+        self.assertEqual(cache.resume(LAYER_NAMES, keys, _Seed)[1].log, ["L1", "L2"])
+
+        layer_stats = cache.stats()["layers"]
+        self.assertEqual(layer_stats["L2"]["hits"], 2)
+        self.assertEqual(layer_stats["L3"]["misses"], 2)
+
+    def test_resume_without_checkpoints(self):
+        cache = LayerCheckpointCache()
+        self.assertEqual(cache.resume(LAYER_NAMES, layer_keys("text", {}, LAYERS), _Seed), (0, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import json
+import unittest
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from lc_comfyui_epistemic_nodes.lazy_seed import LazySeedView, seed_view
+from lc_comfyui_epistemic_nodes.seed_codec import encode_seed
+from lc_comfyui_epistemic_nodes.seed_paths import parse_path
+
+
+class _Content(BaseModel):
+    formatted_text: Optional[str] = None
+
+
+class _Seed(BaseModel):
+    seed_id: str
+    items: List[_Content] = []
+
+
+class TestLazySeedView(unittest.TestCase):
+
+    def test_same_fields_from_json_codec_and_model(self):
+        seed = _Seed(seed_id="s", items=[_Content(formatted_text="a"), _Content()])
+        for source in (seed.model_dump_json(), encode_seed(seed), seed):
+            view = seed_view(source)
+            self.assertEqual(view.seed_id, "s")
+            self.assertEqual(view.get("items[0].formatted_text"), "a")
+            self.assertIsNone(view.get("items[1].formatted_text"))
+            self.assertEqual(view.get("items.5.formatted_text", "missing"), "missing")
+            self.assertIsInstance(view.items[0], LazySeedView)
+            self.assertEqual(view.items[0].materialize(_Content), _Content(formatted_text="a"))
+            with self.assertRaises(AttributeError):
+                view.nope
+
+    def test_layer_alias_paths(self):
+        self.assertEqual(parse_path("@L2.L2_frame_type_obj"),
+                         ("seed_content", "L1_startle_reflex", "L2_frame_type", "L2_frame_type_obj"))
+        data = {"seed_content": {"L1_startle_reflex": {"L2_frame_type": {"L2_frame_type_obj": {"frame_type_L2": "x"}}}}}
+        self.assertEqual(seed_view(json.dumps(data)).get("@L2.L2_frame_type_obj.frame_type_L2"), "x")
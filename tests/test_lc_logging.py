@@ -0,0 +1,64 @@
+import importlib
+import logging
+import os
+import unittest
+from unittest.mock import patch
+
+from lc_comfyui_epistemic_nodes import lc_logging
+
+
+class TestLcLogging(unittest.TestCase):
+
+    def setUp(self):
+        logger = lc_logging.get_logger()
+        level, propagate = logger.level, logger.propagate
+
+        def restore():
+            lc_logging.disable_ring_buffer()
+            logger.setLevel(level)
+            logger.propagate = propagate
+        self.addCleanup(restore)
+
+    def test_child_loggers(self):
+        self.assertEqual(lc_logging.get_logger("lc_comfyui_epistemic_nodes.l1_startle_node").name,
+                         "lc_epistemic_nodes.l1_startle_node")
+        self.assertIs(lc_logging.get_logger(), logging.getLogger(lc_logging.LOGGER_NAME))
+
+    def test_environment_configuration(self):
+        env = {lc_logging.LEVEL_ENV_VAR: "debug", lc_logging.RING_BUFFER_ENV_VAR: "3"}
+        with patch.dict(os.environ, env):
+            importlib.reload(lc_logging)
+        logger = lc_logging.get_logger("test")
+        self.assertEqual(lc_logging.get_logger().level, logging.DEBUG)
+        for index in range(5):
+            logger.debug("message %d", index)
+        messages = lc_logging.get_recent_log_messages()
+        self.assertEqual(len(messages), 3)
+        self.assertTrue(messages[-1].endswith("DEBUG: message 4"))
+        self.assertEqual(len(lc_logging.get_recent_log_messages(limit=1)), 1)
+
+        lc_logging.disable_ring_buffer()
+        with patch.dict(os.environ, {lc_logging.LEVEL_ENV_VAR: "not-a-level", lc_logging.RING_BUFFER_ENV_VAR: ""}):
+            importlib.reload(lc_logging)
+        self.assertEqual(lc_logging.get_logger().level, lc_logging.DEFAULT_LEVEL)
+        self.assertEqual(lc_logging.get_recent_log_messages(), [])
+
+    def test_ring_buffer_respects_level_and_resizes(self):
+        lc_logging.set_log_level("WARNING")
+        handler = lc_logging.enable_ring_buffer(capacity=10, propagate=False)
+        logger = lc_logging.get_logger("test")
+        logger.info("filtered out")
+        logger.warning("kept %s", "once")
+        self.assertEqual(len(handler.records), 1)
+        self.assertFalse(lc_logging.get_logger().propagate)
+
+        resized = lc_logging.enable_ring_buffer(capacity=2)
+        self.assertNotIn(handler, lc_logging.get_logger().handlers)
+        self.assertEqual(resized.records.maxlen, 2)
+        lc_logging.disable_ring_buffer()
+        self.assertTrue(lc_logging.get_logger().propagate)
+        self.assertEqual(lc_logging.get_recent_log_messages(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
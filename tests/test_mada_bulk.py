@@ -0,0 +1,258 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from lc_comfyui_epistemic_nodes import storage_backends
+from lc_comfyui_epistemic_nodes.mada_bulk import ERROR, STORED, get_mada_objects, parse_payloads, store_mada_objects
+from lc_comfyui_epistemic_nodes.mada_read_cache import configure_mada_read_cache, invalidate_mada_objects
+from lc_comfyui_epistemic_nodes.storage_backends import MadaStorageBackend, SQLiteStorageBackend, new_crux_uid
+
+
+class DictBackend(MadaStorageBackend):
+    """
+    In-memory backend for the single-object calls; the others are not
+    needed here. `uid_results` and `create_results` script ensure_uid /
+    create_object in call order: an exception instance is raised, any other
+    value returned; None means the default behaviour. get_object raises the
+    exception in `get_errors` for its UID, and records each UID it is called
+    with in `get_calls`.
+    """
+
+    name = "dict"
+
+    def __init__(self, uid_results=(), create_results=()):
+        self.objects = {}
+        self.uid_results = list(uid_results)
+        self.create_results = list(create_results)
+        self.calls = []
+        self.get_errors = {}
+        self.get_calls = []
+        self.get_threads = set()
+
+    @staticmethod
+    def _scripted(results):
+        result = results.pop(0) if results else None
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def ensure_uid(self, object_type, context_description=None):
+        self.calls.append("ensure_uid")
+        return self._scripted(self.uid_results) or new_crux_uid(object_type)
+
+    def create_object(self, object_uid, object_payload, initial_metadata=None, requesting_persona_context=None):
+        self.calls.append("create_object")
+        result = self._scripted(self.create_results)
+        if result is not None:
+            return result
+        self.objects[object_uid] = {"object_uid": object_uid, "payload": object_payload, "metadata": initial_metadata or {}}
+        return True
+
+    def get_object(self, object_uid, requesting_persona_context=None):
+        self.get_calls.append(object_uid)
+        self.get_threads.add(threading.current_thread().name)
+        if object_uid in self.get_errors:
+            raise self.get_errors[object_uid]
+        return self.objects.get(object_uid)
+
+    def query_objects(self, query_params, requesting_persona_context=None):
+        raise NotImplementedError
+
+    def write_mada_object(self, object_payload_json, object_type, requesting_persona_context_json="{}",
+                          object_uid_to_update=None, initial_metadata_json="{}", update_metadata_json="{}"):
+        raise NotImplementedError
+
+    def create_pbi(self, pbi_data, requesting_persona_context=None):
+        raise NotImplementedError
+
+    def get_pbi_details(self, pbi_uid, requesting_persona_context=None):
+        raise NotImplementedError
+
+    def link_pbis(self, source_pbi_uid, target_pbi_uid, link_type, requesting_persona_context=None):
+        raise NotImplementedError
+
+    def add_comment_to_pbi(self, pbi_uid, comment_text, author_persona_uid, requesting_persona_context=None):
+        raise NotImplementedError
+
+
+class BackendTestCase(unittest.TestCase):
+
+    def use_backend(self, backend):
+        patcher = patch.object(storage_backends, "_backend", backend)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        configure_mada_read_cache()
+        self.addCleanup(configure_mada_read_cache)
+        return backend
+
+    def sqlite_backend(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        backend = SQLiteStorageBackend(os.path.join(tmp.name, "mada.sqlite3"), pool_size=2)
+        self.addCleanup(backend.close)
+        return self.use_backend(backend)
+
+
+class TestParsePayloads(unittest.TestCase):
+
+    def test_array_ndjson_and_single_object(self):
+        self.assertEqual(parse_payloads('[{"a": 1}, {"b": 2}]'), [({"a": 1}, None), ({"b": 2}, None)])
+        self.assertEqual(parse_payloads('{"a": 1}\n\n{"b": 2}\n'), [({"a": 1}, None), ({"b": 2}, None)])
+        self.assertEqual(parse_payloads('{\n  "a": 1\n}'), [({"a": 1}, None)])
+        self.assertEqual(parse_payloads("  "), [])
+
+    def test_bad_items_fail_alone(self):
+        parsed = parse_payloads('{"a": 1}\n{"b": \n[3]')
+        self.assertEqual(parsed[0], ({"a": 1}, None))
+        self.assertIn("line 2", parsed[1][1])
+        self.assertIsNone(parsed[2][0])
+        self.assertIn("JSON object", parsed[2][1])
+        with self.assertRaises(ValueError):
+            parse_payloads('[{"a": 1},')
+
+
+class TestStoreMadaObjects(BackendTestCase):
+
+    def test_sqlite_batch_path(self):
+        backend = self.sqlite_backend()
+        result = store_mada_objects('{"n": 1}\n{bad\n{"n": 2}', "Obs", initial_metadata={"src": "test"})
+        self.assertTrue(result.batched)
+        self.assertEqual(result.counts(), {"total": 3, STORED: 2, ERROR: 1})
+        self.assertEqual([status["status"] for status in result.statuses], [STORED, ERROR, STORED])
+        self.assertEqual(result.object_uids[1], "")
+        self.assertIn("line 2", result.statuses[1]["error"])
+        stored = backend.get_object(result.object_uids[2])
+        self.assertEqual((stored["object_type"], stored["payload"], stored["metadata"]), ("Obs", {"n": 2}, {"src": "test"}))
+
+    def test_batch_create_is_all_or_nothing(self):
+        backend = self.sqlite_backend()
+        existing = store_mada_objects([{"n": 0}], "Obs").object_uids[0]
+        # The second UID collides, so the whole transaction is rolled back
+        fresh = new_crux_uid("Obs")
+        with patch.object(backend, "ensure_uids", return_value=[fresh, existing]):
+            result = store_mada_objects([{"n": 1}, {"n": 2}], "Obs")
+        self.assertTrue(result.batched)
+        self.assertEqual(result.object_uids, ["", ""])
+        self.assertEqual([status["status"] for status in result.statuses], [ERROR, ERROR])
+        self.assertTrue(all("UID already exists" in status["error"] for status in result.statuses))
+        self.assertIsNone(backend.get_object(fresh))
+        self.assertEqual(backend.get_object(existing)["payload"], {"n": 0})
+
+    def test_batch_result_count_mismatch_fails_every_item(self):
+        backend = self.sqlite_backend()
+        with patch.object(backend, "create_objects", return_value=[True]):
+            result = store_mada_objects([{"n": 1}, {"n": 2}], "Obs")
+        self.assertEqual(result.object_uids, ["", ""])
+        self.assertTrue(all("expected 2 results" in status["error"] for status in result.statuses))
+
+    def test_per_item_fallback(self):
+        backend = self.use_backend(DictBackend(create_results=[None, "Error: quota exceeded", RuntimeError("disk gone")]))
+        result = store_mada_objects([{"n": 1}, {"n": 2}, {"n": 3}, "not an object"], "Obs")
+        self.assertFalse(result.batched)
+        self.assertEqual([status["status"] for status in result.statuses], [STORED, ERROR, ERROR, ERROR])
+        self.assertIn("quota exceeded", result.statuses[1]["error"])
+        self.assertIn("disk gone", result.statuses[2]["error"])
+        self.assertIn("JSON object", result.statuses[3]["error"])
+        self.assertEqual(backend.calls, ["ensure_uid"] * 3 + ["create_object"] * 3)
+        self.assertEqual(list(backend.objects), [result.object_uids[0]])
+        self.assertEqual(result.object_uids[1:], ["", "", ""])
+
+    def test_uid_errors_skip_the_write(self):
+        backend = self.use_backend(DictBackend(uid_results=[None, "ERROR_UID_SERVICE_DOWN", ValueError("no uids"), None]))
+        result = store_mada_objects([{"n": 1}, {"n": 2}, {"n": 3}, {"n": 4}], "Obs")
+        self.assertEqual([status["status"] for status in result.statuses], [STORED, ERROR, ERROR, STORED])
+        self.assertIn("ERROR_UID_SERVICE_DOWN", result.statuses[1]["error"])
+        self.assertIn("no uids", result.statuses[2]["error"])
+        self.assertEqual(backend.calls.count("create_object"), 2)
+        self.assertEqual(set(backend.objects), {result.object_uids[0], result.object_uids[3]})
+
+    def test_batch_uid_count_mismatch(self):
+        backend = self.sqlite_backend()
+        with patch.object(backend, "ensure_uids", return_value=[new_crux_uid("Obs")]):
+            result = store_mada_objects([{"n": 1}, {"n": 2}], "Obs")
+        self.assertEqual([status["status"] for status in result.statuses], [ERROR, ERROR])
+        self.assertTrue(all("expected 2 UIDs" in status["error"] for status in result.statuses))
+
+    def test_nothing_to_store(self):
+        self.use_backend(DictBackend(uid_results=[AssertionError("backend must not be called")]))
+        result = store_mada_objects("[1, 2]", "Obs")
+        self.assertEqual((result.object_uids, result.batched), (["", ""], False))
+        self.assertEqual(result.counts()[ERROR], 2)
+
+
+class TestGetMadaObjects(BackendTestCase):
+
+    def setUp(self):
+        self.backend = self.use_backend(DictBackend())
+        self.uids = store_mada_objects([{"n": n} for n in range(4)], "Obs").object_uids
+
+    def test_duplicates_fetched_once_in_first_requested_order(self):
+        requested = [self.uids[2], self.uids[0], "", self.uids[2], self.uids[0]]
+        result = get_mada_objects(requested, use_cache=False)
+        self.assertFalse(result.batched)
+        self.assertEqual(list(result.objects), [self.uids[2], self.uids[0]])
+        self.assertEqual(result.objects[self.uids[2]]["payload"], {"n": 2})
+        self.assertEqual(sorted(self.backend.get_calls), sorted([self.uids[2], self.uids[0]]))
+
+    def test_thread_pool_fallback(self):
+        # Every read waits until two are in flight, so a serial fetch would time out
+        barrier = threading.Barrier(2, timeout=5)
+        real_get = self.backend.get_object
+
+        def get_object(object_uid, requesting_persona_context=None):
+            barrier.wait()
+            return real_get(object_uid, requesting_persona_context)
+
+        with patch.object(self.backend, "get_object", get_object):
+            result = get_mada_objects(self.uids, max_workers=2, use_cache=False)
+        self.assertEqual([obj["payload"] for obj in result.objects.values()], [{"n": n} for n in range(4)])
+        self.assertTrue(all(name.startswith("lc-mada-get") for name in self.backend.get_threads))
+        self.assertEqual(len(self.backend.get_threads), 2)
+
+        self.backend.get_threads.clear()
+        get_mada_objects(self.uids, max_workers=1, use_cache=False)
+        self.assertEqual(self.backend.get_threads, {threading.current_thread().name})
+
+    def test_errors_and_unknown_uids_are_missing(self):
+        self.backend.get_errors[self.uids[1]] = RuntimeError("connection reset")
+        self.backend.objects[self.uids[3]] = "Object urn:x not found in mock_mada_store"
+        unknown = new_crux_uid("Obs")
+        result = get_mada_objects([self.uids[0], self.uids[1], unknown, self.uids[3]], use_cache=False)
+        self.assertEqual(result.missing, [self.uids[1], unknown, self.uids[3]])
+        self.assertEqual(list(result.errors), [self.uids[1]])
+        self.assertIn("connection reset", result.errors[self.uids[1]])
+        self.assertEqual([result.objects[uid] for uid in result.missing], [None, None, None])
+        self.assertEqual(result.objects[self.uids[0]]["payload"], {"n": 0})
+
+    def test_cache_hits_skip_the_backend(self):
+        unknown = new_crux_uid("Obs")
+        get_mada_objects([self.uids[0], self.uids[1], unknown])
+        self.backend.get_calls.clear()
+        result = get_mada_objects([self.uids[0], self.uids[1], unknown])
+        # Missing objects are not cached
+        self.assertEqual(self.backend.get_calls, [unknown])
+        self.assertEqual(result.objects[self.uids[1]]["payload"], {"n": 1})
+
+        # Persona contexts are cached separately, and invalidation forces a re-read
+        self.backend.get_calls.clear()
+        get_mada_objects([self.uids[0]], requesting_persona_context={"persona": "p"})
+        self.assertEqual(self.backend.get_calls, [self.uids[0]])
+        invalidate_mada_objects(self.uids[1])
+        self.backend.get_calls.clear()
+        get_mada_objects([self.uids[0], self.uids[1]])
+        self.assertEqual(self.backend.get_calls, [self.uids[1]])
+
+    def test_sqlite_batch_get(self):
+        backend = self.sqlite_backend()
+        uids = store_mada_objects([{"n": 1}, {"n": 2}], "Obs").object_uids
+        with patch.object(backend, "get_object", side_effect=AssertionError("single reads must not be used")):
+            result = get_mada_objects(uids + [uids[0], new_crux_uid("Obs")], use_cache=False)
+        self.assertTrue(result.batched)
+        self.assertEqual([obj["payload"] for obj in result.objects.values() if obj], [{"n": 1}, {"n": 2}])
+        self.assertEqual(len(result.missing), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
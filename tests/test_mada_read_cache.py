@@ -0,0 +1,47 @@
+import time
+import unittest
+
+from lc_comfyui_epistemic_nodes.mada_read_cache import MadaReadCache
+
+PBI_A = "urn:crux:uid::PBI::a"
+PBI_B = "urn:crux:uid::PBI::b"
+
+
+class TestMadaReadCache(unittest.TestCase):
+
+    def test_read_through_lru_and_ttl(self):
+        cache = MadaReadCache(max_entries=2, ttl_seconds=0.05)
+        loads = []
+
+        def loader(uid):
+            return lambda: loads.append(uid) or {"uid": uid}
+
+        for uid in ("a", "a", "b", "c", "a"):
+            cache.get_or_load("object", uid, loader(uid))
+        self.assertEqual(loads, ["a", "b", "c", "a"]) # "a" was evicted by "c"
+        self.assertIsNone(cache.get_or_load("object", "gone", lambda: None))
+        self.assertEqual(cache.get("object", "gone"), (False, None)) # misses are not cached
+        time.sleep(0.06)
+        self.assertEqual(cache.get("object", "a"), (False, None))
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["evictions"], stats["expired"]), (1, 2, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 1 / 8)
+
+    def test_invalidation_by_own_and_referenced_uid(self):
+        cache = MadaReadCache()
+        cache.put("pbi_details", PBI_A, {"links": [{"target": PBI_B}]}, variant="ctx1")
+        cache.put("object", PBI_A, {"title": "A"})
+        cache.put("object", PBI_B, {"title": "B"})
+        self.assertEqual(cache.invalidate([PBI_B]), 2)
+        self.assertFalse(cache.get("pbi_details", PBI_A, variant="ctx1")[0])
+        self.assertTrue(cache.get("object", PBI_A)[0])
+
+        # A read that overlapped an invalidation is not stored
+        epoch = cache.current_epoch()
+        cache.invalidate([PBI_A])
+        cache.put("object", PBI_A, {"title": "old A"}, epoch=epoch)
+        self.assertFalse(cache.get("object", PBI_A)[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
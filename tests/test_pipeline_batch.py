@@ -0,0 +1,68 @@
+import unittest
+from unittest.mock import patch
+
+from lc_comfyui_epistemic_nodes import pipeline_node
+from lc_comfyui_epistemic_nodes.pipeline_metrics import PIPELINE_METRICS
+from lc_comfyui_epistemic_nodes.pipeline_node import run_pipeline_batch, split_batch_input
+
+
+def _fake_run_pipeline(input_text, params, timings=None, *args, **kwargs):
+    if input_text == "bad":
+        raise ValueError("cannot parse")
+    if timings is not None:
+        timings["L1_startle"] = 0.001
+    seed = {"text": input_text, "origin": params["l1_origin_hint"]}
+    return (seed, f"trace-{input_text}", "l6", "l7", "next")
+
+
+class TestSplitBatchInput(unittest.TestCase):
+
+    def test_json_array(self):
+        self.assertEqual(split_batch_input('["a", "b c", 3]'), ["a", "b c", "3"])
+
+    def test_lines(self):
+        self.assertEqual(split_batch_input("first\n\n  second  \n"), ["first", "second"])
+        # Not a JSON list, so still one input per line
+        self.assertEqual(split_batch_input("[draft]\nnext"), ["[draft]", "next"])
+        self.assertEqual(split_batch_input('{"a": 1}'), ['{"a": 1}'])
+
+    def test_empty(self):
+        self.assertEqual(split_batch_input(""), [])
+        self.assertEqual(split_batch_input("  \n "), [])
+        self.assertEqual(split_batch_input(None), [])
+
+
+class TestRunPipelineBatch(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch.object(pipeline_node, "run_pipeline", _fake_run_pipeline)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        PIPELINE_METRICS.reset()
+        self.addCleanup(PIPELINE_METRICS.reset)
+
+    def test_failed_item_does_not_stop_batch(self):
+        result = run_pipeline_batch(["one", "bad", "three"], l1_origin_hint="batch")
+
+        self.assertEqual([item["status"] for item in result["items"]], ["ok", "error", "ok"])
+        self.assertEqual([item["index"] for item in result["items"]], [0, 1, 2])
+        self.assertEqual(result["items"][1]["error"], "ValueError: cannot parse")
+        self.assertIsNone(result["items"][1]["trace_id"])
+        self.assertEqual(result["items"][2]["trace_id"], "trace-three")
+        self.assertEqual(result["seeds"][0], {"text": "one", "origin": "batch"})
+        self.assertIsNone(result["seeds"][1])
+
+        timing = result["timing"]
+        self.assertEqual((timing["item_count"], timing["succeeded"], timing["failed"]), (3, 2, 1))
+        # Only items that produced layer timings are recorded
+        self.assertEqual(PIPELINE_METRICS.run_count, 2)
+
+    def test_empty_batch(self):
+        result = run_pipeline_batch([])
+        self.assertEqual(result["seeds"], [])
+        self.assertEqual(result["timing"]["item_count"], 0)
+        self.assertEqual(result["timing"]["items_per_second"], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+from pydantic import BaseModel
+
+from lc_comfyui_epistemic_nodes.pipeline_cache import PipelineResultCache, pipeline_cache_key
+
+
+class _Seed(BaseModel):
+    seed_id: str
+    payload: dict
+
+
+def _result(seed_id: str):
+    return (_Seed(seed_id=seed_id, payload={"layers": [1, 2, 3]}), "trace", "l6", "l7", "next")
+
+
+class TestPipelineResultCache(unittest.TestCase):
+
+    def test_key_depends_on_input_and_params(self):
+        params = {"l1_origin_hint": "hint", "l2_communication_context_hints": {"b": 1, "a": 2}}
+        key = pipeline_cache_key("text", params)
+        self.assertEqual(key, pipeline_cache_key("text", {"l2_communication_context_hints": {"a": 2, "b": 1}, "l1_origin_hint": "hint"}))
+        self.assertNotEqual(key, pipeline_cache_key("other text", params))
+        self.assertNotEqual(key, pipeline_cache_key("text", dict(params, l1_origin_hint="other")))
+
+    def test_hit_returns_fresh_seed(self):
+        cache = PipelineResultCache(max_entries=4)
+        cache.put("k", _result("s1"))
+        first = cache.get("k", _Seed)
+        second = cache.get("k", _Seed)
+        self.assertEqual(first, _result("s1"))
+        self.assertIsNot(first[0], second[0])
+        self.assertIsNone(cache.get("missing", _Seed))
+        self.assertEqual((cache.stats()["hits"], cache.stats()["misses"]), (2, 1))
+
+    def test_lru_eviction_and_disk_tier(self):
+        with tempfile.TemporaryDirectory() as disk_dir:
+            cache = PipelineResultCache(max_entries=1, disk_dir=disk_dir)
+            cache.put("a", _result("a"))
+            cache.put("b", _result("b"))
+            self.assertEqual(cache.stats()["evictions"], 1)
+            # "a" was evicted from memory but is still on disk
+            self.assertEqual(cache.get("a", _Seed)[0].seed_id, "a")
+            self.assertEqual(cache.stats()["disk_hits"], 1)
+
+            restarted = PipelineResultCache(max_entries=1, disk_dir=disk_dir)
+            self.assertEqual(restarted.get("b", _Seed)[0].seed_id, "b")
+
+    def test_corrupt_disk_entry_is_a_miss(self):
+        with tempfile.TemporaryDirectory() as disk_dir:
+            PipelineResultCache(max_entries=1, disk_dir=disk_dir).put("k", _result("k"))
+            (path,) = [os.path.join(disk_dir, name) for name in os.listdir(disk_dir)]
+            with open(path, "rb") as f:
+                blob = f.read()
+            with open(path, "wb") as f:
+                f.write(blob[:-3]) # truncated compressed body
+
+            cache = PipelineResultCache(max_entries=1, disk_dir=disk_dir)
+            self.assertIsNone(cache.get("k", _Seed))
+            self.assertEqual((cache.stats()["errors"], cache.stats()["misses"]), (1, 1))
+            self.assertFalse(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
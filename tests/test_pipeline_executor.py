@@ -0,0 +1,63 @@
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+from lc_comfyui_epistemic_nodes import pipeline_executor, pipeline_node
+from lc_comfyui_epistemic_nodes.pipeline_executor import run_batch_in_pool
+
+
+def _fake_run_pipeline(input_text, params, timings=None, *args, **kwargs):
+    if input_text == "bad":
+        raise ValueError("cannot parse")
+    return ({"text": input_text}, f"trace-{input_text}", "l6", "l7", "next")
+
+
+class _CrashingPool:
+    """
+    Runs chunks inline; a chunk containing "crash" fails the way a dead
+    worker process does.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def submit(self, fn, chunk, params):
+        self.chunks.append(chunk)
+        future = Future()
+        if any(input_text == "crash" for _, input_text in chunk):
+            future.set_exception(BrokenProcessPool("A child process terminated abruptly"))
+        else:
+            future.set_result(fn(chunk, params))
+        return future
+
+
+class TestRunBatchInPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = _CrashingPool()
+        for target, name, replacement in ((pipeline_node, "run_pipeline", _fake_run_pipeline),
+                                          (pipeline_executor, "get_process_pool", lambda workers: self.pool)):
+            patcher = patch.object(target, name, replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_worker_crash_fails_only_its_chunk(self):
+        inputs = ["a", "b", "crash", "c", "bad", "d"]
+        # 1 worker -> chunks of ceil(6 / 4) = 2 items
+        result = run_batch_in_pool(inputs, pipeline_node.prepare_pipeline_params(), workers=1)
+
+        self.assertEqual(self.pool.chunks[1], [(2, "crash"), (3, "c")])
+        statuses = [item["status"] for item in result["items"]]
+        self.assertEqual(statuses, ["ok", "ok", "error", "error", "error", "ok"])
+        self.assertEqual([item["index"] for item in result["items"]], list(range(6)))
+        self.assertIn("BrokenProcessPool", result["items"][3]["error"])
+        self.assertEqual(result["items"][4]["error"], "ValueError: cannot parse")
+        self.assertEqual(result["seeds"][0], {"text": "a"}) # round-tripped through the worker payload
+        self.assertEqual(result["seeds"][2:5], [None, None, None])
+        self.assertEqual(result["seeds"][5], {"text": "d"})
+        self.assertEqual((result["timing"]["failed"], result["timing"]["workers"]), (3, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
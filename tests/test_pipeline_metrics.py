@@ -0,0 +1,56 @@
+import time
+import unittest
+
+from lc_comfyui_epistemic_nodes.pipeline_metrics import PipelineMetricsRegistry, timed_span
+
+
+class TestTimedSpan(unittest.TestCase):
+
+    def test_accumulates_per_span(self):
+        timings = {}
+        with timed_span(timings, "parse_params"):
+            time.sleep(0.01)
+        with timed_span(timings, "parse_params"):
+            pass
+        self.assertGreaterEqual(timings["parse_params"], 0.01)
+        self.assertEqual(list(timings), ["parse_params"])
+
+    def test_records_on_exception(self):
+        timings = {}
+        with self.assertRaises(RuntimeError):
+            with timed_span(timings, "L1_startle"):
+                raise RuntimeError("sop failed")
+        self.assertIn("L1_startle", timings)
+
+    def test_none_is_a_no_op(self):
+        with timed_span(None, "L1_startle"):
+            pass
+
+
+class TestPipelineMetricsRegistry(unittest.TestCase):
+
+    def test_aggregates(self):
+        registry = PipelineMetricsRegistry()
+        registry.record_run({"L1_startle": 0.2, "total": 1.0})
+        registry.record_run({"L1_startle": 0.4, "total": 3.0})
+        registry.record("L1_startle", 0.3)
+
+        snapshot = registry.snapshot()
+        self.assertEqual(registry.run_count, 2)
+        l1 = snapshot["L1_startle"]
+        self.assertEqual(l1["count"], 3)
+        self.assertAlmostEqual(l1["total_seconds"], 0.9)
+        self.assertAlmostEqual(l1["mean_seconds"], 0.3)
+        self.assertEqual((l1["min_seconds"], l1["max_seconds"], l1["last_seconds"]), (0.2, 0.4, 0.3))
+        self.assertAlmostEqual(snapshot["total"]["mean_seconds"], 2.0)
+
+        # The snapshot is a copy
+        snapshot["L1_startle"]["count"] = 99
+        self.assertEqual(registry.snapshot()["L1_startle"]["count"], 3)
+
+        registry.reset()
+        self.assertEqual((registry.snapshot(), registry.run_count), ({}, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import threading
+import unittest
+from typing import List, Optional
+from unittest.mock import patch
+
+from pydantic import BaseModel
+
+from lc_comfyui_epistemic_nodes import pipeline_node
+from lc_comfyui_epistemic_nodes.pipeline_node import PipelineCancelled, drain_pipeline, iter_pipeline, prepare_pipeline_params
+
+
+class _TraceMetadata(BaseModel):
+    L1_trace: Optional[dict] = None
+
+
+class _Seed(BaseModel):
+    seed_id: str
+    trace_metadata: _TraceMetadata = _TraceMetadata()
+    log: List[str] = []
+
+
+def _sop(name):
+    def process(mada_seed, *args):
+        mada_seed.log.append(name) # mutates in place, like the real SOPs
+        return mada_seed
+    return process
+
+
+async def _async_sop(mada_seed):
+    mada_seed.log.append("L3")
+    return mada_seed
+
+
+class TestIterPipeline(unittest.TestCase):
+
+    def setUp(self):
+        patches = {
+            "startle_process": lambda input_event: _Seed(seed_id="seed", log=["L1"]),
+            "frame_click_process": _sop("L2"),
+            "keymap_click_process": _async_sop,
+            "anchor_click_process": _sop("L4"),
+            "field_click_process": _sop("L5"),
+            "reflect_boom_process": _sop("L6"),
+            "apply_done_process": _sop("L7"),
+        }
+        for name, replacement in patches.items():
+            patcher = patch.object(pipeline_node, name, replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.params = prepare_pipeline_params()
+
+    def test_yields_snapshot_per_layer(self):
+        steps = list(iter_pipeline("text", self.params))
+        self.assertEqual([step.layer for step in steps], [layer for layer, _ in pipeline_node.PIPELINE_LAYERS])
+        # Each snapshot reflects the seed right after its own layer
+        self.assertEqual(steps[1].mada_seed.log, ["L1", "L2"])
+        self.assertEqual(steps[-1].mada_seed.log, ["L1", "L2", "L3", "L4", "L5", "L6", "L7"])
+
+    def test_drain_returns_final_result(self):
+        final_mada_seed, trace_id, *_ = drain_pipeline(iter_pipeline("text", self.params))
+        self.assertEqual(trace_id, "seed")
+        self.assertEqual(len(final_mada_seed.log), 7)
+
+    def test_cancel_between_layers(self):
+        cancel = threading.Event()
+        steps = iter_pipeline("text", self.params, cancel=cancel)
+        self.assertEqual(next(steps).layer, "L1_startle")
+        cancel.set()
+        with self.assertRaises(PipelineCancelled):
+            next(steps)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from typing import List
+
+from pydantic import BaseModel
+
+from lc_comfyui_epistemic_nodes.seed_archive import SeedArchive
+
+
+class _Seed(BaseModel):
+    seed_id: str
+    log: List[str] = []
+
+
+class TestSeedArchive(unittest.TestCase):
+
+    def test_get_and_range_by_seed_id(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "seeds.lcsa")
+            with SeedArchive(path, _Seed) as archive:
+                archive.extend([_Seed(seed_id=f"s{i}", log=[str(i)]) for i in range(5)])
+                archive.append(_Seed(seed_id="s1", log=["replaced"]))
+
+            with SeedArchive(path, _Seed) as archive:
+                self.assertEqual(len(archive), 5)
+                self.assertEqual(archive.get("s3").log, ["3"])
+                self.assertEqual(archive.get("s1").log, ["replaced"])
+                self.assertIsNone(archive.get("missing"))
+                self.assertEqual([seed_id for seed_id, _ in archive.iter_range("s2", 2)], ["s2", "s3"])
+
+    def test_recovers_records_written_without_index(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "seeds.lcsa")
+            with SeedArchive(path, _Seed) as archive:
+                archive.extend([_Seed(seed_id="a"), _Seed(seed_id="b")])
+            os.remove(path + ".idx") # as if the writer died before the index write
+            with open(path, "ab") as f:
+                f.write(b"\x00\x01") # and a torn record
+
+            with SeedArchive(path, _Seed) as archive:
+                self.assertEqual(archive.seed_ids(), ["a", "b"])
+                archive.append(_Seed(seed_id="c"))
+            with SeedArchive(path, _Seed) as archive:
+                self.assertEqual(archive.seed_ids(), ["a", "b", "c"])
+                self.assertEqual(archive.get("c").seed_id, "c")
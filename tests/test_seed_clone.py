@@ -0,0 +1,97 @@
+import unittest
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from lc_comfyui_epistemic_nodes.benchmarks.stub_backends import MadaSeed
+from lc_comfyui_epistemic_nodes.seed_clone import compile_model_clone
+
+_calls = []
+
+
+def _counted_list():
+    _calls.append(1)
+    return []
+
+
+class Leaf(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    name: str = "leaf"
+    tags: List[str] = Field(default_factory=list)
+
+
+class Root(BaseModel):
+    seed_id: str
+    created: Optional[datetime] = None
+    leaves: List[Leaf] = Field(default_factory=list)
+    mapping: Dict[str, Leaf] = Field(default_factory=dict)
+    counted: List[int] = Field(default_factory=_counted_list)
+
+
+class Opaque(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    value: object = None
+
+
+class TestCompileModelClone(unittest.TestCase):
+
+    def _prototype(self):
+        return Root(seed_id="proto", leaves=[Leaf(name="a", tags=["x"], note="extra")], mapping={"k": Leaf()})
+
+    def test_clone_equals_prototype(self):
+        prototype = self._prototype()
+        clone = compile_model_clone(prototype)()
+        self.assertIsNot(clone, prototype)
+        self.assertEqual(clone, prototype)
+        self.assertEqual(clone.model_dump(exclude_unset=True), prototype.model_dump(exclude_unset=True))
+        self.assertEqual(clone.leaves[0].note, "extra")
+
+    def test_clones_share_no_mutable_state(self):
+        prototype = self._prototype()
+        clone_fn = compile_model_clone(prototype)
+        first, second = clone_fn(), clone_fn()
+        first.leaves[0].tags.append("mutated")
+        first.mapping["k"].name = "mutated"
+        first.leaves.append(Leaf())
+        self.assertEqual(second, prototype)
+        self.assertEqual(prototype.leaves[0].tags, ["x"])
+
+    def test_default_factory_runs_per_clone(self):
+        clone_fn = compile_model_clone(self._prototype())
+        _calls.clear()
+        first, second = clone_fn(), clone_fn()
+        self.assertEqual(len(_calls), 2)
+        self.assertIsNot(first.counted, second.counted)
+        self.assertNotIn("counted", first.model_fields_set)
+
+    def test_holes_are_substituted(self):
+        now = datetime.now(timezone.utc)
+        clone_fn = compile_model_clone(self._prototype(), {("seed_id",): "seed_id", ("created",): "created",
+                                                          ("leaves", "0", "name"): "seed_id"})
+        clone = clone_fn(seed_id="urn:1", created=now)
+        self.assertEqual((clone.seed_id, clone.created, clone.leaves[0].name), ("urn:1", now, "urn:1"))
+        with self.assertRaises(TypeError):
+            clone_fn()
+
+    def test_invalid_holes_and_values_raise(self):
+        with self.assertRaises(ValueError):
+            compile_model_clone(self._prototype(), {("missing",): "missing"})
+        with self.assertRaises(ValueError):
+            compile_model_clone(self._prototype(), {("seed_id",): "not a name"})
+        with self.assertRaises(TypeError):
+            compile_model_clone(Opaque(value=object()))
+        with self.assertRaises(TypeError):
+            compile_model_clone({"seed_id": "x"})
+
+    def test_mada_seed_tree(self):
+        prototype = MadaSeed.model_validate({"version": "0.1.0", "seed_id": "proto", "seed_content": {"raw_signals": []},
+                                             "trace_metadata": {"trace_id": "proto"}})
+        clone = compile_model_clone(prototype, {("seed_id",): "seed_id"})(seed_id="urn:2")
+        self.assertEqual(clone.seed_id, "urn:2")
+        self.assertEqual(clone.model_dump(exclude={"seed_id"}), prototype.model_dump(exclude={"seed_id"}))
+        self.assertIsNot(clone.trace_metadata.L2_trace, prototype.trace_metadata.L2_trace)
+
+
+if __name__ == "__main__":
+    unittest.main()
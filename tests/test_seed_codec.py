@@ -0,0 +1,55 @@
+import json
+import unittest
+
+from lc_comfyui_epistemic_nodes.seed_codec import (
+    CODEC_VERSION, MAGIC, SeedCodecError, decode_data, encode_data, is_encoded_seed
+)
+
+SAMPLE = {
+    "version": "0.3.0",
+    "seed_id": "urn:crux:uid::trace_event_L1::abc",
+    "seed_content": {
+        "raw_signals": [{"raw_input_id": "r1", "raw_input_signal": "x" * 200}],
+        "L1_startle_reflex": {"L2_frame_type": {"L2_frame_type_obj": {"version": "0.1.2", "error_details": None}}},
+    },
+    "numbers": [0, 1, -1, 127, 128, -129, 2 ** 70, 3.25, -0.5],
+    "flags": [True, False, None],
+    "unicode": "fält ✓",
+    "repeated": ["0.1.2", "0.1.2", "0.1.2"],
+}
+
+
+class TestSeedCodec(unittest.TestCase):
+
+    def test_tagged_round_trip(self):
+        data = encode_data(SAMPLE, fmt="tagged")
+        self.assertTrue(data.startswith(MAGIC))
+        self.assertEqual(data[len(MAGIC)], CODEC_VERSION)
+        self.assertEqual(decode_data(data), SAMPLE)
+
+    def test_compressed_round_trip(self):
+        self.assertEqual(decode_data(encode_data(SAMPLE, fmt="tagged", compress=True)), SAMPLE)
+
+    def test_smaller_than_indented_json(self):
+        self.assertLess(len(encode_data(SAMPLE, fmt="tagged")), len(json.dumps(SAMPLE, indent=2).encode("utf-8")))
+
+    def test_rejects_newer_version_and_garbage(self):
+        data = bytearray(encode_data(SAMPLE, fmt="tagged"))
+        data[len(MAGIC)] = CODEC_VERSION + 1
+        with self.assertRaises(SeedCodecError):
+            decode_data(bytes(data))
+        with self.assertRaises(SeedCodecError):
+            decode_data(b'{"seed_id": "x"}')
+        with self.assertRaises(SeedCodecError):
+            decode_data(encode_data(SAMPLE, fmt="tagged")[:-3])
+        with self.assertRaises(SeedCodecError):
+            decode_data(encode_data(SAMPLE, fmt="tagged", compress=True)[:-3])
+        self.assertFalse(is_encoded_seed('{"seed_id": "x"}'))
+
+    def test_unknown_format(self):
+        with self.assertRaises(SeedCodecError):
+            encode_data(SAMPLE, fmt="xml")
+
+
+if __name__ == '__main__':
+    unittest.main()
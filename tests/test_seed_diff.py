@@ -0,0 +1,31 @@
+import unittest
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from lc_comfyui_epistemic_nodes.seed_diff import apply_seed_diff, diff_seeds
+
+
+class _Layer(BaseModel):
+    state: Optional[str] = None
+
+
+class _Seed(BaseModel):
+    seed_id: str
+    layer: Optional[_Layer] = None
+    signals: List[str] = []
+    hints: Dict[str, str] = {}
+
+
+class TestSeedDiff(unittest.TestCase):
+
+    def test_paths_and_round_trip(self):
+        before = _Seed(seed_id="s", signals=["a", "b"], hints={"x": "1", "y": "2"})
+        after = _Seed(seed_id="s", layer=_Layer(state="Framed"), signals=["a"], hints={"x": "9", "z": "3"})
+        diff = diff_seeds(before, after)
+        self.assertEqual(diff.added, {"layer": _Layer(state="Framed"), "hints.z": "3"})
+        self.assertEqual(diff.changed, {"hints.x": ("1", "9")})
+        self.assertEqual(diff.removed, {"signals[1]": "b", "hints.y": "2"})
+        self.assertEqual(apply_seed_diff(before, diff), after)
+        self.assertEqual(apply_seed_diff(after, diff_seeds(after, before)), before)
+        self.assertFalse(diff_seeds(after, after.model_copy(deep=True)))
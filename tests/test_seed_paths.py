@@ -0,0 +1,36 @@
+import unittest
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from lc_comfyui_epistemic_nodes.seed_paths import MISSING, compile_path
+
+
+class _Leaf(BaseModel):
+    text: Optional[str] = None
+
+
+class _Node(BaseModel):
+    leaf: Optional[_Leaf] = None
+    leaves: List[_Leaf] = []
+
+
+class TestSeedPaths(unittest.TestCase):
+
+    def test_missing_links_return_sentinel(self):
+        text = compile_path("leaf.text")
+        self.assertIs(compile_path("leaf.text"), text)
+        self.assertEqual(text(_Node(leaf=_Leaf(text="a"))), "a")
+        self.assertIsNone(text(_Node(leaf=_Leaf()))) # present, but None
+        self.assertIs(text(_Node()), MISSING)
+        self.assertIs(text(None), MISSING)
+        self.assertIs(compile_path("leaf.nope")(_Node(leaf=_Leaf())), MISSING)
+        self.assertFalse(MISSING)
+        self.assertEqual(text.get(_Node(), "default"), "default")
+
+    def test_indexes_and_plain_data(self):
+        first = compile_path("leaves[0].text")
+        self.assertEqual(first(_Node(leaves=[_Leaf(text="x")])), "x")
+        self.assertIs(first(_Node()), MISSING)
+        self.assertEqual(first({"leaves": [{"text": "y"}]}), "y")
+        self.assertEqual(compile_path("@L1.L1_startle_context").steps, ("seed_content", "L1_startle_reflex", "L1_startle_context"))
@@ -0,0 +1,133 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from lc_comfyui_epistemic_nodes.storage_backends import MadaStorageBackend, SQLiteStorageBackend
+
+
+class TestSQLiteStorageBackend(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.backend = SQLiteStorageBackend(os.path.join(self._tmp.name, "mada.sqlite3"), pool_size=2)
+
+    def tearDown(self):
+        self.backend.close()
+        self._tmp.cleanup()
+
+    def test_write_update_and_versions(self):
+        created = self.backend.write_mada_object('{"v": 1}', "Doc", initial_metadata_json='{"a": 1}')
+        uid = created["object_uid"]
+        self.assertEqual(created["version"], 1)
+        updated = self.backend.write_mada_object('{"v": 2}', "Doc", object_uid_to_update=uid, update_metadata_json='{"b": 2}')
+        self.assertEqual(updated["version"], 2)
+        current = self.backend.get_object(uid)
+        self.assertEqual((current["payload"], current["metadata"]), ({"v": 2}, {"a": 1, "b": 2}))
+        self.assertEqual(self.backend.get_object(uid, version=1)["payload"], {"v": 1})
+        self.assertTrue(self.backend.write_mada_object("{bad", "Doc")["status"].startswith("Error"))
+        missing = self.backend.write_mada_object("{}", "Doc", object_uid_to_update="urn:crux:uid::Doc::none")
+        self.assertIsNone(missing["version"])
+
+    def test_batch_create_get_and_query(self):
+        uids = self.backend.batch_call("ensure_uids")("Obs", 150)
+        objects = [{"object_uid": uid, "object_payload": {"n": index % 3}} for index, uid in enumerate(uids)]
+        self.assertTrue(all(self.backend.batch_call("create_objects")(objects)))
+        found = self.backend.batch_call("get_objects")(uids + ["urn:crux:uid::Obs::none"])
+        self.assertEqual(len(found), 150) # spans several fixed-size IN chunks
+        self.assertEqual(found[uids[4]]["payload"], {"n": 1})
+        self.assertEqual(len(self.backend.query_objects({"object_type": "Obs", "n": 0})), 50)
+        self.assertIsNone(self.backend.batch_call("drop_everything"))
+
+    def test_concurrent_writers_share_the_pool(self):
+        errors = []
+
+        def writer():
+            for index in range(25):
+                result = self.backend.write_mada_object(f'{{"i": {index}}}', "Doc")
+                if result["version"] != 1:
+                    errors.append(result["status"])
+
+        threads = [threading.Thread(target=writer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.backend.query_objects({"object_type": "Doc"})), 100)
+
+    def test_pbi_links_and_comments(self):
+        source = self.backend.create_pbi({"title": "A", "status": "New"})
+        target = self.backend.create_pbi({"title": "B", "status": "New"})
+        self.assertEqual(self.backend.link_pbis(source, target, "blocks")["status"], "Success")
+        self.assertEqual(self.backend.link_pbis(source, target, "blocks")["status"], "Success") # idempotent
+        self.assertEqual(self.backend.add_comment_to_pbi(source, "hi", "urn:persona")["status"], "Success")
+        details = self.backend.get_pbi_details(source)["details"]
+        self.assertEqual(details["links"], [{"target_pbi_uid": target, "link_type": "blocks"}])
+        self.assertEqual([comment["text"] for comment in details["comments"]], ["hi"])
+        self.assertTrue(self.backend.link_pbis(source, "urn:crux:uid::pbi::none", "blocks")["status"].startswith("Error"))
+        self.assertEqual(len(self.backend.query_objects({"object_type": self.backend.pbi_object_type, "title": "B"})), 1)
+
+    def test_query_filters_match_python_equality(self):
+        payloads = [{"status": "New", "n": 1, "flag": True, "tags": ["a"], "a.b": 1, "big": 2**70},
+                    {"status": "New", "n": "1", "flag": False, "tags": [], "gone": None},
+                    {"status": "Done", "n": 1.0, "tags": ["a"]}]
+        uids = self.backend.ensure_uids("Obs", len(payloads))
+        self.backend.create_objects([{"object_uid": uid, "object_payload": payload} for uid, payload in zip(uids, payloads)])
+        queries = [{"status": "New"}, {"n": 1}, {"n": "1"}, {"flag": True}, {"flag": 1}, {"gone": None}, {"tags": ["a"]},
+                   {"tags": '["a"]'}, {"a.b": 1}, {"big": 2**70}, {"status": "New", "n": 1}, {"missing": "x"}]
+        for query in queries:
+            expected = [payload for payload in payloads if all(payload.get(key) == value for key, value in query.items())]
+            self.assertEqual(self.backend.query_objects(dict(query, object_type="Obs")), expected, query)
+
+    def test_pbi_field_queries_use_expression_indexes(self):
+        with self.backend.connection() as conn:
+            plan = conn.execute("EXPLAIN QUERY PLAN SELECT payload FROM mada_objects WHERE object_type = ? "
+                                "AND json_extract(payload, '$.status') = ?", ("PBI", "New")).fetchall()
+        self.assertIn("idx_mada_objects_status", " ".join(str(row) for row in plan))
+
+    def test_close_drains_the_pool(self):
+        self.backend.get_object("urn:crux:uid::Doc::none")
+        self.assertGreater(self.backend._pool.qsize(), 0)
+        self.backend.close()
+        self.assertEqual(self.backend._all, [])
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.backend.get_object("urn:crux:uid::Doc::none")
+        self.assertTrue(self.backend.write_mada_object("{}", "Doc")["status"].startswith("Error"))
+        self.backend.close() # idempotent
+
+    def test_close_with_borrowed_connections(self):
+        backend = SQLiteStorageBackend(os.path.join(self._tmp.name, "borrowed.sqlite3"), pool_size=1)
+        waiter_error = []
+        with backend.connection() as conn:
+            def borrow():
+                try:
+                    with backend.connection():
+                        pass
+                except sqlite3.ProgrammingError as e:
+                    waiter_error.append(e)
+
+            waiter = threading.Thread(target=borrow)
+            waiter.start()
+            waiter.join(0.1) # waiting for the only connection
+            backend.close()
+            waiter.join(5)
+            self.assertEqual(len(waiter_error), 1)
+            conn.execute("SELECT 1") # still usable by its borrower
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1") # closed when returned
+
+
+class TestMadaStorageBackend(unittest.TestCase):
+
+    def test_incomplete_backend_cannot_be_instantiated(self):
+        class PartialBackend(MadaStorageBackend):
+            def ensure_uid(self, object_type, context_description=None):
+                return "urn:x"
+
+        with self.assertRaises(TypeError):
+            PartialBackend()
+
+if __name__ == "__main__":
+    unittest.main()
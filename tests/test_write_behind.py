@@ -0,0 +1,139 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from lc_comfyui_epistemic_nodes.write_behind import WriteBehindQueue, is_provisional_uid
+
+
+class _Store:
+    def __init__(self):
+        self.objects = {}
+
+    def write(self, object_payload_json, object_type, object_uid_to_update=None, **kwargs):
+        uid = object_uid_to_update or f"urn:crux:uid::{object_type}::{len(self.objects)}"
+        self.objects[uid] = object_payload_json
+        return {"object_uid": uid, "status": "Success", "version": 1}
+
+
+class TestWriteBehind(unittest.TestCase):
+
+    def test_provisional_uid_and_ordered_updates(self):
+        store = _Store()
+        write_queue = WriteBehindQueue(store.write, max_pending=4, batch_size=2)
+        provisional = write_queue.submit({"object_payload_json": "v1", "object_type": "T"})
+        self.assertTrue(is_provisional_uid(provisional))
+        write_queue.submit({"object_payload_json": "v2", "object_type": "T", "object_uid_to_update": provisional})
+        for index in range(10): # more than max_pending: submit waits for the worker
+            write_queue.submit({"object_payload_json": str(index), "object_type": "T"})
+        self.assertTrue(write_queue.close(timeout=5))
+        real_uid = write_queue.resolve_uid(provisional)
+        self.assertEqual(store.objects[real_uid], "v2")
+        self.assertEqual(len(store.objects), 11)
+        self.assertEqual(write_queue.stats()["flushed"], 12)
+
+    def test_journal_replays_unflushed_writes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            journal_path = os.path.join(tmp, "writes.jsonl")
+            release = threading.Event()
+            stuck = WriteBehindQueue(lambda **kwargs: release.wait(), journal_path=journal_path, batch_size=1)
+            stuck.submit({"object_payload_json": "a", "object_type": "T"})
+            stuck.submit({"object_payload_json": "b", "object_type": "T"})
+
+            store = _Store()
+            replayed = WriteBehindQueue(store.write, journal_path=journal_path)
+            self.assertTrue(replayed.close(timeout=5))
+            self.assertEqual(sorted(store.objects.values()), ["a", "b"])
+            self.assertEqual(os.path.getsize(journal_path), 0)
+            release.set()
+
+    def test_transient_failures_are_retried(self):
+        store = _Store()
+        calls = []
+
+        def flaky_write(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise ConnectionError("reset")
+            return store.write(**kwargs)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            journal_path = os.path.join(tmp, "writes.jsonl")
+            write_queue = WriteBehindQueue(flaky_write, journal_path=journal_path, retry_backoff=0)
+            provisional = write_queue.submit({"object_payload_json": "a", "object_type": "T"})
+            self.assertTrue(write_queue.close(timeout=5))
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(write_queue.stats()["retries"], 1)
+            self.assertEqual(store.objects[write_queue.resolve_uid(provisional)], "a")
+            self.assertEqual(os.path.getsize(journal_path), 0)
+
+    def test_failed_writes_stay_in_the_journal(self):
+        def rejected(**kwargs):
+            return {"object_uid": None, "status": "Error: payload rejected", "version": None}
+
+        def unreachable(**kwargs):
+            if kwargs["object_payload_json"] == "rejected":
+                return rejected()
+            raise ConnectionError("backend down")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            journal_path = os.path.join(tmp, "writes.jsonl")
+            failing = WriteBehindQueue(unreachable, journal_path=journal_path, retries=1, retry_backoff=0)
+            provisional = failing.submit({"object_payload_json": "v1", "object_type": "T"})
+            failing.submit({"object_payload_json": "v2", "object_type": "T", "object_uid_to_update": provisional})
+            failing.submit({"object_payload_json": "rejected", "object_type": "T"})
+            self.assertTrue(failing.close(timeout=5))
+            self.assertEqual(failing.stats()["failed"], 3)
+            self.assertTrue(failing.result(provisional)["status"].startswith("Error"))
+
+            # The create and the update held back behind it are replayed in order;
+            # the write the backend rejected is not.
+            store = _Store()
+            replayed = WriteBehindQueue(store.write, journal_path=journal_path)
+            self.assertTrue(replayed.close(timeout=5))
+            self.assertEqual(replayed.stats()["replayed"], 2)
+            self.assertEqual(list(store.objects.values()), ["v2"])
+            self.assertEqual(store.objects[replayed.resolve_uid(provisional)], "v2")
+
+    def test_replayed_update_goes_to_the_real_uid(self):
+        store = _Store()
+        create_started, release = threading.Event(), threading.Event()
+
+        def blocked_updates(**kwargs):
+            if kwargs.get("object_uid_to_update"):
+                release.wait()
+                return {"object_uid": None, "status": "Error: process died", "version": None}
+            create_started.wait()
+            return store.write(**kwargs)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            journal_path = os.path.join(tmp, "writes.jsonl")
+            first = WriteBehindQueue(blocked_updates, journal_path=journal_path, batch_size=1)
+            provisional = first.submit({"object_payload_json": "v1", "object_type": "T"})
+            # Queued while the create is in flight, so journaled against the provisional UID
+            first.submit({"object_payload_json": "v2", "object_type": "T", "object_uid_to_update": provisional})
+            first.submit({"object_payload_json": "x1", "object_type": "X"})
+            create_started.set()
+            for _ in range(500):
+                if first.resolve_uid(provisional) != provisional:
+                    break
+                time.sleep(0.01)
+            real_uid = first.resolve_uid(provisional)
+            self.assertFalse(is_provisional_uid(real_uid))
+
+            # A second process that also dies before flushing compacts the journal
+            second = WriteBehindQueue(blocked_updates, journal_path=journal_path, batch_size=1)
+            self.assertEqual(second.resolve_uid(provisional), real_uid)
+            self.assertEqual(second.stats()["replayed"], 2)
+
+            third = WriteBehindQueue(store.write, journal_path=journal_path)
+            self.assertTrue(third.close(timeout=5))
+            self.assertEqual(third.resolve_uid(provisional), real_uid)
+            self.assertEqual(store.objects[real_uid], "v2")
+            self.assertNotIn(provisional, store.objects)
+            self.assertIn("x1", store.objects.values())
+            release.set()
+
+if __name__ == "__main__":
+    unittest.main()
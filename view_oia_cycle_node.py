@@ -1,5 +1,11 @@
 import json
-from lc_python_core.sops.meta_sops.sop_oia_cycle_management import get_oia_cycle_state
+
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+
+logger = get_logger(__name__)
+
+get_oia_cycle_state = lazy_import("lc_python_core.sops.meta_sops.sop_oia_cycle_management", "get_oia_cycle_state")
 
 class ViewOiaCycleNode:
     CATEGORY = "LearntCloud/OIA"
@@ -17,7 +23,7 @@ class ViewOiaCycleNode:
         }
 
     def view_cycle(self, oia_cycle_uid: str):
-        print(f"ViewOiaCycleNode: Calling get_oia_cycle_state for UID: {oia_cycle_uid}")
+        logger.debug("ViewOiaCycleNode: Calling get_oia_cycle_state for UID: %s", oia_cycle_uid)
         cycle_state_dict = get_oia_cycle_state(oia_cycle_uid)
         summary = "OIA Cycle state not found or error in retrieval."
         if cycle_state_dict:
@@ -26,12 +32,8 @@ class ViewOiaCycleNode:
             except TypeError:
                 summary = "Error: OIA cycle state is not JSON serializable."
         
-        # For console printing via the ShowTextNode pattern:
-        print("--------------------------------")
-        print(f"OIA Cycle State for {oia_cycle_uid}:")
-        print("--------------------------------")
-        print(summary)
-        print("--------------------------------")
+        # The full state only goes to the log at INFO; the UI preview below is the primary display.
+        logger.info("OIA Cycle State for %s:\n%s", oia_cycle_uid, summary)
         # For direct UI display (if node has UI preview text element)
         return {"ui": {"text": [summary]}} # This allows text to be shown in some simple text widgets in ComfyUI if node has one
         # If not using UI preview, just return the summary string for connection
@@ -1,6 +1,13 @@
 import json
 from typing import Optional
-from lc_python_core.sops.meta_sops.sop_rdsotm_management import get_rdsotm_cycle_details
+
+from .lazy_imports import lazy_import
+from .lc_logging import get_logger
+from .mada_read_cache import get_mada_read_cache
+
+logger = get_logger(__name__)
+
+get_rdsotm_cycle_details = lazy_import("lc_python_core.sops.meta_sops.sop_rdsotm_management", "get_rdsotm_cycle_details")
 
 class ViewRDSOTMCycleDetailsNode:
     CATEGORY = "LearntCloud/RDSOTM"
@@ -15,16 +22,28 @@ class ViewRDSOTMCycleDetailsNode:
             "required": {
                 "cycle_linkage_uid": ("STRING", {"forceInput": True}),
                 "resolve_component_summaries": ("BOOLEAN", {"default": True}),
+            },
+            "optional": {
+                # Serve the details from the shared read cache (see mada_read_cache); new components evict them
+                "use_read_cache": ("BOOLEAN", {"default": True}),
             }
         }
 
-    def view_details(self, cycle_linkage_uid: str, resolve_component_summaries: bool):
-        print(f"ViewRDSOTMCycleDetailsNode: Calling get_rdsotm_cycle_details for UID: {cycle_linkage_uid}")
+    def view_details(self, cycle_linkage_uid: str, resolve_component_summaries: bool, use_read_cache: bool = True):
+        logger.debug("ViewRDSOTMCycleDetailsNode: Calling get_rdsotm_cycle_details for UID: %s", cycle_linkage_uid)
         
-        cycle_details_dict = get_rdsotm_cycle_details(
-            cycle_linkage_uid=cycle_linkage_uid,
-            resolve_component_summaries=resolve_component_summaries
-        )
+        def load_details():
+            return get_rdsotm_cycle_details(
+                cycle_linkage_uid=cycle_linkage_uid,
+                resolve_component_summaries=resolve_component_summaries
+            )
+
+        if use_read_cache:
+            cycle_details_dict = get_mada_read_cache().get_or_load(
+                "rdsotm_cycle_details", cycle_linkage_uid, load_details, variant=bool(resolve_component_summaries),
+                cacheable=bool)
+        else:
+            cycle_details_dict = load_details()
         
         summary_str = f"RDSOTM Cycle details for {cycle_linkage_uid} not found or error in retrieval."
         if cycle_details_dict:
@@ -33,11 +52,7 @@ class ViewRDSOTMCycleDetailsNode:
             except TypeError:
                 summary_str = f"Error: RDSOTM Cycle details for {cycle_linkage_uid} are not JSON serializable."
         
-        print("--------------------------------")
-        print(f"RDSOTM Cycle Details for {cycle_linkage_uid}:")
-        print("--------------------------------")
-        print(summary_str)
-        print("--------------------------------")
+        logger.info("RDSOTM Cycle Details for %s:\n%s", cycle_linkage_uid, summary_str)
         
         return {"ui": {"text": [summary_str]}} # For direct UI display in node
         # Alternatively, to output as a string for ShowTextNode:
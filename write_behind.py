@@ -0,0 +1,402 @@
+"""
+Write-behind buffering for MADA writes.
+
+LcMemWriteNode normally calls write_mada_object and waits for storage. In
+its write-behind modes the write is queued instead and the node returns at
+once:
+
+    queue = get_write_behind_queue(write_mada_object, journal_path=None)
+    provisional_uid = queue.submit(write_kwargs)      # blocks only while the queue is full
+    queue.result(provisional_uid)                     # None until flushed, then the backend's result dict
+
+A daemon worker drains the queue in batches (up to LC_EPISTEMIC_WRITE_BEHIND_BATCH
+writes, default 64) in submission order, so a later update of the same
+object is never written before the create. Creates get a provisional UID
+("urn:crux:uid::<type>::pending-<hex>"). Once the create has been flushed,
+resolve_uid() maps it to the real UID. An update queued against a
+provisional UID is rewritten to the real UID by the worker.
+
+Back-pressure: at most LC_EPISTEMIC_WRITE_BEHIND_MAX_PENDING writes (default
+1024) wait in memory. submit() blocks while the queue is full and raises
+WriteBehindFull if no space frees up within `block_timeout` seconds.
+
+Failures: a write that raises is retried up to LC_EPISTEMIC_WRITE_BEHIND_RETRIES
+times (default 2), with exponential backoff. An error status returned by
+the backend is its answer for that write and is not retried.
+
+Durability: with a `journal_path`, every write is appended to a JSON-lines
+journal and fsync'd before submit() returns. It is marked done once the
+backend has answered, and a create's done record also holds the real UID.
+Writes still pending when the process dies are replayed the next time a
+queue is opened on that journal, as are writes that still raised after
+their retries, and updates queued against a create that did not go
+through. Replayed updates of provisional UIDs go to the real UIDs
+recorded in the journal. Without a journal, queued writes survive only a
+normal shutdown. An atexit hook flushes every queue (for up to
+LC_EPISTEMIC_WRITE_BEHIND_SHUTDOWN_TIMEOUT seconds, default 30).
+"""
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from .lc_logging import get_logger
+from .mada_read_cache import invalidate_mada_objects
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_PENDING = 1024
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_FLUSH_INTERVAL = 0.05
+DEFAULT_BLOCK_TIMEOUT = 30.0
+DEFAULT_SHUTDOWN_TIMEOUT = 30.0
+DEFAULT_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 0.05
+# Flushed results kept for result()/resolve_uid()
+MAX_RESULTS = 10000
+PROVISIONAL_MARKER = "::pending-"
+
+_STOP = object()
+
+
+class WriteBehindFull(Exception):
+    pass
+
+
+def _env_number(name: str, default: float) -> float:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, value)
+        return default
+
+
+def is_provisional_uid(object_uid: Optional[str]) -> bool:
+    return bool(object_uid) and PROVISIONAL_MARKER in object_uid
+
+
+class WriteBehindQueue:
+    """
+    Bounded queue of write_mada_object calls, flushed by one worker thread.
+    """
+
+    def __init__(self, write_fn: Callable[..., Dict[str, Any]], journal_path: Optional[str] = None,
+                 max_pending: int = DEFAULT_MAX_PENDING, batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, retries: int = DEFAULT_RETRIES,
+                 retry_backoff: float = DEFAULT_RETRY_BACKOFF):
+        self._write_fn = write_fn
+        self.journal_path = journal_path
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(0.0, float(flush_interval))
+        self.retries = max(0, int(retries))
+        self.retry_backoff = max(0.0, float(retry_backoff))
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, int(max_pending)))
+        self._lock = threading.Lock()
+        self._results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._real_uids: "OrderedDict[str, str]" = OrderedDict()
+        # Provisional UIDs whose create raised; updates of them are held back
+        self._unwritten_creates: set = set()
+        self._journal = None
+        self._journal_open_ids = 0 # journaled writes not yet marked done
+        self._stats = {"submitted": 0, "flushed": 0, "failed": 0, "retries": 0, "batches": 0, "replayed": 0, "full_waits": 0}
+        self._closed = False
+        replay = self._open_journal() if journal_path else []
+        self._worker = threading.Thread(target=self._run, name="lc-write-behind", daemon=True)
+        self._worker.start()
+        for entry in replay:
+            self._queue.put(entry)
+
+    # --- journal ---
+
+    def _open_journal(self) -> List[Dict[str, Any]]:
+        # Returns the writes that were journaled but never marked done, and
+        # restores the provisional -> real UID mappings recorded in it.
+        pending: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        real_uids: Dict[str, str] = {}
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue # a torn last line
+                    if record.get("op") == "write":
+                        pending[record["id"]] = record
+                    elif record.get("op") == "done":
+                        pending.pop(record["id"], None)
+                    if record.get("real_uid"): # "done" of a create, or "uid"
+                        real_uids[record["object_uid"]] = record["real_uid"]
+        for provisional, real_uid in real_uids.items():
+            self._real_uids[provisional] = real_uid
+        while len(self._real_uids) > MAX_RESULTS:
+            self._real_uids.popitem(last=False)
+        directory = os.path.dirname(os.path.abspath(self.journal_path))
+        os.makedirs(directory, exist_ok=True)
+        # Rewrite the journal with only the pending writes, preceded by the
+        # mappings they still need.
+        targets = dict.fromkeys(record["kwargs"].get("object_uid_to_update") for record in pending.values())
+        tmp_path = self.journal_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for target in targets:
+                if target in real_uids:
+                    f.write(json.dumps({"op": "uid", "object_uid": target, "real_uid": real_uids[target]}) + "\n")
+            for record in pending.values():
+                f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.journal_path)
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._journal_open_ids = len(pending)
+        if pending:
+            logger.warning("WriteBehindQueue: Replaying %d unflushed write(s) from %s.", len(pending), self.journal_path)
+            self._stats["replayed"] = len(pending)
+        return list(pending.values())
+
+    def _journal_append(self, records: List[Dict[str, Any]], opened: int = 0):
+        # Caller holds the lock.
+        self._journal.write("".join(json.dumps(record) + "\n" for record in records))
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal_open_ids += opened
+
+    def _journal_done(self, records: List[Dict[str, Any]]):
+        with self._lock:
+            self._journal_append(records, opened=-len(records))
+            if self._journal_open_ids == 0:
+                # Nothing pending: start the journal afresh instead of growing it forever.
+                self._journal.truncate(0)
+                self._journal.seek(0)
+
+    # --- submitting ---
+
+    def submit(self, write_kwargs: Dict[str, Any], block_timeout: Optional[float] = DEFAULT_BLOCK_TIMEOUT) -> str:
+        """
+        Queues write_fn(**write_kwargs) and returns the object's UID: the
+        update target, or a provisional UID for a create.
+        """
+        if self._closed:
+            raise RuntimeError("WriteBehindQueue is closed")
+        object_uid = write_kwargs.get("object_uid_to_update")
+        if not object_uid:
+            object_uid = f"urn:crux:uid::{write_kwargs.get('object_type') or 'object'}{PROVISIONAL_MARKER}{uuid.uuid4().hex}"
+        elif is_provisional_uid(object_uid):
+            # Already flushed: journal the update against the real UID
+            with self._lock:
+                real_uid = self._real_uids.get(object_uid)
+            if real_uid:
+                write_kwargs = dict(write_kwargs, object_uid_to_update=real_uid)
+        entry = {"op": "write", "id": uuid.uuid4().hex, "object_uid": object_uid, "kwargs": write_kwargs}
+        if self._journal is not None:
+            with self._lock:
+                self._journal_append([entry], opened=1)
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            with self._lock:
+                self._stats["full_waits"] += 1
+            try:
+                self._queue.put(entry, timeout=block_timeout)
+            except queue.Full:
+                if self._journal is not None:
+                    self._journal_done([{"op": "done", "id": entry["id"]}])
+                raise WriteBehindFull(f"Write-behind queue full ({self._queue.maxsize} pending writes)")
+        with self._lock:
+            self._stats["submitted"] += 1
+        return object_uid
+
+    # --- worker ---
+
+    def _run(self):
+        while True:
+            entry = self._queue.get()
+            if entry is _STOP:
+                self._queue.task_done()
+                return
+            batch = [entry]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    entry = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stop = True
+                    break
+                batch.append(entry)
+            self._flush_batch(batch)
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, kwargs: Dict[str, Any]):
+        # (result, raised): an exception is retried with backoff; any result,
+        # error status or not, is the backend's answer.
+        delay = self.retry_backoff
+        for attempt in range(self.retries + 1):
+            try:
+                result = self._write_fn(**kwargs)
+            except Exception as e:
+                if attempt == self.retries:
+                    return {"object_uid": None, "status": f"Error calling write_mada_object: {type(e).__name__} - {e}", "version": None}, True
+                logger.warning("WriteBehindQueue: write_mada_object raised %r, retrying in %.2fs.", e, delay)
+                with self._lock:
+                    self._stats["retries"] += 1
+                time.sleep(delay)
+                delay *= 2
+                continue
+            if not isinstance(result, dict):
+                result = {"object_uid": None, "status": f"Error: Unexpected result from write_mada_object: {result!r}", "version": None}
+            return result, False
+
+    def _flush_batch(self, batch: List[Dict[str, Any]]):
+        done: List[Dict[str, Any]] = []
+        for entry in batch:
+            kwargs = dict(entry["kwargs"])
+            target = kwargs.get("object_uid_to_update")
+            held_back = False
+            if is_provisional_uid(target):
+                with self._lock:
+                    kwargs["object_uid_to_update"] = self._real_uids.get(target, target)
+                    held_back = target in self._unwritten_creates
+            if held_back:
+                result, raised = {"object_uid": None, "status": f"Error: The create of {target} has not been written", "version": None}, True
+            else:
+                result, raised = self._write(kwargs)
+            real_uid = result.get("object_uid")
+            failed = not real_uid or str(result.get("status", "")).startswith("Error")
+            if failed:
+                logger.error("WriteBehindQueue: Write of %s failed%s: %s", entry["object_uid"],
+                             " and stays in the journal" if raised and self._journal is not None else "", result.get("status"))
+            invalidate_mada_objects(real_uid, kwargs.get("object_uid_to_update"))
+            with self._lock:
+                self._stats["failed" if failed else "flushed"] += 1
+                self._results[entry["object_uid"]] = result
+                if raised and not target:
+                    self._unwritten_creates.add(entry["object_uid"])
+                if real_uid and real_uid != entry["object_uid"]:
+                    self._real_uids[entry["object_uid"]] = real_uid
+                for mapping in (self._results, self._real_uids):
+                    while len(mapping) > MAX_RESULTS:
+                        mapping.popitem(last=False)
+            if raised:
+                continue # left open in the journal: replayed when a queue is next opened on it
+            record = {"op": "done", "id": entry["id"]}
+            if not target and real_uid:
+                record.update(object_uid=entry["object_uid"], real_uid=real_uid)
+            done.append(record)
+        with self._lock:
+            self._stats["batches"] += 1
+        if self._journal is not None and done:
+            self._journal_done(done)
+
+    # --- results and lifecycle ---
+
+    def result(self, object_uid: str) -> Optional[Dict[str, Any]]:
+        """
+        The backend's result for the latest flushed write of `object_uid`
+        (a provisional or update UID), or None while it is still queued.
+        """
+        with self._lock:
+            return self._results.get(object_uid)
+
+    def resolve_uid(self, object_uid: str) -> str:
+        """
+        The real UID for a flushed provisional UID; anything else as-is.
+        """
+        with self._lock:
+            return self._real_uids.get(object_uid, object_uid)
+
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every write submitted so far has been flushed. Returns
+        False if `timeout` ran out first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def close(self, timeout: Optional[float] = DEFAULT_SHUTDOWN_TIMEOUT) -> bool:
+        """
+        Flushes, then stops the worker. Writes left over after `timeout`
+        stay in the journal, if there is one.
+        """
+        if self._closed:
+            return True
+        self._closed = True
+        flushed = self.flush(timeout)
+        if flushed:
+            self._queue.put(_STOP)
+            self._worker.join(timeout)
+        else:
+            logger.error("WriteBehindQueue: %d write(s) not flushed at shutdown%s.", self.pending(),
+                         f"; they remain in {self.journal_path}" if self.journal_path else " and are lost")
+        if self._journal is not None:
+            with self._lock:
+                self._journal.close()
+        return flushed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["pending"] = self.pending()
+        stats["max_pending"] = self._queue.maxsize
+        stats["journal_path"] = self.journal_path
+        return stats
+
+
+_queues: Dict[Optional[str], WriteBehindQueue] = {}
+_queues_lock = threading.Lock()
+
+
+def get_write_behind_queue(write_fn: Callable[..., Dict[str, Any]], journal_path: Optional[str] = None) -> WriteBehindQueue:
+    """
+    The shared queue for `journal_path` (None: the in-memory-only queue),
+    created on first use with the LC_EPISTEMIC_WRITE_BEHIND_* settings.
+    """
+    key = os.path.abspath(journal_path) if journal_path else None
+    with _queues_lock:
+        write_queue = _queues.get(key)
+        if write_queue is None:
+            write_queue = WriteBehindQueue(
+                write_fn, journal_path=key,
+                max_pending=int(_env_number("LC_EPISTEMIC_WRITE_BEHIND_MAX_PENDING", DEFAULT_MAX_PENDING)),
+                batch_size=int(_env_number("LC_EPISTEMIC_WRITE_BEHIND_BATCH", DEFAULT_BATCH_SIZE)),
+                retries=int(_env_number("LC_EPISTEMIC_WRITE_BEHIND_RETRIES", DEFAULT_RETRIES)),
+            )
+            _queues[key] = write_queue
+        return write_queue
+
+
+def flush_write_behind(timeout: Optional[float] = None) -> bool:
+    with _queues_lock:
+        queues = list(_queues.values())
+    return all(write_queue.flush(timeout) for write_queue in queues)
+
+
+def shutdown_write_behind(timeout: Optional[float] = None):
+    if timeout is None:
+        timeout = _env_number("LC_EPISTEMIC_WRITE_BEHIND_SHUTDOWN_TIMEOUT", DEFAULT_SHUTDOWN_TIMEOUT)
+    with _queues_lock:
+        queues = list(_queues.values())
+        _queues.clear()
+    for write_queue in queues:
+        write_queue.close(timeout)
+
+
+atexit.register(shutdown_write_behind)